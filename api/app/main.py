@@ -22,13 +22,14 @@ backward compatibility with existing API functionality.
 import os
 import sys
 import asyncio
+import contextvars
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import logging
 
 from fastapi import FastAPI, HTTPException, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, FileResponse, JSONResponse
+from fastapi.responses import Response, FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
 import pytz
@@ -40,24 +41,36 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(os.path.dirname(current_dir))
 sys.path.insert(0, parent_dir)
 
-from services.event_parser import EventParser
 from models.event_models import ParsedEvent
 
 # Import enhanced components
 from .models import (
-    ParseRequest, ParseResponse, HealthResponse, ICSRequest, 
-    APIError, ErrorDetail, ErrorCode
+    ParseRequest, ParseResponse, HealthResponse, ICSRequest, ICSFeedRequest,
+    IncrementalParseRequest, IncrementalParseResponse, APIError, ErrorDetail, ErrorCode
 )
 from .middleware import (
     RateLimitMiddleware, SecurityMiddleware, 
-    RequestLoggingMiddleware, ErrorHandlingMiddleware
+    RequestLoggingMiddleware, ErrorHandlingMiddleware, StageTimingMiddleware
 )
 from .error_handlers import (
     validation_exception_handler, http_exception_handler, 
-    handle_parsing_error, validate_timezone, validate_datetime_string
+    handle_parsing_error, validate_timezone, validate_datetime_string,
+    create_error_response
 )
 from .health import health_checker
 from services.cache_manager import get_cache_manager
+from services.startup_optimizer import get_startup_optimizer, get_startup_mode
+from services.stage_timing import stage, open_stage
+from services.request_profiler import get_request_profiler
+from services.regex_guard import regex_cpu_budget
+from services.prompt_budget import get_token_usage_tracker
+from services.short_input_parser import get_short_input_parser
+from services.async_pipeline import get_async_pipeline, run_cpu
+from services.cancellation import CancellationToken, ParseCancelled, cancellation_scope, get_disconnect_poll_interval_s
+from services.ics_feed import (
+    escape_ics_text, feed_etag, format_date_for_ics, format_datetime_for_ics, get_ics_feed_generator,
+    get_ics_feed_store
+)
 
 # Configure enhanced logging for production
 from .logging_config import setup_logging, get_logger, parsing_logger
@@ -131,7 +144,8 @@ app.add_middleware(
         "X-RateLimit-Limit-Hour", 
         "X-RateLimit-Remaining-Minute",
         "X-RateLimit-Remaining-Hour",
-        "Retry-After"
+        "Retry-After",
+        "Server-Timing"
     ]
 )
 
@@ -140,13 +154,28 @@ app.add_middleware(ErrorHandlingMiddleware)
 app.add_middleware(SecurityMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(RateLimitMiddleware, calls_per_minute=60, calls_per_hour=1000)
+# Outermost, so Server-Timing covers the whole request including the middleware above
+app.add_middleware(StageTimingMiddleware, on_complete=metrics_collector.record_stage_timings)
+
+# Export LLM prompt/completion token counts
+get_token_usage_tracker().add_listener(metrics_collector.record_llm_token_usage)
 
 # Add exception handlers
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(HTTPException, http_exception_handler)
 
-# Initialize event parser
-event_parser = EventParser()
+def get_event_parser():
+    """
+    Get the shared event parser, building it on first use.
+    
+    The parser pulls in the regex, hybrid and LLM pipelines, so it is loaded
+    through the startup optimizer's lazy loader instead of at import time.
+    This keeps /healthz responsive while a cold worker is still booting.
+    """
+    parser = get_startup_optimizer().get_performance_optimizer().get_lazy_module('event_parser')
+    if parser is None:
+        raise RuntimeError("Event parser failed to initialize")
+    return parser
 
 # Background task for cache cleanup
 import asyncio
@@ -157,6 +186,17 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting API server with enhanced endpoints")
     
+    # Build heavy components before serving (eager) or after (lazy)
+    startup_optimizer = get_startup_optimizer()
+    startup_mode = get_startup_mode()
+    logger.info(f"Startup mode: {startup_mode}")
+    if startup_mode == 'eager':
+        await startup_optimizer.warm_up_components()
+    else:
+        startup_optimizer.background_tasks.append(
+            asyncio.create_task(startup_optimizer.warm_up_components())
+        )
+    
     # Start background cache cleanup task
     cleanup_task = asyncio.create_task(cache_cleanup_task())
     
@@ -168,6 +208,8 @@ async def lifespan(app: FastAPI):
         await cleanup_task
     except asyncio.CancelledError:
         pass
+    await startup_optimizer.shutdown()
+    await get_async_pipeline().aclose()
     logger.info("API server shutdown complete")
 
 async def cache_cleanup_task():
@@ -335,6 +377,7 @@ async def parse_text(
     - Returns 400 for validation errors with specific field information
     - Returns 503 when LLM service is unavailable (falls back to regex parsing)
     - Returns 429 when rate limit is exceeded
+    - Returns 499 when the client disconnects before parsing finishes (the parse is cancelled)
     
     Stateless operation - no data is stored.
     """
@@ -383,14 +426,19 @@ async def parse_text(
         cached_result = None
         cache_hit = False
         
-        if not mode and not requested_fields:  # Only use cache for normal parsing
-            cached_result = get_cache_manager().get(request.text)
+        # Short unambiguous phrases skip merging, routing and the LLM altogether
+        parsed_event = _try_fast_path(request, mode, current_time)
+        fast_path_hit = parsed_event is not None
+        
+        if not fast_path_hit and not mode and not requested_fields:  # Only use cache for normal parsing
+            with stage('cache'):
+                cached_result = get_cache_manager().get(request.text)
             if cached_result:
                 cache_hit = True
                 parsed_event = cached_result
         
         # Parse the text if not cached
-        if not cache_hit:
+        if not cache_hit and not fast_path_hit:
             try:
                 # Use async parsing with concurrent field processing
                 parsed_event = await _parse_text_async(
@@ -399,13 +447,22 @@ async def parse_text(
                     prefer_dd_mm_format=prefer_dd_mm,
                     current_time=current_time,
                     use_llm_enhancement=request.use_llm_enhancement,
-                    requested_fields=requested_fields
+                    requested_fields=requested_fields,
+                    request_id=request_id,
+                    # Debug metadata is only read by audit mode
+                    lean_metadata=mode != "audit",
+                    http_request=http_request
                 )
                 
-                # Cache the result for future requests (skip for audit/partial parsing)
-                if not mode and not requested_fields:
-                    get_cache_manager().put(request.text, parsed_event)
+                # Cache the result for future requests (skip for audit/partial parsing,
+                # and for results cut short by the regex CPU budget)
+                if not mode and not requested_fields and not _regex_budget_exhausted(parsed_event):
+                    with stage('cache'):
+                        get_cache_manager().put(request.text, parsed_event)
                     
+            except ParseCancelled as cancelled:
+                logger.info(f"Parse cancelled - Request: {request_id}, Reason: {cancelled.reason}")
+                return Response(status_code=499)
             except Exception as parsing_error:
                 return handle_parsing_error(parsing_error, request_id)
         
@@ -421,6 +478,8 @@ async def parse_text(
             warnings.append("No event title detected - consider adding a descriptive title")
         if not parsed_event.location and "location" in request.text.lower() and (not requested_fields or 'location' in requested_fields):
             warnings.append("Location mentioned but not extracted - please verify location field")
+        if _regex_budget_exhausted(parsed_event):
+            warnings.append("Text too complex to analyse fully - some fields may be missing, consider trimming the input")
         
         # Collect parsing metadata
         parsing_metadata = {
@@ -432,7 +491,8 @@ async def parse_text(
             "partial_parsing": bool(requested_fields),
             "requested_fields": requested_fields,
             "cache_hit": cache_hit,
-            "cache_enabled": not mode and not requested_fields
+            "cache_enabled": not mode and not requested_fields,
+            "fast_path": fast_path_hit
         }
         
         # Add audit mode information if requested
@@ -440,6 +500,8 @@ async def parse_text(
             parsing_metadata.update(_get_audit_information(parsed_event, request.text))
         
         # Convert to response format with timezone-aware ISO 8601 strings
+        # (the serialization stage stays open until the response starts)
+        open_stage('serialization')
         response = ParseResponse(
             title=parsed_event.title,
             start_datetime=_format_datetime_with_tz(parsed_event.start_datetime, request.timezone),
@@ -464,6 +526,120 @@ async def parse_text(
         return handle_parsing_error(e, request_id)
 
 
+@app.post("/parse/incremental", response_model=IncrementalParseResponse)
+async def parse_text_incremental(request: IncrementalParseRequest, http_request: Request):
+    """
+    Re-parse edited text, re-running only the extractors the edits touch.
+    
+    ## Request Body
+    - **text**: Full text to parse; returns a parse token for later edits
+    - **parse_token**: Token from a previous response, sent together with **edits**
+    - **edits**: List of `{start, end, text}` replacements applied in order
+    - **timezone**: Timezone for date interpretation (default: UTC)
+    - **now**: Current datetime for relative date parsing (ISO 8601)
+    
+    ## Response
+    The same event data as /parse plus `parse_token`. `parsing_metadata.incremental`
+    lists which fields were re-extracted and which were reused from the previous parse.
+    
+    ## Error Handling
+    - Returns 400 when neither text nor parse_token and edits are given, or an edit is out of range
+    - Returns 404 for unknown or expired parse tokens (send the full text again)
+    
+    Parse tokens and their field results are kept in memory for a limited time.
+    """
+    request_id = getattr(http_request.state, 'request_id', None)
+    from services.incremental_parser import IncrementalParser, TextEdit
+    
+    if request.timezone and not validate_timezone(request.timezone):
+        return handle_parsing_error(ValueError(f"Invalid timezone: {request.timezone}"), request_id)
+    if request.text is None and not (request.parse_token and request.edits is not None):
+        return create_error_response(
+            error_code=ErrorCode.VALIDATION_ERROR,
+            message="Either text or parse_token with edits is required",
+            field="text",
+            request_id=request_id
+        )
+    
+    current_time = request.now or datetime.utcnow()
+    edits = [TextEdit(edit.start, edit.end, edit.text) for edit in request.edits or []]
+    
+    def parse():
+        with regex_cpu_budget():
+            incremental_parser = IncrementalParser(get_event_parser().hybrid_parser)
+            if request.text is not None:
+                return incremental_parser.parse(request.text, current_time=current_time)
+            return incremental_parser.reparse(request.parse_token, edits, current_time=current_time)
+    
+    try:
+        context = contextvars.copy_context()
+        result = await asyncio.get_event_loop().run_in_executor(None, context.run, parse)
+    except ValueError as e:
+        return create_error_response(
+            error_code=ErrorCode.VALIDATION_ERROR,
+            message=str(e),
+            field="edits",
+            request_id=request_id
+        )
+    except Exception as e:
+        return handle_parsing_error(e, request_id)
+    
+    if result is None:
+        return create_error_response(
+            error_code=ErrorCode.PARSE_TOKEN_NOT_FOUND,
+            message="Parse token not found or expired",
+            status_code=404,
+            field="parse_token",
+            suggestion="Send the full text again to get a new parse token",
+            request_id=request_id
+        )
+    
+    parsed_event = result.parsed_event
+    return IncrementalParseResponse(
+        title=parsed_event.title,
+        start_datetime=_format_datetime_with_tz(parsed_event.start_datetime, request.timezone),
+        end_datetime=_format_datetime_with_tz(parsed_event.end_datetime, request.timezone),
+        location=parsed_event.location,
+        description=parsed_event.description,
+        confidence_score=parsed_event.confidence_score,
+        all_day=_is_all_day_event(parsed_event),
+        timezone=request.timezone,
+        parsing_metadata={
+            "timezone": request.timezone,
+            "incremental": result.to_metadata()
+        },
+        parse_token=result.parse_token
+    )
+
+
+def _try_fast_path(request: ParseRequest, mode: Optional[str], current_time: datetime) -> Optional[ParsedEvent]:
+    """
+    Parse a short phrase with the deterministic fast path.
+    
+    Returns None when the request needs the full pipeline: audit mode (which
+    reports routing decisions), clipboard merging, or text the fast path
+    grammar cannot resolve unambiguously. Hits and escalation reasons are
+    recorded as metrics.
+    """
+    parsed_event = None
+    if mode == "audit":
+        reason = 'audit_mode'
+    elif request.clipboard_text:
+        reason = 'clipboard_text'
+    else:
+        with stage('fast_path'):
+            result = get_short_input_parser().parse(request.text, current_time)
+        parsed_event, reason = result.parsed_event, result.escalation_reason
+    metrics_collector.record_fast_path(reason)
+    return parsed_event
+
+
+def _regex_budget_exhausted(parsed_event: ParsedEvent) -> bool:
+    """Whether parsing was cut short by the regex CPU budget."""
+    metadata = parsed_event.extraction_metadata or {}
+    return metadata.get('regex_budget_exhausted') is True
+
+
 def _format_datetime_with_tz(dt: Optional[datetime], timezone: str) -> Optional[str]:
     """Format datetime as ISO 8601 string with timezone offset."""
     if not dt:
@@ -632,28 +808,37 @@ async def _parse_text_async(
     prefer_dd_mm_format: bool = False,
     current_time: Optional[datetime] = None,
     use_llm_enhancement: bool = True,
-    requested_fields: Optional[List[str]] = None
+    requested_fields: Optional[List[str]] = None,
+    request_id: Optional[str] = None,
+    lean_metadata: bool = False,
+    http_request: Optional[Request] = None
 ):
     """
     Parse text asynchronously with concurrent field processing.
     
     This function implements concurrent processing for different parsing components
-    to improve performance and reduce latency.
+    to improve performance and reduce latency. The main parse is cancelled
+    (see services.cancellation) when it times out or, given http_request,
+    when the client disconnects; the latter raises ParseCancelled.
     """
     try:
         # Create tasks for concurrent processing
         parsing_tasks = []
         
         # Always run the main parsing task
-        main_parsing_task = asyncio.create_task(
-            _run_main_parsing(
-                text=text,
-                clipboard_text=clipboard_text,
-                prefer_dd_mm_format=prefer_dd_mm_format,
-                current_time=current_time,
-                use_llm_enhancement=use_llm_enhancement
+        # (the task's copy of the context carries the cancellation token into the parse)
+        with cancellation_scope() as cancellation_token:
+            main_parsing_task = asyncio.create_task(
+                _run_main_parsing(
+                    text=text,
+                    clipboard_text=clipboard_text,
+                    prefer_dd_mm_format=prefer_dd_mm_format,
+                    current_time=current_time,
+                    use_llm_enhancement=use_llm_enhancement,
+                    request_id=request_id,
+                    lean_metadata=lean_metadata
+                )
             )
-        )
         parsing_tasks.append(main_parsing_task)
         
         # If specific fields are requested, we can optimize by running field-specific parsing
@@ -689,7 +874,7 @@ async def _parse_text_async(
         
         # Wait for main parsing with timeout
         try:
-            parsed_event = await asyncio.wait_for(main_parsing_task, timeout=10.0)
+            parsed_event = await _wait_for_parse(main_parsing_task, cancellation_token, http_request, timeout=10.0)
             return parsed_event
         except asyncio.TimeoutError:
             logger.error("Main parsing timeout - returning partial results")
@@ -709,38 +894,118 @@ async def _parse_text_async(
         raise
 
 
+async def _wait_for_parse(
+    parsing_task: asyncio.Task,
+    cancellation_token: CancellationToken,
+    http_request: Optional[Request],
+    timeout: float
+):
+    """
+    Wait for a parse task, abandoning it on timeout or client disconnect.
+    
+    An abandoned parse is cancelled both as a task and through its
+    cancellation token, so executor threads working on it stop at their next
+    cancellation check and release their worker and LLM provider slot.
+    
+    Raises:
+        asyncio.TimeoutError: If the parse takes longer than timeout
+        ParseCancelled: If the client disconnected
+    """
+    disconnect_task = asyncio.create_task(_wait_for_disconnect(http_request)) if http_request else None
+    reason = 'cancelled'
+    try:
+        done, _ = await asyncio.wait(
+            [task for task in (parsing_task, disconnect_task) if task is not None],
+            timeout=timeout,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        if parsing_task in done:
+            return parsing_task.result()
+        reason = 'client_disconnect' if disconnect_task in done else 'timeout'
+    finally:
+        if disconnect_task is not None:
+            disconnect_task.cancel()
+        if not parsing_task.done():
+            cancellation_token.cancel(reason)
+            parsing_task.cancel()
+            metrics_collector.record_cancellation(reason)
+    
+    if reason == 'timeout':
+        raise asyncio.TimeoutError()
+    raise ParseCancelled(reason)
+
+
+async def _wait_for_disconnect(http_request: Request):
+    """Return once the client has disconnected, polling every PARSE_DISCONNECT_POLL_MS."""
+    poll_interval = get_disconnect_poll_interval_s()
+    while not await http_request.is_disconnected():
+        await asyncio.sleep(poll_interval)
+
+
 async def _run_main_parsing(
     text: str,
     clipboard_text: Optional[str] = None,
     prefer_dd_mm_format: bool = False,
     current_time: Optional[datetime] = None,
-    use_llm_enhancement: bool = True
+    use_llm_enhancement: bool = True,
+    request_id: Optional[str] = None,
+    lean_metadata: bool = False
 ):
-    """Run the main parsing logic asynchronously."""
+    """
+    Run the main parsing logic asynchronously.
+    
+    LLM-enhanced parses use the async pipeline (see services.async_pipeline)
+    unless ASYNC_PIPELINE_ENABLED is off or request profiling is on (the
+    profiler observes one thread per request); cancelling this coroutine
+    (request timeout) then also aborts in-flight LLM calls.
+    """
     loop = asyncio.get_event_loop()
     
-    # Run the synchronous parser in a thread pool to avoid blocking
-    if use_llm_enhancement:
-        parsed_event = await loop.run_in_executor(
-            None,
-            lambda: event_parser.parse_text_enhanced(
+    if (use_llm_enhancement and get_async_pipeline().config.enabled
+            and not get_request_profiler().enabled):
+        # The regex CPU budget follows the parse's CPU stages across pool threads
+        with regex_cpu_budget() as budget:
+            # Resolved on the CPU pool, since the first call builds the parser
+            event_parser = await run_cpu(get_event_parser)
+            parsed_event = await event_parser.parse_text_enhanced_async(
                 text=text,
                 clipboard_text=clipboard_text,
                 prefer_dd_mm_format=prefer_dd_mm_format,
-                current_time=current_time
-            )
-        )
-    else:
-        parsed_event = await loop.run_in_executor(
-            None,
-            lambda: event_parser.parse_text(
-                text=text,
-                prefer_dd_mm_format=prefer_dd_mm_format,
-                current_time=current_time
+                current_time=current_time,
+                lean_metadata=lean_metadata
             )
-        )
+        if budget is not None and budget.exhausted and parsed_event is not None:
+            parsed_event.extraction_metadata['regex_budget_exhausted'] = True
+        return parsed_event
+    
+    def parse():
+        # Profiled on the executor thread; a no-op unless PARSE_PROFILING_ENABLED.
+        # The regex CPU budget stops pattern-heavy stages on pathological input.
+        with get_request_profiler().profile_request(request_id), regex_cpu_budget() as budget:
+            if use_llm_enhancement:
+                parsed_event = get_event_parser().parse_text_enhanced(
+                    text=text,
+                    clipboard_text=clipboard_text,
+                    prefer_dd_mm_format=prefer_dd_mm_format,
+                    current_time=current_time,
+                    lean_metadata=lean_metadata
+                )
+            else:
+                parsed_event = get_event_parser().parse_text(
+                    text=text,
+                    prefer_dd_mm_format=prefer_dd_mm_format,
+                    current_time=current_time,
+                    lean_metadata=lean_metadata
+                )
+            if budget is not None and budget.exhausted and parsed_event is not None:
+                parsed_event.extraction_metadata['regex_budget_exhausted'] = True
+            return parsed_event
     
-    return parsed_event
+    # Run the synchronous parser in a thread pool to avoid blocking
+    # (the parser itself is resolved there too, since the first call builds it).
+    # The request context is copied so stage timings reach the worker thread.
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, context.run, parse)
 
 
 async def _extract_title_async(text: str):
@@ -888,6 +1153,130 @@ async def generate_ics(
         return handle_parsing_error(e, request_id)
 
 
+# Maximum number of events accepted in one ICS feed request
+MAX_FEED_EVENTS = 10000
+
+
+@app.post("/ics/feed")
+async def generate_ics_feed(feed_request: ICSFeedRequest, http_request: Request):
+    """
+    Stream one ICS (iCalendar) file containing many events.
+    
+    ## Request Body
+    - **events**: List of events (title, start, end, location, description, allday,
+      recurrence as an RRULE, or recurrence_text such as "every other Tuesday")
+    - **batch_id**: Alternatively, the ID of a previously submitted batch
+    - **calendar_name**: Optional calendar display name
+    
+    ## Response
+    A single VCALENDAR streamed with chunked encoding. The `X-Feed-Batch-ID` header
+    holds the batch ID; `GET /ics/feed/{batch_id}` re-downloads the same feed and can
+    be used as a calendar subscription URL. Responses carry an ETag, and requests
+    with a matching `If-None-Match` get 304 Not Modified.
+    
+    ## Error Handling
+    - Returns 400 for missing/too many events or invalid datetime formats
+    - Returns 422 for event text fields over their length limits
+    - Returns 404 for unknown or expired batch IDs
+    """
+    request_id = getattr(http_request.state, 'request_id', None)
+    store = get_ics_feed_store()
+    
+    if feed_request.events:
+        if len(feed_request.events) > MAX_FEED_EVENTS:
+            return create_error_response(
+                error_code=ErrorCode.VALIDATION_ERROR,
+                message=f"Too many events (maximum {MAX_FEED_EVENTS})",
+                field="events",
+                request_id=request_id
+            )
+        
+        events = [event.model_dump() for event in feed_request.events]
+        for position, event in enumerate(events):
+            for field in ('start', 'end'):
+                if event[field] and not validate_datetime_string(event[field]):
+                    return create_error_response(
+                        error_code=ErrorCode.VALIDATION_ERROR,
+                        message=f"Invalid {field} datetime format",
+                        field=f"events[{position}].{field}",
+                        suggestion="Use ISO 8601 format (e.g., '2024-01-16T14:00:00-05:00')",
+                        request_id=request_id
+                    )
+        batch_id = store.put(events)
+    elif feed_request.batch_id:
+        batch_id = feed_request.batch_id
+        events = store.get(batch_id)
+        if events is None:
+            return _batch_not_found(batch_id, request_id)
+    else:
+        return create_error_response(
+            error_code=ErrorCode.VALIDATION_ERROR,
+            message="Either events or batch_id is required",
+            field="events",
+            request_id=request_id
+        )
+    
+    return _ics_feed_response(http_request, events, batch_id, feed_request.calendar_name)
+
+
+@app.get("/ics/feed/{batch_id}")
+async def get_ics_feed(batch_id: str, http_request: Request, calendar_name: Optional[str] = None):
+    """
+    Stream a previously submitted ICS feed batch.
+    
+    Supports `If-None-Match` with the batch ETag for cheap calendar subscription polling.
+    """
+    request_id = getattr(http_request.state, 'request_id', None)
+    events = get_ics_feed_store().get(batch_id)
+    if events is None:
+        return _batch_not_found(batch_id, request_id)
+    
+    return _ics_feed_response(http_request, events, batch_id, calendar_name)
+
+
+def _batch_not_found(batch_id: str, request_id: Optional[str]) -> JSONResponse:
+    """Error response for unknown or evicted feed batches."""
+    return create_error_response(
+        error_code=ErrorCode.BATCH_NOT_FOUND,
+        message=f"ICS feed batch not found: {batch_id}",
+        status_code=404,
+        field="batch_id",
+        suggestion="Submit the events again to create a new batch",
+        request_id=request_id
+    )
+
+
+def _ics_feed_response(
+    http_request: Request,
+    events: List[Dict[str, Any]],
+    batch_id: str,
+    calendar_name: Optional[str]
+) -> Response:
+    """Build a 304 or a streaming ICS response for a feed batch."""
+    etag = feed_etag(batch_id, calendar_name)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "X-Feed-Batch-ID": batch_id,
+        "Content-Location": f"/ics/feed/{batch_id}",
+    }
+    
+    if_none_match = http_request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        if "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates):
+            return Response(status_code=304, headers=headers)
+    
+    logger.info(f"Streaming ICS feed - Batch: {batch_id}, Events: {len(events)}")
+    
+    headers["Content-Disposition"] = "attachment; filename=events.ics"
+    return StreamingResponse(
+        get_ics_feed_generator().stream(events, batch_id, calendar_name=calendar_name),
+        media_type="text/calendar",
+        headers=headers
+    )
+
+
 def _generate_ics_content(
     title: Optional[str] = None,
     start_datetime: Optional[str] = None,
@@ -912,12 +1301,12 @@ def _generate_ics_content(
         "METHOD:PUBLISH",
         "BEGIN:VEVENT",
         f"UID:{uid}",
-        f"DTSTAMP:{_format_datetime_for_ics(now)}"
+        f"DTSTAMP:{format_datetime_for_ics(now)}"
     ]
     
     # Add title
     if title:
-        ics_lines.append(f"SUMMARY:{_escape_ics_text(title)}")
+        ics_lines.append(f"SUMMARY:{escape_ics_text(title)}")
     else:
         ics_lines.append("SUMMARY:Calendar Event")
     
@@ -928,43 +1317,43 @@ def _generate_ics_content(
             
             if all_day:
                 # All-day event
-                ics_lines.append(f"DTSTART;VALUE=DATE:{_format_date_for_ics(start_dt)}")
+                ics_lines.append(f"DTSTART;VALUE=DATE:{format_date_for_ics(start_dt)}")
                 if end_datetime:
                     end_dt = datetime.fromisoformat(end_datetime.replace('Z', '+00:00'))
                 else:
                     # Default to next day for all-day events
                     from datetime import timedelta
                     end_dt = start_dt + timedelta(days=1)
-                ics_lines.append(f"DTEND;VALUE=DATE:{_format_date_for_ics(end_dt)}")
+                ics_lines.append(f"DTEND;VALUE=DATE:{format_date_for_ics(end_dt)}")
             else:
                 # Timed event
-                ics_lines.append(f"DTSTART:{_format_datetime_for_ics(start_dt)}")
+                ics_lines.append(f"DTSTART:{format_datetime_for_ics(start_dt)}")
                 if end_datetime:
                     end_dt = datetime.fromisoformat(end_datetime.replace('Z', '+00:00'))
                 else:
                     # Default to +1 hour
                     from datetime import timedelta
                     end_dt = start_dt + timedelta(hours=1)
-                ics_lines.append(f"DTEND:{_format_datetime_for_ics(end_dt)}")
+                ics_lines.append(f"DTEND:{format_datetime_for_ics(end_dt)}")
                 
         except Exception as e:
             logger.warning(f"Date parsing error in ICS generation: {e}")
             # Add current time as fallback
-            ics_lines.append(f"DTSTART:{_format_datetime_for_ics(now)}")
+            ics_lines.append(f"DTSTART:{format_datetime_for_ics(now)}")
             from datetime import timedelta
-            ics_lines.append(f"DTEND:{_format_datetime_for_ics(now + timedelta(hours=1))}")
+            ics_lines.append(f"DTEND:{format_datetime_for_ics(now + timedelta(hours=1))}")
     
     # Add location
     if location:
-        ics_lines.append(f"LOCATION:{_escape_ics_text(location)}")
+        ics_lines.append(f"LOCATION:{escape_ics_text(location)}")
     
     # Add description
     if description:
-        ics_lines.append(f"DESCRIPTION:{_escape_ics_text(description)}")
+        ics_lines.append(f"DESCRIPTION:{escape_ics_text(description)}")
     
     # Add creation time
-    ics_lines.append(f"CREATED:{_format_datetime_for_ics(now)}")
-    ics_lines.append(f"LAST-MODIFIED:{_format_datetime_for_ics(now)}")
+    ics_lines.append(f"CREATED:{format_datetime_for_ics(now)}")
+    ics_lines.append(f"LAST-MODIFIED:{format_datetime_for_ics(now)}")
     
     # Close event and calendar
     ics_lines.extend([
@@ -975,35 +1364,6 @@ def _generate_ics_content(
     return "\r\n".join(ics_lines)
 
 
-def _format_date_for_ics(dt: datetime) -> str:
-    """Format date for ICS (YYYYMMDD)."""
-    return dt.strftime("%Y%m%d")
-
-
-def _format_datetime_for_ics(dt: datetime) -> str:
-    """Format datetime for ICS (YYYYMMDDTHHMMSSZ)."""
-    # Convert to UTC if not already
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=pytz.UTC)
-    elif dt.tzinfo != pytz.UTC:
-        dt = dt.astimezone(pytz.UTC)
-    
-    return dt.strftime("%Y%m%dT%H%M%SZ")
-
-
-def _escape_ics_text(text: str) -> str:
-    """Escape text for ICS format."""
-    if not text:
-        return ""
-    
-    return (text
-            .replace("\\", "\\\\")
-            .replace(";", "\\;")
-            .replace(",", "\\,")
-            .replace("\n", "\\n")
-            .replace("\r", ""))
-
-
 # Additional API endpoints for monitoring and documentation
 
 @app.get("/cache/stats")
@@ -1074,6 +1434,11 @@ async def api_info():
                 "path": "/ics",
                 "description": "Generate ICS calendar file"
             },
+            "ics_feed": {
+                "method": "POST",
+                "path": "/ics/feed",
+                "description": "Stream one ICS file with many events (also GET /ics/feed/{batch_id})"
+            },
             "health": {
                 "method": "GET",
                 "path": "/healthz",
@@ -1308,6 +1673,50 @@ async def clear_error_logs(
         raise HTTPException(status_code=500, detail="Failed to clear error logs")
 
 
+@app.get("/admin/profiles")
+async def list_request_profiles():
+    """
+    List captured /parse request profiles, newest first.
+    
+    Profiles are captured only when PARSE_PROFILING_ENABLED is set:
+    - **sampled**: cProfile of 1 in PARSE_PROFILING_SAMPLE_EVERY requests (`.prof`, load with pstats)
+    - **slow**: stack samples of requests slower than PARSE_PROFILING_SLOW_MS (`.folded`, flame graph input)
+    """
+    profiler = get_request_profiler()
+    config = profiler.config
+    return {
+        "success": True,
+        "enabled": profiler.enabled,
+        "config": {
+            "sample_every": config.sample_every,
+            "slow_threshold_ms": config.slow_threshold_ms,
+            "sample_interval_ms": config.sample_interval_ms,
+            "max_profiles": config.max_profiles
+        },
+        "captured": dict(profiler.stats),
+        "profiles": [info.to_dict() for info in profiler.list_profiles()],
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+@app.get("/admin/profiles/{name}")
+async def download_request_profile(name: str, http_request: Request):
+    """Download a captured request profile by name."""
+    path = get_request_profiler().get_profile_path(name)
+    if path is None:
+        return create_error_response(
+            error_code=ErrorCode.PROFILE_NOT_FOUND,
+            message=f"Profile not found: {name}",
+            status_code=404,
+            field="name",
+            suggestion="List available profiles at /admin/profiles; old profiles are rotated out",
+            request_id=getattr(http_request.state, 'request_id', None)
+        )
+    
+    media_type = "text/plain" if path.suffix == ".folded" else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=name)
+
+
 async def _get_error_logs_from_files(
     limit: int = 100,
     level: str = "ERROR",
@@ -97,6 +97,15 @@ component_latency_seconds = Histogram(
     registry=registry
 )
 
+# Per-request pipeline stage metrics (exclusive time, see services.stage_timing)
+request_stage_duration_seconds = Histogram(
+    'request_stage_duration_seconds',
+    'Time spent in each parsing pipeline stage per request in seconds',
+    ['stage'],
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+    registry=registry
+)
+
 component_requests_total = Counter(
     'component_requests_total',
     'Total component processing requests',
@@ -145,6 +154,22 @@ llm_request_duration_seconds = Histogram(
     registry=registry
 )
 
+# LLM token usage (provider-reported where available, see services.prompt_budget)
+llm_tokens_total = Counter(
+    'llm_tokens_total',
+    'Total LLM tokens by calling component, provider and kind (prompt/completion)',
+    ['component', 'provider', 'kind'],
+    registry=registry
+)
+
+llm_prompt_tokens = Histogram(
+    'llm_prompt_tokens',
+    'Prompt tokens per LLM call',
+    ['component'],
+    buckets=[64, 128, 256, 512, 768, 1024, 1536, 2048, 4096, 8192],
+    registry=registry
+)
+
 llm_service_available = Gauge(
     'llm_service_available',
     'LLM service availability (1=available, 0=unavailable)',
@@ -186,6 +211,22 @@ field_extraction_confidence = Histogram(
     registry=registry
 )
 
+# Short input fast path metrics (see services.short_input_parser)
+fast_path_requests_total = Counter(
+    'fast_path_requests_total',
+    'Parse requests by fast path outcome (hit or escalated) and escalation reason',
+    ['outcome', 'reason'],
+    registry=registry
+)
+
+# Abandoned parse metrics (see services.cancellation)
+parse_cancellations_total = Counter(
+    'parse_cancellations_total',
+    'Parse requests abandoned before the parse finished, by reason (client_disconnect, timeout, cancelled)',
+    ['reason'],
+    registry=registry
+)
+
 # Error metrics
 parsing_errors_total = Counter(
     'parsing_errors_total',
@@ -263,6 +304,11 @@ class MetricsCollector:
             status='success' if success else 'error'
         ).inc()
     
+    def record_stage_timings(self, timings):
+        """Record the stage durations collected for one request."""
+        for stage, duration_ns in timings.totals_ns().items():
+            request_stage_duration_seconds.labels(stage=stage).observe(duration_ns / 1e9)
+    
     def record_cache_operation(self, operation: str, result: str):
         """Record cache operation metrics."""
         cache_operations_total.labels(
@@ -282,6 +328,12 @@ class MetricsCollector:
         llm_requests_total.labels(status=status).inc()
         llm_request_duration_seconds.observe(duration)
     
+    def record_llm_token_usage(self, usage):
+        """Record the token counts of one LLM call (a services.prompt_budget.TokenUsage)."""
+        llm_tokens_total.labels(component=usage.component, provider=usage.provider, kind='prompt').inc(usage.prompt_tokens)
+        llm_tokens_total.labels(component=usage.component, provider=usage.provider, kind='completion').inc(usage.completion_tokens)
+        llm_prompt_tokens.labels(component=usage.component).observe(usage.prompt_tokens)
+    
     def update_llm_availability(self, available: bool):
         """Update LLM service availability."""
         llm_service_available.set(1 if available else 0)
@@ -295,6 +347,17 @@ class MetricsCollector:
         
         field_extraction_confidence.labels(field=field).observe(confidence)
     
+    def record_fast_path(self, escalation_reason: Optional[str]):
+        """Record a fast path hit (no escalation reason) or an escalation to the full pipeline."""
+        if escalation_reason is None:
+            fast_path_requests_total.labels(outcome='hit', reason='none').inc()
+        else:
+            fast_path_requests_total.labels(outcome='escalated', reason=escalation_reason).inc()
+    
+    def record_cancellation(self, reason: str):
+        """Record a parse abandoned before it finished."""
+        parse_cancellations_total.labels(reason=reason).inc()
+    
     def record_parsing_error(self, error_type: str):
         """Record parsing error."""
         parsing_errors_total.labels(error_type=error_type).inc()
@@ -5,15 +5,18 @@ Enhanced middleware for rate limiting, error handling, and security.
 import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 import logging
 from collections import defaultdict, deque
 
 from fastapi import Request, Response, HTTPException
 from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .models import APIError, ErrorDetail, ErrorCode, RateLimitInfo
+from services.stage_timing import StageTimings, is_stage_timing_enabled, request_scope
 
 logger = logging.getLogger(__name__)
 
@@ -236,4 +239,39 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             return JSONResponse(
                 status_code=500,
                 content=error.model_dump()
-            )
\ No newline at end of file
+            )
+
+
+class StageTimingMiddleware:
+    """
+    Per-request pipeline stage timing exposed via the Server-Timing header.
+    
+    Implemented as plain ASGI (not BaseHTTPMiddleware) so the header can be
+    added when the response starts, after serialization has been timed.
+    """
+    
+    def __init__(self, app: ASGIApp, enabled: Optional[bool] = None,
+                 on_complete: Optional[Callable[[StageTimings], None]] = None):
+        self.app = app
+        self.enabled = is_stage_timing_enabled() if enabled is None else enabled
+        self.on_complete = on_complete
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        with request_scope() as timings:
+            async def send_with_timing(message: Message):
+                if message["type"] == "http.response.start":
+                    timings.close_open_stages()
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timings.server_timing_header())
+                    if self.on_complete:
+                        try:
+                            self.on_complete(timings)
+                        except Exception as e:
+                            logger.warning(f"Failed to record stage timings: {e}")
+                await send(message)
+            
+            await self.app(scope, receive, send_with_timing)
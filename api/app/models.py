@@ -22,6 +22,9 @@ class ErrorCode(str, Enum):
     TIMEOUT_ERROR = "TIMEOUT_ERROR"
     CONCURRENT_PROCESSING_ERROR = "CONCURRENT_PROCESSING_ERROR"
     ASYNC_PROCESSING_ERROR = "ASYNC_PROCESSING_ERROR"
+    BATCH_NOT_FOUND = "BATCH_NOT_FOUND"
+    PROFILE_NOT_FOUND = "PROFILE_NOT_FOUND"
+    PARSE_TOKEN_NOT_FOUND = "PARSE_TOKEN_NOT_FOUND"
 
 
 class ErrorDetail(BaseModel):
@@ -154,6 +157,47 @@ class ParseResponse(BaseModel):
     )
 
 
+class TextEditModel(BaseModel):
+    """One edit of previously parsed text: text[start:end] is replaced by text."""
+    start: int = Field(..., ge=0, description="Start offset of the replaced range")
+    end: int = Field(..., ge=0, description="End offset of the replaced range (exclusive)")
+    text: str = Field(default="", max_length=10000, description="Replacement text")
+
+
+class IncrementalParseRequest(BaseModel):
+    """Request model for incremental re-parsing of edited text."""
+    text: Optional[str] = Field(
+        default=None,
+        description="Full text to parse (first request, or to start over)",
+        min_length=1,
+        max_length=10000,
+        example="Budget review Friday at 2pm in Room 4"
+    )
+    parse_token: Optional[str] = Field(
+        default=None,
+        description="Token of a previous /parse/incremental response the edits apply to"
+    )
+    edits: Optional[List[TextEditModel]] = Field(
+        default=None,
+        description="Edits applied in order, each against the text left by the previous one",
+        max_length=100
+    )
+    timezone: Optional[str] = Field(
+        default="UTC",
+        description="Timezone for date interpretation (e.g., 'America/New_York')",
+        example="America/New_York"
+    )
+    now: Optional[datetime] = Field(
+        default=None,
+        description="Current datetime for relative date parsing (ISO 8601)"
+    )
+
+
+class IncrementalParseResponse(ParseResponse):
+    """Parsed event data plus the token for the next incremental request."""
+    parse_token: str = Field(description="Token to send with the next edit of this text")
+
+
 class HealthResponse(BaseModel):
     """Health check response model."""
     status: str = Field(description="Service status", example="healthy")
@@ -200,6 +244,68 @@ class ICSRequest(BaseModel):
     )
 
 
+class ICSFeedEvent(ICSRequest):
+    """One event in a multi-event ICS feed (text fields are bounded; feeds are kept in memory)."""
+    title: Optional[str] = Field(
+        default=None,
+        max_length=500,
+        description="Event title",
+        example="Team Meeting"
+    )
+    start: Optional[str] = Field(
+        default=None,
+        max_length=64,
+        description="Start datetime in ISO format",
+        example="2024-01-16T14:00:00-05:00"
+    )
+    end: Optional[str] = Field(
+        default=None,
+        max_length=64,
+        description="End datetime in ISO format",
+        example="2024-01-16T15:00:00-05:00"
+    )
+    location: Optional[str] = Field(
+        default=None,
+        max_length=500,
+        description="Event location",
+        example="Conference Room A"
+    )
+    description: Optional[str] = Field(
+        default=None,
+        max_length=2000,
+        description="Event description"
+    )
+    recurrence: Optional[str] = Field(
+        default=None,
+        max_length=500,
+        description="RFC 5545 recurrence rule (with or without the RRULE: prefix); invalid rules are dropped",
+        example="FREQ=WEEKLY;BYDAY=TU"
+    )
+    recurrence_text: Optional[str] = Field(
+        default=None,
+        max_length=200,
+        description="Natural language recurrence, converted with RecurrenceProcessor",
+        example="every other Tuesday"
+    )
+
+
+class ICSFeedRequest(BaseModel):
+    """Request model for multi-event ICS feed generation."""
+    events: Optional[List[ICSFeedEvent]] = Field(
+        default=None,
+        description="Events to include in the feed"
+    )
+    batch_id: Optional[str] = Field(
+        default=None,
+        description="ID of a previously submitted feed batch (alternative to events)"
+    )
+    calendar_name: Optional[str] = Field(
+        default=None,
+        description="Calendar display name (X-WR-CALNAME)",
+        example="Fall Semester"
+    )
+
+
 class RateLimitInfo(BaseModel):
     """Rate limiting information."""
     limit: int = Field(description="Request limit per window")
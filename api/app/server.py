@@ -3,10 +3,14 @@ Enhanced server startup with uvloop and async optimizations.
 """
 
 import asyncio
+import gc
 import logging
+import signal
+import socket
 import sys
 import os
-from typing import Optional
+import time
+from typing import Optional, List, Dict
 
 import uvicorn
 
@@ -23,6 +27,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pre-fork respawn backoff: a worker that dies soon after it started (e.g. on
+# startup) is replaced after a delay that doubles with each such crash
+RESPAWN_BACKOFF_INITIAL_S = 0.5
+RESPAWN_BACKOFF_MAX_S = 30.0
+WORKER_STABLE_AFTER_S = 10.0  # a worker that ran this long resets the backoff
+
 
 def setup_uvloop():
     """Setup uvloop for better async performance."""
@@ -79,7 +89,8 @@ async def startup_tasks():
     
     try:
         # Warm up the event parser
-        from app.main import event_parser
+        from app.main import get_event_parser
+        get_event_parser()
         logger.info("Event parser initialized")
         
         # Initialize cache manager
@@ -100,12 +111,192 @@ async def startup_tasks():
         logger.error(f"Error during startup tasks: {e}")
 
 
+def prefork_supported() -> bool:
+    """Check whether the pre-fork server mode can run on this platform."""
+    return hasattr(os, "fork") and sys.platform != 'win32'
+
+
+def warm_up_master():
+    """
+    Build all shared state in the master process before forking workers.
+    
+    Imports the app, builds the event parser and lazily registered components,
+    precompiles regex patterns and runs ModelWarmUp.warm_up_models once. The
+    heap is then frozen so workers share these pages copy-on-write instead of
+    each rebuilding them (gc.freeze keeps the collector from touching, and
+    therefore copying, the inherited objects).
+    
+    The LLM service is not warmed up here: its HTTP clients keep pooled
+    connections, which forked workers would share. Each worker builds its
+    own clients on first use (see services.async_pipeline.ProcessLocalClient).
+    
+    Returns:
+        The FastAPI application object to serve in each worker
+    """
+    from app.main import app
+    from services.startup_optimizer import get_startup_optimizer
+    
+    startup_optimizer = get_startup_optimizer()
+    startup_optimizer.preload_components()
+    
+    # Regex precompilation and model warm-up, run synchronously in the master
+    asyncio.run(startup_optimizer.initialize_application(
+        enable_warm_up=True,
+        warm_up_in_background=False,
+        skip_warm_up=('llm_service',)
+    ))
+    startup_optimizer.log_import_report()
+    
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Master warm-up complete, {gc.get_freeze_count()} objects frozen for copy-on-write sharing")
+    
+    return app
+
+
+def create_listen_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Bind the listening socket in the master so all workers accept on it."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app, sock: socket.socket, log_level: str):
+    """Serve requests in a forked worker using the inherited socket and warm state."""
+    # Restore default signal handling; uvicorn installs its own shutdown handlers
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    
+    config = uvicorn.Config(
+        app=app,
+        log_level=log_level,
+        access_log=True,
+        server_header=False,
+        date_header=False,
+        loop="uvloop" if UVLOOP_AVAILABLE else "auto",
+    )
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+
+
+def _spawn_worker(app, sock: socket.socket, log_level: str) -> int:
+    """Fork a worker process and return its pid (in the master)."""
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 0
+        try:
+            _run_worker(app, sock, log_level)
+        except Exception as e:
+            logger.error(f"Worker {os.getpid()} failed: {e}")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+    
+    logger.info(f"Started worker {pid}")
+    return pid
+
+
+class RespawnBackoff:
+    """
+    Delay before replacing a worker that exited unexpectedly.
+    
+    Workers that die within stable_after_s of starting are replaced after a
+    delay that doubles with each such crash, up to max_s, so a worker that
+    fails on startup is not re-forked in a tight loop. A worker that ran for
+    stable_after_s resets the delay.
+    """
+    
+    def __init__(self, initial_s: float = RESPAWN_BACKOFF_INITIAL_S, max_s: float = RESPAWN_BACKOFF_MAX_S,
+                 stable_after_s: float = WORKER_STABLE_AFTER_S):
+        self.initial_s = initial_s
+        self.max_s = max_s
+        self.stable_after_s = stable_after_s
+        self.crashes = 0
+    
+    def next_delay(self, uptime_s: float) -> float:
+        """Seconds to wait before replacing a worker that ran for uptime_s."""
+        if uptime_s >= self.stable_after_s:
+            self.crashes = 0
+            return 0.0
+        delay = min(self.max_s, self.initial_s * 2 ** self.crashes)
+        self.crashes += 1
+        return delay
+
+
+def run_prefork_server(host: str, port: int, workers: int, log_level: str = "info"):
+    """
+    Run the server in pre-fork mode.
+    
+    The master binds the socket and warms everything up once, then forks
+    `workers` processes that inherit the warm state copy-on-write. Workers that
+    exit unexpectedly are replaced from the same warm master, with a backoff
+    for workers that keep dying soon after start (see RespawnBackoff).
+    """
+    sock = create_listen_socket(host, port)
+    app = warm_up_master()
+    
+    started: Dict[int, float] = {}
+    
+    def spawn() -> int:
+        pid = _spawn_worker(app, sock, log_level)
+        started[pid] = time.monotonic()
+        return pid
+    
+    worker_pids: List[int] = [spawn() for _ in range(workers)]
+    backoff = RespawnBackoff()
+    shutting_down = False
+    
+    def handle_shutdown(signum, frame):
+        nonlocal shutting_down
+        shutting_down = True
+        logger.info(f"Master received signal {signum}, stopping {len(worker_pids)} workers")
+        for pid in worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    
+    signal.signal(signal.SIGINT, handle_shutdown)
+    signal.signal(signal.SIGTERM, handle_shutdown)
+    
+    try:
+        while worker_pids:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            
+            if pid not in worker_pids:
+                continue
+            worker_pids.remove(pid)
+            uptime = time.monotonic() - started.pop(pid)
+            
+            if not shutting_down:
+                delay = backoff.next_delay(uptime)
+                logger.warning(f"Worker {pid} exited with status {status} after {uptime:.1f}s, "
+                               f"restarting in {delay:.1f}s")
+                # Sleep in short steps so a shutdown signal is not held up by the backoff
+                deadline = time.monotonic() + delay
+                while not shutting_down and time.monotonic() < deadline:
+                    time.sleep(max(0.0, min(0.1, deadline - time.monotonic())))
+                if not shutting_down:
+                    worker_pids.append(spawn())
+    finally:
+        sock.close()
+        logger.info("Pre-fork server shutdown complete")
+
+
 def run_server(
     host: Optional[str] = None,
     port: Optional[int] = None,
     workers: Optional[int] = None,
     reload: bool = False,
-    log_level: str = "info"
+    log_level: str = "info",
+    prefork: Optional[bool] = None
 ):
     """Run the FastAPI server with uvloop and async optimizations."""
     
@@ -117,6 +308,15 @@ def run_server(
     port = port or int(os.getenv("PORT", "8000"))
     workers = workers or int(os.getenv("WORKERS", "1"))
     log_level = os.getenv("LOG_LEVEL", log_level).lower()
+    if prefork is None:
+        prefork = os.getenv("PREFORK", "false").lower() in ("1", "true", "yes")
+    
+    if prefork and not reload:
+        if prefork_supported():
+            logger.info(f"Starting pre-fork server with {workers} workers on {host}:{port}")
+            run_prefork_server(host=host, port=port, workers=workers, log_level=log_level)
+            return
+        logger.warning("Pre-fork mode requires os.fork, falling back to uvicorn workers")
     
     # Create server configuration
     config = create_server_config(
@@ -144,6 +344,8 @@ if __name__ == "__main__":
     parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
     parser.add_argument("--log-level", default="info", help="Log level")
+    parser.add_argument("--prefork", action="store_true", default=None,
+                        help="Warm up once in a master process and fork workers sharing its memory")
     
     args = parser.parse_args()
     
@@ -152,5 +354,6 @@ if __name__ == "__main__":
         port=args.port,
         workers=args.workers,
         reload=args.reload,
-        log_level=args.log_level
+        log_level=args.log_level,
+        prefork=args.prefork
     )
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Tests for the async parsing pipeline behind the /parse endpoint.
+"""
+
+import itertools
+import sys
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from models.event_models import ParsedEvent
+
+# The module defining the endpoints: app.main or api.app.main, depending on the rootdir
+main = sys.modules[next(route.endpoint for route in app.routes if getattr(route, "path", None) == "/parse").__module__]
+
+# Distinct client IPs so the shared rate limiter does not throttle these tests
+_client_ips = (f"10.46.0.{n}" for n in itertools.count(1))
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, headers={"X-Forwarded-For": next(_client_ips)})
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    parser = Mock()
+    event = ParsedEvent(
+        title="Lunch", start_datetime=datetime(2025, 10, 3, 12, 0), confidence_score=0.9,
+        extraction_metadata={'parsing_path': 'regex_only'}
+    )
+    parser.parse_text_enhanced.return_value = event
+    parser.parse_text_enhanced_async = AsyncMock(return_value=event)
+    monkeypatch.setattr(main, "get_event_parser", lambda: parser)
+    return parser
+
+
+def _parse(client):
+    # Unique text so neither the response cache nor the short input fast path answers
+    text = f"Lunch with Sarah at Cafe Roma on Friday at noon {uuid.uuid4().hex}"
+    return client.post("/parse", json={"text": text, "use_llm_enhancement": True})
+
+
+class TestAsyncParse:
+    """Test which pipeline serves LLM-enhanced parses."""
+
+    def test_llm_enhanced_parses_are_awaited(self, client, parser):
+        response = _parse(client)
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Lunch"
+        parser.parse_text_enhanced_async.assert_awaited_once()
+        parser.parse_text_enhanced.assert_not_called()
+
+    def test_disabled_pipeline_parses_in_a_thread(self, client, parser, monkeypatch):
+        monkeypatch.setattr(main.get_async_pipeline().config, "enabled", False)
+
+        assert _parse(client).status_code == 200
+
+        parser.parse_text_enhanced.assert_called_once()
+        parser.parse_text_enhanced_async.assert_not_called()
@@ -0,0 +1,60 @@
+"""
+Tests for the short input fast path on /parse.
+"""
+
+import itertools
+import sys
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+# Distinct client IPs so the shared rate limiter does not throttle these tests
+_client_ips = (f"10.45.0.{n}" for n in itertools.count(1))
+
+NOW = "2025-10-01T09:00:00"
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, headers={"X-Forwarded-For": next(_client_ips)})
+
+
+def _parse_module():
+    endpoint = next(route.endpoint for route in app.routes if getattr(route, "path", None) == "/parse")
+    return sys.modules[endpoint.__module__]
+
+
+class TestFastPath:
+    """Test that short phrases skip the full pipeline and escalations reach it."""
+
+    def test_short_phrase_skips_full_pipeline(self, client):
+        main = _parse_module()
+        with patch.object(main, "_parse_text_async", side_effect=AssertionError("full pipeline used")):
+            response = client.post("/parse", json={"text": "lunch tomorrow at noon", "now": NOW})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["title"] == "lunch"
+        assert body["start_datetime"].startswith("2025-10-02T12:00:00")
+        assert body["end_datetime"].startswith("2025-10-02T13:00:00")
+        assert body["parsing_metadata"]["fast_path"] is True
+
+    def test_ambiguous_phrase_escalates(self, client):
+        main = _parse_module()
+        with patch.object(main, "_parse_text_async", wraps=main._parse_text_async) as full_pipeline:
+            response = client.post("/parse", json={"text": "standup at 9", "now": NOW})
+
+        assert response.status_code == 200
+        assert response.json()["parsing_metadata"]["fast_path"] is False
+        full_pipeline.assert_called_once()
+
+    def test_outcomes_are_recorded(self, client):
+        main = _parse_module()
+        with patch.object(main.metrics_collector, "record_fast_path") as record:
+            client.post("/parse", json={"text": "standup 9am", "now": NOW})
+            client.post("/parse", json={"text": "standup 9am", "clipboard_text": "Room 4", "now": NOW})
+
+        assert [call.args[0] for call in record.call_args_list] == [None, "clipboard_text"]
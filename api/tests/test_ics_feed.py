@@ -0,0 +1,163 @@
+"""
+Tests for the streaming multi-event ICS feed (/ics/feed).
+"""
+
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from services.ics_feed import ICSFeedGenerator, ICSFeedStore, fold_ics_line, validate_rrule
+
+# Distinct client IPs so the shared rate limiter does not throttle these tests
+_client_ips = (f"10.30.0.{n}" for n in itertools.count(1))
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, headers={"X-Forwarded-For": next(_client_ips)})
+
+
+def _events(count: int):
+    return [
+        {
+            "title": f"Lecture {i}",
+            "start": f"2024-09-{(i % 28) + 1:02d}T10:00:00-04:00",
+            "end": f"2024-09-{(i % 28) + 1:02d}T11:00:00-04:00",
+            "location": "Hall B",
+        }
+        for i in range(count)
+    ]
+
+
+class TestICSFeedEndpoint:
+    """Test the /ics/feed endpoints."""
+
+    def test_streams_all_events_in_one_calendar(self, client):
+        response = client.post("/ics/feed", json={"events": _events(150), "calendar_name": "Fall"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/calendar")
+        body = response.text
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert body.count("BEGIN:VEVENT") == 150
+        assert "X-WR-CALNAME:Fall" in body
+        assert "DTSTART:20240901T140000Z" in body
+
+    def test_recurrence_rules(self, client):
+        response = client.post("/ics/feed", json={"events": [
+            {"title": "Seminar", "start": "2024-09-03T15:00:00Z", "recurrence_text": "every other Tuesday"},
+            {"title": "Standup", "start": "2024-09-02T09:00:00Z", "recurrence": "RRULE:FREQ=DAILY;COUNT=5"},
+        ]})
+
+        assert "RRULE:FREQ=WEEKLY;INTERVAL=2;BYDAY=TU" in response.text
+        assert "RRULE:FREQ=DAILY;COUNT=5" in response.text
+
+    def test_recurrence_cannot_inject_content_lines(self, client):
+        response = client.post("/ics/feed", json={"events": [{
+            "title": "Standup", "start": "2024-09-02T09:00:00Z",
+            "recurrence": "FREQ=DAILY\r\nEND:VEVENT\r\nBEGIN:VEVENT\r\nSUMMARY:Injected",
+        }]})
+
+        assert response.status_code == 200
+        assert response.text.count("BEGIN:VEVENT") == 1
+        assert "Injected" not in response.text
+        assert "RRULE" not in response.text
+
+    def test_etag_and_batch_download(self, client):
+        response = client.post("/ics/feed", json={"events": _events(3)})
+        etag = response.headers["etag"]
+        batch_id = response.headers["x-feed-batch-id"]
+
+        assert etag == f'"{batch_id}"'
+
+        not_modified = client.get(f"/ics/feed/{batch_id}", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+
+        again = client.get(f"/ics/feed/{batch_id}")
+        assert again.status_code == 200
+        assert again.headers["etag"] == etag
+        assert again.text.count("BEGIN:VEVENT") == 3
+
+        by_id = client.post("/ics/feed", json={"batch_id": batch_id}, headers={"If-None-Match": f"W/{etag}"})
+        assert by_id.status_code == 304
+
+    def test_identical_batches_have_stable_uids(self, client):
+        first = client.post("/ics/feed", json={"events": _events(2)})
+        second = client.post("/ics/feed", json={"events": _events(2)})
+
+        uids = [line for line in first.text.split("\r\n") if line.startswith("UID:")]
+        assert uids == [line for line in second.text.split("\r\n") if line.startswith("UID:")]
+        assert len(set(uids)) == 2
+
+    def test_errors(self, client):
+        assert client.post("/ics/feed", json={}).status_code == 400
+        assert client.get("/ics/feed/unknown").status_code == 404
+
+        response = client.post("/ics/feed", json={"events": [{"title": "Bad", "start": "not-a-date"}]})
+        assert response.status_code == 400
+        assert response.json()["error"]["field"] == "events[0].start"
+
+        oversized = client.post("/ics/feed", json={"events": [{"title": "Big", "description": "x" * 2001}]})
+        assert oversized.status_code == 422
+        assert oversized.json()["error"]["field"] == "body.events.0.description"
+
+
+class TestICSFeedGenerator:
+    """Unit tests for feed generation helpers."""
+
+    def test_stream_consumes_events_lazily(self):
+        consumed = []
+
+        def events():
+            for i in range(10):
+                consumed.append(i)
+                yield {"title": f"Event {i}", "start": "2024-01-01T10:00:00Z"}
+
+        stream = ICSFeedGenerator(chunk_events=4).stream(events(), "batch")
+        next(stream)  # header
+        next(stream)  # first chunk of events
+
+        assert consumed == [0, 1, 2, 3]
+        assert sum(chunk.count("BEGIN:VEVENT") for chunk in stream) == 6
+
+    def test_long_lines_are_folded(self):
+        folded = fold_ics_line("DESCRIPTION:" + "é" * 100)
+
+        lines = folded.rstrip("\r\n").split("\r\n")
+        assert len(lines) > 1
+        assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+        assert all(line.startswith(" ") for line in lines[1:])
+        assert "".join(line[1:] if i else line for i, line in enumerate(lines)) == "DESCRIPTION:" + "é" * 100
+
+    def test_validate_rrule(self):
+        assert validate_rrule("RRULE:freq=monthly;byday=-1FR;until=20250101T000000Z") == \
+            "FREQ=MONTHLY;BYDAY=-1FR;UNTIL=20250101T000000Z"
+        assert validate_rrule("FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH;WKST=MO") == "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH;WKST=MO"
+        for rule in ("COUNT=3", "FREQ=DAILY;FOO=1", "FREQ=DAILY;FREQ=WEEKLY", "FREQ=DAILY;COUNT=x",
+                     "FREQ=DAILY;COUNT=2;UNTIL=20250101", "FREQ=DAILY\nX-EVIL:1", "FREQ=DAILY;BYDAY=MO:X", ""):
+            assert validate_rrule(rule) is None, rule
+
+    def test_store_evicts_least_recently_used(self):
+        store = ICSFeedStore(max_batches=2)
+        first = store.put([{"title": "a"}])
+        second = store.put([{"title": "b"}])
+        store.get(first)
+        store.put([{"title": "c"}])
+
+        assert store.get(first) is not None
+        assert store.get(second) is None
+
+    def test_store_evicts_when_size_budget_is_exceeded(self):
+        store = ICSFeedStore(max_batches=100, max_bytes=3000)
+        batches = [store.put([{"title": f"Batch {n}", "description": "x" * 900}]) for n in range(4)]
+
+        assert store.total_bytes <= 3000
+        assert store.get(batches[0]) is None
+        assert all(store.get(batch_id) is not None for batch_id in batches[2:])
+
+        oversized = store.put([{"title": "Huge", "description": "x" * 5000}])
+        assert store.get(oversized) is None
+        assert store.get(batches[-1]) is not None
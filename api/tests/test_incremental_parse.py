@@ -0,0 +1,63 @@
+"""
+Tests for the /parse/incremental endpoint.
+"""
+
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+# Distinct client IPs so the shared rate limiter does not throttle these tests
+_client_ips = (f"10.44.0.{n}" for n in itertools.count(1))
+
+TEXT = "Budget review on Friday at 2pm. Afterwards we head over to Conference Room B"
+NOW = "2025-10-01T09:00:00"
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, headers={"X-Forwarded-For": next(_client_ips)})
+
+
+class TestIncrementalParse:
+    """Test full and incremental parses through the API."""
+
+    def test_edit_reuses_untouched_fields(self, client):
+        first = client.post("/parse/incremental", json={"text": TEXT, "now": NOW})
+        assert first.status_code == 200
+        assert first.json()["parsing_metadata"]["incremental"]["full_parse"] is True
+
+        position = TEXT.index("2pm")
+        second = client.post("/parse/incremental", json={
+            "parse_token": first.json()["parse_token"],
+            "edits": [{"start": position, "end": position + 3, "text": "4pm"}],
+            "now": NOW
+        })
+
+        body = second.json()
+        assert second.status_code == 200
+        assert body["parse_token"] != first.json()["parse_token"]
+        assert body["start_datetime"].startswith("2025-10-03T16:00:00")
+        assert body["location"] == "Conference Room B"
+        assert body["parsing_metadata"]["incremental"]["full_parse"] is False
+
+    def test_unknown_token_is_404(self, client):
+        response = client.post("/parse/incremental", json={"parse_token": "unknown", "edits": []})
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "PARSE_TOKEN_NOT_FOUND"
+
+    def test_out_of_range_edit_is_400(self, client):
+        token = client.post("/parse/incremental", json={"text": TEXT, "now": NOW}).json()["parse_token"]
+
+        response = client.post("/parse/incremental", json={
+            "parse_token": token, "edits": [{"start": 0, "end": 500, "text": "x"}]
+        })
+
+        assert response.status_code == 400
+        assert response.json()["error"]["field"] == "edits"
+
+    def test_text_or_token_required(self, client):
+        assert client.post("/parse/incremental", json={}).status_code == 400
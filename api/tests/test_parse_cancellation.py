@@ -0,0 +1,118 @@
+"""
+Tests for cancelling /parse work when the client disconnects.
+"""
+
+import asyncio
+import itertools
+import sys
+import threading
+import time
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.main import app
+from models.event_models import ParsedEvent
+from services.cancellation import ParseCancelled, check_cancelled
+
+# The module defining the endpoints: app.main or api.app.main, depending on the rootdir
+main = sys.modules[next(route.endpoint for route in app.routes if getattr(route, "path", None) == "/parse").__module__]
+
+# Distinct client IPs so the shared rate limiter does not throttle these tests
+_client_ips = (f"10.47.0.{n}" for n in itertools.count(1))
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, headers={"X-Forwarded-For": next(_client_ips)})
+
+
+@pytest.fixture
+def client_gone(monkeypatch):
+    """Event that disconnects the client once set."""
+    gone = threading.Event()
+
+    async def is_disconnected(self):
+        return gone.is_set()
+
+    monkeypatch.setattr(Request, "is_disconnected", is_disconnected)
+    monkeypatch.setenv("PARSE_DISCONNECT_POLL_MS", "10")
+    return gone
+
+
+@pytest.fixture
+def cancellations(monkeypatch):
+    record = Mock()
+    monkeypatch.setattr(main.metrics_collector, "record_cancellation", record)
+    return record
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    parser = Mock()
+    monkeypatch.setattr(main, "get_event_parser", lambda: parser)
+    return parser
+
+
+def _parse(client):
+    # Unique text so neither the response cache nor the short input fast path answers
+    text = f"Lunch with Sarah at Cafe Roma on Friday at noon {uuid.uuid4().hex}"
+    return client.post("/parse", json={"text": text, "use_llm_enhancement": True})
+
+
+class TestParseCancellation:
+    """Test that abandoned parses are cancelled."""
+
+    def test_disconnect_cancels_async_parse(self, client, parser, client_gone, cancellations):
+        cancelled = []
+
+        async def slow_parse(**kwargs):
+            client_gone.set()
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        parser.parse_text_enhanced_async = slow_parse
+
+        start = time.perf_counter()
+        response = _parse(client)
+
+        assert response.status_code == 499
+        assert time.perf_counter() - start < 2
+        assert cancelled == [True]
+        cancellations.assert_called_once_with('client_disconnect')
+
+    def test_connected_client_gets_the_parse(self, client, parser, client_gone, cancellations):
+        parser.parse_text_enhanced_async = AsyncMock(return_value=ParsedEvent(title="Lunch", confidence_score=0.9))
+
+        response = _parse(client)
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Lunch"
+        cancellations.assert_not_called()
+
+    def test_disconnect_stops_parse_thread(self, client, parser, client_gone, cancellations, monkeypatch):
+        monkeypatch.setattr(main.get_async_pipeline().config, "enabled", False)
+        stopped = threading.Event()
+
+        def slow_parse(**kwargs):
+            client_gone.set()
+            deadline = time.monotonic() + 5
+            try:
+                while time.monotonic() < deadline:
+                    check_cancelled()
+                    time.sleep(0.01)
+            except ParseCancelled:
+                stopped.set()
+                raise
+
+        parser.parse_text_enhanced.side_effect = slow_parse
+
+        assert _parse(client).status_code == 499
+        assert stopped.wait(2)
+        cancellations.assert_called_once_with('client_disconnect')
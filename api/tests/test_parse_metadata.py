@@ -0,0 +1,60 @@
+"""
+Tests for lean parse metadata on the /parse endpoint.
+"""
+
+import itertools
+import sys
+import uuid
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from models.event_models import ParsedEvent
+
+# The module defining the endpoints: app.main or api.app.main, depending on the rootdir
+main = sys.modules[next(route.endpoint for route in app.routes if getattr(route, "path", None) == "/parse").__module__]
+
+# Distinct client IPs so the shared rate limiter does not throttle these tests
+_client_ips = (f"10.43.0.{n}" for n in itertools.count(1))
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, headers={"X-Forwarded-For": next(_client_ips)})
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    parser = Mock()
+    parser.parse_text.return_value = ParsedEvent(
+        title="Lunch", start_datetime=datetime(2025, 10, 3, 12, 0), confidence_score=0.9,
+        extraction_metadata={'parsing_path': 'regex_only'}
+    )
+    monkeypatch.setattr(main, "get_event_parser", lambda: parser)
+    return parser
+
+
+def _parse(client, mode=None):
+    # Unique text so the response cache never answers
+    text = f"Lunch on Friday at noon {uuid.uuid4().hex}"
+    params = {"mode": mode} if mode else None
+    return client.post("/parse", params=params, json={"text": text, "use_llm_enhancement": False})
+
+
+class TestLeanParseMetadata:
+    """Test which requests skip debug metadata."""
+
+    def test_normal_requests_are_lean(self, client, parser):
+        assert _parse(client).status_code == 200
+
+        assert parser.parse_text.call_args.kwargs["lean_metadata"] is True
+
+    def test_audit_requests_get_full_metadata(self, client, parser):
+        response = _parse(client, mode="audit")
+
+        assert response.status_code == 200
+        assert parser.parse_text.call_args.kwargs["lean_metadata"] is False
+        assert response.json()["parsing_metadata"]["routing_decisions"]["parsing_method"] == "regex_only"
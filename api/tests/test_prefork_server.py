@@ -0,0 +1,112 @@
+"""
+Tests for the pre-fork server mode in api/app/server.py.
+"""
+
+import gc
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+
+from api.app.server import RespawnBackoff, create_listen_socket, prefork_supported, warm_up_master
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytestmark = pytest.mark.skipif(not prefork_supported(), reason="pre-fork mode requires os.fork")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_healthz(port: int, timeout: float = 60.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/healthz", timeout=1.0).status_code == 204:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    return False
+
+
+def _child_pids(pid: int) -> list:
+    result = subprocess.run(["ps", "--ppid", str(pid), "-o", "pid="], capture_output=True, text=True)
+    return [int(line) for line in result.stdout.split()]
+
+
+class TestPreforkHelpers:
+    """Unit tests for master-side helpers."""
+
+    def test_listen_socket_is_inheritable(self):
+        sock = create_listen_socket("127.0.0.1", 0)
+        try:
+            assert sock.get_inheritable()
+            assert sock.getsockname()[1] > 0
+        finally:
+            sock.close()
+
+    def test_warm_up_master_builds_parser_and_freezes_heap(self):
+        from services.startup_optimizer import get_startup_optimizer
+
+        try:
+            app = warm_up_master()
+
+            assert app is not None
+            assert get_startup_optimizer().get_import_report()['event_parser']['loaded']
+            assert gc.get_freeze_count() > 0
+            # LLM HTTP clients are built in the workers, not warmed in the master
+            assert 'llm_service' not in get_startup_optimizer().performance_optimizer.model_warmup.warm_up_results
+        finally:
+            gc.unfreeze()
+
+    def test_respawn_backoff_grows_for_crashing_workers(self):
+        backoff = RespawnBackoff(initial_s=0.5, max_s=4.0, stable_after_s=10.0)
+
+        assert [backoff.next_delay(0.1) for _ in range(5)] == [0.5, 1.0, 2.0, 4.0, 4.0]
+        assert backoff.next_delay(60.0) == 0.0
+        assert backoff.next_delay(0.1) == 0.5
+
+
+class TestPreforkServer:
+    """End-to-end test of the pre-fork master and its workers."""
+
+    def test_serves_restarts_workers_and_shuts_down(self):
+        port = _free_port()
+        master = subprocess.Popen(
+            [sys.executable, "-m", "api.app.server", "--prefork", "--workers", "2",
+             "--host", "127.0.0.1", "--port", str(port)],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            assert _wait_for_healthz(port), "pre-fork server did not come up"
+            workers = _child_pids(master.pid)
+            assert len(workers) == 2
+
+            # A killed worker is replaced from the warm master
+            os.kill(workers[0], signal.SIGKILL)
+            deadline = time.time() + 10
+            while time.time() < deadline:
+                replacement = _child_pids(master.pid)
+                if len(replacement) == 2 and workers[0] not in replacement:
+                    break
+                time.sleep(0.1)
+            assert len(replacement) == 2 and workers[0] not in replacement
+            assert _wait_for_healthz(port, timeout=10)
+
+            master.send_signal(signal.SIGTERM)
+            assert master.wait(timeout=20) == 0
+        finally:
+            if master.poll() is None:
+                master.kill()
+                master.wait()
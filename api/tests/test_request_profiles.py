@@ -0,0 +1,54 @@
+"""
+Tests for the /admin/profiles request profile endpoints.
+"""
+
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+import services.request_profiler as request_profiler
+from services.request_profiler import ProfilerConfig, RequestProfiler
+
+# Distinct client IPs so the shared rate limiter does not throttle these tests
+_client_ips = (f"10.35.0.{n}" for n in itertools.count(1))
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, headers={"X-Forwarded-For": next(_client_ips)})
+
+
+@pytest.fixture
+def profiler(tmp_path, monkeypatch):
+    profiler = RequestProfiler(ProfilerConfig(
+        enabled=True, sample_every=1, slow_threshold_ms=0, directory=str(tmp_path)
+    ))
+    monkeypatch.setattr(request_profiler, "_request_profiler", profiler)
+    return profiler
+
+
+class TestRequestProfileEndpoints:
+    """Test listing and downloading captured profiles."""
+
+    def test_sampled_parse_is_listed_and_downloadable(self, client, profiler):
+        parsed = client.post("/parse", json={"text": "Lunch with Sam on Friday at noon", "use_llm_enhancement": False})
+        assert parsed.status_code == 200
+
+        listing = client.get("/admin/profiles").json()
+        assert listing["enabled"] is True
+        assert listing["captured"]["sampled"] == 1
+        profile = listing["profiles"][0]
+        assert profile["trigger"] == "sampled"
+        assert profile["request_id"] == parsed.headers["x-request-id"]
+
+        download = client.get(f"/admin/profiles/{profile['name']}")
+        assert download.status_code == 200
+        assert len(download.content) == profile["size_bytes"]
+
+    def test_unknown_profile_is_404(self, client, profiler):
+        response = client.get("/admin/profiles/20250101T000000000-slow-5ms-missing.folded")
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "PROFILE_NOT_FOUND"
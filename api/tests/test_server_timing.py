@@ -0,0 +1,65 @@
+"""
+Tests for the Server-Timing stage breakdown on API responses.
+"""
+
+import itertools
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+# Distinct client IPs so the shared rate limiter does not throttle these tests
+_client_ips = (f"10.34.0.{n}" for n in itertools.count(1))
+
+
+def _timings(header: str):
+    entries = {}
+    for entry in header.split(", "):
+        name, _, duration = entry.partition(";dur=")
+        entries[name] = float(duration)
+    return entries
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, headers={"X-Forwarded-For": next(_client_ips)})
+
+
+class TestServerTiming:
+    """Test the Server-Timing header."""
+
+    def test_parse_reports_stage_breakdown(self, client):
+        response = client.post("/parse", json={
+            "text": "Team standup tomorrow at 9am in Room 4",
+            "use_llm_enhancement": False
+        })
+
+        assert response.status_code == 200
+        timings = _timings(response.headers["server-timing"])
+        assert "total" in timings
+        assert "serialization" in timings
+        assert "regex" in timings
+        stages = sum(duration for name, duration in timings.items() if name != "total")
+        assert stages <= timings["total"]
+
+    def test_header_exposed_to_browsers(self, client):
+        response = client.get("/health", headers={"Origin": "https://example.com"})
+
+        assert "Server-Timing" in response.headers["access-control-expose-headers"]
+        assert "total;dur=" in response.headers["server-timing"]
+
+    def test_disabled_middleware_passes_through(self):
+        from fastapi import FastAPI
+        from api.app.middleware import StageTimingMiddleware
+
+        recorded = []
+        plain = FastAPI()
+        plain.get("/ping")(lambda: {"ok": True})
+        plain.add_middleware(StageTimingMiddleware, enabled=False, on_complete=recorded.append)
+
+        response = TestClient(plain).get("/ping")
+
+        assert response.status_code == 200
+        assert "server-timing" not in response.headers
+        assert recorded == []
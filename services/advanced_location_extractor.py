@@ -8,6 +8,15 @@ from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from services.keyword_prefilter import get_keyword_prefilter
+from services.regex_guard import guard_pattern
+
+NAMED_LOCATION_KEYWORDS = (
+    'Square|Plaza|Center|Centre|Market|Mall|Park|Building|Tower|Complex|Hall|Stadium|Arena|'
+    'Theatre|Theater|Hospital|Clinic|School|University|College|Library|Museum|Gallery|Station|'
+    'Terminal|Airport'
+)
+
 
 class LocationType(Enum):
     """Types of locations that can be extracted."""
@@ -68,6 +77,7 @@ class AdvancedLocationExtractor:
     
     def __init__(self):
         self._compile_patterns()
+        self._setup_pattern_triggers()
     
     def _compile_patterns(self):
         """Compile regex patterns and keyword lists for comprehensive location extraction."""
@@ -80,10 +90,15 @@ class AdvancedLocationExtractor:
                 re.IGNORECASE
             ),
             
-            # Named locations (squares, centers, etc.)
-            'named_location': re.compile(
-                r'\b([A-Z][A-Za-z\s&\']+(?:Square|Plaza|Center|Centre|Market|Mall|Park|Building|Tower|Complex|Hall|Stadium|Arena|Theatre|Theater|Hospital|Clinic|School|University|College|Library|Museum|Gallery|Station|Terminal|Airport))\b',
-                re.IGNORECASE
+            # Named locations (squares, centers, etc.). The name span is bounded
+            # because an unbounded one backtracks quadratically on long text, and
+            # the pattern only runs when a venue keyword occurs at all.
+            'named_location': guard_pattern(
+                re.compile(
+                    r'\b([A-Z][A-Za-z\s&\']{1,80}(?:' + NAMED_LOCATION_KEYWORDS + r'))\b',
+                    re.IGNORECASE
+                ),
+                prefilter=re.compile(r'(?:' + NAMED_LOCATION_KEYWORDS + r')\b', re.IGNORECASE)
             ),
             
             # Canadian postal codes
@@ -319,11 +334,33 @@ class AdvancedLocationExtractor:
         
         return locations
     
+    def _setup_pattern_triggers(self):
+        """Keyword prefilter triggers required by the venue and implicit patterns."""
+        self.prefilter = get_keyword_prefilter()
+        triggers = {
+            'room_patterns': ('room',),
+            'building_patterns': ('building',),
+            'floor_patterns': ('floor',),
+            'office_patterns': ('office',),
+            'workplace': ('workplace',),
+            'educational': ('education',),
+            'home': ('home',),
+            'generic_places': ('generic_place',)
+        }
+        self.pattern_triggers = {name: self.prefilter.mask(*groups) for name, groups in triggers.items()}
+    
+    def _triggered_patterns(self, patterns: Dict[str, Any], text: str):
+        """Patterns whose trigger keywords occur in text; the others cannot match."""
+        bits = self.prefilter.scan(text)
+        for pattern_name, pattern in patterns.items():
+            if bits & self.pattern_triggers.get(pattern_name, -1):
+                yield pattern_name, pattern
+    
     def _extract_venue_locations(self, text: str) -> List[LocationResult]:
         """Extract venue-based locations using keyword recognition."""
         locations = []
         
-        for pattern_name, pattern in self.venue_patterns.items():
+        for pattern_name, pattern in self._triggered_patterns(self.venue_patterns, text):
             for match in pattern.finditer(text):
                 location_text = match.group(1).strip()
                 
@@ -347,7 +384,7 @@ class AdvancedLocationExtractor:
         """Extract implicit location references."""
         locations = []
         
-        for pattern_name, pattern in self.implicit_patterns.items():
+        for pattern_name, pattern in self._triggered_patterns(self.implicit_patterns, text):
             for match in pattern.finditer(text):
                 location_text = match.group(1).strip()
                 
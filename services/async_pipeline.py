@@ -0,0 +1,199 @@
+"""
+Async parsing pipeline primitives.
+
+The parse pipeline mixes CPU-bound stages (regex extraction, field routing,
+aggregation) with I/O-bound LLM calls. Run synchronously in executor threads,
+every in-flight request pins a thread for its whole LLM round trip, so LLM
+latency caps concurrency at the thread pool size.
+
+The async pipeline (EventParser.parse_text_enhanced_async down to the LLM
+enhancers' *_async methods) keeps the event loop for I/O and hands CPU work
+off explicitly:
+- run_cpu runs a CPU stage on a small bounded pool, with the request context
+  (stage timings, regex CPU budget) carried over to the worker thread
+- post_json awaits an LLM HTTP call on the loop through one shared httpx
+  connection pool, so thousands of LLM-bound requests can be in flight on a
+  handful of threads
+- run_blocking_io is the escape hatch for providers without an HTTP API
+  (local models, the micro-batcher), which still block a thread
+
+HTTP clients hold pooled connections, so none is shared across fork (the
+pre-fork server mode): each process builds its own on first use, see
+ProcessLocalClient.
+
+Cancelling the awaiting task (request timeout, client disconnect) aborts the
+in-flight HTTP request and no later stage starts; a CPU stage that is already
+running stops at its next cancellation check (see services.cancellation),
+since threads cannot be interrupted.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from services.cancellation import check_cancelled
+from services.env_config import env_bool, env_int
+from services.regex_guard import regex_budget_segment
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AsyncPipelineConfig:
+    """Async pipeline settings (see from_env for the environment variables)."""
+    enabled: bool = True
+    cpu_workers: int = min(4, os.cpu_count() or 1)  # CPU stages hold the GIL; more threads only queue
+    max_connections: int = 256                      # concurrent LLM HTTP requests; more wait for a connection
+
+    @classmethod
+    def from_env(cls) -> 'AsyncPipelineConfig':
+        """Build config from ASYNC_PIPELINE_* environment variables."""
+        return cls(
+            enabled=env_bool('ASYNC_PIPELINE_ENABLED', True),
+            cpu_workers=max(1, env_int('ASYNC_PIPELINE_CPU_WORKERS', cls.cpu_workers)),
+            max_connections=max(1, env_int('ASYNC_PIPELINE_MAX_CONNECTIONS', cls.max_connections)),
+        )
+
+
+class ProcessLocalClient:
+    """
+    Client built on first use in each process.
+
+    A client inherited across fork would share its pooled sockets with the
+    parent and sibling workers, so a forked process builds its own.
+
+    Args:
+        factory: Builds the client
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._client = None
+        self._pid: Optional[int] = None
+
+    def get(self) -> Any:
+        """This process's client."""
+        if self._client is None or self._pid != os.getpid():
+            self._client = self._factory()
+            self._pid = os.getpid()
+        return self._client
+
+
+class AsyncPipeline:
+    """
+    CPU pool and HTTP client shared by the async parsing pipeline.
+
+    Args:
+        config: Pipeline settings
+    """
+
+    def __init__(self, config: Optional[AsyncPipelineConfig] = None):
+        self.config = config or AsyncPipelineConfig.from_env()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._http_client = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http_client_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Bounded pool for CPU stages, created on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.config.cpu_workers, thread_name_prefix='parse-cpu'
+                    )
+        return self._executor
+
+    async def run_cpu(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a CPU stage on the CPU pool in a copy of the current context."""
+        context = contextvars.copy_context()
+        call = functools.partial(_run_segment, func, args, kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, context.run, call)
+
+    async def run_blocking_io(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking I/O call on the loop's default executor in a copy of the current context."""
+        context = contextvars.copy_context()
+        call = functools.partial(func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(None, context.run, call)
+
+    def http_client(self):
+        """The running loop's shared httpx.AsyncClient (one per loop and process, since connections are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        if (self._http_client is None or self._http_client_loop is not loop or self._http_client.is_closed
+                or self._http_client_pid != os.getpid()):
+            import httpx
+            self._http_client = httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=min(self.config.max_connections, 32)
+            ))
+            self._http_client_loop = loop
+            self._http_client_pid = os.getpid()
+        return self._http_client
+
+    async def post_json(self, url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None,
+                        timeout: float = 30.0) -> Tuple[int, Any]:
+        """
+        POST a JSON payload and await the response.
+
+        Returns:
+            Tuple of (status code, decoded JSON body); the body is None unless the status is 200
+        """
+        response = await self.http_client().post(url, json=payload, headers=headers, timeout=timeout)
+        if response.status_code != 200:
+            return response.status_code, None
+        return response.status_code, response.json()
+
+    async def aclose(self):
+        """Close the HTTP client and shut the CPU pool down (application shutdown)."""
+        client, self._http_client = self._http_client, None
+        if client is not None and self._http_client_loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._http_client_loop = None
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def _run_segment(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+    # A stage queued behind others may start after its parse was abandoned
+    check_cancelled()
+    # Charge the stage's thread CPU time to the parse's regex budget on this worker
+    with regex_budget_segment():
+        return func(*args, **kwargs)
+
+
+# Global instance
+_async_pipeline: Optional[AsyncPipeline] = None
+
+
+def get_async_pipeline() -> AsyncPipeline:
+    """Get the global async pipeline."""
+    global _async_pipeline
+    if _async_pipeline is None:
+        _async_pipeline = AsyncPipeline()
+    return _async_pipeline
+
+
+async def run_cpu(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a CPU stage on the global pipeline's CPU pool."""
+    return await get_async_pipeline().run_cpu(func, *args, **kwargs)
+
+
+async def run_blocking_io(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking I/O call off the event loop."""
+    return await get_async_pipeline().run_blocking_io(func, *args, **kwargs)
+
+
+async def post_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None,
+                    timeout: float = 30.0) -> Tuple[int, Any]:
+    """POST JSON through the global pipeline's shared HTTP client."""
+    return await get_async_pipeline().post_json(url, payload, headers, timeout)
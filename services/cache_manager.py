@@ -6,6 +6,7 @@ This module implements the CacheManager class that provides:
 - 24-hour TTL with automatic cleanup
 - Cache hit/miss tracking and performance metrics
 - Thread-safe operations for concurrent access
+- Hit/miss latency quantiles over rolling windows via streaming sketches
 """
 
 import hashlib
@@ -17,6 +18,10 @@ from typing import Dict, Optional, Tuple, List, Any
 from dataclasses import dataclass, field
 
 from models.event_models import ParsedEvent, CacheEntry
+from services.quantile_sketch import WindowedSketch
+
+# Rolling window used for the latency fields of CacheStats
+CACHE_STATS_WINDOW = '1h'
 
 
 @dataclass
@@ -30,6 +35,10 @@ class CacheStats:
     memory_usage_bytes: int = 0
     average_hit_time_ms: float = 0.0
     average_miss_time_ms: float = 0.0
+    p95_hit_time_ms: float = 0.0
+    p99_hit_time_ms: float = 0.0
+    p95_miss_time_ms: float = 0.0
+    p99_miss_time_ms: float = 0.0
     
     @property
     def hit_rate(self) -> float:
@@ -55,7 +64,11 @@ class CacheStats:
             'expired_entries_cleaned': self.expired_entries_cleaned,
             'memory_usage_bytes': self.memory_usage_bytes,
             'average_hit_time_ms': round(self.average_hit_time_ms, 2),
-            'average_miss_time_ms': round(self.average_miss_time_ms, 2)
+            'average_miss_time_ms': round(self.average_miss_time_ms, 2),
+            'p95_hit_time_ms': round(self.p95_hit_time_ms, 2),
+            'p99_hit_time_ms': round(self.p99_hit_time_ms, 2),
+            'p95_miss_time_ms': round(self.p95_miss_time_ms, 2),
+            'p99_miss_time_ms': round(self.p99_miss_time_ms, 2)
         }
 
 
@@ -91,8 +104,8 @@ class CacheManager:
         
         # Performance tracking
         self._stats = CacheStats()
-        self._hit_times: List[float] = []
-        self._miss_times: List[float] = []
+        self._hit_times = WindowedSketch()
+        self._miss_times = WindowedSketch()
         
         # Cleanup tracking
         self._last_cleanup = datetime.now()
@@ -222,24 +235,13 @@ class CacheManager:
         with self._lock:
             self._stats.total_requests += 1
             
+            # Averages and percentiles are computed from the sketches in get_stats()
             if is_hit:
                 self._stats.cache_hits += 1
-                self._hit_times.append(processing_time_ms)
-                
-                # Keep only recent hit times for average calculation
-                if len(self._hit_times) > 1000:
-                    self._hit_times = self._hit_times[-1000:]
-                
-                self._stats.average_hit_time_ms = sum(self._hit_times) / len(self._hit_times)
+                self._hit_times.add(processing_time_ms)
             else:
                 self._stats.cache_misses += 1
-                self._miss_times.append(processing_time_ms)
-                
-                # Keep only recent miss times for average calculation
-                if len(self._miss_times) > 1000:
-                    self._miss_times = self._miss_times[-1000:]
-                
-                self._stats.average_miss_time_ms = sum(self._miss_times) / len(self._miss_times)
+                self._miss_times.add(processing_time_ms)
     
     def _estimate_memory_usage(self) -> int:
         """
@@ -431,6 +433,9 @@ class CacheManager:
             self._stats.memory_usage_bytes = self._estimate_memory_usage()
             self._stats.total_entries = len(self._cache)
             
+            hit_stats = self._hit_times.get_stats(CACHE_STATS_WINDOW)
+            miss_stats = self._miss_times.get_stats(CACHE_STATS_WINDOW)
+            
             # Return a copy of stats
             return CacheStats(
                 total_requests=self._stats.total_requests,
@@ -439,8 +444,12 @@ class CacheManager:
                 total_entries=self._stats.total_entries,
                 expired_entries_cleaned=self._stats.expired_entries_cleaned,
                 memory_usage_bytes=self._stats.memory_usage_bytes,
-                average_hit_time_ms=self._stats.average_hit_time_ms,
-                average_miss_time_ms=self._stats.average_miss_time_ms
+                average_hit_time_ms=hit_stats['mean'],
+                average_miss_time_ms=miss_stats['mean'],
+                p95_hit_time_ms=hit_stats['p95'],
+                p99_hit_time_ms=hit_stats['p99'],
+                p95_miss_time_ms=miss_stats['p95'],
+                p99_miss_time_ms=miss_stats['p99']
             )
     
     def get_cache_info(self) -> Dict[str, Any]:
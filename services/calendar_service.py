@@ -4,13 +4,42 @@ Provides interface for event management with validation and error handling.
 """
 
 import json
+import logging
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from models.event_models import Event, ValidationResult
+from services.event_index import EventIntervalIndex
+from services.event_journal import EventJournal, OP_CREATE, OP_DELETE
 from ui.safe_input import safe_input, is_non_interactive, confirm_action, get_choice
 
+logger = logging.getLogger(__name__)
+
+# Storage backends: 'json' rewrites storage_path on every change, 'journal'
+# appends changes to <storage_path>.journal and compacts into storage_path
+STORAGE_BACKENDS = ('json', 'journal')
+DEFAULT_STORAGE_BACKEND = 'json'
+
+
+def get_storage_backend(storage_backend: Optional[str] = None) -> str:
+    """
+    Resolve the calendar storage backend.
+
+    Args:
+        storage_backend: Explicit backend, or None to read CALENDAR_STORAGE_BACKEND
+
+    Returns:
+        One of STORAGE_BACKENDS (unknown values fall back to the default)
+    """
+    backend = (storage_backend or os.getenv('CALENDAR_STORAGE_BACKEND', DEFAULT_STORAGE_BACKEND)).strip().lower()
+    if backend not in STORAGE_BACKENDS:
+        logger.warning(f"Unknown calendar storage backend '{backend}', using '{DEFAULT_STORAGE_BACKEND}'")
+        return DEFAULT_STORAGE_BACKEND
+    return backend
+
 
 class CalendarServiceError(Exception):
     """Base exception for calendar service errors."""
@@ -36,22 +65,42 @@ class CalendarService:
     like Google Calendar, Outlook, or other calendar systems.
     """
     
-    def __init__(self, storage_path: str = "calendar_events.json", max_retries: int = 3):
+    def __init__(self, storage_path: str = "calendar_events.json", max_retries: int = 3,
+                 storage_backend: Optional[str] = None, compact_threshold: int = 1000):
         """
         Initialize the calendar service.
         
         Args:
             storage_path: Path to the file where events will be stored
             max_retries: Maximum number of retry attempts for failed operations
+            storage_backend: 'json' or 'journal' (defaults to CALENDAR_STORAGE_BACKEND or 'json')
+            compact_threshold: Journal records between compactions (journal backend only)
         """
         self.storage_path = Path(storage_path)
         self.default_calendar_id = "default"
         self.max_retries = max_retries
+        self.storage_backend = get_storage_backend(storage_backend)
+        
+        # In-memory interval index over stored events, rebuilt when the file changes
+        self._index: Optional[EventIntervalIndex] = None
+        self._index_signature: Optional[tuple] = None
+        
+        # Journal backend state: the journal, this service's read position, and
+        # the in-process lock (flock alone does not serialize threads sharing a service)
+        self._journal: Optional[EventJournal] = None
+        if self.storage_backend == 'journal':
+            self._journal = EventJournal(self.storage_path, compact_threshold=compact_threshold)
+        self._journal_cursor = None
+        self._thread_lock = threading.RLock()
+        self._write_lock_depth = 0
+        
         self._ensure_storage_exists()
     
     def _ensure_storage_exists(self):
         """Ensure the storage file exists and is properly formatted."""
-        if not self.storage_path.exists():
+        if self._journal is not None:
+            self._journal.ensure_snapshot()
+        elif not self.storage_path.exists():
             self._save_events([])
     
     def _load_events(self) -> List[Dict[str, Any]]:
@@ -70,6 +119,103 @@ class CalendarService:
         except IOError as e:
             raise EventCreationError(f"Failed to save events: {e}")
     
+    def _storage_signature(self) -> Optional[tuple]:
+        """Get a cheap fingerprint of the storage file (mtime and size)."""
+        try:
+            stat = self.storage_path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def _get_index(self) -> EventIntervalIndex:
+        """
+        Get the event index, rebuilding it only if the storage file changed
+        since it was last loaded or written by this service.
+        
+        With the journal backend, only journal records appended since the last
+        call (by any process) are applied.
+        """
+        if self._journal is not None:
+            with self._thread_lock:
+                if self._write_lock_depth:
+                    return self._sync_journal()
+                with self._journal.locked(exclusive=False):
+                    return self._sync_journal()
+        
+        signature = self._storage_signature()
+        if self._index is None or signature != self._index_signature:
+            self._index = EventIntervalIndex.from_events(self._load_events())
+            self._index_signature = signature
+        return self._index
+    
+    def _save_index(self, index: EventIntervalIndex):
+        """Persist the index's events and record the resulting file signature."""
+        self._save_events(index.events())
+        self._index_signature = self._storage_signature()
+    
+    @contextmanager
+    def _storage_lock(self):
+        """
+        Serialize a read-modify-write of storage.
+        
+        With the journal backend this holds the exclusive file lock, so the index
+        read inside the block is current across processes.
+        """
+        with self._thread_lock:
+            if self._journal is None or self._write_lock_depth:
+                self._write_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._write_lock_depth -= 1
+                return
+            
+            with self._journal.locked(exclusive=True):
+                self._write_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._write_lock_depth -= 1
+    
+    def _sync_journal(self) -> EventIntervalIndex:
+        """Apply journal changes since this service's cursor. Call with the lock held."""
+        replay = self._journal.read(self._journal_cursor)
+        if replay.snapshot is not None:
+            self._index = EventIntervalIndex.from_events(replay.snapshot)
+        
+        # Replay is idempotent by ID: a compaction interrupted after the snapshot
+        # was replaced leaves records in the journal that the snapshot already holds
+        for record in replay.records:
+            if record['op'] == OP_CREATE and isinstance(record.get('event'), dict):
+                self._index.put(record['event'])
+            elif record['op'] == OP_DELETE:
+                self._index.remove(record.get('id'))
+        
+        self._journal_cursor = replay.cursor
+        return self._index
+    
+    def _append_records(self, records: List[Dict[str, Any]]):
+        """
+        Append records to the journal and apply them. Call inside _storage_lock().
+        
+        Raises:
+            EventCreationError: If the journal cannot be written
+        """
+        try:
+            for record in records:
+                self._journal.append(record)
+        except (IOError, OSError) as e:
+            raise EventCreationError(f"Failed to save events: {e}")
+        
+        index = self._sync_journal()
+        
+        if self._journal.needs_compaction(self._journal_cursor):
+            try:
+                self._journal_cursor = self._journal.compact(index.events())
+            except (IOError, OSError) as e:
+                # The journal still holds the changes; compaction is retried on the next write
+                logger.warning(f"Calendar journal compaction failed: {e}")
+    
     def validate_event(self, event: Event) -> ValidationResult:
         """
         Validate an event before creation.
@@ -137,25 +283,34 @@ class CalendarService:
             raise EventValidationError(error_msg)
         
         try:
-            # Load existing events
-            events = self._load_events()
-            
-            # Check for conflicts (optional warning)
-            conflicts = self._check_conflicts(event, events)
-            conflict_warnings = []
-            if conflicts:
-                conflict_warnings = [f"Conflicts with existing event: {c.get('title', 'Unknown')}" for c in conflicts[:3]]
-                if len(conflicts) > 3:
-                    conflict_warnings.append(f"... and {len(conflicts) - 3} more conflicts")
-            
-            # Add the new event
-            event_id = self._generate_event_id()
-            event_data = event.to_dict()
-            event_data['id'] = event_id
-            events.append(event_data)
-            
-            # Save updated events
-            self._save_events(events)
+            with self._storage_lock():
+                # Load existing events (index is reused unless the file changed)
+                index = self._get_index()
+                
+                # Check for conflicts (optional warning)
+                conflicts = self._check_conflicts(event)
+                conflict_warnings = []
+                if conflicts:
+                    conflict_warnings = [f"Conflicts with existing event: {c.get('title', 'Unknown')}" for c in conflicts[:3]]
+                    if len(conflicts) > 3:
+                        conflict_warnings.append(f"... and {len(conflicts) - 3} more conflicts")
+                
+                # Add the new event
+                event_id = self._generate_event_id()
+                event_data = event.to_dict()
+                event_data['id'] = event_id
+                
+                if self._journal is not None:
+                    self._append_records([{'op': OP_CREATE, 'event': event_data}])
+                else:
+                    index.add(event_data)
+                    
+                    # Save updated events, dropping the in-memory copy if the write fails
+                    try:
+                        self._save_index(index)
+                    except Exception:
+                        index.remove(event_id)
+                        raise
             
             # Create success message
             success_msg = self._create_success_message(event, event_id, conflict_warnings)
@@ -170,34 +325,25 @@ class CalendarService:
         """Generate a unique event ID."""
         return f"event_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
     
-    def _check_conflicts(self, new_event: Event, existing_events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _check_conflicts(self, new_event: Event,
+                         existing_events: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Check for scheduling conflicts with existing events.
         
         Args:
             new_event: The event to check for conflicts
-            existing_events: List of existing events
+            existing_events: Optional list of events to check against
+                (defaults to the stored events, via the interval index)
             
         Returns:
-            List of conflicting events
+            List of conflicting events (malformed events are skipped)
         """
-        conflicts = []
-        
-        for existing in existing_events:
-            try:
-                existing_start = datetime.fromisoformat(existing['start_datetime'])
-                existing_end = datetime.fromisoformat(existing['end_datetime'])
-                
-                # Check for overlap
-                if (new_event.start_datetime < existing_end and 
-                    new_event.end_datetime > existing_start):
-                    conflicts.append(existing)
-                    
-            except (KeyError, ValueError):
-                # Skip malformed events
-                continue
+        if existing_events is None:
+            index = self._get_index()
+        else:
+            index = EventIntervalIndex.from_events(existing_events)
         
-        return conflicts
+        return index.overlapping(new_event.start_datetime, new_event.end_datetime)
     
     def _create_success_message(self, event: Event, event_id: str, conflict_warnings: List[str] = None) -> str:
         """
@@ -272,26 +418,17 @@ class CalendarService:
         Returns:
             List of events matching the criteria
         """
-        events_data = self._load_events()
         events = []
         
-        for event_data in events_data:
+        # The index applies the date filters and returns events sorted by start time
+        for event_data in self._get_index().in_range(start_date, end_date):
             try:
-                event = Event.from_dict(event_data)
-                
-                # Apply date filters if provided
-                if start_date and event.end_datetime < start_date:
-                    continue
-                if end_date and event.start_datetime > end_date:
-                    continue
-                
-                events.append(event)
-                
+                events.append(Event.from_dict(event_data))
             except (KeyError, ValueError):
                 # Skip malformed events
                 continue
         
-        return sorted(events, key=lambda e: e.start_datetime)
+        return events
     
     def delete_event(self, event_id: str) -> bool:
         """
@@ -303,16 +440,97 @@ class CalendarService:
         Returns:
             True if event was deleted, False if not found
         """
-        events = self._load_events()
-        original_count = len(events)
+        with self._storage_lock():
+            index = self._get_index()
+            
+            if self._journal is not None:
+                if event_id not in index:
+                    return False
+                self._append_records([{'op': OP_DELETE, 'id': event_id}])
+                return True
+            
+            removed = index.remove(event_id)
+            
+            if removed:
+                try:
+                    self._save_index(index)
+                except Exception:
+                    # Force a reload from storage so memory matches disk
+                    self._index = None
+                    raise
+                return True
         
-        events = [e for e in events if e.get('id') != event_id]
+        return False
+    
+    def export_events(self, path: Optional[str] = None) -> int:
+        """
+        Export all stored events as a JSON list.
         
-        if len(events) < original_count:
-            self._save_events(events)
-            return True
+        With the journal backend, exporting to storage_path (the default) compacts
+        the journal into it.
         
-        return False
+        Args:
+            path: Destination JSON file (defaults to storage_path)
+            
+        Returns:
+            Number of events exported
+        """
+        destination = Path(path) if path else self.storage_path
+        
+        with self._storage_lock():
+            index = self._get_index()
+            events = index.events()
+            
+            if destination.absolute() == self.storage_path.absolute():
+                if self._journal is not None:
+                    self._journal_cursor = self._journal.compact(events)
+                else:
+                    self._save_index(index)
+            else:
+                with open(destination, 'w', encoding='utf-8') as f:
+                    json.dump(events, f, indent=2, ensure_ascii=False)
+        
+        return len(events)
+    
+    def import_events(self, path: str) -> int:
+        """
+        Import events from a JSON list (the storage_path format) into storage.
+        
+        Args:
+            path: Source JSON file
+            
+        Returns:
+            Number of events imported
+            
+        Raises:
+            CalendarServiceError: If the file cannot be read or is not a list of events
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                events = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            raise CalendarServiceError(f"Failed to import events: {e}")
+        
+        if not isinstance(events, list) or not all(isinstance(e, dict) for e in events):
+            raise CalendarServiceError("Failed to import events: expected a JSON list of events")
+        
+        for event_data in events:
+            event_data.setdefault('id', self._generate_event_id())
+        
+        with self._storage_lock():
+            index = self._get_index()
+            if self._journal is not None:
+                self._append_records([{'op': OP_CREATE, 'event': e} for e in events])
+            else:
+                for event_data in events:
+                    index.add(event_data)
+                try:
+                    self._save_index(index)
+                except Exception:
+                    self._index = None
+                    raise
+        
+        return len(events)
     
     def get_storage_info(self) -> Dict[str, Any]:
         """
@@ -321,14 +539,16 @@ class CalendarService:
         Returns:
             Dictionary with storage information
         """
-        events = self._load_events()
-        
-        return {
+        info = {
             'storage_path': str(self.storage_path.absolute()),
-            'event_count': len(events),
+            'storage_backend': self.storage_backend,
+            'event_count': len(self._get_index()),
             'storage_exists': self.storage_path.exists(),
             'storage_size_bytes': self.storage_path.stat().st_size if self.storage_path.exists() else 0
         }
+        if self._journal is not None:
+            info.update(self._journal.get_info())
+        return info
     
     def create_event_with_retry(self, event: Event, interactive: bool = True) -> tuple[bool, str, Optional[str]]:
         """
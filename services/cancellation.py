@@ -0,0 +1,146 @@
+"""
+Cooperative cancellation of parse requests.
+
+When a client goes away mid-request (the browser extension popup closes, the
+mobile share sheet is dismissed) or the request times out, nobody will read
+the parse result, yet the parse would keep its worker thread and go on
+calling the LLM provider, retries included. The API gives each parse a
+CancellationToken and cancels it when the request is abandoned.
+
+Threads cannot be interrupted, so cancellation is cooperative: the pipeline
+calls check_cancelled() between stages and before each LLM call, and waits
+on LLM calls and retry pauses through wait_event() and sleep(), which return
+as soon as the token is cancelled. Once cancelled, the next check raises
+ParseCancelled, which unwinds the parse on whichever thread it is running.
+A provider request already on the wire finishes in the background, but
+nothing waits for it.
+
+The token lives in a context variable, so like stage timings and the regex
+CPU budget it follows the request into executor threads and async pipeline
+stages.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from services.env_config import env_float
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISCONNECT_POLL_MS = 100.0
+CHECK_INTERVAL_S = 0.05  # how often wait_event looks at the token
+
+
+def get_disconnect_poll_interval_s() -> float:
+    """How often /parse checks for a client disconnect, from PARSE_DISCONNECT_POLL_MS."""
+    return max(env_float('PARSE_DISCONNECT_POLL_MS', DEFAULT_DISCONNECT_POLL_MS), 1.0) / 1000.0
+
+
+class ParseCancelled(BaseException):
+    """
+    Raised at a cancellation check once the parse has been cancelled.
+
+    A BaseException, like asyncio.CancelledError, so the pipeline's
+    ``except Exception`` fallbacks let it unwind the parse instead of
+    degrading to a fallback result nobody will read.
+    """
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CancellationToken:
+    """Cancellation state of one parse, shared by all threads working on it."""
+
+    __slots__ = ('_event', 'reason')
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = 'cancelled'):
+        """Cancel the parse; the first reason given is kept."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Raise ParseCancelled if the parse has been cancelled."""
+        if self._event.is_set():
+            raise ParseCancelled(self.reason)
+
+
+_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    'cancellation_token', default=None
+)
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken] = None):
+    """
+    Make a token the current parse's cancellation token within the block.
+
+    Args:
+        token: Token to use (default: a new one)
+
+    Yields:
+        The CancellationToken
+    """
+    token = token or CancellationToken()
+    context_token = _token.set(token)
+    try:
+        yield token
+    finally:
+        _token.reset(context_token)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """The current parse's cancellation token, if any."""
+    return _token.get()
+
+
+def check_cancelled():
+    """Raise ParseCancelled if the current parse has been cancelled."""
+    token = _token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def wait_event(event: threading.Event, timeout: Optional[float]) -> bool:
+    """
+    threading.Event.wait that raises ParseCancelled once the current parse is cancelled.
+
+    Returns:
+        True if the event was set, False on timeout
+    """
+    token = _token.get()
+    if token is None:
+        return event.wait(timeout)
+    remaining = timeout
+    while True:
+        token.raise_if_cancelled()
+        interval = CHECK_INTERVAL_S if remaining is None else min(CHECK_INTERVAL_S, remaining)
+        if event.wait(interval):
+            return True
+        if remaining is not None:
+            remaining -= interval
+            if remaining <= 0:
+                return False
+
+
+def sleep(seconds: float):
+    """time.sleep that raises ParseCancelled as soon as the current parse is cancelled."""
+    token = _token.get()
+    if token is None:
+        time.sleep(seconds)
+    elif token._event.wait(seconds):
+        token.raise_if_cancelled()
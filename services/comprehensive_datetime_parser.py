@@ -9,6 +9,8 @@ from typing import Optional, Tuple, List, Dict, Any, Union
 from dataclasses import dataclass
 import calendar
 
+from services.relative_date_table import get_relative_date_tables
+
 
 @dataclass
 class DateTimeResult:
@@ -434,6 +436,7 @@ class ComprehensiveDateTimeParser:
         """Parse a relative date match."""
         try:
             today = date.today()
+            table = get_relative_date_tables().for_date(today)
             
             if pattern_name == 'today':
                 return {
@@ -447,7 +450,7 @@ class ComprehensiveDateTimeParser:
             
             elif pattern_name == 'tomorrow':
                 return {
-                    'date': today + timedelta(days=1),
+                    'date': table.resolve('days', 1),
                     'confidence': 0.98,
                     'method': 'relative',
                     'matched_text': match.group(0),
@@ -457,7 +460,7 @@ class ComprehensiveDateTimeParser:
             
             elif pattern_name == 'yesterday':
                 return {
-                    'date': today - timedelta(days=1),
+                    'date': table.resolve('days', -1),
                     'confidence': 0.98,
                     'method': 'relative',
                     'matched_text': match.group(0),
@@ -468,7 +471,7 @@ class ComprehensiveDateTimeParser:
             elif pattern_name == 'next_weekday':
                 weekday_name = match.group(1).lower()
                 target_weekday = self.weekday_names[weekday_name]
-                target_date = self._get_next_weekday(today, target_weekday)
+                target_date = table.resolve('next_weekday', weekday=target_weekday)
                 
                 return {
                     'date': target_date,
@@ -482,7 +485,7 @@ class ComprehensiveDateTimeParser:
             elif pattern_name == 'this_weekday':
                 weekday_name = match.group(1).lower()
                 target_weekday = self.weekday_names[weekday_name]
-                target_date = self._get_this_weekday(today, target_weekday)
+                target_date = table.resolve('this_weekday', weekday=target_weekday)
                 
                 return {
                     'date': target_date,
@@ -499,7 +502,7 @@ class ComprehensiveDateTimeParser:
                 
                 if days > 0:
                     return {
-                        'date': today + timedelta(days=days),
+                        'date': table.resolve('days', days),
                         'confidence': 0.9,
                         'method': 'relative',
                         'matched_text': match.group(0),
@@ -513,7 +516,7 @@ class ComprehensiveDateTimeParser:
                 
                 if weeks > 0:
                     return {
-                        'date': today + timedelta(weeks=weeks),
+                        'date': table.resolve('weeks', weeks),
                         'confidence': 0.9,
                         'method': 'relative',
                         'matched_text': match.group(0),
@@ -523,7 +526,7 @@ class ComprehensiveDateTimeParser:
             
             elif pattern_name == 'next_week':
                 return {
-                    'date': today + timedelta(weeks=1),
+                    'date': table.resolve('weeks', 1),
                     'confidence': 0.85,
                     'method': 'relative',
                     'matched_text': match.group(0),
@@ -532,12 +535,8 @@ class ComprehensiveDateTimeParser:
                 }
             
             elif pattern_name == 'end_of_month':
-                # Get last day of current month
-                last_day = calendar.monthrange(today.year, today.month)[1]
-                end_date = date(today.year, today.month, last_day)
-                
                 return {
-                    'date': end_date,
+                    'date': table.resolve('end_of_month', 0),
                     'confidence': 0.8,
                     'method': 'inferred',
                     'matched_text': match.group(0),
@@ -547,7 +546,7 @@ class ComprehensiveDateTimeParser:
             
             elif pattern_name == 'first_day_back':
                 # This is context-dependent, assume next Monday as a reasonable default
-                next_monday = self._get_next_weekday(today, 0)  # Monday = 0
+                next_monday = table.resolve('next_weekday', weekday=0)  # Monday = 0
                 
                 return {
                     'date': next_monday,
@@ -1040,20 +1039,12 @@ class ComprehensiveDateTimeParser:
         return None
     
     def _get_next_weekday(self, from_date: date, target_weekday: int) -> date:
-        """Get the next occurrence of a specific weekday."""
-        days_ahead = target_weekday - from_date.weekday()
-        if days_ahead <= 0:  # Target day already happened this week
-            days_ahead += 7
-        return from_date + timedelta(days=days_ahead)
+        """Get the next occurrence of a specific weekday (strictly after from_date)."""
+        return get_relative_date_tables().resolve('next_weekday', 0, target_weekday, from_date)
     
     def _get_this_weekday(self, from_date: date, target_weekday: int) -> date:
-        """Get the occurrence of a specific weekday in the current week."""
-        days_ahead = target_weekday - from_date.weekday()
-        if days_ahead < 0:  # Target day already happened this week, get next week
-            days_ahead += 7
-        elif days_ahead == 0:  # Target day is today
-            return from_date
-        return from_date + timedelta(days=days_ahead)
+        """Get the occurrence of a specific weekday in the current week (from_date itself if it matches)."""
+        return get_relative_date_tables().resolve('this_weekday', 0, target_weekday, from_date)
     
     def validate_extraction(self, result: DateTimeResult) -> Dict[str, Any]:
         """
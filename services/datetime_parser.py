@@ -27,6 +27,8 @@ from datetime import datetime, time, date, timedelta
 from typing import Optional, Tuple, List, Dict, Any
 from dataclasses import dataclass
 
+from services.relative_date_table import get_relative_date_tables
+
 
 @dataclass
 class DateTimeMatch:
@@ -714,6 +716,7 @@ class DateTimeParser:
         matches = []
         now = datetime.now()
         today = now.date()
+        table = get_relative_date_tables().for_date(today)
         
         for pattern_name, pattern in self.relative_date_patterns.items():
             for match in pattern.finditer(text):
@@ -726,11 +729,11 @@ class DateTimeParser:
                         confidence = 0.95
                     
                     elif pattern_name == 'tomorrow':
-                        date_obj = today + timedelta(days=1)
+                        date_obj = table.resolve('days', 1)
                         confidence = 0.95
                     
                     elif pattern_name == 'yesterday':
-                        date_obj = today - timedelta(days=1)
+                        date_obj = table.resolve('days', -1)
                         confidence = 0.95
                     
                     elif pattern_name == 'next_weekday':
@@ -747,12 +750,12 @@ class DateTimeParser:
                     
                     elif pattern_name == 'in_days':
                         days = int(match.group(1))
-                        date_obj = today + timedelta(days=days)
+                        date_obj = table.resolve('days', days)
                         confidence = 0.9
                     
                     elif pattern_name == 'in_weeks':
                         weeks = int(match.group(1))
-                        date_obj = today + timedelta(weeks=weeks)
+                        date_obj = table.resolve('weeks', weeks)
                         confidence = 0.9
                     
                     elif pattern_name == 'in_months':
@@ -762,12 +765,12 @@ class DateTimeParser:
                     
                     elif pattern_name == 'days_from_now':
                         days = int(match.group(1))
-                        date_obj = today + timedelta(days=days)
+                        date_obj = table.resolve('days', days)
                         confidence = 0.9
                     
                     elif pattern_name == 'weeks_from_now':
                         weeks = int(match.group(1))
-                        date_obj = today + timedelta(weeks=weeks)
+                        date_obj = table.resolve('weeks', weeks)
                         confidence = 0.9
                     
                     if date_obj:
@@ -878,28 +881,16 @@ class DateTimeParser:
         return None
     
     def _get_next_weekday(self, from_date: date, target_weekday: int) -> date:
-        """Get the next occurrence of a specific weekday."""
-        days_ahead = target_weekday - from_date.weekday()
-        if days_ahead <= 0:  # Target day already happened this week
-            days_ahead += 7
-        return from_date + timedelta(days=days_ahead)
+        """Get the next occurrence of a specific weekday (strictly after from_date)."""
+        return get_relative_date_tables().resolve('next_weekday', 0, target_weekday, from_date)
     
     def _get_this_weekday(self, from_date: date, target_weekday: int) -> date:
-        """Get the occurrence of a specific weekday in the current week."""
-        days_ahead = target_weekday - from_date.weekday()
-        if days_ahead < 0:  # Target day already happened this week, get next week
-            days_ahead += 7
-        elif days_ahead == 0:  # Target day is today
-            return from_date
-        return from_date + timedelta(days=days_ahead)
+        """Get the occurrence of a specific weekday in the current week (from_date itself if it matches)."""
+        return get_relative_date_tables().resolve('this_weekday', 0, target_weekday, from_date)
     
     def _add_months(self, start_date: date, months: int) -> date:
-        """Add months to a date, handling month boundaries correctly."""
-        month = start_date.month - 1 + months
-        year = start_date.year + month // 12
-        month = month % 12 + 1
-        day = min(start_date.day, self._days_in_month(year, month))
-        return date(year, month, day)
+        """Add months to a date, clamping the day to the target month's length."""
+        return get_relative_date_tables().resolve('months', months, 0, start_date)
     
     def _days_in_month(self, year: int, month: int) -> int:
         """Get the number of days in a specific month and year."""
@@ -0,0 +1,40 @@
+"""
+Environment variable parsing for service configuration.
+
+Service configs are read from the environment in their from_env classmethods.
+A malformed value logs a warning and falls back to the default rather than
+failing startup.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+
+def env_int(name: str, default: int) -> int:
+    """Integer environment variable, or the default if unset or invalid."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name}, using {default}")
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    """Float environment variable, or the default if unset or invalid."""
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Invalid {name}, using {default}")
+        return default
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Boolean environment variable (1/true/yes/on), or the default if unset."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in TRUE_VALUES
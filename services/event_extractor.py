@@ -7,6 +7,7 @@ import re
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from models.event_models import ParsedEvent
+from services.keyword_prefilter import get_keyword_prefilter
 
 
 @dataclass
@@ -29,6 +30,7 @@ class EventInformationExtractor:
     
     def __init__(self):
         self._compile_patterns()
+        self._setup_pattern_triggers()
     
     def _compile_patterns(self):
         """Compile regex patterns and keyword lists for information extraction."""
@@ -105,6 +107,41 @@ class EventInformationExtractor:
             re.compile(r'`([^`]+)`')
         ]
     
+    def _setup_pattern_triggers(self):
+        """Keyword prefilter triggers required by the title indicator and location keyword patterns."""
+        self.prefilter = get_keyword_prefilter()
+        triggers = {
+            'meeting': ('meet',),
+            'simple_meet': ('meet',),
+            'call': ('call',),
+            'appointment': ('appointment',),
+            'lunch': ('meal',),
+            'interview': ('interview',),
+            'presentation': ('presentation',),
+            'training': ('training',),
+            'conference': ('conference',)
+        }
+        self.title_triggers = {name: self.prefilter.mask(*groups) for name, groups in triggers.items()}
+        triggers = {
+            'at': ('at',),
+            'in': ('in',),
+            '@': ('at_sign',),
+            'location': ('location_label',),
+            'venue': ('location_label',),
+            'address': ('location_label',),
+            'room': ('room',),
+            'building': ('building',),
+            'office': ('office',)
+        }
+        self.location_triggers = {name: self.prefilter.mask(*groups) for name, groups in triggers.items()}
+    
+    def _triggered_patterns(self, patterns: Dict[str, Any], triggers: Dict[str, int], text: str):
+        """Patterns whose trigger keywords occur in text; the others cannot match."""
+        bits = self.prefilter.scan(text)
+        for name, pattern in patterns.items():
+            if bits & triggers.get(name, -1):
+                yield name, pattern
+    
     def extract_title(self, text: str) -> List[ExtractionMatch]:
         """
         Extract potential event titles from text using various heuristics.
@@ -118,7 +155,7 @@ class EventInformationExtractor:
         matches = []
         
         # Method 1: Extract using event type patterns
-        for event_type, pattern in self.title_indicators.items():
+        for event_type, pattern in self._triggered_patterns(self.title_indicators, self.title_triggers, text):
             for match in pattern.finditer(text):
                 title = match.group(1).strip()
                 # Clean up temporal words from the end of titles
@@ -221,7 +258,7 @@ class EventInformationExtractor:
         matches = []
         
         # Method 1: Extract using location keywords
-        for keyword, pattern in self.location_keywords.items():
+        for keyword, pattern in self._triggered_patterns(self.location_keywords, self.location_triggers, text):
             for match in pattern.finditer(text):
                 location = match.group(1).strip()
                 if self._is_valid_location(location):
@@ -0,0 +1,272 @@
+"""
+Interval index over stored calendar events.
+
+Keeps events sorted by start time so overlap (conflict) and date-range queries
+touch only the candidate slice instead of parsing every stored event:
+- Events up to `long_event_threshold` long live in a sorted start array. Any event
+  overlapping [start, end) must start after `start - max_duration`, which bounds
+  the slice that has to be checked.
+- Longer events (multi-day, all-week) are rare and kept in a separate list that is
+  always checked, so one outlier does not widen every query.
+
+Queries cost O(log n + k + L) for k matches and L long events. Inserts and deletes
+are O(log n) searches plus a list shift.
+"""
+
+import bisect
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple
+
+
+# Sort key for indexed events: (start, insertion sequence)
+IndexKey = Tuple[datetime, int]
+
+
+class EventIntervalIndex:
+    """
+    Sorted-start interval index for calendar event dictionaries.
+
+    Events are stored as the same dictionaries that are persisted to storage, in
+    insertion order, so the index can also serve as the in-memory event list.
+    Events whose datetimes cannot be parsed are retained (for persistence) but
+    never match a query.
+    """
+
+    def __init__(self, long_event_threshold: timedelta = timedelta(days=1)):
+        """
+        Initialize an empty index.
+
+        Args:
+            long_event_threshold: Events longer than this are kept out of the sorted array
+        """
+        self.long_event_threshold = long_event_threshold
+
+        # All events by insertion sequence (dicts preserve insertion order)
+        self._events: Dict[int, Dict[str, Any]] = {}
+        self._next_seq = 0
+
+        # Parsed (start, end) per indexed sequence
+        self._bounds: Dict[int, Tuple[datetime, datetime]] = {}
+
+        # Sequences per event ID (IDs are not guaranteed unique in legacy files)
+        self._seqs_by_id: Dict[str, List[int]] = {}
+
+        # Sorted keys for events up to long_event_threshold, and the longest such duration
+        self._sorted_keys: List[IndexKey] = []
+        self._max_duration = timedelta(0)
+
+        # Sequences of events longer than long_event_threshold
+        self._long_seqs: set = set()
+
+    @classmethod
+    def from_events(cls, events: List[Dict[str, Any]], **kwargs) -> 'EventIntervalIndex':
+        """
+        Build an index from stored event dictionaries.
+
+        Args:
+            events: Event dictionaries as loaded from storage
+            **kwargs: Passed to the constructor
+
+        Returns:
+            Populated EventIntervalIndex
+        """
+        index = cls(**kwargs)
+        for event_data in events:
+            index._insert(event_data, keep_sorted=False)
+        index._sorted_keys.sort()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, event_id: str) -> bool:
+        return bool(self._seqs_by_id.get(event_id))
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Get all events (including unindexable ones) in insertion order."""
+        return list(self._events.values())
+
+    def add(self, event_data: Dict[str, Any]):
+        """
+        Add an event to the index.
+
+        Args:
+            event_data: Event dictionary with ISO 8601 'start_datetime' and 'end_datetime'
+        """
+        self._insert(event_data, keep_sorted=True)
+
+    def put(self, event_data: Dict[str, Any]):
+        """
+        Add an event, replacing any events with the same ID in place.
+
+        Unlike add(), applying the same event twice leaves one copy, so
+        replaying changes that storage already contains is harmless.
+
+        Args:
+            event_data: Event dictionary with ISO 8601 'start_datetime' and 'end_datetime'
+        """
+        seqs = self._seqs_by_id.get(event_data.get('id'))
+        if not seqs:
+            self._insert(event_data, keep_sorted=True)
+            return
+
+        seq, *duplicates = seqs
+        for duplicate in duplicates:
+            self._events.pop(duplicate)
+            self._unindex(duplicate)
+        self._seqs_by_id[event_data['id']] = [seq]
+
+        self._unindex(seq)
+        self._events[seq] = event_data  # keeps the event's insertion position
+        self._index(seq, event_data, keep_sorted=True)
+
+    def remove(self, event_id: str) -> List[Dict[str, Any]]:
+        """
+        Remove all events with the given ID.
+
+        Args:
+            event_id: ID of the event to remove
+
+        Returns:
+            The removed event dictionaries (empty if none matched)
+        """
+        removed = []
+        for seq in self._seqs_by_id.pop(event_id, []):
+            removed.append(self._events.pop(seq))
+            self._unindex(seq)
+
+        return removed
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+        """
+        Find events that overlap the half-open interval [start, end).
+
+        Args:
+            start: Interval start
+            end: Interval end
+
+        Returns:
+            Overlapping events sorted by start time
+        """
+        return [
+            self._events[seq]
+            for seq in self._query(start, end, lambda s, e: s < end and e > start)
+        ]
+
+    def in_range(self, start_date: Optional[datetime] = None,
+                 end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Find events that touch the closed range [start_date, end_date].
+
+        Matches CalendarService.list_events semantics: an event is excluded only if
+        it ends before start_date or starts after end_date. Either bound may be None.
+
+        Args:
+            start_date: Optional range start
+            end_date: Optional range end
+
+        Returns:
+            Matching events sorted by start time
+        """
+        def matches(event_start: datetime, event_end: datetime) -> bool:
+            if start_date is not None and event_end < start_date:
+                return False
+            if end_date is not None and event_start > end_date:
+                return False
+            return True
+
+        return [self._events[seq] for seq in self._query(start_date, end_date, matches, inclusive_end=True)]
+
+    def _insert(self, event_data: Dict[str, Any], keep_sorted: bool):
+        """Store an event and index it if its datetimes parse."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._events[seq] = event_data
+
+        event_id = event_data.get('id')
+        if event_id is not None:
+            self._seqs_by_id.setdefault(event_id, []).append(seq)
+
+        self._index(seq, event_data, keep_sorted)
+
+    def _index(self, seq: int, event_data: Dict[str, Any], keep_sorted: bool):
+        """Index a stored event's interval if its datetimes parse."""
+        bounds = self._parse_bounds(event_data)
+        if bounds is None:
+            return
+        self._bounds[seq] = bounds
+
+        duration = bounds[1] - bounds[0]
+        if duration > self.long_event_threshold:
+            self._long_seqs.add(seq)
+            return
+
+        if duration > self._max_duration:
+            self._max_duration = duration
+
+        key = (bounds[0], seq)
+        if keep_sorted:
+            bisect.insort(self._sorted_keys, key)
+        else:
+            self._sorted_keys.append(key)
+
+    def _unindex(self, seq: int):
+        """Drop a stored event's interval from the index."""
+        bounds = self._bounds.pop(seq, None)
+        if bounds is None:
+            return
+
+        if seq in self._long_seqs:
+            self._long_seqs.discard(seq)
+        else:
+            key = (bounds[0], seq)
+            position = bisect.bisect_left(self._sorted_keys, key)
+            if position < len(self._sorted_keys) and self._sorted_keys[position] == key:
+                del self._sorted_keys[position]
+
+    def _query(self, start: Optional[datetime], end: Optional[datetime], matches,
+               inclusive_end: bool = False) -> List[int]:
+        """
+        Collect sequences of matching events, sorted by (start, insertion order).
+
+        Args:
+            start: Lower bound of the query interval (None for unbounded)
+            end: Upper bound of the query interval (None for unbounded)
+            matches: Predicate on (event_start, event_end)
+            inclusive_end: Whether events starting exactly at `end` are candidates
+        """
+        lower = 0
+        if start is not None:
+            lower = bisect.bisect_left(self._sorted_keys, (start - self._max_duration, -1))
+
+        upper = len(self._sorted_keys)
+        if end is not None:
+            # Sequences are >= 0, so (end, -1) sorts before every key starting at `end`
+            upper = bisect.bisect_left(self._sorted_keys, (end, -1))
+            if inclusive_end:
+                upper = bisect.bisect_right(self._sorted_keys, (end, self._next_seq))
+
+        keys = [
+            key for key in self._sorted_keys[lower:upper]
+            if matches(*self._bounds[key[1]])
+        ]
+
+        long_keys = [
+            (self._bounds[seq][0], seq) for seq in self._long_seqs
+            if matches(*self._bounds[seq])
+        ]
+        if long_keys:
+            keys = sorted(keys + long_keys)
+
+        return [seq for _, seq in keys]
+
+    @staticmethod
+    def _parse_bounds(event_data: Dict[str, Any]) -> Optional[Tuple[datetime, datetime]]:
+        """Parse an event's start/end datetimes, returning None for malformed events."""
+        try:
+            return (
+                datetime.fromisoformat(event_data['start_datetime']),
+                datetime.fromisoformat(event_data['end_datetime'])
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
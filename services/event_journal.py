@@ -0,0 +1,266 @@
+"""
+Append-only journal for calendar event storage.
+
+The JSON file at `storage_path` stays the snapshot (and import/export format);
+changes since the last compaction are appended to `<storage_path>.journal` as
+one JSON record per line:
+
+    {"op": "create", "event": {...}}
+    {"op": "delete", "id": "event_..."}
+
+This module provides:
+- O(1) appends instead of rewriting the whole file on every change
+- Advisory file locking (`<storage_path>.lock`) so several processes can share storage
+- Memory-mapped replay that only reads journal bytes past the caller's cursor
+- Compaction that atomically rewrites the snapshot and truncates the journal
+"""
+
+import json
+import logging
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+    LOCKING_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    LOCKING_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Journal operations
+OP_CREATE = "create"
+OP_DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class JournalCursor:
+    """Position of a reader in the snapshot + journal pair."""
+    snapshot_signature: Optional[tuple]
+    offset: int = 0
+    record_count: int = 0
+
+
+@dataclass
+class JournalReplay:
+    """Result of reading the journal from a cursor."""
+    cursor: JournalCursor
+    records: List[Dict[str, Any]]
+    # Snapshot events when the reader must rebuild from scratch, otherwise None
+    snapshot: Optional[List[Dict[str, Any]]] = None
+
+
+class EventJournal:
+    """
+    Snapshot + append-only journal storage for event dictionaries.
+
+    Readers keep a JournalCursor and call read() to pick up changes made by any
+    process since their last read. A changed snapshot (after compaction) or a
+    shrunken journal forces a full reload.
+    """
+
+    def __init__(self, snapshot_path: Path, compact_threshold: int = 1000, fsync: bool = True):
+        """
+        Initialize the journal.
+
+        Args:
+            snapshot_path: Path of the JSON snapshot (the calendar storage_path)
+            compact_threshold: Journal records after which compaction is due
+            fsync: Whether to fsync after each append (durability vs. latency)
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(f"{self.snapshot_path}.journal")
+        self.lock_path = Path(f"{self.snapshot_path}.lock")
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+
+        if not LOCKING_AVAILABLE:
+            logger.warning("fcntl not available; calendar journal is not safe for multi-process use")
+
+    @contextmanager
+    def locked(self, exclusive: bool = True) -> Iterator[None]:
+        """
+        Hold the storage lock for the duration of the block.
+
+        Args:
+            exclusive: Exclusive lock for writers, shared lock for readers
+        """
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.lock_path, 'a+') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def ensure_snapshot(self):
+        """Create an empty snapshot if none exists."""
+        if not self.snapshot_path.exists():
+            with self.locked():
+                if not self.snapshot_path.exists():
+                    self.write_snapshot([])
+
+    def read(self, cursor: Optional[JournalCursor] = None) -> JournalReplay:
+        """
+        Read changes since `cursor`. Call with the lock held.
+
+        Args:
+            cursor: Position from a previous read, or None to load everything
+
+        Returns:
+            JournalReplay with the new cursor, new records, and the snapshot if reloaded
+        """
+        snapshot = None
+        signature = self._snapshot_signature()
+        journal_size = self._journal_size()
+
+        if cursor is None or cursor.snapshot_signature != signature or journal_size < cursor.offset:
+            snapshot = self._load_snapshot()
+            cursor = JournalCursor(snapshot_signature=signature)
+
+        records, end = self._read_records(cursor.offset, journal_size)
+        cursor = JournalCursor(
+            snapshot_signature=signature,
+            offset=end,
+            record_count=cursor.record_count + len(records)
+        )
+        return JournalReplay(cursor=cursor, records=records, snapshot=snapshot)
+
+    def append(self, record: Dict[str, Any]):
+        """
+        Append one record to the journal. Call with the exclusive lock held.
+
+        Args:
+            record: Journal record ({"op": ..., ...})
+
+        Raises:
+            IOError: If the journal cannot be written
+        """
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+        with open(self.journal_path, 'ab') as f:
+            # Terminate a record torn by a crashed writer so it is skipped, not merged
+            if f.tell() > 0 and not self._ends_with_newline():
+                f.write(b"\n")
+            f.write(line.encode('utf-8'))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def needs_compaction(self, cursor: JournalCursor) -> bool:
+        """Check whether the journal has grown past the compaction threshold."""
+        return cursor.record_count >= self.compact_threshold
+
+    def compact(self, events: List[Dict[str, Any]]) -> JournalCursor:
+        """
+        Write `events` as the new snapshot and truncate the journal.
+        Call with the exclusive lock held, after reading to the end of the journal.
+
+        A crash between the two steps leaves journal records that the new
+        snapshot already contains, so readers must replay creates by ID
+        (EventIntervalIndex.put) rather than appending them.
+
+        Args:
+            events: Full current event list
+
+        Returns:
+            Cursor positioned at the start of the empty journal
+        """
+        self.write_snapshot(events)
+        with open(self.journal_path, 'wb') as f:
+            if self.fsync:
+                os.fsync(f.fileno())
+        return JournalCursor(snapshot_signature=self._snapshot_signature())
+
+    def write_snapshot(self, events: List[Dict[str, Any]]):
+        """Atomically replace the snapshot file with `events`."""
+        directory = self.snapshot_path.parent
+        fd, temp_path = tempfile.mkstemp(prefix=f".{self.snapshot_path.name}.", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(events, f, indent=2, ensure_ascii=False)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get journal file information for storage diagnostics."""
+        return {
+            'journal_path': str(self.journal_path.absolute()),
+            'journal_size_bytes': self._journal_size(),
+            'compact_threshold': self.compact_threshold,
+            'locking_available': LOCKING_AVAILABLE
+        }
+
+    def _snapshot_signature(self) -> Optional[tuple]:
+        """Fingerprint of the snapshot file; changes whenever it is replaced."""
+        try:
+            stat = self.snapshot_path.stat()
+            return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def _journal_size(self) -> int:
+        try:
+            return self.journal_path.stat().st_size
+        except OSError:
+            return 0
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.journal_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _load_snapshot(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                events = json.load(f)
+            return events if isinstance(events, list) else []
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _read_records(self, offset: int, size: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Parse complete journal lines in [offset, size) via mmap.
+
+        Returns:
+            Tuple of (records, offset just past the last complete line)
+        """
+        if size <= offset:
+            return [], offset
+
+        with open(self.journal_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                # A trailing partial line is an append in progress; leave it for the next read
+                end = mm.rfind(b"\n", offset, size) + 1
+                if end <= offset:
+                    return [], offset
+                chunk = mm[offset:end]
+
+        records = []
+        for line in chunk.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning(f"Skipping corrupt record in {self.journal_path}")
+                continue
+            if isinstance(record, dict) and record.get('op') in (OP_CREATE, OP_DELETE):
+                records.append(record)
+
+        return records, end
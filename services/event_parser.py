@@ -3,17 +3,26 @@ Unified event parser service that integrates DateTimeParser and EventInformation
 to provide complete event parsing functionality from natural language text.
 """
 
-from typing import Optional, List, Dict, Any, Tuple, Union
+from typing import Optional, List, Dict, Any, Tuple, Union, TYPE_CHECKING
 from datetime import datetime, timedelta, time
+from dataclasses import replace
 import re
 
 from models.event_models import ParsedEvent, ValidationResult
 from services.datetime_parser import DateTimeParser, DateTimeMatch
 from services.event_extractor import EventInformationExtractor, ExtractionMatch
-from services.text_merge_helper import TextMergeHelper
+from services.text_merge_helper import TextMergeHelper, MergeResult
 from services.hybrid_event_parser import HybridEventParser, HybridParsingResult
+from services.stage_timing import stage
+from services.relevance_windowing import WindowedText, get_relevance_windower
+from services.async_pipeline import run_cpu
+from services.cancellation import check_cancelled
+from services.env_config import env_bool
 from ui.safe_input import safe_input, confirm_action, get_choice, is_non_interactive
 
+if TYPE_CHECKING:
+    from services.llm_enhancer import EnhancementResult
+
 
 class EventParser:
     """
@@ -38,6 +47,10 @@ class EventParser:
             'enable_ambiguity_detection': True,  # Whether to detect and flag ambiguous text
             'use_hybrid_parsing': True,  # Enable hybrid parsing pipeline (Task 26.4)
             'hybrid_mode': 'hybrid',  # hybrid|regex_only|llm_only
+            # One LLM call for text enhancement and field extraction (LLM_FUSED_ENHANCEMENT)
+            'fused_llm_enhancement': env_bool('LLM_FUSED_ENHANCEMENT', False),
+            # Skip debug metadata (processing details, telemetry, text copies) that only audit reads
+            'lean_metadata': False,
         }
     
     def parse_text_enhanced(self, text: str, clipboard_text: Optional[str] = None, **kwargs) -> ParsedEvent:
@@ -59,30 +72,125 @@ class EventParser:
                 extraction_metadata={'error': 'Empty or invalid input text'}
             )
         
-        # Step 1: Enhance text using LLM and smart merging
-        merge_result = self.text_merge_helper.enhance_text_for_parsing(text, clipboard_text)
+        config = self.config.copy()
+        config.update(kwargs)
+        
+        # Step 1: Enhance text using LLM and smart merging; long texts are
+        # first cut down to their event-relevant windows to keep prompts small.
+        # In fused mode one LLM call also extracts the fields, and the split
+        # path is only used when that call fails or does not validate
+        llm_extraction = None
+        fused_metadata = None
+        with stage('preprocess'):
+            windowed = get_relevance_windower().window(text)
+            source_text = windowed.text if windowed else text
+            if config.get('fused_llm_enhancement'):
+                current_time = config.get('current_time') or self.hybrid_parser.current_time
+                merge_result, extraction = self._fused_enhancement(source_text, clipboard_text, current_time)
+                fused_metadata = {'used': extraction.success, 'processing_time': extraction.processing_time}
+                if extraction.success:
+                    llm_extraction = extraction
+                else:
+                    fused_metadata['fallback_reason'] = extraction.error
+            if llm_extraction is None:
+                merge_result = self.text_merge_helper.enhance_text_for_parsing(source_text, clipboard_text)
         enhanced_text = merge_result.final_text
+        check_cancelled()
 
         # Step 2: Parse the enhanced text using hybrid parsing (uses RegexDateExtractor which handles "noon" correctly)
-        parsed_event = self.parse_event_text(enhanced_text, **kwargs)
+        parsed_event = self.parse_event_text(enhanced_text, llm_extraction=llm_extraction, **kwargs)
+        check_cancelled()
+        
+        return self._finish_enhanced_parse(text, parsed_event, merge_result, windowed, fused_metadata, config)
+
+    async def parse_text_enhanced_async(self, text: str, clipboard_text: Optional[str] = None,
+                                        **kwargs) -> ParsedEvent:
+        """
+        Async parse_text_enhanced, with the same results (see services.async_pipeline).
+        
+        CPU stages run on the async pipeline's CPU pool and LLM calls are
+        awaited, so a request waiting on the LLM holds no thread. Cancelling
+        the awaiting task cancels the parse.
+        
+        Args:
+            text: Input text containing event information
+            clipboard_text: Optional clipboard content for smart merging
+            **kwargs: Optional configuration overrides
+            
+        Returns:
+            ParsedEvent object with extracted information and confidence scores
+        """
+        if not text or not text.strip():
+            return ParsedEvent(
+                description=text,
+                confidence_score=0.0,
+                extraction_metadata={'error': 'Empty or invalid input text'}
+            )
+        
+        config = self.config.copy()
+        config.update(kwargs)
+        
+        llm_extraction = None
+        fused_metadata = None
+        with stage('preprocess'):
+            windowed = await run_cpu(get_relevance_windower().window, text)
+            source_text = windowed.text if windowed else text
+            if config.get('fused_llm_enhancement'):
+                current_time = config.get('current_time') or self.hybrid_parser.current_time
+                merge_result, extraction = await self._fused_enhancement_async(source_text, clipboard_text, current_time)
+                fused_metadata = {'used': extraction.success, 'processing_time': extraction.processing_time}
+                if extraction.success:
+                    llm_extraction = extraction
+                else:
+                    fused_metadata['fallback_reason'] = extraction.error
+            if llm_extraction is None:
+                merge_result = await self.text_merge_helper.enhance_text_for_parsing_async(source_text, clipboard_text)
+        
+        parsed_event = await self.parse_event_text_async(merge_result.final_text, llm_extraction=llm_extraction, **kwargs)
+        return await run_cpu(
+            self._finish_enhanced_parse, text, parsed_event, merge_result, windowed, fused_metadata, config
+        )
+
+    def _finish_enhanced_parse(self, text: str, parsed_event: ParsedEvent, merge_result: MergeResult,
+                               windowed: Optional[WindowedText], fused_metadata: Optional[Dict[str, Any]],
+                               config: Dict[str, Any]) -> ParsedEvent:
+        """Steps 3-5 of parse_text_enhanced: safer defaults, enhancement metadata, confidence boost."""
+        enhanced_text = merge_result.final_text
         
         # Step 3: Apply safer defaults if needed
-        parsed_event = self.text_merge_helper.apply_safer_defaults(parsed_event, enhanced_text)
+        with stage('aggregation'):
+            parsed_event = self.text_merge_helper.apply_safer_defaults(parsed_event, enhanced_text)
         
         # Step 4: Update metadata with enhancement information
         if parsed_event.extraction_metadata is None:
             parsed_event.extraction_metadata = {}
         
-        parsed_event.extraction_metadata.update({
-            'text_enhancement': {
+        text_enhancement = {
+            'merge_applied': merge_result.merge_applied,
+            'enhancement_applied': merge_result.enhancement_applied,
+            'enhancement_confidence': merge_result.confidence
+        }
+        if not config.get('lean_metadata'):
+            text_enhancement.update({
                 'original_text': text,
                 'enhanced_text': enhanced_text,
-                'merge_applied': merge_result.merge_applied,
-                'enhancement_applied': merge_result.enhancement_applied,
-                'enhancement_confidence': merge_result.confidence,
                 'enhancement_metadata': merge_result.metadata
-            }
-        })
+            })
+        parsed_event.extraction_metadata['text_enhancement'] = text_enhancement
+        
+        if fused_metadata is not None:
+            parsed_event.extraction_metadata['text_enhancement']['fused_llm'] = fused_metadata
+        
+        if windowed:
+            # Spans refer to the pre-cleaned enhanced text; map them onto the full input.
+            # A copy, so an event held by the parser's cache keeps its own spans
+            map_span = windowed.span_mapper(self.hybrid_parser._pre_clean_text(enhanced_text))
+            parsed_event = replace(parsed_event, field_results={
+                name: replace(field_result, span=map_span(field_result.span))
+                for name, field_result in parsed_event.field_results.items()
+            })
+            parsed_event.description = text
+            parsed_event.extraction_metadata['text_windowing'] = windowed.to_metadata()
         
         # Boost overall confidence if enhancement was successful
         if merge_result.enhancement_applied and merge_result.confidence > 0.7:
@@ -90,6 +198,63 @@ class EventParser:
         
         return parsed_event
 
+    def _fused_enhancement(self, text: str, clipboard_text: Optional[str],
+                           current_time: Optional[datetime]) -> Tuple[MergeResult, "EnhancementResult"]:
+        """
+        Enhance text and extract event fields with a single LLM call.
+        
+        Args:
+            text: Input text (already windowed)
+            clipboard_text: Optional clipboard content for smart merging
+            current_time: Current datetime for relative date resolution
+            
+        Returns:
+            Tuple of (MergeResult, EnhancementResult); an unsuccessful extraction
+            means the split path has to be used
+        """
+        merge_result = self.text_merge_helper.enhance_text_for_parsing(text, clipboard_text, use_llm=False)
+        context = "gmail_selection" if merge_result.merge_applied else "single_text"
+        extraction = self.hybrid_parser.llm_enhancer.fused_extraction(merge_result.final_text, current_time, context)
+        return self._apply_fused_extraction(merge_result, extraction)
+
+    async def _fused_enhancement_async(self, text: str, clipboard_text: Optional[str],
+                                       current_time: Optional[datetime]) -> Tuple[MergeResult, "EnhancementResult"]:
+        """Async _fused_enhancement."""
+        merge_result = await self.text_merge_helper.enhance_text_for_parsing_async(text, clipboard_text, use_llm=False)
+        context = "gmail_selection" if merge_result.merge_applied else "single_text"
+        # First use builds the enhancer, which may probe providers
+        llm_enhancer = await run_cpu(getattr, self.hybrid_parser, 'llm_enhancer')
+        extraction = await llm_enhancer.fused_extraction_async(merge_result.final_text, current_time, context)
+        return self._apply_fused_extraction(merge_result, extraction)
+
+    def _apply_fused_extraction(self, merge_result: MergeResult,
+                                extraction: "EnhancementResult") -> Tuple[MergeResult, "EnhancementResult"]:
+        """Merge result carrying a fused extraction's enhanced text, if it succeeded and is confident enough."""
+        if not extraction.success:
+            return merge_result, extraction
+        
+        metadata = dict(merge_result.metadata)
+        metadata.pop('llm_enhancement_skipped', None)
+        metadata['fused_llm'] = True
+        
+        # Same acceptance threshold as the split path's text enhancement
+        if extraction.text_confidence > 0.6:
+            metadata.update({
+                'llm_enhancement': True,
+                'enhancement_type': 'fused',
+                'llm_metadata': {'provider': extraction.llm_provider, 'model_used': extraction.llm_model}
+            })
+            return replace(
+                merge_result,
+                final_text=extraction.enhanced_text,
+                confidence=extraction.text_confidence,
+                enhancement_applied=True,
+                metadata=metadata
+            ), extraction
+        
+        metadata['llm_enhancement_skipped'] = f"Low confidence: {extraction.text_confidence}"
+        return replace(merge_result, metadata=metadata), extraction
+
     def parse_text(self, text: str, **kwargs) -> ParsedEvent:
         """
         Parse natural language text and return a complete ParsedEvent object.
@@ -113,13 +278,14 @@ class EventParser:
         config.update(kwargs)
         
         # Extract all components
-        datetime_matches = self.datetime_parser.extract_datetime(
-            text, 
-            prefer_dd_mm=config['prefer_dd_mm_format']
-        )
-        duration_matches = self.datetime_parser.extract_durations(text)
-        title_matches = self.info_extractor.extract_title(text)
-        location_matches = self.info_extractor.extract_location(text)
+        with stage('regex'):
+            datetime_matches = self.datetime_parser.extract_datetime(
+                text, 
+                prefer_dd_mm=config['prefer_dd_mm_format']
+            )
+            duration_matches = self.datetime_parser.extract_durations(text)
+            title_matches = self.info_extractor.extract_title(text)
+            location_matches = self.info_extractor.extract_location(text)
         
         # Create ParsedEvent with best matches
         parsed_event = ParsedEvent()
@@ -164,7 +330,8 @@ class EventParser:
         
         # Calculate overall confidence and store metadata
         parsed_event.extraction_metadata = self._build_extraction_metadata(
-            text, datetime_matches, duration_matches, title_matches, location_matches, config
+            text, datetime_matches, duration_matches, title_matches, location_matches, config,
+            lean=config.get('lean_metadata', False)
         )
         
         # Calculate overall confidence using the info extractor's method
@@ -172,7 +339,8 @@ class EventParser:
         
         return parsed_event
     
-    def parse_event_text(self, text: str, **kwargs) -> ParsedEvent:
+    def parse_event_text(self, text: str, llm_extraction: Optional["EnhancementResult"] = None,
+                         **kwargs) -> ParsedEvent:
         """
         Parse event text using hybrid regex-LLM pipeline (Task 26.4).
         
@@ -182,6 +350,7 @@ class EventParser:
         
         Args:
             text: Input text containing event information
+            llm_extraction: LLM extraction already made for this text (fused mode)
             **kwargs: Configuration overrides (mode, timezone_offset, current_time, etc.)
             
         Returns:
@@ -199,68 +368,99 @@ class EventParser:
             # Fall back to legacy parsing
             return self.parse_text(text, **kwargs)
         
-        # Apply configuration overrides
-        config = self.config.copy()
-        config.update(kwargs)
+        config, hybrid_args = self._hybrid_parse_args(kwargs)
         
-        # Extract parsing parameters
-        mode = config.get('hybrid_mode', 'hybrid')
-        timezone_offset = config.get('timezone_offset')
-        current_time = config.get('current_time')
+        # Execute hybrid parsing
+        try:
+            result = self.hybrid_parser.parse_event_text(text=text, llm_extraction=llm_extraction, **hybrid_args)
+            return self._hybrid_parsed_event(text, result, config)
+            
+        except Exception as e:
+            return self._legacy_fallback(text, e, kwargs)
+    
+    async def parse_event_text_async(self, text: str, llm_extraction: Optional["EnhancementResult"] = None,
+                                     **kwargs) -> ParsedEvent:
+        """Async parse_event_text, with the same results (see HybridEventParser.parse_event_text_async)."""
+        if not text or not text.strip():
+            return ParsedEvent(
+                description=text,
+                confidence_score=0.0,
+                extraction_metadata={'error': 'Empty or invalid input text'}
+            )
         
-        # Update hybrid parser current time if provided
-        if current_time:
-            self.hybrid_parser.current_time = current_time
+        if not self.config.get('use_hybrid_parsing', True):
+            return await run_cpu(self.parse_text, text, **kwargs)
+        
+        config, hybrid_args = self._hybrid_parse_args(kwargs)
         
-        # Execute hybrid parsing
         try:
-            result = self.hybrid_parser.parse_event_text(
-                text=text,
-                mode=mode,
-                timezone_offset=timezone_offset,
-                current_time=current_time
+            result = await self.hybrid_parser.parse_event_text_async(
+                text=text, llm_extraction=llm_extraction, **hybrid_args
             )
-            
-            # Extract ParsedEvent from hybrid result
-            parsed_event = result.parsed_event
-            
-            # Add hybrid-specific metadata
-            if not parsed_event.extraction_metadata:
-                parsed_event.extraction_metadata = {}
-            
-            parsed_event.extraction_metadata.update({
-                'hybrid_parsing_used': True,
-                'parsing_path': result.parsing_path,
-                'warnings': result.warnings,
-                'processing_metadata': result.processing_metadata,
-                'hybrid_confidence': result.confidence_score
-            })
-            
-            # Collect telemetry if enabled
-            if config.get('enable_telemetry', True):
-                telemetry = self.hybrid_parser.collect_telemetry(text, result)
-                parsed_event.extraction_metadata['telemetry'] = telemetry
-            
-            return parsed_event
+            return await run_cpu(self._hybrid_parsed_event, text, result, config)
             
         except Exception as e:
-            # Fall back to legacy parsing on error
-            import logging
-            logging.error(f"Hybrid parsing failed: {e}")
-            
-            fallback_event = self.parse_text(text, **kwargs)
-            
-            # Add error metadata
-            if not fallback_event.extraction_metadata:
-                fallback_event.extraction_metadata = {}
-            
-            fallback_event.extraction_metadata.update({
-                'hybrid_parsing_used': False,
-                'hybrid_parsing_error': str(e),
-                'fallback_to_legacy': True
-            })
-            
-            return fallback_event
+            return await run_cpu(self._legacy_fallback, text, e, kwargs)
+    
+    def _hybrid_parse_args(self, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Effective config and HybridEventParser arguments for a parse with configuration overrides."""
+        # Apply configuration overrides
+        config = self.config.copy()
+        config.update(kwargs)
+        
+        return config, {
+            'mode': config.get('hybrid_mode', 'hybrid'),
+            'timezone_offset': config.get('timezone_offset'),
+            'current_time': config.get('current_time'),  # per parse; the shared hybrid parser is left untouched
+            'lean': config.get('lean_metadata', False)
+        }
+    
+    def _hybrid_parsed_event(self, text: str, result: HybridParsingResult, config: Dict[str, Any]) -> ParsedEvent:
+        """ParsedEvent of a hybrid parse, with hybrid metadata and telemetry."""
+        lean = config.get('lean_metadata', False)
+        
+        # Extract ParsedEvent from hybrid result
+        parsed_event = result.parsed_event
+        
+        # Add hybrid-specific metadata
+        if not parsed_event.extraction_metadata:
+            parsed_event.extraction_metadata = {}
+        
+        parsed_event.extraction_metadata.update({
+            'hybrid_parsing_used': True,
+            'parsing_path': result.parsing_path,
+            'warnings': result.warnings,
+            'hybrid_confidence': result.confidence_score
+        })
+        if not lean:
+            parsed_event.extraction_metadata['processing_metadata'] = result.processing_metadata
+        
+        # Collect telemetry if enabled (lean mode only when asked for explicitly)
+        if config.get('enable_telemetry', not lean):
+            telemetry = self.hybrid_parser.collect_telemetry(text, result)
+            parsed_event.extraction_metadata['telemetry'] = telemetry
+        
+        return parsed_event
+    
+    def _legacy_fallback(self, text: str, error: Exception, kwargs: Dict[str, Any]) -> ParsedEvent:
+        """Legacy parse of text after hybrid parsing raised."""
+        # Fall back to legacy parsing on error
+        import logging
+        logging.error(f"Hybrid parsing failed: {error}")
+        
+        fallback_event = self.parse_text(text, **kwargs)
+        
+        # Add error metadata
+        if not fallback_event.extraction_metadata:
+            fallback_event.extraction_metadata = {}
+        
+        fallback_event.extraction_metadata.update({
+            'hybrid_parsing_used': False,
+            'hybrid_parsing_error': str(error),
+            'fallback_to_legacy': True
+        })
+        
+        return fallback_event
     
     def parse_multiple_events(self, text: str, **kwargs) -> List[ParsedEvent]:
         """
@@ -428,13 +628,10 @@ class EventParser:
     
     def _build_extraction_metadata(self, text: str, datetime_matches: List[DateTimeMatch], 
                                  duration_matches: List, title_matches: List[ExtractionMatch], 
-                                 location_matches: List[ExtractionMatch], config: Dict[str, Any]) -> Dict[str, Any]:
-        """Build comprehensive metadata about the extraction process."""
+                                 location_matches: List[ExtractionMatch], config: Dict[str, Any],
+                                 lean: bool = False) -> Dict[str, Any]:
+        """Build comprehensive metadata about the extraction process (summary fields only when lean)."""
         metadata = {
-            'original_text': text,
-            'parsing_config': config.copy(),
-            'extraction_timestamp': datetime.now().isoformat(),
-            
             # DateTime extraction info
             'datetime_matches_found': len(datetime_matches),
             'datetime_confidence': datetime_matches[0].confidence if datetime_matches else 0.0,
@@ -466,6 +663,14 @@ class EventParser:
             'has_ambiguous_datetime': len(datetime_matches) > 1,
             'has_ambiguous_title': len(title_matches) > 1,
             'has_ambiguous_location': len(location_matches) > 1,
+        }
+        if lean:
+            return metadata
+        
+        metadata.update({
+            'original_text': text,
+            'parsing_config': config.copy(),
+            'extraction_timestamp': datetime.now().isoformat(),
             
             # All matches for debugging/alternative selection
             'all_datetime_matches': [
@@ -498,7 +703,7 @@ class EventParser:
                 }
                 for match in location_matches
             ]
-        }
+        })
         
         return metadata
     
@@ -0,0 +1,62 @@
+"""
+Per-parse memo for extractor outputs.
+
+Per-field routing extracts each field on its own, but several fields are
+served by the same extractor run: start_datetime and end_datetime both come
+from one RegexDateExtractor.extract_datetime call, the deterministic path
+falls back to the regex extractors, and every LLM-routed field reads the same
+fallback extraction. ExtractionMemo lets those fields share one computation
+per parse instead of repeating it per field.
+
+A memo belongs to a single input text and is discarded with the parse. It is
+safe to share between the worker threads of concurrent field processing:
+concurrent lookups of the same key wait for one computation.
+"""
+
+import threading
+from typing import Any, Callable, Dict
+
+
+class ExtractionMemo:
+    """Compute-once store for extractor outputs within one parse."""
+
+    def __init__(self):
+        self._values: Dict[Any, Any] = {}
+        self._key_locks: Dict[Any, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.computed = 0
+        self.reused = 0
+
+    def get(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Return the value stored under key, computing it on first use.
+
+        Exceptions from compute propagate and nothing is stored, so a later
+        lookup retries.
+        """
+        with self._lock:
+            if key in self._values:
+                self.reused += 1
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    self.reused += 1
+                    return self._values[key]
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+                self.computed += 1
+            return value
+
+    def set(self, key: Any, value: Any):
+        """Store a value computed elsewhere (e.g. by a fused LLM call)."""
+        with self._lock:
+            self._values[key] = value
+
+    def get_stats(self) -> Dict[str, int]:
+        """Computation and reuse counts."""
+        with self._lock:
+            return {'computed': self.computed, 'reused': self.reused}
@@ -97,11 +97,15 @@ class FormatAwareTextProcessor:
     
     def _compile_patterns(self):
         """Compile regex patterns for efficient processing."""
+        # Line-start patterns use [^\S\n]* rather than \s* for leading blanks:
+        # \s* would also consume newlines, which backtracks quadratically on
+        # runs of blank lines (see tests/performance/regex_fuzz.py)
+        
         # Bullet point patterns
         self.bullet_patterns = [
-            re.compile(r'^[\s]*[-•*]\s+(.+)$', re.MULTILINE),  # Standard bullets
-            re.compile(r'^[\s]*\d+[\.\)]\s+(.+)$', re.MULTILINE),  # Numbered lists
-            re.compile(r'^[\s]*[a-zA-Z][\.\)]\s+(.+)$', re.MULTILINE),  # Lettered lists
+            re.compile(r'^[^\S\n]*[-•*]\s+(.+)$', re.MULTILINE),  # Standard bullets
+            re.compile(r'^[^\S\n]*\d+[\.\)]\s+(.+)$', re.MULTILINE),  # Numbered lists
+            re.compile(r'^[^\S\n]*[a-zA-Z][\.\)]\s+(.+)$', re.MULTILINE),  # Lettered lists
         ]
         
         # Time normalization patterns - order matters for proper matching
@@ -127,8 +131,8 @@ class FormatAwareTextProcessor:
         
         # Multiple event detection patterns
         self.event_boundary_patterns = [
-            re.compile(r'^\s*[-•*]\s+', re.MULTILINE),  # Bullet points at line start
-            re.compile(r'^\s*\d+[\.\)]\s+', re.MULTILINE),  # Numbered items at line start
+            re.compile(r'^[^\S\n]*[-•*]\s+', re.MULTILINE),  # Bullet points at line start
+            re.compile(r'^[^\S\n]*\d+[\.\)]\s+', re.MULTILINE),  # Numbered items at line start
             re.compile(r'\b(?:then|next|after that|also|additionally)\b', re.IGNORECASE),  # Sequence words
         ]
         
@@ -144,10 +148,10 @@ class FormatAwareTextProcessor:
         
         # Format detection patterns
         self.format_detection_patterns = {
-            'bullet_points': re.compile(r'^[\s]*[-•*]\s+', re.MULTILINE),
-            'numbered_list': re.compile(r'^[\s]*\d+[\.\)]\s+', re.MULTILINE),
+            'bullet_points': re.compile(r'^[^\S\n]*[-•*]\s+', re.MULTILINE),
+            'numbered_list': re.compile(r'^[^\S\n]*\d+[\.\)]\s+', re.MULTILINE),
             'email_headers': re.compile(r'^(From|To|Subject|Date|Time|When|Where):\s*', re.MULTILINE | re.IGNORECASE),
-            'structured_content': re.compile(r'^[\s]*(Title|Event|Meeting|Subject|Date|Time|Location|Where|When):\s*', re.MULTILINE | re.IGNORECASE),
+            'structured_content': re.compile(r'^[^\S\n]*(Title|Event|Meeting|Subject|Date|Time|Location|Where|When):\s*', re.MULTILINE | re.IGNORECASE),
         }
     
     def _normalize_am_pm(self, match) -> str:
@@ -0,0 +1,368 @@
+"""
+Parallel golden-set evaluation for the accuracy/latency gate.
+
+This module provides:
+- Sharding of golden test cases across a process pool
+- A bounded async pool per worker for slow (LLM-backed) parse calls
+- Deterministic merging of AccuracyResults in golden-set order
+- Incremental runs that re-parse only cases whose component outputs changed
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.event_models import ParsedEvent
+from services.performance_monitor import AccuracyResult, GoldenTestCase, PerformanceMonitor
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached case format or scoring inputs change
+CACHE_VERSION = 1
+
+# Shards per worker; more, smaller shards balance slow LLM cases across workers
+SHARDS_PER_WORKER = 4
+
+# Fields of the regex-only parse that make up a case's component fingerprint
+FINGERPRINT_FIELDS = ('title', 'start_datetime', 'end_datetime', 'location', 'description',
+                      'recurrence', 'participants', 'all_day', 'confidence_score')
+
+ParserFunc = Callable[[str], Any]
+
+
+def default_parser_factory() -> ParserFunc:
+    """Build the full parse function evaluated against the golden set."""
+    from services.event_parser import EventParser
+    return EventParser().parse_event_text
+
+
+def default_fingerprint_factory() -> Callable[[str], str]:
+    """
+    Build the component fingerprint function used for incremental runs.
+
+    The fingerprint hashes the deterministic regex-only parse, so a cached
+    full-pipeline result is reused only while the upstream component output
+    for that input is unchanged.
+    """
+    from services.event_parser import EventParser
+    parser = EventParser()
+
+    def fingerprint(text: str) -> str:
+        event = parser.parse_event_text(text, hybrid_mode='regex_only')
+        data = event.to_dict()
+        return _digest({name: data.get(name) for name in FINGERPRINT_FIELDS})
+
+    return fingerprint
+
+
+def _digest(data: Any) -> str:
+    encoded = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+def case_key(test_case: GoldenTestCase, salt: str = "") -> str:
+    """Hash of a golden case's definition; editing the case invalidates its cache entry."""
+    return _digest({'salt': salt, 'case': test_case.to_dict()})
+
+
+@dataclass
+class CaseOutcome:
+    """Result of running one golden case in a worker."""
+    index: int
+    case_id: str
+    fingerprint: Optional[str]
+    predicted: Optional[Dict[str, Any]] = None
+    processing_time_ms: float = 0.0
+    error: Optional[str] = None
+    reused: bool = False
+
+
+class ShardEvaluator:
+    """
+    Evaluates shards of golden cases inside one worker.
+
+    Fingerprints run inline; full parses go through an async pool bounded by
+    `llm_concurrency`, so a worker keeps several LLM calls in flight without
+    exceeding the provider's concurrency budget.
+    """
+
+    def __init__(self, parser_factory: Callable[[], ParserFunc],
+                 fingerprint_factory: Optional[Callable[[], Callable[[str], str]]] = None,
+                 llm_concurrency: int = 4):
+        self.parser_factory = parser_factory
+        self.fingerprint = fingerprint_factory() if fingerprint_factory else None
+        self.llm_concurrency = max(1, llm_concurrency)
+        # Parsers are not guaranteed thread-safe, so each pool thread builds its own
+        self._local = threading.local()
+
+    def _parser(self) -> ParserFunc:
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self.parser_factory()
+            self._local.parser = parser
+        return parser
+
+    def evaluate(self, tasks: List[Tuple[int, str, str, Optional[str]]]) -> List[CaseOutcome]:
+        """
+        Evaluate a shard.
+
+        Args:
+            tasks: (index, case_id, input_text, cached_fingerprint) tuples
+
+        Returns:
+            CaseOutcome per task, in task order
+        """
+        return asyncio.run(self._evaluate(tasks))
+
+    async def _evaluate(self, tasks: List[Tuple[int, str, str, Optional[str]]]) -> List[CaseOutcome]:
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        with ThreadPoolExecutor(max_workers=self.llm_concurrency) as pool:
+            return await asyncio.gather(*(
+                self._evaluate_case(task, semaphore, pool) for task in tasks
+            ))
+
+    async def _evaluate_case(self, task: Tuple[int, str, str, Optional[str]],
+                             semaphore: asyncio.Semaphore, pool: ThreadPoolExecutor) -> CaseOutcome:
+        index, case_id, text, cached_fingerprint = task
+        outcome = CaseOutcome(index=index, case_id=case_id, fingerprint=None)
+
+        if self.fingerprint is not None:
+            try:
+                outcome.fingerprint = self.fingerprint(text)
+            except Exception as e:
+                logger.debug(f"Fingerprint failed for {case_id}: {e}")
+            if outcome.fingerprint is not None and outcome.fingerprint == cached_fingerprint:
+                outcome.reused = True
+                return outcome
+
+        async with semaphore:
+            start_time = time.perf_counter()
+            try:
+                loop = asyncio.get_running_loop()
+                predicted = await loop.run_in_executor(pool, self._parse, text)
+                if inspect.isawaitable(predicted):
+                    predicted = await predicted
+                outcome.processing_time_ms = (time.perf_counter() - start_time) * 1000
+                if predicted is not None:
+                    # Round-trip through JSON so fresh and cached predictions score identically
+                    outcome.predicted = json.loads(json.dumps(predicted.to_dict(), default=str))
+            except Exception as e:
+                outcome.processing_time_ms = (time.perf_counter() - start_time) * 1000
+                outcome.error = str(e)
+        return outcome
+
+    def _parse(self, text: str):
+        return self._parser()(text)
+
+
+# Per-process evaluator for pool workers
+_worker_evaluator: Optional[ShardEvaluator] = None
+
+
+def _init_worker(parser_factory, fingerprint_factory, llm_concurrency):
+    global _worker_evaluator
+    _worker_evaluator = ShardEvaluator(parser_factory, fingerprint_factory, llm_concurrency)
+
+
+def _evaluate_shard(tasks):
+    return _worker_evaluator.evaluate(tasks)
+
+
+class ParallelGoldenEvaluator:
+    """
+    Runs the golden set across a process pool and merges results deterministically.
+
+    Summaries have the same shape as PerformanceMonitor.evaluate_accuracy, plus
+    an 'evaluation' section describing the run.
+    """
+
+    def __init__(self, monitor: Optional[PerformanceMonitor] = None,
+                 parser_factory: Callable[[], ParserFunc] = default_parser_factory,
+                 fingerprint_factory: Optional[Callable[[], Callable[[str], str]]] = default_fingerprint_factory,
+                 workers: Optional[int] = None,
+                 llm_concurrency: int = 4,
+                 cache_path: Optional[str] = None,
+                 cache_salt: str = "",
+                 mp_context: Optional[str] = None):
+        """
+        Initialize the evaluator.
+
+        Args:
+            monitor: PerformanceMonitor holding the golden set (global monitor if None)
+            parser_factory: Picklable zero-argument callable returning the parse function
+            fingerprint_factory: Picklable factory for the component fingerprint function
+            workers: Worker processes (CPU count if None; <= 1 runs in-process)
+            llm_concurrency: Maximum in-flight parse calls per worker
+            cache_path: JSON file for incremental runs (disabled if None)
+            cache_salt: Extra cache key material, e.g. a model or prompt version
+            mp_context: multiprocessing start method (platform default if None)
+        """
+        if monitor is None:
+            from services.performance_monitor import get_performance_monitor
+            monitor = get_performance_monitor()
+
+        self.monitor = monitor
+        self.parser_factory = parser_factory
+        self.fingerprint_factory = fingerprint_factory
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.llm_concurrency = max(1, llm_concurrency)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache_salt = cache_salt
+        self.mp_context = mp_context
+
+    @property
+    def incremental(self) -> bool:
+        """Whether cached results can be reused."""
+        return self.cache_path is not None and self.fingerprint_factory is not None
+
+    def evaluate(self) -> Dict[str, Any]:
+        """
+        Evaluate every golden test case.
+
+        Returns:
+            Evaluation summary (see PerformanceMonitor.summarize_accuracy_results)
+        """
+        start_time = time.perf_counter()
+        test_cases = list(self.monitor.golden_test_cases)
+        keys = [case_key(test_case, self.cache_salt) for test_case in test_cases]
+        cache = self._load_cache() if self.incremental else {}
+
+        tasks = []
+        for index, (test_case, key) in enumerate(zip(test_cases, keys)):
+            entry = cache.get(test_case.id)
+            cached_fingerprint = entry.get('fingerprint') if entry and entry.get('case_key') == key else None
+            tasks.append((index, test_case.id, test_case.input_text, cached_fingerprint))
+
+        outcomes = self._run(tasks)
+
+        results = []
+        new_cache = {}
+        reused = 0
+        for test_case, key, outcome in zip(test_cases, keys, outcomes):
+            if outcome.reused:
+                entry = cache[test_case.id]
+                outcome.predicted = entry.get('predicted')
+                outcome.processing_time_ms = entry.get('processing_time_ms', 0.0)
+                outcome.error = entry.get('error')
+                reused += 1
+
+            results.append(self._score(test_case, outcome))
+            if outcome.fingerprint is not None:
+                new_cache[test_case.id] = {
+                    'case_key': key,
+                    'fingerprint': outcome.fingerprint,
+                    'predicted': outcome.predicted,
+                    'processing_time_ms': outcome.processing_time_ms,
+                    'error': outcome.error
+                }
+
+        if self.incremental:
+            self._save_cache(new_cache)
+
+        summary = self.monitor.summarize_accuracy_results(results)
+        latencies = [r.processing_time_ms for r in results if r.processing_time_ms > 0]
+        summary['evaluation'] = {
+            'workers': self._effective_workers(len(tasks)),
+            'llm_concurrency': self.llm_concurrency,
+            'incremental': self.incremental,
+            'evaluated_cases': len(results) - reused,
+            'reused_cases': reused,
+            'p95_processing_time_ms': float(np.percentile(latencies, 95)) if latencies else 0.0,
+            'wall_time_ms': (time.perf_counter() - start_time) * 1000
+        }
+        logger.info(f"Golden evaluation: {len(results) - reused} evaluated, {reused} reused "
+                    f"in {summary['evaluation']['wall_time_ms']:.0f}ms")
+        return summary
+
+    def _effective_workers(self, task_count: int) -> int:
+        return max(1, min(self.workers, task_count))
+
+    def _run(self, tasks: List[Tuple[int, str, str, Optional[str]]]) -> List[CaseOutcome]:
+        if not tasks:
+            return []
+
+        workers = self._effective_workers(len(tasks))
+        fingerprint_factory = self.fingerprint_factory if self.incremental else None
+        if workers <= 1:
+            evaluator = ShardEvaluator(self.parser_factory, fingerprint_factory, self.llm_concurrency)
+            return evaluator.evaluate(tasks)
+
+        shard_size = max(1, math.ceil(len(tasks) / (workers * SHARDS_PER_WORKER)))
+        shards = [tasks[i:i + shard_size] for i in range(0, len(tasks), shard_size)]
+        context = multiprocessing.get_context(self.mp_context) if self.mp_context else None
+
+        outcomes: List[CaseOutcome] = []
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_worker,
+                                 initargs=(self.parser_factory, fingerprint_factory,
+                                           self.llm_concurrency)) as executor:
+            for shard_outcomes in executor.map(_evaluate_shard, shards):
+                outcomes.extend(shard_outcomes)
+
+        # executor.map preserves shard order; sort anyway so merging never depends on scheduling
+        outcomes.sort(key=lambda outcome: outcome.index)
+        return outcomes
+
+    def _score(self, test_case: GoldenTestCase, outcome: CaseOutcome) -> AccuracyResult:
+        if outcome.error is not None:
+            return AccuracyResult(
+                test_case_id=test_case.id,
+                predicted_event=None,
+                accuracy_score=0.0,
+                errors=[outcome.error],
+                processing_time_ms=outcome.processing_time_ms
+            )
+
+        predicted_event = ParsedEvent.from_dict(outcome.predicted) if outcome.predicted else None
+        try:
+            result = self.monitor._calculate_accuracy(test_case, predicted_event)
+        except Exception as e:
+            logger.error(f"Error scoring test case {test_case.id}: {e}")
+            result = AccuracyResult(
+                test_case_id=test_case.id,
+                predicted_event=None,
+                accuracy_score=0.0,
+                errors=[str(e)]
+            )
+        result.processing_time_ms = outcome.processing_time_ms
+        return result
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable golden evaluation cache {self.cache_path}: {e}")
+            return {}
+
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('cases', {})
+
+    def _save_cache(self, cases: Dict[str, Dict[str, Any]]):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'cases': cases}, f, indent=2, default=str)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save golden evaluation cache {self.cache_path}: {e}")
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
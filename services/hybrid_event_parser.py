@@ -7,18 +7,27 @@ Enhanced with per-field confidence routing, caching capabilities, and performanc
 import asyncio
 import logging
 import hashlib
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Union, TYPE_CHECKING
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from services.regex_date_extractor import RegexDateExtractor, DateTimeResult
 from services.title_extractor import TitleExtractor
-from services.llm_enhancer import LLMEnhancer, EnhancementResult
-from services.advanced_location_extractor import AdvancedLocationExtractor
 from services.per_field_confidence_router import PerFieldConfidenceRouter, ProcessingMethod
 from services.performance_optimizer import get_performance_optimizer
+from services.stage_timing import stage
+from services.regex_guard import regex_budget_exhausted
+from services.cancellation import check_cancelled
+from services.extraction_memo import ExtractionMemo
+from services.relevance_windowing import WindowedText, get_relevance_windower
+from services.async_pipeline import run_cpu
 from models.event_models import ParsedEvent, TitleResult, FieldResult, CacheEntry, ValidationResult
 
+if TYPE_CHECKING:
+    # Heavy modules (the LLM stack pulls in provider SDKs); loaded on first use
+    from services.llm_enhancer import LLMEnhancer, EnhancementResult
+    from services.advanced_location_extractor import AdvancedLocationExtractor
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +41,17 @@ class HybridParsingResult:
     processing_metadata: Dict[str, Any]
 
 
+@dataclass
+class _PreparedParse:
+    """Pre-cleaned, windowed input of one parse and its result tracking."""
+    cleaned_text: str
+    parse_text: str
+    windowed: Optional[WindowedText]
+    warnings: List[str]
+    processing_metadata: Dict[str, Any]
+    current_time: datetime  # reference time for relative dates
+
+
 class HybridEventParser:
     """
     Hybrid parsing pipeline that integrates regex-first datetime extraction with LLM enhancement/fallback.
@@ -78,29 +98,29 @@ class HybridEventParser:
             'default_mode': 'hybrid',  # hybrid|regex_only|llm_only
             'enable_telemetry': True,
             'enable_caching': True,
-            'max_processing_time': 30.0,  # seconds
-            'enable_concurrent_processing': True,  # Enable concurrent field processing
-            'field_processing_timeout': 10.0,  # Timeout for individual field processing
-            'enable_partial_results': True,  # Return partial results on timeout
+            'max_processing_time': 30.0,  # seconds (async parsing)
+            'enable_windowing': True,  # Extract only event-relevant regions of long texts
         }
     
     @property
-    def location_extractor(self) -> AdvancedLocationExtractor:
+    def location_extractor(self) -> "AdvancedLocationExtractor":
         """Lazy-loaded location extractor."""
         if self._location_extractor is None:
             self._location_extractor = self.performance_optimizer.get_lazy_module('location_extractor')
             if self._location_extractor is None:
                 # Fallback to direct instantiation
+                from services.advanced_location_extractor import AdvancedLocationExtractor
                 self._location_extractor = AdvancedLocationExtractor()
         return self._location_extractor
     
     @property
-    def llm_enhancer(self) -> LLMEnhancer:
+    def llm_enhancer(self) -> "LLMEnhancer":
         """Lazy-loaded LLM enhancer."""
         if self._llm_enhancer is None:
             self._llm_enhancer = self.performance_optimizer.get_lazy_module('llm_enhancer')
             if self._llm_enhancer is None:
                 # Fallback to direct instantiation
+                from services.llm_enhancer import LLMEnhancer
                 self._llm_enhancer = LLMEnhancer()
         return self._llm_enhancer
     
@@ -109,7 +129,9 @@ class HybridEventParser:
                         mode: str = "hybrid",
                         fields: Optional[List[str]] = None,
                         timezone_offset: Optional[int] = None,
-                        current_time: Optional[datetime] = None) -> HybridParsingResult:
+                        current_time: Optional[datetime] = None,
+                        llm_extraction: Optional["EnhancementResult"] = None,
+                        lean: bool = False) -> HybridParsingResult:
         """
         Main parsing orchestration with per-field confidence routing and caching.
         
@@ -119,88 +141,121 @@ class HybridEventParser:
             fields: Optional list of specific fields to parse (for partial parsing)
             timezone_offset: Timezone offset in hours for relative date resolution
             current_time: Current datetime context (overrides instance current_time)
+            llm_extraction: LLM extraction already made for this text (fused mode);
+                LLM-routed fields use it instead of calling the LLM again
+            lean: Only record the processing metadata parsing itself needs, skipping
+                per-field analyses and timings that only audit and telemetry read
             
         Returns:
             HybridParsingResult with parsed event and metadata
         """
         start_time = datetime.now()
+        prepared = self._prepare_parse(text, mode, fields, timezone_offset, current_time, lean, start_time)
+        if isinstance(prepared, HybridParsingResult):
+            return prepared
+        
+        try:
+            if mode == "llm_only":
+                result = self._llm_only_parsing(
+                    prepared.parse_text, fields, prepared.warnings, prepared.processing_metadata,
+                    current_time=prepared.current_time
+                )
+            elif mode == "regex_only":
+                result = self._regex_only_parsing(
+                    prepared.parse_text, fields, prepared.warnings, prepared.processing_metadata, prepared.current_time
+                )
+            else:  # hybrid mode with per-field routing
+                memo = self._parse_memo(llm_extraction, prepared.processing_metadata)
+                result = self._per_field_routing_parsing(
+                    prepared.parse_text, fields, timezone_offset, prepared.warnings, prepared.processing_metadata, memo,
+                    prepared.current_time
+                )
+            
+            return self._restore_windowed_result(result, prepared.windowed, prepared.cleaned_text)
         
-        # Update current time context if provided
-        if current_time:
-            self.current_time = current_time
-            self.regex_extractor.set_current_time(current_time)
+        except Exception as e:
+            logger.error(f"Parsing failed: {e}")
+            return self._error_result(text, e, prepared.processing_metadata, start_time)
+    
+    def _prepare_parse(self,
+                       text: str,
+                       mode: str,
+                       fields: Optional[List[str]],
+                       timezone_offset: Optional[int],
+                       current_time: Optional[datetime],
+                       lean: bool,
+                       start_time: datetime) -> Union[_PreparedParse, HybridParsingResult]:
+        """Pre-clean and window the text; a cached result if there is one."""
+        # Per-parse reference time; the parser is shared, so it is passed along rather than stored
+        current_time = current_time or self.current_time
         
         # Pre-clean text
-        cleaned_text = self._pre_clean_text(text)
+        with stage('preprocess'):
+            cleaned_text = self._pre_clean_text(text)
         
         # Check cache first
         if self.config['enable_caching']:
-            cache_result = self._check_cache(cleaned_text, fields)
+            with stage('cache'):
+                cache_result = self._check_cache(cleaned_text, fields)
             if cache_result:
                 return cache_result
         
         # Initialize result tracking
-        warnings = []
-        processing_metadata = {
-            'original_text': text,
-            'cleaned_text': cleaned_text,
-            'mode': mode,
-            'fields_requested': fields,
-            'current_time': self.current_time.isoformat(),
-            'timezone_offset': timezone_offset,
-            'processing_start': start_time.isoformat()
-        }
+        if lean:
+            processing_metadata = {'mode': mode, 'lean': True, 'processing_start': start_time.isoformat()}
+        else:
+            processing_metadata = {
+                'original_text': text,
+                'cleaned_text': cleaned_text,
+                'mode': mode,
+                'fields_requested': fields,
+                'current_time': current_time.isoformat(),
+                'timezone_offset': timezone_offset,
+                'processing_start': start_time.isoformat()
+            }
         
-        try:
-            if mode == "llm_only":
-                return self._llm_only_parsing(cleaned_text, fields, warnings, processing_metadata)
-            elif mode == "regex_only":
-                return self._regex_only_parsing(cleaned_text, fields, warnings, processing_metadata)
-            else:  # hybrid mode with per-field routing
-                # Use concurrent processing if enabled and in async context
-                if self.config['enable_concurrent_processing']:
-                    try:
-                        # Try to run concurrent processing
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            # We're in an async context, use concurrent processing
-                            return asyncio.create_task(
-                                self._per_field_routing_parsing_concurrent(
-                                    cleaned_text, fields, timezone_offset, warnings, processing_metadata
-                                )
-                            ).result()
-                        else:
-                            # Not in async context, fall back to sequential
-                            return self._per_field_routing_parsing(cleaned_text, fields, timezone_offset, warnings, processing_metadata)
-                    except RuntimeError:
-                        # No event loop, fall back to sequential
-                        return self._per_field_routing_parsing(cleaned_text, fields, timezone_offset, warnings, processing_metadata)
-                else:
-                    return self._per_field_routing_parsing(cleaned_text, fields, timezone_offset, warnings, processing_metadata)
+        # Restrict long texts to their event-relevant regions
+        windowed = self._window_text(cleaned_text, processing_metadata)
+        return _PreparedParse(
+            cleaned_text=cleaned_text,
+            parse_text=windowed.text if windowed else cleaned_text,
+            windowed=windowed,
+            warnings=[],
+            processing_metadata=processing_metadata,
+            current_time=current_time
+        )
+    
+    @staticmethod
+    def _parse_memo(llm_extraction: Optional["EnhancementResult"], processing_metadata: Dict[str, Any]) -> ExtractionMemo:
+        """Memo for one hybrid parse, seeded with an LLM extraction already made for the text."""
+        memo = ExtractionMemo()
+        if llm_extraction is not None:
+            memo.set('llm_fallback', llm_extraction)
+            processing_metadata['llm_extraction_reused'] = llm_extraction.enhancement_method
+        return memo
+    
+    def _error_result(self, text: str, error: Exception, processing_metadata: Dict[str, Any],
+                      start_time: datetime) -> HybridParsingResult:
+        """Fallback result for a parse that raised."""
+        fallback_event = ParsedEvent(
+            description=text,
+            confidence_score=0.0,
+            extraction_metadata={
+                'error': str(error),
+                'parsing_path': 'error_fallback'
+            }
+        )
         
-        except Exception as e:
-            logger.error(f"Parsing failed: {e}")
-            
-            # Create fallback result
-            fallback_event = ParsedEvent(
-                description=text,
-                confidence_score=0.0,
-                extraction_metadata={
-                    'error': str(e),
-                    'parsing_path': 'error_fallback'
-                }
-            )
-            
-            processing_metadata['error'] = str(e)
-            processing_metadata['processing_time'] = (datetime.now() - start_time).total_seconds()
-            
-            return HybridParsingResult(
-                parsed_event=fallback_event,
-                parsing_path="error_fallback",
-                confidence_score=0.0,
-                warnings=["Parsing failed with error"],
-                processing_metadata=processing_metadata
-            )
+        processing_metadata['error'] = str(error)
+        processing_metadata['processing_time'] = (datetime.now() - start_time).total_seconds()
+        
+        return HybridParsingResult(
+            parsed_event=fallback_event,
+            parsing_path="error_fallback",
+            confidence_score=0.0,
+            warnings=["Parsing failed with error"],
+            processing_metadata=processing_metadata
+        )
     
     def _hybrid_parsing(self, 
                        text: str, 
@@ -331,14 +386,15 @@ class HybridEventParser:
     def _llm_fallback_parsing(self,
                              text: str,
                              warnings: List[str],
-                             processing_metadata: Dict[str, Any]) -> HybridParsingResult:
+                             processing_metadata: Dict[str, Any],
+                             current_time: Optional[datetime] = None) -> HybridParsingResult:
         """Regex failed → Full LLM extraction with confidence ≤0.5."""
         
         # Add warning for regex failure
         warnings.append("Regex extraction failed, using LLM fallback (confidence ≤0.5)")
         
         # Try LLM fallback
-        fallback_result = self.llm_enhancer.fallback_extraction(text, self.current_time)
+        fallback_result = self.llm_enhancer.fallback_extraction(text, current_time or self.current_time)
         
         processing_metadata['llm_fallback'] = {
             'success': fallback_result.success,
@@ -384,15 +440,17 @@ class HybridEventParser:
                            text: str,
                            fields: Optional[List[str]],
                            warnings: List[str],
-                           processing_metadata: Dict[str, Any]) -> HybridParsingResult:
+                           processing_metadata: Dict[str, Any],
+                           current_time: Optional[datetime] = None) -> HybridParsingResult:
         """Regex-only parsing mode."""
         
         # Extract datetime with regex
-        datetime_result = self.regex_extractor.extract_datetime(text)
-        title_matches = self.title_extractor.extract_title(text)
-        title_result = title_matches[0] if title_matches else None
-        location_results = self.location_extractor.extract_locations(text)
-        location = location_results[0].location if location_results else None
+        with stage('regex'):
+            datetime_result = self.regex_extractor.extract_datetime(text, current_time=current_time)
+            title_matches = self.title_extractor.extract_title(text)
+            title_result = title_matches[0] if title_matches else None
+            location_results = self.location_extractor.extract_locations(text)
+            location = location_results[0].location if location_results else None
         
         processing_metadata['regex_only'] = {
             'datetime_confidence': datetime_result.confidence,
@@ -442,11 +500,14 @@ class HybridEventParser:
                          text: str,
                          fields: Optional[List[str]],
                          warnings: List[str],
-                         processing_metadata: Dict[str, Any]) -> HybridParsingResult:
-        """LLM-only parsing mode."""
+                         processing_metadata: Dict[str, Any],
+                         fallback_result: Optional["EnhancementResult"] = None,
+                         current_time: Optional[datetime] = None) -> HybridParsingResult:
+        """LLM-only parsing mode (fallback_result: LLM extraction already made for the text)."""
         
         # Use LLM fallback (which handles full extraction)
-        fallback_result = self.llm_enhancer.fallback_extraction(text, self.current_time)
+        if fallback_result is None:
+            fallback_result = self.llm_enhancer.fallback_extraction(text, current_time or self.current_time)
         
         processing_metadata['llm_only'] = {
             'success': fallback_result.success,
@@ -485,6 +546,37 @@ class HybridEventParser:
             processing_metadata=processing_metadata
         )
     
+    def _window_text(self, text: str, processing_metadata: Dict[str, Any]) -> Optional[WindowedText]:
+        """Window long texts to their event-relevant regions (see services.relevance_windowing)."""
+        if not self.config['enable_windowing']:
+            return None
+        with stage('preprocess'):
+            windowed = get_relevance_windower().window(text)
+        if windowed:
+            processing_metadata['windowing'] = windowed.to_metadata()
+        return windowed
+    
+    def _restore_windowed_result(self,
+                                 result: HybridParsingResult,
+                                 windowed: Optional[WindowedText],
+                                 text: str) -> HybridParsingResult:
+        """Map a result parsed from windowed text back onto the full text."""
+        if windowed is None or result is None or result.parsed_event is None:
+            return result
+        
+        parsed_event = result.parsed_event
+        for field_result in parsed_event.field_results.values():
+            field_result.span = windowed.map_span(field_result.span)
+        parsed_event.description = text
+        parsed_event.extraction_metadata['windowing'] = windowed.to_metadata()
+        
+        # Re-key the cache entry by the full text so repeated requests hit it
+        if self.config['enable_caching']:
+            self.cache.pop(self._generate_cache_key(windowed.text, None), None)
+            self._cache_result(text, parsed_event)
+        
+        return result
+    
     def _pre_clean_text(self, text: str) -> str:
         """Pre-clean text for better parsing."""
         if not text:
@@ -540,14 +632,23 @@ class HybridEventParser:
         
         return telemetry
     
-    async def parse_event_text_async(self, 
-                                   text: str, 
-                                   mode: str = "hybrid",
-                                   fields: Optional[List[str]] = None,
-                                   timezone_offset: Optional[int] = None,
-                                   current_time: Optional[datetime] = None) -> HybridParsingResult:
+    async def parse_event_text_async(self,
+                                     text: str,
+                                     mode: str = "hybrid",
+                                     fields: Optional[List[str]] = None,
+                                     timezone_offset: Optional[int] = None,
+                                     current_time: Optional[datetime] = None,
+                                     llm_extraction: Optional["EnhancementResult"] = None,
+                                     lean: bool = False) -> HybridParsingResult:
         """
-        Async version of main parsing orchestration with performance optimizations.
+        Async parse_event_text, with the same results.
+        
+        CPU stages (preprocessing, routing, field extraction, aggregation) run
+        on the async pipeline's CPU pool. The LLM extraction that LLM-routed
+        fields share is awaited natively between routing and field extraction,
+        so no thread waits on the LLM. Parses running past max_processing_time
+        return a timeout fallback result; cancelling the awaiting task cancels
+        the parse, including an in-flight LLM request.
         
         Args:
             text: Input text to parse
@@ -555,125 +656,74 @@ class HybridEventParser:
             fields: Optional list of specific fields to parse (for partial parsing)
             timezone_offset: Timezone offset in hours for relative date resolution
             current_time: Current datetime context (overrides instance current_time)
+            llm_extraction: LLM extraction already made for this text (fused mode)
+            lean: Only record the processing metadata parsing itself needs
             
         Returns:
             HybridParsingResult with parsed event and metadata
-            
-        Requirements:
-        - 16.4: Concurrent field processing with asyncio.gather()
-        - 16.5: Timeout handling that returns partial results
         """
         start_time = datetime.now()
-        
-        # Update current time context if provided
-        if current_time:
-            self.current_time = current_time
-            self.regex_extractor.set_current_time(current_time)
-        
-        # Pre-clean text using precompiled patterns if available
-        cleaned_text = self._pre_clean_text_optimized(text)
-        
-        # Check cache first
-        if self.config['enable_caching']:
-            cache_result = self._check_cache(cleaned_text, fields)
-            if cache_result:
-                return cache_result
-        
-        # Initialize result tracking
-        warnings = []
-        processing_metadata = {
-            'original_text': text,
-            'cleaned_text': cleaned_text,
-            'mode': mode,
-            'fields_requested': fields,
-            'current_time': self.current_time.isoformat(),
-            'timezone_offset': timezone_offset,
-            'processing_start': start_time.isoformat(),
-            'concurrent_processing_enabled': self.config['enable_concurrent_processing']
-        }
+        prepared = await run_cpu(
+            self._prepare_parse, text, mode, fields, timezone_offset, current_time, lean, start_time
+        )
+        if isinstance(prepared, HybridParsingResult):
+            return prepared
         
         try:
-            # Execute parsing with timeout handling
-            async def parsing_operation():
-                if mode == "llm_only":
-                    return self._llm_only_parsing(cleaned_text, fields, warnings, processing_metadata)
-                elif mode == "regex_only":
-                    return self._regex_only_parsing(cleaned_text, fields, warnings, processing_metadata)
-                else:  # hybrid mode with concurrent per-field routing
-                    return await self._per_field_routing_parsing_concurrent(
-                        cleaned_text, fields, timezone_offset, warnings, processing_metadata
-                    )
-            
-            # Execute with timeout
-            result = await self.performance_optimizer.execute_with_timeout(
-                parsing_operation,
-                timeout_seconds=self.config['max_processing_time'],
-                fallback_result=self._create_fallback_result(text, warnings, processing_metadata)
+            result = await asyncio.wait_for(
+                self._parse_prepared_async(prepared, mode, fields, timezone_offset, llm_extraction),
+                timeout=self.config['max_processing_time']
             )
-            
-            return result
+            return await run_cpu(self._restore_windowed_result, result, prepared.windowed, prepared.cleaned_text)
         
+        except asyncio.TimeoutError:
+            logger.warning(f"Async parsing timed out after {self.config['max_processing_time']}s")
+            # Copies: a CPU stage that was running may still be writing to them
+            return self._create_fallback_result(text, list(prepared.warnings), dict(prepared.processing_metadata))
         except Exception as e:
             logger.error(f"Async parsing failed: {e}")
-            
-            # Create fallback result
-            fallback_event = ParsedEvent(
-                description=text,
-                confidence_score=0.0,
-                extraction_metadata={
-                    'error': str(e),
-                    'parsing_path': 'error_fallback'
-                }
-            )
-            
-            processing_metadata['error'] = str(e)
-            processing_metadata['processing_time'] = (datetime.now() - start_time).total_seconds()
-            
-            return HybridParsingResult(
-                parsed_event=fallback_event,
-                parsing_path="error_fallback",
-                confidence_score=0.0,
-                warnings=["Async parsing failed with error"],
-                processing_metadata=processing_metadata
-            )
+            return self._error_result(text, e, prepared.processing_metadata, start_time)
     
-    def _pre_clean_text_optimized(self, text: str) -> str:
-        """
-        Pre-clean text using precompiled regex patterns for better performance.
-        
-        Args:
-            text: Input text to clean
-            
-        Returns:
-            Cleaned text
-        """
-        if not text:
-            return ""
-        
-        # Basic cleaning
-        cleaned = text.strip()
-        
-        # Use precompiled patterns if available
-        time_12hour_pattern = self.performance_optimizer.get_regex_pattern('time_12hour_colon')
-        if time_12hour_pattern:
-            # Use precompiled pattern for time normalization
-            cleaned = time_12hour_pattern.sub(
-                lambda m: m.group(0).replace('.', '').replace(' ', ''),
-                cleaned
+    async def _parse_prepared_async(self,
+                                    prepared: _PreparedParse,
+                                    mode: str,
+                                    fields: Optional[List[str]],
+                                    timezone_offset: Optional[int],
+                                    llm_extraction: Optional["EnhancementResult"]) -> HybridParsingResult:
+        """Parse prepared input: CPU stages on the CPU pool, the LLM call awaited."""
+        text = prepared.parse_text
+        warnings, processing_metadata = prepared.warnings, prepared.processing_metadata
+        current_time = prepared.current_time
+        
+        if mode == "regex_only":
+            return await run_cpu(self._regex_only_parsing, text, fields, warnings, processing_metadata, current_time)
+        
+        if mode == "llm_only":
+            # First use builds the enhancer, which may probe providers
+            llm_enhancer = await run_cpu(getattr, self, 'llm_enhancer')
+            fallback_result = await llm_enhancer.fallback_extraction_async(text, current_time)
+            return await run_cpu(
+                self._llm_only_parsing, text, fields, warnings, processing_metadata, fallback_result
             )
-        else:
-            # Fallback to manual regex
-            import re
-            cleaned = re.sub(r'(\d+)\s*a\.?\s*m\.?', r'\1 AM', cleaned, flags=re.IGNORECASE)
-            cleaned = re.sub(r'(\d+)\s*p\.?\s*m\.?', r'\1 PM', cleaned, flags=re.IGNORECASE)
-            cleaned = re.sub(r'(\d+:\d+)\s*a\.?\s*m\.?', r'\1 AM', cleaned, flags=re.IGNORECASE)
-            cleaned = re.sub(r'(\d+:\d+)\s*p\.?\s*m\.?', r'\1 PM', cleaned, flags=re.IGNORECASE)
         
-        # Normalize whitespace
-        import re
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        memo = self._parse_memo(llm_extraction, processing_metadata)
         
-        return cleaned
+        def plan():
+            field_plan = self._plan_field_routing(text, fields, processing_metadata)
+            needs_llm = (
+                llm_extraction is None
+                and any(method == ProcessingMethod.LLM for method in self._field_methods(field_plan))
+                and self.llm_enhancer.is_available()
+            )
+            return field_plan, needs_llm
+        
+        field_plan, needs_llm = await run_cpu(plan)
+        if needs_llm:
+            memo.set('llm_fallback', await self.llm_enhancer.fallback_extraction_async(text, current_time))
+        return await run_cpu(
+            self._complete_field_routing, text, field_plan, timezone_offset, warnings, processing_metadata, memo,
+            current_time
+        )
     
     def _create_fallback_result(self, 
                               text: str, 
@@ -710,163 +760,41 @@ class HybridEventParser:
             processing_metadata=processing_metadata
         )
     
-    async def _per_field_routing_parsing_concurrent(self,
-                                                  text: str,
-                                                  fields: Optional[List[str]],
-                                                  timezone_offset: Optional[int],
-                                                  warnings: List[str],
-                                                  processing_metadata: Dict[str, Any]) -> HybridParsingResult:
-        """
-        Execute per-field confidence routing parsing with concurrent processing.
-        
-        Requirements:
-        - 16.4: Concurrent field processing with asyncio.gather()
-        - 16.5: Timeout handling that returns partial results
-        """
-        
-        # Step 1: Analyze field confidence potential
-        field_analyses = self.analyze_field_confidence(text)
-        processing_metadata['field_analyses'] = {
-            field: {
-                'confidence_potential': analysis.confidence_potential,
-                'recommended_method': analysis.recommended_method.value,
-                'complexity_score': analysis.complexity_score,
-                'pattern_matches': analysis.pattern_matches
-            }
-            for field, analysis in field_analyses.items()
-        }
-        
-        # Step 2: Determine which fields to process
-        if fields:
-            target_fields = fields
-        else:
-            # Include all fields that have analysis results, plus essential fields
-            target_fields = list(field_analyses.keys())
-            essential_fields = ['title', 'start_datetime', 'end_datetime']
-            for field in essential_fields:
-                if field not in target_fields:
-                    target_fields.append(field)
-        
-        # Step 3: Optimize processing order
-        optimized_fields = self.confidence_router.optimize_processing_order(target_fields)
-        processing_metadata['processing_order'] = optimized_fields
-        
-        # Step 4: Create field processors for concurrent execution
-        field_processors = {}
-        for field in optimized_fields:
-            field_analysis = field_analyses.get(field)
-            field_processors[field] = lambda t, f=field, a=field_analysis: self.route_field_processing(
-                f, t, timezone_offset, a
-            )
-        
-        # Step 5: Process fields concurrently with timeout handling
-        try:
-            if self.config['enable_concurrent_processing']:
-                field_results = await self.performance_optimizer.process_fields_with_optimization(
-                    field_processors, text, self.config['field_processing_timeout']
-                )
-            else:
-                # Fallback to sequential processing
-                field_results = {}
-                for field in optimized_fields:
-                    field_result = self.route_field_processing(field, text, timezone_offset, field_analyses.get(field))
-                    if field_result:
-                        field_results[field] = field_result
-        
-        except asyncio.TimeoutError:
-            # Handle timeout with partial results
-            warnings.append(f"Field processing timed out after {self.config['field_processing_timeout']}s")
-            if self.config['enable_partial_results']:
-                # Try to get partial results from completed fields
-                field_results = await self._get_partial_field_results(field_processors, text, optimized_fields[:3])
-                warnings.append("Returning partial results due to timeout")
-            else:
-                # Return empty results
-                field_results = {}
-        
-        processing_metadata['field_processing_times'] = {
-            field: result.processing_time_ms for field, result in field_results.items()
-            if hasattr(result, 'processing_time_ms')
-        }
-        
-        # Step 6: Aggregate results
-        parsed_event = self.aggregate_field_results(field_results, text)
-        
-        # Step 7: Validate and cache
-        validation_result = self.validate_and_cache(text, parsed_event)
-        if not validation_result.is_valid:
-            warnings.extend(validation_result.warnings)
-            parsed_event.needs_confirmation = True
-        
-        # Calculate overall confidence and parsing path
-        confidence_score = self._calculate_overall_confidence(field_results)
-        parsing_path = self._determine_parsing_path(field_results)
-        
-        # Add warnings based on confidence
-        if confidence_score < self.config['warning_confidence_threshold']:
-            warnings.append(f"Overall confidence below threshold ({confidence_score:.2f})")
-        
-        processing_metadata['processing_time'] = (datetime.now() - datetime.fromisoformat(processing_metadata['processing_start'])).total_seconds()
-        
-        return HybridParsingResult(
-            parsed_event=parsed_event,
-            parsing_path=parsing_path,
-            confidence_score=confidence_score,
-            warnings=warnings,
-            processing_metadata=processing_metadata
-        )
-    
-    async def _get_partial_field_results(self, 
-                                       field_processors: Dict[str, Any],
-                                       text: str,
-                                       priority_fields: List[str]) -> Dict[str, FieldResult]:
-        """
-        Get partial results from high-priority fields when timeout occurs.
-        
-        Args:
-            field_processors: Field processing functions
-            text: Input text
-            priority_fields: High-priority fields to process first
-            
-        Returns:
-            Dictionary of partial field results
-        """
-        partial_results = {}
-        
-        # Process only high-priority fields with shorter timeout
-        priority_processors = {
-            field: processor for field, processor in field_processors.items()
-            if field in priority_fields
-        }
-        
-        try:
-            partial_results = await self.performance_optimizer.process_fields_with_optimization(
-                priority_processors, text, timeout_seconds=3.0  # Shorter timeout for partial results
-            )
-        except Exception as e:
-            logger.warning(f"Partial field processing failed: {e}")
-        
-        return partial_results
-    
     def _per_field_routing_parsing(self,
                                   text: str,
                                   fields: Optional[List[str]],
                                   timezone_offset: Optional[int],
                                   warnings: List[str],
-                                  processing_metadata: Dict[str, Any]) -> HybridParsingResult:
+                                  processing_metadata: Dict[str, Any],
+                                  memo: Optional[ExtractionMemo] = None,
+                                  current_time: Optional[datetime] = None) -> HybridParsingResult:
         """Execute per-field confidence routing parsing strategy."""
+        field_plan = self._plan_field_routing(text, fields, processing_metadata)
+        return self._complete_field_routing(
+            text, field_plan, timezone_offset, warnings, processing_metadata,
+            memo if memo is not None else ExtractionMemo(), current_time
+        )
+    
+    def _plan_field_routing(self,
+                            text: str,
+                            fields: Optional[List[str]],
+                            processing_metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Per-field routing steps 1-3: (field analyses, fields in processing order)."""
         
         # Step 1: Analyze field confidence potential
-        field_analyses = self.analyze_field_confidence(text)
-        processing_metadata['field_analyses'] = {
-            field: {
-                'confidence_potential': analysis.confidence_potential,
-                'recommended_method': analysis.recommended_method.value,
-                'complexity_score': analysis.complexity_score,
-                'pattern_matches': analysis.pattern_matches
+        with stage('routing'):
+            field_analyses = self.analyze_field_confidence(text)
+        lean = processing_metadata.get('lean', False)
+        if not lean:
+            processing_metadata['field_analyses'] = {
+                field: {
+                    'confidence_potential': analysis.confidence_potential,
+                    'recommended_method': analysis.recommended_method.value,
+                    'complexity_score': analysis.complexity_score,
+                    'pattern_matches': analysis.pattern_matches
+                }
+                for field, analysis in field_analyses.items()
             }
-            for field, analysis in field_analyses.items()
-        }
         
         # Step 2: Determine which fields to process
         if fields:
@@ -881,31 +809,58 @@ class HybridEventParser:
         
         # Step 3: Optimize processing order
         optimized_fields = self.confidence_router.optimize_processing_order(target_fields)
-        processing_metadata['processing_order'] = optimized_fields
+        if not lean:
+            processing_metadata['processing_order'] = optimized_fields
         
-        # Step 4: Route and process each field
+        return field_analyses, optimized_fields
+    
+    def _field_methods(self, field_plan: Tuple[Dict[str, Any], List[str]]) -> List[ProcessingMethod]:
+        """Processing method of each planned field."""
+        field_analyses, optimized_fields = field_plan
+        return [self._processing_method(field, field_analyses.get(field)) for field in optimized_fields]
+    
+    def _complete_field_routing(self,
+                                text: str,
+                                field_plan: Tuple[Dict[str, Any], List[str]],
+                                timezone_offset: Optional[int],
+                                warnings: List[str],
+                                processing_metadata: Dict[str, Any],
+                                memo: ExtractionMemo,
+                                current_time: Optional[datetime] = None) -> HybridParsingResult:
+        """Per-field routing steps 4-6: extract the planned fields, aggregate and validate."""
+        field_analyses, optimized_fields = field_plan
+        lean = processing_metadata.get('lean', False)
+        
+        # Step 4: Route and process each field, sharing extractor outputs
         field_results = {}
         for field in optimized_fields:
-            field_result = self.route_field_processing(field, text, timezone_offset, field_analyses.get(field))
+            # Stop between fields once the request has been abandoned
+            check_cancelled()
+            field_result = self.route_field_processing(
+                field, text, timezone_offset, field_analyses.get(field), memo, current_time
+            )
             if field_result:
                 field_results[field] = field_result
         
-        processing_metadata['field_processing_times'] = {
-            field: result.processing_time_ms for field, result in field_results.items()
-        }
+        if not lean:
+            processing_metadata['field_processing_times'] = {
+                field: result.processing_time_ms for field, result in field_results.items()
+            }
+            processing_metadata['extraction_memo'] = memo.get_stats()
         
         # Step 5: Aggregate results
-        parsed_event = self.aggregate_field_results(field_results, text)
-        
-        # Step 6: Validate and cache
-        validation_result = self.validate_and_cache(text, parsed_event)
-        if not validation_result.is_valid:
-            warnings.extend(validation_result.warnings)
-            parsed_event.needs_confirmation = True
-        
-        # Calculate overall confidence and parsing path
-        confidence_score = self._calculate_overall_confidence(field_results)
-        parsing_path = self._determine_parsing_path(field_results)
+        with stage('aggregation'):
+            parsed_event = self.aggregate_field_results(field_results, text)
+            
+            # Step 6: Validate and cache
+            validation_result = self.validate_and_cache(text, parsed_event)
+            if not validation_result.is_valid:
+                warnings.extend(validation_result.warnings)
+                parsed_event.needs_confirmation = True
+            
+            # Calculate overall confidence and parsing path
+            confidence_score = self._calculate_overall_confidence(field_results)
+            parsing_path = self._determine_parsing_path(field_results)
         
         # Add warnings based on confidence
         if confidence_score < self.config['warning_confidence_threshold']:
@@ -937,7 +892,9 @@ class HybridEventParser:
                               field: str, 
                               text: str, 
                               timezone_offset: Optional[int],
-                              field_analysis: Optional[Any] = None) -> Optional[FieldResult]:
+                              field_analysis: Optional[Any] = None,
+                              memo: Optional[ExtractionMemo] = None,
+                              current_time: Optional[datetime] = None) -> Optional[FieldResult]:
         """
         Determine optimal processing method per field and execute extraction.
         
@@ -946,34 +903,32 @@ class HybridEventParser:
             text: Input text
             timezone_offset: Timezone offset for datetime fields
             field_analysis: Pre-computed field analysis (optional)
+            memo: Extractor outputs shared by the fields of this parse (optional)
+            current_time: Reference time for relative dates (default: the parser's)
             
         Returns:
             FieldResult with extracted value and metadata
         """
         start_time = datetime.now()
+        processing_method = self._processing_method(field, field_analysis)
         
-        # Determine processing method
-        if field_analysis:
-            processing_method = field_analysis.recommended_method
-            confidence_potential = field_analysis.confidence_potential
-        else:
-            # Fallback analysis
-            confidence_potential = 0.5  # Default medium confidence
-            processing_method = self.confidence_router.route_processing_method(field, confidence_potential)
-        
-        # For essential fields, don't skip even if recommended
-        essential_fields = ['title', 'start_datetime', 'end_datetime']
-        if processing_method == ProcessingMethod.SKIP and field in essential_fields:
-            processing_method = ProcessingMethod.DETERMINISTIC  # Try deterministic for essential fields
+        # Once the parse has spent its regex CPU budget, skip the remaining
+        # pattern-heavy stages instead of pinning the worker
+        if processing_method in (ProcessingMethod.REGEX, ProcessingMethod.DETERMINISTIC) and regex_budget_exhausted():
+            logger.warning(f"Skipping {processing_method.value} extraction for {field}: regex CPU budget exhausted")
+            return None
         
         # Execute extraction based on method
         try:
             if processing_method == ProcessingMethod.REGEX:
-                result = self._extract_field_with_regex(field, text, timezone_offset)
+                with stage('regex'):
+                    result = self._extract_field_with_regex(field, text, timezone_offset, memo, current_time)
             elif processing_method == ProcessingMethod.DETERMINISTIC:
-                result = self._extract_field_with_deterministic(field, text, timezone_offset)
+                with stage('deterministic'):
+                    result = self._extract_field_with_deterministic(field, text, timezone_offset, memo, current_time)
             elif processing_method == ProcessingMethod.LLM:
-                result = self._extract_field_with_llm(field, text, timezone_offset)
+                with stage('llm'):
+                    result = self._extract_field_with_llm(field, text, timezone_offset, memo, current_time)
             else:  # SKIP
                 return None
             
@@ -994,6 +949,20 @@ class HybridEventParser:
                 processing_time_ms=int((datetime.now() - start_time).total_seconds() * 1000)
             )
     
+    def _processing_method(self, field: str, field_analysis: Optional[Any] = None) -> ProcessingMethod:
+        """Processing method for a field, from its analysis or a default-confidence route."""
+        if field_analysis:
+            processing_method = field_analysis.recommended_method
+        else:
+            # Fallback analysis with default medium confidence
+            processing_method = self.confidence_router.route_processing_method(field, 0.5)
+        
+        # For essential fields, don't skip even if recommended
+        essential_fields = ['title', 'start_datetime', 'end_datetime']
+        if processing_method == ProcessingMethod.SKIP and field in essential_fields:
+            processing_method = ProcessingMethod.DETERMINISTIC  # Try deterministic for essential fields
+        return processing_method
+    
     def aggregate_field_results(self, field_results: Dict[str, FieldResult], original_text: str) -> ParsedEvent:
         """
         Combine field results with provenance tracking into a ParsedEvent.
@@ -1070,47 +1039,59 @@ class HybridEventParser:
         
         return validation_result
     
-    def _extract_field_with_regex(self, field: str, text: str, timezone_offset: Optional[int]) -> Optional[FieldResult]:
+    @staticmethod
+    def _memoized(memo: Optional[ExtractionMemo], key: Any, compute):
+        """Run compute through the parse's memo, or directly without one."""
+        return memo.get(key, compute) if memo is not None else compute()
+    
+    def _extract_field_with_regex(self, field: str, text: str, timezone_offset: Optional[int],
+                                  memo: Optional[ExtractionMemo] = None,
+                                  current_time: Optional[datetime] = None) -> Optional[FieldResult]:
         """Extract field using regex-based methods."""
         if field in ['start_datetime', 'end_datetime']:
-            datetime_result = self.regex_extractor.extract_datetime(text, timezone_offset)
+            datetime_result = self._memoized(
+                memo, ('datetime', timezone_offset),
+                lambda: self.regex_extractor.extract_datetime(text, timezone_offset, current_time)
+            )
             if field == 'start_datetime' and datetime_result.start_datetime:
                 return FieldResult(
                     value=datetime_result.start_datetime,
                     source="regex",
                     confidence=datetime_result.confidence,
-                    span=(0, len(text))  # Simplified span
+                    span=datetime_result.span or (0, len(text))
                 )
             elif field == 'end_datetime' and datetime_result.end_datetime:
                 return FieldResult(
                     value=datetime_result.end_datetime,
                     source="regex",
                     confidence=datetime_result.confidence,
-                    span=(0, len(text))
+                    span=datetime_result.span or (0, len(text))
                 )
         elif field == 'title':
-            title_matches = self.title_extractor.extract_title(text)
+            title_matches = self._memoized(memo, 'titles', lambda: self.title_extractor.extract_title(text))
             title_result = title_matches[0] if title_matches else None
             if title_result and title_result.title:
                 return FieldResult(
                     value=title_result.title,
                     source="regex",
                     confidence=title_result.confidence,
-                    span=(0, len(text))
+                    span=(title_result.start_pos, title_result.end_pos)
                 )
         elif field == 'location':
-            location_results = self.location_extractor.extract_locations(text)
+            location_results = self._memoized(memo, 'locations', lambda: self.location_extractor.extract_locations(text))
             if location_results:
                 return FieldResult(
                     value=location_results[0].location,
                     source="regex",
                     confidence=location_results[0].confidence,
-                    span=(0, len(text))
+                    span=tuple(location_results[0].position)
                 )
         
         return None
     
-    def _extract_field_with_deterministic(self, field: str, text: str, timezone_offset: Optional[int]) -> Optional[FieldResult]:
+    def _extract_field_with_deterministic(self, field: str, text: str, timezone_offset: Optional[int],
+                                          memo: Optional[ExtractionMemo] = None,
+                                          current_time: Optional[datetime] = None) -> Optional[FieldResult]:
         """Extract field using deterministic backup methods."""
         try:
             # Initialize deterministic backup layer if not available
@@ -1121,7 +1102,7 @@ class HybridEventParser:
             # Check if deterministic services are available
             if not self.deterministic_backup.is_available():
                 # Fallback to regex with reduced confidence
-                result = self._extract_field_with_regex(field, text, timezone_offset)
+                result = self._extract_field_with_regex(field, text, timezone_offset, memo, current_time)
                 if result:
                     result.source = "deterministic_fallback"
                     result.confidence = min(0.8, result.confidence)  # Cap at 0.8 for deterministic
@@ -1130,7 +1111,7 @@ class HybridEventParser:
             
             # For now, skip actual deterministic extraction to avoid timezone issues
             # and fallback to regex with deterministic confidence range
-            result = self._extract_field_with_regex(field, text, timezone_offset)
+            result = self._extract_field_with_regex(field, text, timezone_offset, memo, current_time)
             if result:
                 result.source = "deterministic_simulated"
                 result.confidence = max(0.6, min(0.8, result.confidence))  # Ensure deterministic range
@@ -1159,7 +1140,7 @@ class HybridEventParser:
         except Exception as e:
             logger.error(f"Deterministic extraction failed for {field}: {e}")
             # Fallback to regex with reduced confidence
-            result = self._extract_field_with_regex(field, text, timezone_offset)
+            result = self._extract_field_with_regex(field, text, timezone_offset, memo, current_time)
             if result:
                 result.source = "deterministic_error_fallback"
                 result.confidence = min(0.7, result.confidence)
@@ -1238,15 +1219,19 @@ class HybridEventParser:
         
         return None
     
-    def _extract_field_with_llm(self, field: str, text: str, timezone_offset: Optional[int]) -> Optional[FieldResult]:
+    def _extract_field_with_llm(self, field: str, text: str, timezone_offset: Optional[int],
+                                memo: Optional[ExtractionMemo] = None,
+                                current_time: Optional[datetime] = None) -> Optional[FieldResult]:
         """Extract field using LLM enhancement."""
         try:
             # Check if LLM enhancer is available
             if not self.llm_enhancer.is_available():
                 return None
             
-            # Use fallback extraction and extract specific field
-            fallback_result = self.llm_enhancer.fallback_extraction(text, self.current_time)
+            # Use fallback extraction (one call serves every LLM-routed field) and extract specific field
+            fallback_result = self._memoized(
+                memo, 'llm_fallback', lambda: self.llm_enhancer.fallback_extraction(text, current_time or self.current_time)
+            )
             if fallback_result.success and fallback_result.fallback_event:
                 event = fallback_result.fallback_event
                 
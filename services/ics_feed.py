@@ -0,0 +1,397 @@
+"""
+Streaming multi-event ICS feed generation.
+
+This module provides:
+- Chunked VCALENDAR generation for many events in constant memory
+- RRULE support from explicit rules or natural language via RecurrenceProcessor;
+  rules are checked against the RFC 5545 RECUR grammar and invalid ones are
+  dropped, so no caller input can inject content lines into the feed
+- Content-addressed feed batches (the batch ID doubles as the ETag)
+- A bounded in-memory batch store so feeds can be re-downloaded or subscribed to
+- The ICS text helpers (line folding, escaping, date formatting) shared with
+  the single-event /ics endpoint
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pytz
+
+from services.recurrence_processor import RecurrenceProcessor
+
+logger = logging.getLogger(__name__)
+
+# Events rendered per yielded chunk (amortizes per-write overhead of chunked responses)
+DEFAULT_CHUNK_EVENTS = 64
+
+# RFC 5545 content lines are folded at 75 octets
+ICS_LINE_LIMIT = 75
+
+# Serialized feed event bytes the batch store keeps across all batches
+DEFAULT_STORE_MAX_BYTES = 32 * 1024 * 1024
+
+# Fields of a feed event that are part of its identity (and the batch ETag)
+FEED_EVENT_FIELDS = ('title', 'start', 'end', 'location', 'description', 'allday',
+                     'recurrence', 'recurrence_text')
+
+# RFC 5545 RECUR rule parts and the values each accepts
+_WEEKDAY = r'(?:SU|MO|TU|WE|TH|FR|SA)'
+
+
+def _number_list(digits: int, signed: bool = False) -> str:
+    number = (r'[+-]?' if signed else '') + r'\d{1,%d}' % digits
+    return rf'{number}(?:,{number})*'
+
+
+RRULE_PART_VALUES = {
+    'FREQ': r'(?:SECONDLY|MINUTELY|HOURLY|DAILY|WEEKLY|MONTHLY|YEARLY)',
+    'UNTIL': r'\d{8}(?:T\d{6}Z?)?',
+    'COUNT': r'\d{1,6}',
+    'INTERVAL': r'\d{1,6}',
+    'BYSECOND': _number_list(2),
+    'BYMINUTE': _number_list(2),
+    'BYHOUR': _number_list(2),
+    'BYDAY': rf'[+-]?\d{{0,2}}{_WEEKDAY}(?:,[+-]?\d{{0,2}}{_WEEKDAY})*',
+    'BYMONTHDAY': _number_list(2, signed=True),
+    'BYYEARDAY': _number_list(3, signed=True),
+    'BYWEEKNO': _number_list(2, signed=True),
+    'BYMONTH': _number_list(2),
+    'BYSETPOS': _number_list(3, signed=True),
+    'WKST': _WEEKDAY,
+}
+_RRULE_PART_PATTERNS = {name: re.compile(value, re.ASCII) for name, value in RRULE_PART_VALUES.items()}
+
+
+def compute_batch_id(events: Iterable[Dict[str, Any]]) -> str:
+    """
+    Compute a content hash for a list of feed events.
+
+    The hash is updated one event at a time, so it does not need the rendered feed.
+
+    Args:
+        events: Feed event dictionaries
+
+    Returns:
+        Hex digest used as both batch ID and ETag
+    """
+    return _hash_batch(events)[0]
+
+
+def _hash_batch(events: Iterable[Dict[str, Any]]) -> Tuple[str, int]:
+    """Compute the batch ID and the serialized size of the events in bytes."""
+    digest = hashlib.sha256()
+    size = 0
+    for event in events:
+        canonical = {field: event.get(field) for field in FEED_EVENT_FIELDS}
+        encoded = json.dumps(canonical, sort_keys=True, default=str).encode('utf-8')
+        digest.update(encoded)
+        digest.update(b"\n")
+        size += len(encoded)
+    return digest.hexdigest()[:32], size
+
+
+def feed_etag(batch_id: str, calendar_name: Optional[str] = None) -> str:
+    """
+    Build the quoted ETag for a rendered feed.
+
+    Args:
+        batch_id: Batch content hash
+        calendar_name: Calendar name, which also changes the rendered output
+
+    Returns:
+        Strong ETag header value
+    """
+    if not calendar_name:
+        return f'"{batch_id}"'
+    suffix = hashlib.sha256(calendar_name.encode('utf-8')).hexdigest()[:8]
+    return f'"{batch_id}-{suffix}"'
+
+
+class ICSFeedGenerator:
+    """Renders feed events into a streamed VCALENDAR."""
+
+    def __init__(self, recurrence_processor: Optional[RecurrenceProcessor] = None,
+                 chunk_events: int = DEFAULT_CHUNK_EVENTS):
+        """
+        Initialize the generator.
+
+        Args:
+            recurrence_processor: Processor for natural language recurrence text
+            chunk_events: Number of VEVENTs per yielded chunk
+        """
+        self.recurrence_processor = recurrence_processor or RecurrenceProcessor()
+        self.chunk_events = max(1, chunk_events)
+
+    def stream(self, events: Iterable[Dict[str, Any]], batch_id: str,
+               calendar_name: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the VCALENDAR in chunks.
+
+        Only one chunk of rendered text is held at a time; `events` may be any
+        iterable, including a generator.
+
+        Args:
+            events: Feed event dictionaries
+            batch_id: Batch ID, used to derive stable UIDs
+            calendar_name: Optional X-WR-CALNAME
+
+        Yields:
+            ICS text chunks
+        """
+        header = [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//Calendar Event Creator//EN",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+        ]
+        if calendar_name:
+            header.append(f"X-WR-CALNAME:{escape_ics_text(calendar_name)}")
+        yield "".join(fold_ics_line(line) for line in header)
+
+        dtstamp = format_datetime_for_ics(datetime.utcnow())
+        chunk: List[str] = []
+        for position, event in enumerate(events):
+            chunk.append(self.render_event(event, f"{batch_id}-{position}@calendar-event-creator", dtstamp))
+            if len(chunk) >= self.chunk_events:
+                yield "".join(chunk)
+                chunk = []
+
+        chunk.append(fold_ics_line("END:VCALENDAR"))
+        yield "".join(chunk)
+
+    def render_event(self, event: Dict[str, Any], uid: str, dtstamp: str) -> str:
+        """
+        Render one VEVENT.
+
+        Args:
+            event: Feed event dictionary
+            uid: Stable UID for the event
+            dtstamp: Pre-formatted DTSTAMP value
+
+        Returns:
+            VEVENT text with CRLF line endings
+        """
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{uid}",
+            f"DTSTAMP:{dtstamp}",
+            f"SUMMARY:{escape_ics_text(event.get('title') or 'Calendar Event')}",
+        ]
+
+        start = _parse_datetime(event.get('start'))
+        end = _parse_datetime(event.get('end'))
+        if start is not None:
+            if event.get('allday'):
+                end = end or start + timedelta(days=1)
+                lines.append(f"DTSTART;VALUE=DATE:{format_date_for_ics(start)}")
+                lines.append(f"DTEND;VALUE=DATE:{format_date_for_ics(end)}")
+            else:
+                end = end or start + timedelta(hours=1)
+                lines.append(f"DTSTART:{format_datetime_for_ics(start)}")
+                lines.append(f"DTEND:{format_datetime_for_ics(end)}")
+
+        rrule = self.resolve_rrule(event)
+        if rrule:
+            lines.append(f"RRULE:{rrule}")
+
+        if event.get('location'):
+            lines.append(f"LOCATION:{escape_ics_text(event['location'])}")
+        if event.get('description'):
+            lines.append(f"DESCRIPTION:{escape_ics_text(event['description'])}")
+
+        lines.append("END:VEVENT")
+        return "".join(fold_ics_line(line) for line in lines)
+
+    def resolve_rrule(self, event: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the RRULE value for an event.
+
+        An explicit `recurrence` (with or without the "RRULE:" prefix) wins;
+        otherwise `recurrence_text` is parsed with RecurrenceProcessor. Rules
+        that do not validate (see validate_rrule) are dropped.
+        """
+        recurrence = (event.get('recurrence') or '').strip()
+        if recurrence:
+            rrule = validate_rrule(recurrence)
+        elif event.get('recurrence_text'):
+            recurrence = self.recurrence_processor.parse_recurrence_pattern(event['recurrence_text']).rrule
+            rrule = validate_rrule(recurrence) if recurrence else None
+        else:
+            return None
+
+        if recurrence and rrule is None:
+            logger.warning(f"Dropping invalid RRULE from ICS feed event: {recurrence!r}")
+        return rrule
+
+
+class ICSFeedStore:
+    """
+    Bounded, thread-safe LRU store of feed batches keyed by batch ID.
+
+    Batches are evicted least recently used first once either the batch count
+    or the total serialized size of the stored events exceeds its limit. A
+    batch larger than the whole size budget is not stored.
+    """
+
+    def __init__(self, max_batches: int = 256, max_bytes: int = DEFAULT_STORE_MAX_BYTES):
+        self.max_batches = max_batches
+        self.max_bytes = max_bytes
+        self._batches: "OrderedDict[str, Tuple[List[Dict[str, Any]], int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, events: List[Dict[str, Any]]) -> str:
+        """
+        Store a batch of feed events.
+
+        Args:
+            events: Feed event dictionaries
+
+        Returns:
+            The batch ID (content hash, so identical batches share an ID)
+        """
+        batch_id, size = _hash_batch(events)
+        if size > self.max_bytes:
+            logger.warning(f"ICS feed batch {batch_id} ({size} bytes) exceeds the store budget; not stored")
+            return batch_id
+
+        with self._lock:
+            previous = self._batches.pop(batch_id, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            self._batches[batch_id] = (events, size)
+            self._total_bytes += size
+            while len(self._batches) > self.max_batches or self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._batches.popitem(last=False)
+                self._total_bytes -= evicted_size
+        return batch_id
+
+    def get(self, batch_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Get a stored batch, or None if unknown or evicted."""
+        with self._lock:
+            entry = self._batches.get(batch_id)
+            if entry is None:
+                return None
+            self._batches.move_to_end(batch_id)
+            return entry[0]
+
+    @property
+    def total_bytes(self) -> int:
+        """Serialized size of all stored events."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._batches)
+
+
+def fold_ics_line(line: str) -> str:
+    """Fold a content line at 75 octets and terminate it with CRLF."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= ICS_LINE_LIMIT:
+        return line + "\r\n"
+
+    parts = []
+    limit = ICS_LINE_LIMIT
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Do not split a multi-byte UTF-8 sequence
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+        limit = ICS_LINE_LIMIT - 1  # continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def validate_rrule(rule: str) -> Optional[str]:
+    """
+    Validate a recurrence rule against the RFC 5545 RECUR grammar.
+
+    Args:
+        rule: Rule value, with or without the "RRULE:" prefix
+
+    Returns:
+        The rule value (upper-cased, without prefix), or None if it is not a
+        valid RECUR value: unknown or repeated parts, malformed values, no
+        FREQ, or any character (such as CR/LF) outside the grammar
+    """
+    rule = rule.strip().upper()
+    if rule.startswith('RRULE:'):
+        rule = rule[len('RRULE:'):]
+    if not rule or '\r' in rule or '\n' in rule:
+        return None
+
+    names = set()
+    for part in rule.split(';'):
+        name, separator, value = part.partition('=')
+        pattern = _RRULE_PART_PATTERNS.get(name)
+        if not separator or pattern is None or name in names or not pattern.fullmatch(value):
+            return None
+        names.add(name)
+    if 'FREQ' not in names or {'UNTIL', 'COUNT'} <= names:
+        return None
+    return rule
+
+
+def format_date_for_ics(dt: datetime) -> str:
+    """Format date for ICS (YYYYMMDD)."""
+    return dt.strftime("%Y%m%d")
+
+
+def format_datetime_for_ics(dt: datetime) -> str:
+    """Format datetime for ICS (YYYYMMDDTHHMMSSZ)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=pytz.UTC)
+    elif dt.tzinfo != pytz.UTC:
+        dt = dt.astimezone(pytz.UTC)
+    return dt.strftime("%Y%m%dT%H%M%SZ")
+
+
+def escape_ics_text(text: str) -> str:
+    """Escape text for ICS format."""
+    if not text:
+        return ""
+    return (text
+            .replace("\\", "\\\\")
+            .replace(";", "\\;")
+            .replace(",", "\\,")
+            .replace("\n", "\\n")
+            .replace("\r", ""))
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid datetime in ICS feed event: {value!r}")
+        return None
+
+
+# Global instances
+_ics_feed_store: Optional[ICSFeedStore] = None
+_ics_feed_generator: Optional[ICSFeedGenerator] = None
+
+
+def get_ics_feed_store() -> ICSFeedStore:
+    """Get the global ICS feed batch store."""
+    global _ics_feed_store
+    if _ics_feed_store is None:
+        _ics_feed_store = ICSFeedStore()
+    return _ics_feed_store
+
+
+def get_ics_feed_generator() -> ICSFeedGenerator:
+    """Get the global ICS feed generator."""
+    global _ics_feed_generator
+    if _ics_feed_generator is None:
+        _ics_feed_generator = ICSFeedGenerator()
+    return _ics_feed_generator
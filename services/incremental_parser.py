@@ -0,0 +1,307 @@
+"""
+Incremental re-parsing of edited text.
+
+Editors such as the browser extension and the mobile preview re-send the
+whole text every time the user tweaks a word. Per-field routing records the
+span each field was extracted from, so after a small edit most field results
+are still valid: only the fields whose span (widened by a context window,
+since extractors look at neighbouring words) overlaps the edit need their
+extractor run again. The other results are reused with their spans shifted.
+
+A full parse stores a snapshot of its field results under an opaque parse
+token. A reparse applies a list of edits to the snapshot's text, re-runs the
+affected fields and stores the new snapshot under a new token. Snapshots are
+kept in a bounded, thread-safe LRU store with a TTL.
+
+Spans refer to the parser's pre-cleaned text. Edits refer to the text as the
+client sent it, so the edited region is found again by comparing the cleaned
+texts before and after the edit.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from models.event_models import FieldResult, ParsedEvent
+from services.env_config import env_float, env_int
+from services.extraction_memo import ExtractionMemo
+
+logger = logging.getLogger(__name__)
+
+# Fields per-field routing always processes (see HybridEventParser)
+ESSENTIAL_FIELDS = ('title', 'start_datetime', 'end_datetime')
+
+# Fields produced by one extractor run: re-running one re-runs the others
+FIELD_GROUPS = (('start_datetime', 'end_datetime'),)
+
+
+@dataclass
+class IncrementalParseConfig:
+    """Incremental parsing settings (see from_env for the environment variables)."""
+    context_chars: int = 24       # edits this close to a field's span re-run its extractor
+    ttl_seconds: float = 600.0    # how long a parse token stays valid
+    max_snapshots: int = 1000     # least recently used snapshots are evicted beyond this
+    max_text_length: int = 10000  # longest text an edit may produce (matches /parse)
+
+    @classmethod
+    def from_env(cls) -> 'IncrementalParseConfig':
+        """Build config from INCREMENTAL_PARSE_* environment variables."""
+        return cls(
+            context_chars=max(0, env_int('INCREMENTAL_PARSE_CONTEXT_CHARS', cls.context_chars)),
+            ttl_seconds=env_float('INCREMENTAL_PARSE_TTL_SECONDS', cls.ttl_seconds),
+            max_snapshots=max(1, env_int('INCREMENTAL_PARSE_MAX_SNAPSHOTS', cls.max_snapshots)),
+        )
+
+
+@dataclass
+class TextEdit:
+    """Replace text[start:end] with text. Offsets refer to the text before this edit."""
+    start: int
+    end: int
+    text: str = ""
+
+    def apply(self, text: str) -> str:
+        """Return the edited text; raises ValueError for offsets outside the text."""
+        if not 0 <= self.start <= self.end <= len(text):
+            raise ValueError(f"Edit range {self.start}-{self.end} is outside the text (length {len(text)})")
+        return text[:self.start] + self.text + text[self.end:]
+
+
+@dataclass
+class ParseSnapshot:
+    """Field results of one parse, with the text their spans refer to."""
+    text: str
+    parse_text: str
+    field_results: Dict[str, FieldResult]
+    timezone_offset: Optional[int]
+    reference_date: date
+    created_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class IncrementalParseResult:
+    """Result of a full or incremental parse."""
+    parsed_event: ParsedEvent
+    parse_token: str
+    reparsed_fields: List[str]
+    reused_fields: List[str]
+    full_parse: bool
+
+    def to_metadata(self) -> Dict[str, object]:
+        return {
+            'full_parse': self.full_parse,
+            'reparsed_fields': self.reparsed_fields,
+            'reused_fields': self.reused_fields
+        }
+
+
+class ParseSnapshotStore:
+    """
+    Bounded, thread-safe LRU store of parse snapshots keyed by parse token.
+    """
+
+    def __init__(self, max_snapshots: int = 1000, ttl_seconds: float = 600.0):
+        self.max_snapshots = max_snapshots
+        self.ttl_seconds = ttl_seconds
+        self._snapshots: "OrderedDict[str, ParseSnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, snapshot: ParseSnapshot) -> str:
+        """Store a snapshot and return its new parse token."""
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._snapshots[token] = snapshot
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return token
+
+    def get(self, token: str) -> Optional[ParseSnapshot]:
+        """Get a stored snapshot, or None if unknown, evicted or expired."""
+        with self._lock:
+            snapshot = self._snapshots.get(token)
+            if snapshot is None:
+                return None
+            if time.monotonic() - snapshot.created_at > self.ttl_seconds:
+                del self._snapshots[token]
+                return None
+            self._snapshots.move_to_end(token)
+            return snapshot
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+def changed_region(old: str, new: str) -> Tuple[int, int, int]:
+    """
+    Locate the single region where two texts differ.
+
+    Returns:
+        (start, old_end, new_end): old[start:old_end] was replaced by new[start:new_end]
+    """
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    suffix = 0
+    while suffix < limit - start and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return start, len(old) - suffix, len(new) - suffix
+
+
+class IncrementalParser:
+    """
+    Re-parses edited text by re-running only the extractors an edit touches.
+
+    Args:
+        hybrid_parser: HybridEventParser whose per-field routing does the extraction
+        store: Snapshot store (default: the shared store)
+        config: Incremental parsing settings
+    """
+
+    def __init__(self, hybrid_parser, store: Optional[ParseSnapshotStore] = None,
+                 config: Optional[IncrementalParseConfig] = None):
+        self.hybrid_parser = hybrid_parser
+        self.config = config or IncrementalParseConfig.from_env()
+        self.store = store or get_parse_snapshot_store()
+
+    def parse(self, text: str, timezone_offset: Optional[int] = None,
+              current_time: Optional[datetime] = None) -> IncrementalParseResult:
+        """Parse text in full and store its field results under a new parse token."""
+        result = self.hybrid_parser.parse_event_text(
+            text, timezone_offset=timezone_offset, current_time=current_time, lean=True
+        )
+        parsed_event = result.parsed_event
+        # Copies, so later edits never touch results held by the parser's cache
+        field_results = {name: replace(fr) for name, fr in parsed_event.field_results.items()}
+        token = self._remember(text, field_results, timezone_offset, current_time)
+        return IncrementalParseResult(
+            parsed_event=parsed_event,
+            parse_token=token,
+            reparsed_fields=sorted(field_results),
+            reused_fields=[],
+            full_parse=True
+        )
+
+    def reparse(self, token: str, edits: Sequence[TextEdit], timezone_offset: Optional[int] = None,
+                current_time: Optional[datetime] = None) -> Optional[IncrementalParseResult]:
+        """
+        Apply edits to a previous parse and re-run the fields they affect.
+
+        Args:
+            token: Parse token of the previous parse
+            edits: Edits applied in order, each against the text left by the previous one
+            timezone_offset: Timezone offset for datetime fields
+            current_time: Current datetime context
+
+        Returns:
+            IncrementalParseResult, or None if the token is unknown or expired
+
+        Raises:
+            ValueError: If an edit falls outside the text or makes it too long
+        """
+        snapshot = self.store.get(token)
+        if snapshot is None:
+            return None
+
+        text = snapshot.text
+        for edit in edits:
+            text = edit.apply(text)
+        if len(text) > self.config.max_text_length:
+            raise ValueError(f"Edited text is too long (maximum {self.config.max_text_length} characters)")
+
+        # Relative dates were resolved against the snapshot's day and timezone
+        current_time = current_time or self.hybrid_parser.current_time
+        if timezone_offset != snapshot.timezone_offset or current_time.date() != snapshot.reference_date:
+            return self.parse(text, timezone_offset, current_time)
+
+        parse_text = self.hybrid_parser._pre_clean_text(text)
+        if parse_text == snapshot.parse_text:
+            affected, old_end, shift = set(), 0, 0
+        else:
+            start, old_end, new_end = changed_region(snapshot.parse_text, parse_text)
+            shift = new_end - old_end
+            affected = self._affected_fields(snapshot.field_results, start, old_end)
+        field_results = {
+            name: self._shift(result, old_end, shift)
+            for name, result in snapshot.field_results.items()
+            if name not in affected
+        }
+
+        reparsed: List[str] = []
+        if parse_text != snapshot.parse_text:
+            field_analyses = self.hybrid_parser.analyze_field_confidence(parse_text)
+            # Fields the edit touched, plus fields missing before that the edit may have added
+            target_fields = (set(field_analyses) | set(ESSENTIAL_FIELDS)) - set(field_results)
+            memo = ExtractionMemo()
+            for name in self.hybrid_parser.confidence_router.optimize_processing_order(list(target_fields)):
+                reparsed.append(name)
+                field_result = self.hybrid_parser.route_field_processing(
+                    name, parse_text, timezone_offset, field_analyses.get(name), memo, current_time
+                )
+                if field_result:
+                    field_results[name] = field_result
+
+        parsed_event = self.hybrid_parser.aggregate_field_results(field_results, parse_text)
+        reused = sorted(name for name in field_results if name not in reparsed)
+        token = self._remember(text, field_results, timezone_offset, current_time, parse_text)
+        logger.debug(f"Incremental reparse: reused {reused}, re-ran {reparsed}")
+        return IncrementalParseResult(
+            parsed_event=parsed_event,
+            parse_token=token,
+            reparsed_fields=sorted(reparsed),
+            reused_fields=reused,
+            full_parse=False
+        )
+
+    def _affected_fields(self, field_results: Dict[str, FieldResult], start: int, end: int) -> set:
+        """
+        Fields whose span, widened by the context window, touches old[start:end],
+        plus fields that failed or found nothing, which are retried like missing ones.
+        """
+        context = self.config.context_chars
+        affected = {
+            name for name, result in field_results.items()
+            if result.source == 'error' or result.value is None
+            or (result.span[0] - context <= end and result.span[1] + context >= start)
+        }
+        for group in FIELD_GROUPS:
+            if affected.intersection(group):
+                affected.update(group)
+        return affected
+
+    @staticmethod
+    def _shift(result: FieldResult, edit_end: int, shift: int) -> FieldResult:
+        """Copy of a reused result with its span moved past the edit."""
+        span_start, span_end = result.span
+        if span_start >= edit_end:
+            return replace(result, span=(span_start + shift, span_end + shift))
+        return replace(result)
+
+    def _remember(self, text: str, field_results: Dict[str, FieldResult], timezone_offset: Optional[int],
+                  current_time: Optional[datetime] = None, parse_text: Optional[str] = None) -> str:
+        snapshot = ParseSnapshot(
+            text=text,
+            parse_text=parse_text if parse_text is not None else self.hybrid_parser._pre_clean_text(text),
+            field_results=field_results,
+            timezone_offset=timezone_offset,
+            reference_date=(current_time or self.hybrid_parser.current_time).date()
+        )
+        return self.store.put(snapshot)
+
+
+# Global instance
+_parse_snapshot_store: Optional[ParseSnapshotStore] = None
+
+
+def get_parse_snapshot_store() -> ParseSnapshotStore:
+    """Get the global parse snapshot store."""
+    global _parse_snapshot_store
+    if _parse_snapshot_store is None:
+        config = IncrementalParseConfig.from_env()
+        _parse_snapshot_store = ParseSnapshotStore(config.max_snapshots, config.ttl_seconds)
+    return _parse_snapshot_store
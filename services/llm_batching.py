@@ -0,0 +1,252 @@
+"""
+Micro-batching of concurrent schema-constrained LLM calls.
+
+When several requests fall through to the LLM at once (fallback extraction,
+low-confidence field enhancement), each would otherwise pay a full round trip
+and count against the provider's rate limit. LLMMicroBatcher collects calls
+that share a system prompt, schema and temperature over a short window, sends
+them as one numbered multi-item prompt, and hands each caller its own result
+after validating it against the caller's schema. Items the model drops or
+answers with invalid output are retried as individual calls.
+
+There is no dispatcher thread: the first caller of a batch waits out the
+window and executes it, the others block until their result is set. A call
+that arrives alone is sent unchanged once the window expires. The leader
+finishes a shared batch even if its own parse is cancelled meanwhile, since
+the other callers are still waiting on it, and only then unwinds. Batches are
+also closed before their prompt and completions would outgrow the shared
+context window (services.prompt_budget).
+"""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from services.cancellation import CancellationToken, cancellation_scope, check_cancelled, wait_event
+from services.env_config import env_bool, env_float, env_int
+from services.llm_service import LLMResponse
+from services.prompt_budget import estimate_tokens, get_prompt_budget
+
+logger = logging.getLogger(__name__)
+
+# Completion tokens allowed per item in a batched call
+COMPLETION_TOKENS_PER_ITEM = 150
+
+BATCH_INSTRUCTIONS = """
+
+You will receive several numbered items. Handle each item independently, as if it were the only request.
+Respond with one JSON object of the form {"results": [{"id": <item number>, "result": <object matching the schema>}, ...]} containing one entry per item."""
+
+
+@dataclass
+class BatchConfig:
+    """Micro-batching settings (see from_env for the environment variables)."""
+    enabled: bool = False
+    window_ms: float = 10.0      # how long the first call waits for company
+    max_batch_size: int = 8      # a full batch is sent without waiting out the window
+    max_wait_s: float = 30.0     # upper bound for a caller waiting on its batch
+
+    @classmethod
+    def from_env(cls) -> 'BatchConfig':
+        """Build config from LLM_BATCHING_* environment variables."""
+        return cls(
+            enabled=env_bool('LLM_BATCHING_ENABLED', False),
+            window_ms=env_float('LLM_BATCHING_WINDOW_MS', cls.window_ms),
+            max_batch_size=max(1, env_int('LLM_BATCHING_MAX_SIZE', cls.max_batch_size)),
+            max_wait_s=env_float('LLM_BATCHING_MAX_WAIT_S', cls.max_wait_s),
+        )
+
+
+@dataclass
+class _PendingCall:
+    system_prompt: str
+    user_prompt: str
+    schema: Dict[str, Any]
+    temperature: float
+    done: threading.Event = field(default_factory=threading.Event)
+    response: Optional[LLMResponse] = None
+
+
+class _Batch:
+    __slots__ = ('items', 'ready', 'tokens')
+
+    def __init__(self, tokens: int):
+        self.items: List[_PendingCall] = []
+        self.ready = threading.Event()  # set when the batch is full
+        self.tokens = tokens  # estimated prompt and completion tokens
+
+
+# call(system_prompt, user_prompt, schema, temperature, completion_tokens) -> LLMResponse
+LLMCall = Callable[[str, str, Dict[str, Any], float, Optional[int]], LLMResponse]
+# validate(json_text, schema) -> (is_valid, data, error)
+SchemaValidator = Callable[[str, Dict[str, Any]], Tuple[bool, Optional[Dict[str, Any]], Optional[str]]]
+
+
+class LLMMicroBatcher:
+    """
+    Groups concurrent LLM calls into multi-item prompts.
+
+    Args:
+        call: Sends one prompt to the provider
+        validate: Validates an item's JSON against its schema
+        config: Batching settings
+        max_tokens: Token limit of one batched call (default: the prompt budget's context)
+    """
+
+    def __init__(self, call: LLMCall, validate: SchemaValidator, config: Optional[BatchConfig] = None,
+                 max_tokens: Optional[int] = None):
+        self.call = call
+        self.validate = validate
+        self.config = config or BatchConfig.from_env()
+        self.max_tokens = max_tokens or get_prompt_budget().context_tokens
+        self._lock = threading.Lock()
+        self._open: Dict[tuple, _Batch] = {}
+        self._stats = {'calls': 0, 'batches': 0, 'batched_items': 0, 'single_calls': 0, 'item_retries': 0}
+
+    def submit(self, system_prompt: str, user_prompt: str, schema: Dict[str, Any],
+               temperature: float) -> LLMResponse:
+        """
+        Send a call as part of the next batch and wait for its result.
+
+        Returns:
+            LLMResponse for this call alone
+        """
+        pending = _PendingCall(system_prompt, user_prompt, schema, temperature)
+        schema_text = json.dumps(schema, sort_keys=True)
+        key = (system_prompt, schema_text, temperature)
+        cost = estimate_tokens(user_prompt) + COMPLETION_TOKENS_PER_ITEM
+
+        with self._lock:
+            self._stats['calls'] += 1
+            batch = self._open.get(key)
+            if batch is not None and batch.tokens + cost > self.max_tokens:
+                # Send the open batch now; this call starts the next one
+                del self._open[key]
+                batch.ready.set()
+                batch = None
+            leader = batch is None
+            if leader:
+                batch = _Batch(estimate_tokens(system_prompt + BATCH_INSTRUCTIONS) + estimate_tokens(schema_text))
+                self._open[key] = batch
+            batch.items.append(pending)
+            batch.tokens += cost
+            if len(batch.items) >= self.config.max_batch_size:
+                # Later calls start a new batch
+                del self._open[key]
+                batch.ready.set()
+
+        if leader:
+            batch.ready.wait(self.config.window_ms / 1000.0)
+            with self._lock:
+                if self._open.get(key) is batch:
+                    del self._open[key]
+            self._execute(batch.items)
+            check_cancelled()
+        elif not wait_event(pending.done, self.config.max_wait_s):
+            return LLMResponse(
+                success=False, data=None, error="Timed out waiting for batched LLM call",
+                provider="", model="", confidence=0.0, processing_time=self.config.max_wait_s
+            )
+        return pending.response
+
+    def _execute(self, items: List[_PendingCall]):
+        error = "Batched LLM call was cancelled"
+        try:
+            if len(items) == 1:
+                self._run_single(items[0], counter='single_calls')
+            else:
+                # The other callers wait on this batch, so the leader's cancellation must not abandon it
+                with cancellation_scope(CancellationToken()):
+                    self._run_batch(items)
+        except Exception as e:
+            logger.error(f"Batched LLM call failed: {e}")
+            error = str(e)
+        finally:
+            for item in items:
+                if item.response is None:
+                    item.response = LLMResponse(
+                        success=False, data=None, error=error, provider="", model="",
+                        confidence=0.0, processing_time=0.0
+                    )
+                item.done.set()
+
+    def _run_single(self, item: _PendingCall, counter: str):
+        with self._lock:
+            self._stats[counter] += 1
+        item.response = self.call(item.system_prompt, item.user_prompt, item.schema, item.temperature, None)
+
+    def _run_batch(self, items: List[_PendingCall]):
+        first = items[0]
+        schema = {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"id": {"type": "integer"}, "result": first.schema},
+                        "required": ["id", "result"]
+                    }
+                }
+            },
+            "required": ["results"]
+        }
+        user_prompt = "\n\n".join(
+            f"Item {number}:\n{item.user_prompt}" for number, item in enumerate(items, start=1)
+        )
+        with self._lock:
+            self._stats['batches'] += 1
+            self._stats['batched_items'] += len(items)
+
+        response = self.call(
+            first.system_prompt + BATCH_INSTRUCTIONS, user_prompt, schema, first.temperature,
+            COMPLETION_TOKENS_PER_ITEM * len(items)
+        )
+        if not response.success:
+            # Provider failure: every caller gets it and applies its own retry policy
+            for item in items:
+                item.response = response
+            return
+
+        results = self._unpack(response.data)
+        for number, item in enumerate(items, start=1):
+            data = results.get(number)
+            if data is not None:
+                is_valid, validated, error = self.validate(json.dumps(data), item.schema)
+                if is_valid:
+                    confidence = validated.get('confidence')
+                    item.response = LLMResponse(
+                        success=True, data=validated, error=None,
+                        provider=response.provider, model=response.model,
+                        confidence=confidence.get('overall', response.confidence)
+                        if isinstance(confidence, dict) else response.confidence,
+                        processing_time=response.processing_time
+                    )
+                    continue
+                logger.debug(f"Batched item {number} failed validation: {error}")
+            self._run_single(item, counter='item_retries')
+
+    @staticmethod
+    def _unpack(data: Optional[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """Map item numbers to their result objects."""
+        results: Dict[int, Dict[str, Any]] = {}
+        entries = data.get('results') if isinstance(data, dict) else None
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict) or not isinstance(entry.get('result'), dict):
+                continue
+            try:
+                results.setdefault(int(entry.get('id')), entry['result'])
+            except (TypeError, ValueError):
+                continue
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batching counters."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['enabled'] = self.config.enabled
+        stats['window_ms'] = self.config.window_ms
+        stats['max_batch_size'] = self.config.max_batch_size
+        return stats
@@ -12,10 +12,25 @@ from dataclasses import dataclass
 
 from services.llm_service import LLMService, LLMResponse
 from services.regex_date_extractor import DateTimeResult
+from services.stage_timing import stage
+from services.prompt_budget import get_prompt_budget, get_token_usage_tracker, ollama_usage, openai_usage
+from services.llm_batching import BatchConfig, LLMMicroBatcher
+from services.async_pipeline import post_json, run_blocking_io
+from services.cancellation import check_cancelled, sleep, wait_event
 from models.event_models import TitleResult, ParsedEvent, FieldResult
 
 logger = logging.getLogger(__name__)
 
+# Completion lengths for schema calls; the Ollama one is reserved in the prompt budget
+SCHEMA_NUM_PREDICT = 150
+SCHEMA_MAX_TOKENS = 500
+# Fused calls return the cleaned text as well as the fields
+FUSED_COMPLETION_TOKENS = 500
+
+OLLAMA_GENERATE_URL = "http://localhost:11434/api/generate"
+OLLAMA_SCHEMA_TIMEOUT = 10  # seconds; short, since enhancement is optional
+OPENAI_SCHEMA_TIMEOUT = 30  # seconds, async path (the SDK applies its own timeout)
+
 
 @dataclass
 class EnhancementResult:
@@ -25,12 +40,14 @@ class EnhancementResult:
     enhanced_description: Optional[str] = None
     fallback_event: Optional[ParsedEvent] = None
     confidence: float = 0.0
-    enhancement_method: str = "none"  # "polish", "fallback", "failed"
+    enhancement_method: str = "none"  # "polish", "fallback", "fused", "failed"
     processing_time: float = 0.0
     llm_provider: str = ""
     llm_model: str = ""
     error: Optional[str] = None
     raw_response: Optional[Dict[str, Any]] = None
+    enhanced_text: Optional[str] = None  # fused mode: input text restructured for parsing
+    text_confidence: float = 0.0  # fused mode: confidence in enhanced_text
 
 
 class LLMEnhancer:
@@ -56,6 +73,13 @@ class LLMEnhancer:
         """
         self.llm_service = llm_service or LLMService(provider="auto")
         self._compile_schemas()
+        
+        # Optional micro-batching of concurrent schema calls (LLM_BATCHING_ENABLED)
+        batch_config = BatchConfig.from_env()
+        self.batcher = (
+            LLMMicroBatcher(self._send_llm_with_schema, self.validate_json_schema, batch_config)
+            if batch_config.enabled else None
+        )
     
     def _compile_schemas(self):
         """Compile JSON schemas for structured LLM output."""
@@ -143,6 +167,24 @@ class LLMEnhancer:
             "additionalProperties": False
         }
         
+        # Schema for fused mode: fallback fields plus the enhanced text, so one
+        # call replaces text enhancement followed by fallback extraction
+        self.fused_schema = {
+            **self.fallback_schema,
+            "properties": {
+                **self.fallback_schema["properties"],
+                "enhanced_text": {
+                    "type": "string",
+                    "description": "Input text restructured for calendar parsing, preserving all original details"
+                },
+                "enhanced_text_confidence": {
+                    "type": "number", "minimum": 0.0, "maximum": 1.0,
+                    "description": "Confidence that enhanced_text is clearer than the input and loses nothing"
+                }
+            },
+            "required": self.fallback_schema["required"] + ["enhanced_text", "enhanced_text_confidence"]
+        }
+        
         # Function calling schema for field-specific enhancement
         self.function_calling_schema = {
             "name": "enhance_event_fields",
@@ -229,7 +271,8 @@ class LLMEnhancer:
             # Prepare enhancement prompt
             system_prompt = self._get_enhancement_system_prompt()
             user_prompt = self._format_enhancement_prompt(
-                datetime_result, title_result, original_text
+                datetime_result, title_result,
+                self._fit_prompt_text(original_text, system_prompt, self.enhancement_schema)
             )
             
             # Call LLM with strict constraints
@@ -289,76 +332,213 @@ class LLMEnhancer:
             EnhancementResult with fallback ParsedEvent (confidence ≤0.5)
         """
         if not self.llm_service.is_available():
-            return EnhancementResult(
-                success=False,
-                error="LLM service not available for fallback",
-                enhancement_method="failed"
-            )
+            return self._unavailable_result("fallback")
         
         start_time = datetime.now()
         
         try:
-            # Prepare fallback prompt
-            system_prompt = self._get_fallback_system_prompt()
-            user_prompt = self._format_fallback_prompt(text, current_time)
+            system_prompt, user_prompt = self._fallback_prompts(text, current_time)
             
             # Call LLM with fallback schema
             response = self._call_llm_with_schema(
                 system_prompt, user_prompt, self.fallback_schema, temperature=0.2
             )
+            return self._fallback_response_result(response, text, start_time)
+        
+        except Exception as e:
+            logger.error(f"Fallback extraction failed: {e}")
+            return self._failed_result(e, start_time)
+    
+    async def fallback_extraction_async(self, text: str, current_time: Optional[datetime] = None) -> EnhancementResult:
+        """
+        Async fallback_extraction: the LLM call is awaited instead of blocking a thread.
+        
+        Cancelling the awaiting task aborts the in-flight request.
+        """
+        if not self.llm_service.is_available():
+            return self._unavailable_result("fallback")
+        
+        start_time = datetime.now()
+        
+        try:
+            system_prompt, user_prompt = self._fallback_prompts(text, current_time)
+            response = await self._call_llm_with_schema_async(
+                system_prompt, user_prompt, self.fallback_schema, temperature=0.2
+            )
+            return self._fallback_response_result(response, text, start_time)
+        
+        except Exception as e:
+            logger.error(f"Fallback extraction failed: {e}")
+            return self._failed_result(e, start_time)
+    
+    def _fallback_prompts(self, text: str, current_time: Optional[datetime]) -> Tuple[str, str]:
+        """System and user prompt of a fallback extraction."""
+        system_prompt = self._get_fallback_system_prompt()
+        user_prompt = self._format_fallback_prompt(
+            self._fit_prompt_text(text, system_prompt, self.fallback_schema), current_time
+        )
+        return system_prompt, user_prompt
+    
+    def _fallback_response_result(self, response: LLMResponse, text: str, start_time: datetime) -> EnhancementResult:
+        """EnhancementResult of a fallback extraction from the LLM response."""
+        processing_time = (datetime.now() - start_time).total_seconds()
+        
+        if response.success and response.data:
+            return self._build_fallback_result(response.data, text, response, processing_time)
+        return EnhancementResult(
+            success=False,
+            error=response.error or "Fallback extraction failed",
+            enhancement_method="failed",
+            processing_time=processing_time
+        )
+    
+    def fused_extraction(self, text: str, current_time: Optional[datetime] = None,
+                         context: Optional[str] = None) -> EnhancementResult:
+        """
+        Enhance text and extract event fields in a single LLM call (Fused Mode).
+        
+        Replaces LLMTextEnhancer.enhance_text_for_parsing followed by
+        fallback_extraction. The response must validate against fused_schema,
+        otherwise the result is unsuccessful and callers use the split path.
+        
+        Args:
+            text: Original input text
+            current_time: Current datetime for relative date resolution
+            context: Optional context about the text source
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+        Returns:
+            EnhancementResult with fallback ParsedEvent (confidence ≤0.5) and enhanced_text
+        """
+        if not self.llm_service.is_available():
+            return self._unavailable_result("fused extraction")
+        
+        start_time = datetime.now()
+        
+        try:
+            system_prompt, user_prompt = self._fused_prompts(text, current_time, context)
             
-            if response.success and response.data:
-                data = response.data
-                
-                # Create ParsedEvent from LLM response
-                parsed_event = self._create_parsed_event_from_llm(data, text)
-                
-                # Ensure confidence ≤0.5 for fallback mode
-                fallback_confidence = min(0.5, data.get('confidence', {}).get('overall', 0.3))
-                parsed_event.confidence_score = fallback_confidence
-                
-                # Add fallback metadata
-                if not parsed_event.extraction_metadata:
-                    parsed_event.extraction_metadata = {}
-                
-                parsed_event.extraction_metadata.update({
-                    'extraction_method': 'llm_fallback',
-                    'needs_confirmation': data.get('needs_confirmation', True),
-                    'fallback_reason': 'regex_extraction_failed',
-                    'llm_provider': response.provider,
-                    'llm_model': response.model,
-                    'processing_time': processing_time
-                })
-                
-                return EnhancementResult(
-                    success=True,
-                    fallback_event=parsed_event,
-                    confidence=fallback_confidence,
-                    enhancement_method="fallback",
-                    processing_time=processing_time,
-                    llm_provider=response.provider,
-                    llm_model=response.model,
-                    raw_response=data
-                )
-            else:
-                return EnhancementResult(
-                    success=False,
-                    error=response.error or "Fallback extraction failed",
-                    enhancement_method="failed",
-                    processing_time=processing_time
-                )
+            # Not batched: the completion is larger than a batch item's share
+            response = self._send_llm_with_schema(
+                system_prompt, user_prompt, self.fused_schema, temperature=0.2,
+                completion_tokens=FUSED_COMPLETION_TOKENS
+            )
+            return self._fused_response_result(response, text, start_time)
         
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
-            logger.error(f"Fallback extraction failed: {e}")
+            logger.error(f"Fused extraction failed: {e}")
+            return self._failed_result(e, start_time)
+    
+    async def fused_extraction_async(self, text: str, current_time: Optional[datetime] = None,
+                                     context: Optional[str] = None) -> EnhancementResult:
+        """Async fused_extraction: the LLM call is awaited instead of blocking a thread."""
+        if not self.llm_service.is_available():
+            return self._unavailable_result("fused extraction")
+        
+        start_time = datetime.now()
+        
+        try:
+            system_prompt, user_prompt = self._fused_prompts(text, current_time, context)
+            response = await self._send_llm_with_schema_async(
+                system_prompt, user_prompt, self.fused_schema, temperature=0.2,
+                completion_tokens=FUSED_COMPLETION_TOKENS
+            )
+            return self._fused_response_result(response, text, start_time)
+        
+        except Exception as e:
+            logger.error(f"Fused extraction failed: {e}")
+            return self._failed_result(e, start_time)
+    
+    def _fused_prompts(self, text: str, current_time: Optional[datetime], context: Optional[str]) -> Tuple[str, str]:
+        """System and user prompt of a fused extraction."""
+        system_prompt = self._get_fused_system_prompt()
+        fitted = get_prompt_budget().fit_text(
+            text, FUSED_COMPLETION_TOKENS, system_prompt, self._schema_text(self.fused_schema)
+        )
+        return system_prompt, self._format_fused_prompt(fitted, current_time, context)
+    
+    def _fused_response_result(self, response: LLMResponse, text: str, start_time: datetime) -> EnhancementResult:
+        """EnhancementResult of a fused extraction from the LLM response, validated against fused_schema."""
+        processing_time = (datetime.now() - start_time).total_seconds()
+        
+        if not response.success or not response.data:
             return EnhancementResult(
                 success=False,
-                error=str(e),
+                error=response.error or "Fused extraction failed",
                 enhancement_method="failed",
                 processing_time=processing_time
             )
+        
+        is_valid, data, error = self.validate_json_schema(json.dumps(response.data), self.fused_schema)
+        if is_valid and not data['enhanced_text'].strip():
+            is_valid, error = False, "Empty enhanced_text"
+        if not is_valid:
+            return EnhancementResult(
+                success=False,
+                error=error,
+                enhancement_method="failed",
+                processing_time=processing_time,
+                raw_response=response.data
+            )
+        
+        result = self._build_fallback_result(data, text, response, processing_time)
+        result.enhancement_method = "fused"
+        result.fallback_event.extraction_metadata['extraction_method'] = 'llm_fused'
+        result.enhanced_text = data['enhanced_text']
+        result.text_confidence = data['enhanced_text_confidence']
+        return result
+    
+    @staticmethod
+    def _unavailable_result(purpose: str) -> EnhancementResult:
+        """Unsuccessful result for when no LLM provider is available."""
+        return EnhancementResult(
+            success=False,
+            error=f"LLM service not available for {purpose}",
+            enhancement_method="failed"
+        )
+    
+    @staticmethod
+    def _failed_result(error: Exception, start_time: datetime) -> EnhancementResult:
+        """Unsuccessful result for an extraction that raised."""
+        return EnhancementResult(
+            success=False,
+            error=str(error),
+            enhancement_method="failed",
+            processing_time=(datetime.now() - start_time).total_seconds()
+        )
+    
+    def _build_fallback_result(self, data: Dict[str, Any], text: str, response: LLMResponse,
+                               processing_time: float) -> EnhancementResult:
+        """Build a successful fallback EnhancementResult from validated LLM data."""
+        # Create ParsedEvent from LLM response
+        parsed_event = self._create_parsed_event_from_llm(data, text)
+        
+        # Ensure confidence ≤0.5 for fallback mode
+        fallback_confidence = min(0.5, data.get('confidence', {}).get('overall', 0.3))
+        parsed_event.confidence_score = fallback_confidence
+        
+        # Add fallback metadata
+        if not parsed_event.extraction_metadata:
+            parsed_event.extraction_metadata = {}
+        
+        parsed_event.extraction_metadata.update({
+            'extraction_method': 'llm_fallback',
+            'needs_confirmation': data.get('needs_confirmation', True),
+            'fallback_reason': 'regex_extraction_failed',
+            'llm_provider': response.provider,
+            'llm_model': response.model,
+            'processing_time': processing_time
+        })
+        
+        return EnhancementResult(
+            success=True,
+            fallback_event=parsed_event,
+            confidence=fallback_confidence,
+            enhancement_method="fallback",
+            processing_time=processing_time,
+            llm_provider=response.provider,
+            llm_model=response.model,
+            raw_response=data
+        )
     
     def _get_enhancement_system_prompt(self) -> str:
         """Get system prompt for enhancement mode."""
@@ -399,6 +579,14 @@ Extract:
 
 Output must be valid JSON matching the provided schema."""
     
+    def _get_fused_system_prompt(self) -> str:
+        """Get system prompt for fused mode (fallback extraction plus text enhancement)."""
+        return self._get_fallback_system_prompt() + """
+
+Also return:
+- enhanced_text: The input restructured for calendar parsing - event name first, dates and times stated clearly, all original information preserved
+- enhanced_text_confidence: How confident you are that enhanced_text is clearer and loses nothing"""
+    
     def _format_enhancement_prompt(self, 
                                   datetime_result: DateTimeResult,
                                   title_result: Optional[TitleResult],
@@ -469,145 +657,245 @@ Output must be valid JSON matching the provided schema."""
         
         return "\n".join(prompt_parts)
     
+    def _format_fused_prompt(self, text: str, current_time: Optional[datetime], context: Optional[str]) -> str:
+        """Format prompt for fused mode."""
+        prompt = self._format_fallback_prompt(text, current_time)
+        context_info = f" (Context: {context})" if context else ""
+        return prompt + f"\n- Return enhanced_text: the input rewritten for calendar parsing{context_info}"
+    
+    @staticmethod
+    def _schema_text(schema: Dict[str, Any]) -> str:
+        """Compact, byte-stable JSON rendering of a schema for prompts."""
+        return json.dumps(schema, separators=(',', ':'), sort_keys=True)
+    
+    def _fit_prompt_text(self, text: str, system_prompt: str, schema: Dict[str, Any]) -> str:
+        """Compact input text to the context left by the system prompt, schema and completion."""
+        return get_prompt_budget().fit_text(
+            text, SCHEMA_NUM_PREDICT, system_prompt, self._schema_text(schema)
+        )
+    
     def _call_llm_with_schema(self, 
                              system_prompt: str, 
                              user_prompt: str, 
                              schema: Dict[str, Any],
                              temperature: float = 0.1) -> LLMResponse:
-        """Call LLM with JSON schema validation."""
+        """Call LLM with JSON schema validation, batched with concurrent calls when enabled."""
+        check_cancelled()
+        if self.batcher is not None and self.llm_service.provider in ("ollama", "openai"):
+            return self.batcher.submit(system_prompt, user_prompt, schema, temperature)
+        return self._send_llm_with_schema(system_prompt, user_prompt, schema, temperature)
+    
+    def _send_llm_with_schema(self,
+                              system_prompt: str,
+                              user_prompt: str,
+                              schema: Dict[str, Any],
+                              temperature: float = 0.1,
+                              completion_tokens: Optional[int] = None) -> LLMResponse:
+        """Send one schema-constrained prompt to the provider."""
+        check_cancelled()
         try:
-            # Add schema to system prompt
-            schema_prompt = f"{system_prompt}\n\nOutput JSON schema:\n{json.dumps(schema, indent=2)}"
+            # Add schema to system prompt; the system prompt comes first and
+            # stays identical across calls so providers can cache the prefix
+            schema_prompt = f"{system_prompt}\n\nOutput JSON schema:\n{self._schema_text(schema)}"
             
             # Call LLM service with low temperature
             if hasattr(self.llm_service, '_call_ollama') and self.llm_service.provider == "ollama":
-                return self._call_ollama_with_schema(schema_prompt, user_prompt, temperature)
+                with stage('llm'):
+                    return self._call_ollama_with_schema(schema_prompt, user_prompt, temperature, completion_tokens)
             elif hasattr(self.llm_service, '_call_openai') and self.llm_service.provider == "openai":
-                return self._call_openai_with_schema(schema_prompt, user_prompt, temperature)
+                with stage('llm'):
+                    return self._call_openai_with_schema(schema_prompt, user_prompt, temperature, completion_tokens)
             else:
                 # Fallback to regular extraction
                 return self.llm_service.extract_event(user_prompt, template="structured")
         
         except Exception as e:
-            return LLMResponse(
-                success=False,
-                data=None,
-                error=str(e),
-                provider=self.llm_service.provider,
-                model=self.llm_service.model,
-                confidence=0.0,
-                processing_time=0.0
-            )
+            return self._failed_llm_response(self.llm_service.provider, e)
     
-    def _call_ollama_with_schema(self, system_prompt: str, user_prompt: str, temperature: float) -> LLMResponse:
+    async def _call_llm_with_schema_async(self,
+                                          system_prompt: str,
+                                          user_prompt: str,
+                                          schema: Dict[str, Any],
+                                          temperature: float = 0.1) -> LLMResponse:
+        """Async _call_llm_with_schema."""
+        if self.batcher is not None and self.llm_service.provider in ("ollama", "openai"):
+            # The batcher collects calls across threads; waiting for it blocks one
+            return await run_blocking_io(self.batcher.submit, system_prompt, user_prompt, schema, temperature)
+        return await self._send_llm_with_schema_async(system_prompt, user_prompt, schema, temperature)
+    
+    async def _send_llm_with_schema_async(self,
+                                          system_prompt: str,
+                                          user_prompt: str,
+                                          schema: Dict[str, Any],
+                                          temperature: float = 0.1,
+                                          completion_tokens: Optional[int] = None) -> LLMResponse:
+        """
+        Async _send_llm_with_schema: Ollama and OpenAI requests are awaited on
+        the shared HTTP client; other providers run in a thread.
+        """
+        provider = self.llm_service.provider
+        try:
+            schema_prompt = f"{system_prompt}\n\nOutput JSON schema:\n{self._schema_text(schema)}"
+            
+            if hasattr(self.llm_service, '_call_ollama') and provider == "ollama":
+                full_prompt, payload = self._ollama_schema_request(schema_prompt, user_prompt, temperature, completion_tokens)
+                with stage('llm'):
+                    status_code, body = await post_json(OLLAMA_GENERATE_URL, payload, timeout=OLLAMA_SCHEMA_TIMEOUT)
+                return self._ollama_schema_response(full_prompt, status_code, body)
+            elif hasattr(self.llm_service, '_call_openai') and provider == "openai":
+                client = self.llm_service.openai_client
+                with stage('llm'):
+                    status_code, body = await post_json(
+                        f"{str(client.base_url).rstrip('/')}/chat/completions",
+                        self._openai_schema_request(schema_prompt, user_prompt, temperature, completion_tokens),
+                        headers={"Authorization": f"Bearer {client.api_key}"},
+                        timeout=OPENAI_SCHEMA_TIMEOUT
+                    )
+                if status_code != 200:
+                    raise Exception(f"OpenAI API error: {status_code}")
+                return self._openai_schema_response(
+                    schema_prompt, user_prompt, body['choices'][0]['message']['content'], openai_usage(body)
+                )
+            else:
+                return await run_blocking_io(self.llm_service.extract_event, user_prompt, template="structured")
+        
+        except Exception as e:
+            return self._failed_llm_response(provider, e)
+    
+    def _call_ollama_with_schema(self, system_prompt: str, user_prompt: str, temperature: float,
+                                 completion_tokens: Optional[int] = None) -> LLMResponse:
         """Call Ollama with schema validation."""
         import requests
         
-        full_prompt = f"{system_prompt}\n\n{user_prompt}\n\nJSON Response:"
+        full_prompt, payload = self._ollama_schema_request(system_prompt, user_prompt, temperature, completion_tokens)
         
         try:
-            response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": self.llm_service.model,
-                    "prompt": full_prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": temperature,  # Low temperature for consistency
-                        "num_predict": 150,  # Reduced for faster enhancement
-                        "top_p": 0.9,
-                        "num_ctx": 1024,  # Smaller context for speed
-                        "repeat_penalty": 1.1
-                    }
-                },
-                timeout=10  # Faster timeout for enhancement
-            )
-            
-            if response.status_code == 200:
-                result_text = response.json()['response']
-                
-                # Try to parse JSON
-                try:
-                    data = json.loads(result_text)
-                    return LLMResponse(
-                        success=True,
-                        data=data,
-                        error=None,
-                        provider="ollama",
-                        model=self.llm_service.model,
-                        confidence=data.get('confidence', {}).get('overall', 0.5),
-                        processing_time=0.0
-                    )
-                except json.JSONDecodeError:
-                    # Try to extract JSON from response
-                    data = self._extract_json_from_response(result_text)
-                    return LLMResponse(
-                        success=bool(data),
-                        data=data,
-                        error="JSON parsing failed" if not data else None,
-                        provider="ollama",
-                        model=self.llm_service.model,
-                        confidence=0.3,
-                        processing_time=0.0
-                    )
-            else:
-                return LLMResponse(
-                    success=False,
-                    data=None,
-                    error=f"Ollama API error: {response.status_code}",
-                    provider="ollama",
-                    model=self.llm_service.model,
-                    confidence=0.0,
-                    processing_time=0.0
-                )
+            response = requests.post(OLLAMA_GENERATE_URL, json=payload, timeout=OLLAMA_SCHEMA_TIMEOUT)
+            body = response.json() if response.status_code == 200 else None
+            return self._ollama_schema_response(full_prompt, response.status_code, body)
         
         except Exception as e:
+            return self._failed_llm_response("ollama", e)
+    
+    def _ollama_schema_request(self, system_prompt: str, user_prompt: str, temperature: float,
+                               completion_tokens: Optional[int] = None) -> Tuple[str, Dict[str, Any]]:
+        """Full prompt and /api/generate payload of an Ollama schema call."""
+        full_prompt = f"{system_prompt}\n\n{user_prompt}\n\nJSON Response:"
+        return full_prompt, {
+            "model": self.llm_service.model,
+            "prompt": full_prompt,
+            "stream": False,
+            "options": {
+                "temperature": temperature,  # Low temperature for consistency
+                "num_predict": completion_tokens or SCHEMA_NUM_PREDICT,  # Reduced for faster enhancement
+                "top_p": 0.9,
+                # Shared with LLMService: Ollama reloads the model when num_ctx changes
+                "num_ctx": get_prompt_budget().context_tokens,
+                "repeat_penalty": 1.1
+            }
+        }
+    
+    def _ollama_schema_response(self, full_prompt: str, status_code: int,
+                                body: Optional[Dict[str, Any]]) -> LLMResponse:
+        """LLMResponse of an Ollama schema call from its HTTP status and JSON body."""
+        if status_code != 200:
             return LLMResponse(
                 success=False,
                 data=None,
-                error=str(e),
+                error=f"Ollama API error: {status_code}",
                 provider="ollama",
                 model=self.llm_service.model,
                 confidence=0.0,
                 processing_time=0.0
             )
-    
-    def _call_openai_with_schema(self, system_prompt: str, user_prompt: str, temperature: float) -> LLMResponse:
-        """Call OpenAI with schema validation."""
+        
+        result_text = body['response']
+        get_token_usage_tracker().record(
+            'llm_enhancer', 'ollama', full_prompt, result_text, *ollama_usage(body)
+        )
+        
+        # Try to parse JSON
         try:
-            response = self.llm_service.openai_client.chat.completions.create(
-                model=self.llm_service.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=temperature,
-                max_tokens=500,
-                response_format={"type": "json_object"}
-            )
-            
-            data = json.loads(response.choices[0].message.content)
+            data = json.loads(result_text)
             return LLMResponse(
                 success=True,
                 data=data,
                 error=None,
-                provider="openai",
+                provider="ollama",
                 model=self.llm_service.model,
                 confidence=data.get('confidence', {}).get('overall', 0.5),
                 processing_time=0.0
             )
-        
-        except Exception as e:
+        except json.JSONDecodeError:
+            # Try to extract JSON from response
+            data = self._extract_json_from_response(result_text)
             return LLMResponse(
-                success=False,
-                data=None,
-                error=str(e),
-                provider="openai",
+                success=bool(data),
+                data=data,
+                error="JSON parsing failed" if not data else None,
+                provider="ollama",
                 model=self.llm_service.model,
-                confidence=0.0,
+                confidence=0.3,
                 processing_time=0.0
             )
     
+    def _call_openai_with_schema(self, system_prompt: str, user_prompt: str, temperature: float,
+                                 completion_tokens: Optional[int] = None) -> LLMResponse:
+        """Call OpenAI with schema validation."""
+        try:
+            response = self.llm_service.openai_client.chat.completions.create(
+                **self._openai_schema_request(system_prompt, user_prompt, temperature, completion_tokens)
+            )
+            return self._openai_schema_response(
+                system_prompt, user_prompt, response.choices[0].message.content, openai_usage(response)
+            )
+        
+        except Exception as e:
+            return self._failed_llm_response("openai", e)
+    
+    def _openai_schema_request(self, system_prompt: str, user_prompt: str, temperature: float,
+                               completion_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Chat completion parameters (SDK keyword arguments or REST body) of an OpenAI schema call."""
+        return {
+            "model": self.llm_service.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max(completion_tokens or 0, SCHEMA_MAX_TOKENS),
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _openai_schema_response(self, system_prompt: str, user_prompt: str, content: Optional[str],
+                                usage: tuple) -> LLMResponse:
+        """LLMResponse of an OpenAI schema call from the completion content and token usage."""
+        get_token_usage_tracker().record(
+            'llm_enhancer', 'openai', system_prompt + user_prompt, content or '', *usage
+        )
+        data = json.loads(content)
+        return LLMResponse(
+            success=True,
+            data=data,
+            error=None,
+            provider="openai",
+            model=self.llm_service.model,
+            confidence=data.get('confidence', {}).get('overall', 0.5),
+            processing_time=0.0
+        )
+    
+    def _failed_llm_response(self, provider: str, error: Exception) -> LLMResponse:
+        """Unsuccessful LLMResponse for a call that raised."""
+        return LLMResponse(
+            success=False,
+            data=None,
+            error=str(error),
+            provider=provider,
+            model=self.llm_service.model,
+            confidence=0.0,
+            processing_time=0.0
+        )
+    
     def _extract_json_from_response(self, text: str) -> Optional[Dict[str, Any]]:
         """Extract JSON from LLM response text."""
         import re
@@ -714,7 +1002,8 @@ Output must be valid JSON matching the provided schema."""
             # Prepare enhancement prompt
             system_prompt = self._get_field_enhancement_system_prompt(locked_fields)
             user_prompt = self._format_field_enhancement_prompt(
-                residual_text, fields_to_enhance, field_results, locked_fields
+                self._fit_prompt_text(residual_text, system_prompt, enhancement_schema),
+                fields_to_enhance, field_results, locked_fields
             )
             
             # Call LLM with timeout and retry (Requirement 12.4)
@@ -1201,9 +1490,10 @@ Output must match the function calling schema exactly."""
             except Exception as e:
                 logger.warning(f"LLM call error on attempt {attempt + 1}: {e}")
             
-            # Brief pause before retry (not on last attempt)
+            # Brief pause before retry (not on last attempt); an abandoned
+            # request raises ParseCancelled here instead of retrying
             if attempt < total_attempts - 1:
-                time.sleep(0.1)
+                sleep(0.1)
         
         logger.error(f"LLM call failed after {total_attempts} attempts - returning None")
         return None
@@ -1218,7 +1508,7 @@ Output must match the function calling schema exactly."""
         
         This method implements timeout control by:
         1. Running LLM call in separate daemon thread
-        2. Enforcing strict timeout with thread.join()
+        2. Enforcing strict timeout while waiting for it (cut short by request cancellation)
         3. Using temperature=0 for deterministic results
         4. Proper exception handling and timeout detection
         
@@ -1239,6 +1529,7 @@ Output must match the function calling schema exactly."""
         
         result = [None]  # Use list to allow modification in thread
         exception = [None]
+        done = threading.Event()
         start_time = time.time()
         
         def llm_call_thread():
@@ -1252,17 +1543,20 @@ Output must match the function calling schema exactly."""
                 )
             except Exception as e:
                 exception[0] = e
+            finally:
+                done.set()
         
         # Start the LLM call in a separate daemon thread
         thread = threading.Thread(target=llm_call_thread, daemon=True)
         thread.start()
         
-        # Wait for completion or timeout
-        thread.join(timeout=timeout_seconds)
+        # Wait for completion, timeout or cancellation of the request (which
+        # raises ParseCancelled and leaves the call to finish on its own)
+        wait_event(done, timeout_seconds)
         
         elapsed_time = time.time() - start_time
         
-        if thread.is_alive():
+        if not done.is_set():
             # Thread is still running - timeout occurred
             error_msg = f"LLM call timed out after {timeout_seconds}s (elapsed: {elapsed_time:.2f}s)"
             logger.warning(error_msg)
@@ -1476,14 +1770,19 @@ Output must match the function calling schema exactly."""
         return schema
     
     def _get_field_enhancement_system_prompt(self, locked_fields: Dict[str, Any]) -> str:
-        """Get system prompt for field enhancement with locked field constraints."""
-        locked_field_names = list(locked_fields.keys()) if locked_fields else []
+        """
+        Get system prompt for field enhancement with locked field constraints.
+        
+        The locked field names vary per call, so they come last to keep the
+        rest of the prompt a stable, cacheable prefix.
+        """
+        locked_field_names = sorted(locked_fields.keys()) if locked_fields else []
         
         prompt = """You are an AI assistant that enhances specific low-confidence event fields.
 
 CRITICAL CONSTRAINTS:
 - Temperature = 0 for deterministic results
-- NEVER modify or reference these LOCKED fields: """ + str(locked_field_names) + """
+- NEVER modify or reference the LOCKED fields listed below
 - Only enhance the specific fields requested
 - Be conservative - don't invent information not in the text
 - Maintain accuracy and avoid hallucination
@@ -1493,7 +1792,9 @@ Your job is to:
 2. Provide confidence scores for your enhancements
 3. Return null for fields where no enhancement is possible
 
-Output must be valid JSON matching the provided schema."""
+Output must be valid JSON matching the provided schema.
+
+LOCKED fields: """ + str(locked_field_names)
         
         return prompt
     
@@ -1552,5 +1853,6 @@ Output must be valid JSON matching the provided schema."""
                 'context_limiting': True,
                 'timeout_retry': True,
                 'json_validation': True
-            }
+            },
+            'batching': self.batcher.get_stats() if self.batcher else {'enabled': False}
         }
\ No newline at end of file
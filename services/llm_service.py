@@ -6,15 +6,24 @@ Provides a unified interface for LLM-based event parsing with Ollama integration
 import os
 import json
 import logging
+import functools
+import importlib.util
 from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
 from dataclasses import dataclass
 
 from services.llm_prompts import get_prompt_templates, PromptTemplate
+from services.stage_timing import stage
+from services.prompt_budget import get_prompt_budget, get_token_usage_tracker, ollama_usage, openai_usage
+from services.async_pipeline import ProcessLocalClient
 from models.event_models import ParsedEvent
 
 logger = logging.getLogger(__name__)
 
+# Completion lengths; the Ollama one is also reserved in the prompt budget
+OLLAMA_NUM_PREDICT = 200
+CHAT_MAX_TOKENS = 800
+
 # Optional imports - graceful handling of missing dependencies
 try:
     import requests
@@ -23,12 +32,19 @@ except ImportError:
     REQUESTS_AVAILABLE = False
     logger.warning("Requests not available - Ollama integration disabled")
 
-try:
-    import openai
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# The openai SDK takes ~2s to import, so only probe for it here and import
+# it on first use in _initialize_openai.
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+OpenAI = None
+
+
+def _load_openai_client_class():
+    """Import the OpenAI client class on first use."""
+    global OpenAI
+    if OpenAI is None:
+        from openai import OpenAI as _OpenAI
+        OpenAI = _OpenAI
+    return OpenAI
 
 
 @dataclass
@@ -69,9 +85,9 @@ class LLMService:
         self.config = kwargs
         self.prompt_templates = get_prompt_templates()
         
-        # Provider clients
+        # Provider clients (the OpenAI client is built per process, see openai_client)
         self.ollama_available = False
-        self.openai_client = None
+        self._openai_client: Optional[ProcessLocalClient] = None
         
         # Auto-detect best provider
         if self.provider == "auto":
@@ -177,11 +193,22 @@ class LLMService:
             self.model = "gpt-3.5-turbo"
         
         try:
-            self.openai_client = OpenAI(api_key=api_key)
+            self._openai_client = ProcessLocalClient(functools.partial(_load_openai_client_class(), api_key=api_key))
+            self._openai_client.get()
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI: {e}")
+            self._openai_client = None
             self.provider = "heuristic"
     
+    @property
+    def openai_client(self):
+        """This process's OpenAI client, or None if OpenAI is not initialized."""
+        return self._openai_client.get() if self._openai_client is not None else None
+    
+    @openai_client.setter
+    def openai_client(self, client):
+        self._openai_client = ProcessLocalClient(lambda: client) if client is not None else None
+    
     def _initialize_groq(self):
         """Initialize Groq provider."""
         api_key = self.config.get('groq_api_key') or os.getenv('GROQ_API_KEY')
@@ -230,18 +257,26 @@ class LLMService:
             template_name = kwargs.get('template', 
                                      self.prompt_templates.get_template_for_text_type(text))
             
-            # Format the prompt
+            # Format the prompt, with the text fitted to the context budget
+            template = self.prompt_templates.get_template(template_name)
+            prompt_text = text
+            if template:
+                prompt_text = get_prompt_budget().fit_text(
+                    text, OLLAMA_NUM_PREDICT, template.system_prompt, template.user_prompt_template
+                )
             system_prompt, user_prompt = self.prompt_templates.format_prompt(
-                template_name, text, **kwargs
+                template_name, prompt_text, **kwargs
             )
             
             # Call the appropriate provider
-            if self.provider == "ollama":
-                result = self._call_ollama(system_prompt, user_prompt)
-            elif self.provider == "openai":
-                result = self._call_openai(system_prompt, user_prompt)
-            elif self.provider == "groq":
-                result = self._call_groq(system_prompt, user_prompt)
+            if self.provider in ("ollama", "openai", "groq"):
+                with stage('llm'):
+                    if self.provider == "ollama":
+                        result = self._call_ollama(system_prompt, user_prompt)
+                    elif self.provider == "openai":
+                        result = self._call_openai(system_prompt, user_prompt)
+                    else:
+                        result = self._call_groq(system_prompt, user_prompt)
             else:
                 result = self._fallback_extraction(text)
             
@@ -287,9 +322,10 @@ class LLMService:
                 "stream": False,
                 "options": {
                     "temperature": 0.1,  # Low temperature for consistent extraction
-                    "num_predict": 200,  # Reduced tokens for faster response
+                    "num_predict": OLLAMA_NUM_PREDICT,  # Reduced tokens for faster response
                     "top_p": 0.9,
-                    "num_ctx": 2048,  # Smaller context window
+                    # Same window for every call: Ollama reloads the model when num_ctx changes
+                    "num_ctx": get_prompt_budget().context_tokens,
                     "repeat_penalty": 1.1
                 }
             },
@@ -299,7 +335,9 @@ class LLMService:
         if response.status_code != 200:
             raise Exception(f"Ollama API error: {response.status_code} - {response.text}")
         
-        result_text = response.json()['response']
+        body = response.json()
+        result_text = body['response']
+        get_token_usage_tracker().record('llm_service', 'ollama', full_prompt, result_text, *ollama_usage(body))
         
         # Try to parse as JSON
         try:
@@ -320,11 +358,15 @@ class LLMService:
                 {"role": "user", "content": user_prompt}
             ],
             temperature=0.1,
-            max_tokens=800,
+            max_tokens=CHAT_MAX_TOKENS,
             response_format={"type": "json_object"}
         )
         
-        return json.loads(response.choices[0].message.content)
+        content = response.choices[0].message.content
+        get_token_usage_tracker().record(
+            'llm_service', 'openai', system_prompt + user_prompt, content or '', *openai_usage(response)
+        )
+        return json.loads(content)
     
     def _call_groq(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
         """Call Groq API."""
@@ -340,7 +382,7 @@ class LLMService:
                 {"role": "user", "content": user_prompt}
             ],
             "temperature": 0.1,
-            "max_tokens": 800
+            "max_tokens": CHAT_MAX_TOKENS
         }
         
         response = requests.post(
@@ -353,7 +395,9 @@ class LLMService:
         if response.status_code != 200:
             raise Exception(f"Groq API error: {response.status_code}")
         
-        result_text = response.json()['choices'][0]['message']['content']
+        body = response.json()
+        result_text = body['choices'][0]['message']['content']
+        get_token_usage_tracker().record('llm_service', 'groq', system_prompt + user_prompt, result_text, *openai_usage(body))
         
         try:
             return json.loads(result_text)
@@ -6,18 +6,28 @@ Supports multiple LLM providers including free local models and cloud APIs.
 import os
 import json
 import logging
+import importlib.util
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+from services.stage_timing import stage
+from services.async_pipeline import ProcessLocalClient, post_json, run_blocking_io
+from services.cancellation import check_cancelled
+from services.prompt_budget import get_prompt_budget, get_token_usage_tracker, ollama_usage, openai_usage
+
 logger = logging.getLogger(__name__)
 
+# Completion length; also reserved in the prompt budget
+ENHANCEMENT_MAX_TOKENS = 500
+
+OLLAMA_GENERATE_URL = "http://localhost:11434/api/generate"
+PROVIDER_TIMEOUT = 30  # seconds
+
 # Optional imports - will gracefully handle missing dependencies
-try:
-    import openai
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# openai and transformers/torch are expensive to import, so only probe for
+# them here and import them when their provider is initialized.
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+if not OPENAI_AVAILABLE:
     logger.info("OpenAI not available - install with: pip install openai")
 
 try:
@@ -27,12 +37,11 @@ except ImportError:
     REQUESTS_AVAILABLE = False
     logger.info("Requests not available - install with: pip install requests")
 
-try:
-    from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
-    import torch
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+TRANSFORMERS_AVAILABLE = (
+    importlib.util.find_spec("transformers") is not None
+    and importlib.util.find_spec("torch") is not None
+)
+if not TRANSFORMERS_AVAILABLE:
     logger.info("Transformers not available - install with: pip install transformers torch")
 
 
@@ -73,7 +82,7 @@ class LLMTextEnhancer:
         """
         self.provider = provider
         self.model = model
-        self.client = None
+        self._client: Optional[ProcessLocalClient] = None  # built per process, see client
         self.local_model = None
         self.config = kwargs
         
@@ -191,11 +200,23 @@ class LLMTextEnhancer:
             self.model = "gpt-3.5-turbo"
         
         try:
-            self.client = OpenAI(api_key=api_key)
+            from openai import OpenAI
+            self._client = ProcessLocalClient(lambda: OpenAI(api_key=api_key))
+            self._client.get()
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
+            self._client = None
             self.provider = "heuristic"
     
+    @property
+    def client(self):
+        """This process's OpenAI client, or None if OpenAI is not initialized."""
+        return self._client.get() if self._client is not None else None
+    
+    @client.setter
+    def client(self, client):
+        self._client = ProcessLocalClient(lambda: client) if client is not None else None
+    
     def _initialize_huggingface(self):
         """Initialize Hugging Face transformers."""
         if not TRANSFORMERS_AVAILABLE:
@@ -208,6 +229,9 @@ class LLMTextEnhancer:
             self.model = "microsoft/DialoGPT-small"
         
         try:
+            from transformers import pipeline
+            import torch
+            
             # Load model and tokenizer
             self.local_model = pipeline(
                 "text-generation",
@@ -249,6 +273,7 @@ class LLMTextEnhancer:
         """
         if self.provider == "heuristic":
             return self._fallback_enhancement(text)
+        check_cancelled()
         
         try:
             # Detect the type of text and apply appropriate enhancement
@@ -258,94 +283,153 @@ class LLMTextEnhancer:
             system_prompt, user_prompt = self._get_enhancement_prompts(text, enhancement_type, context)
             
             # Call the appropriate LLM provider
-            if self.provider == "ollama":
-                result = self._call_ollama(system_prompt, user_prompt)
-            elif self.provider == "groq":
-                result = self._call_groq(system_prompt, user_prompt)
-            elif self.provider == "openai":
-                result = self._call_openai(system_prompt, user_prompt)
-            elif self.provider == "huggingface":
-                result = self._call_huggingface(system_prompt, user_prompt)
-            else:
-                return self._fallback_enhancement(text)
+            with stage('llm'):
+                if self.provider == "ollama":
+                    result = self._call_ollama(system_prompt, user_prompt)
+                elif self.provider == "groq":
+                    result = self._call_groq(system_prompt, user_prompt)
+                elif self.provider == "openai":
+                    result = self._call_openai(system_prompt, user_prompt)
+                elif self.provider == "huggingface":
+                    result = self._call_huggingface(system_prompt, user_prompt)
+                else:
+                    return self._fallback_enhancement(text)
             
-            return TextEnhancement(
-                enhanced_text=result.get('enhanced_text', text),
-                confidence=result.get('confidence', 0.8),
-                detected_patterns=result.get('detected_patterns', []),
-                original_text=text,
-                enhancement_type=enhancement_type,
-                metadata={
-                    'provider': self.provider,
-                    'model_used': self.model,
-                    'processing_notes': result.get('notes', ''),
-                    'context': context
-                }
-            )
+            return self._build_enhancement(text, enhancement_type, context, result)
             
         except Exception as e:
             logger.error(f"LLM enhancement failed: {e}")
             return self._fallback_enhancement(text)
     
-    def _call_ollama(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
-        """Call Ollama local LLM."""
-        full_prompt = f"{system_prompt}\n\nUser: {user_prompt}\n\nAssistant: "
+    async def enhance_text_for_parsing_async(self, text: str, context: Optional[str] = None) -> TextEnhancement:
+        """
+        Async enhance_text_for_parsing: HTTP providers are awaited on the
+        shared client, local models run in a thread.
+        
+        Cancelling the awaiting task aborts the in-flight request.
+        """
+        if self.provider == "heuristic":
+            return self._fallback_enhancement(text)
         
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={
+        try:
+            enhancement_type = self._detect_text_type(text)
+            system_prompt, user_prompt = self._get_enhancement_prompts(text, enhancement_type, context)
+            
+            with stage('llm'):
+                request = self._http_request(system_prompt, user_prompt)
+                if request is not None:
+                    url, payload, headers, timeout = request
+                    status_code, body = await post_json(url, payload, headers, timeout)
+                    if status_code != 200:
+                        raise Exception(f"{self.provider} API error: {status_code}")
+                    result = self._http_result(system_prompt, user_prompt, body)
+                elif self.provider == "huggingface":
+                    result = await run_blocking_io(self._call_huggingface, system_prompt, user_prompt)
+                else:
+                    return self._fallback_enhancement(text)
+            
+            return self._build_enhancement(text, enhancement_type, context, result)
+            
+        except Exception as e:
+            logger.error(f"LLM enhancement failed: {e}")
+            return self._fallback_enhancement(text)
+    
+    def _build_enhancement(self, text: str, enhancement_type: str, context: Optional[str],
+                           result: Dict[str, Any]) -> TextEnhancement:
+        """TextEnhancement from a provider's parsed response."""
+        return TextEnhancement(
+            enhanced_text=result.get('enhanced_text', text),
+            confidence=result.get('confidence', 0.8),
+            detected_patterns=result.get('detected_patterns', []),
+            original_text=text,
+            enhancement_type=enhancement_type,
+            metadata={
+                'provider': self.provider,
+                'model_used': self.model,
+                'processing_notes': result.get('notes', ''),
+                'context': context
+            }
+        )
+    
+    def _http_request(self, system_prompt: str, user_prompt: str) -> Optional[tuple]:
+        """(url, JSON payload, headers, timeout) of the provider's HTTP call, or None for local providers."""
+        if self.provider == "ollama":
+            return OLLAMA_GENERATE_URL, {
                 "model": self.model,
-                "prompt": full_prompt,
+                "prompt": self._ollama_prompt(system_prompt, user_prompt),
                 "stream": False,
                 "options": {
                     "temperature": 0.1,
-                    "num_predict": 500
+                    "num_predict": ENHANCEMENT_MAX_TOKENS,
+                    "num_ctx": get_prompt_budget().context_tokens
                 }
-            },
-            timeout=30
-        )
+            }, None, PROVIDER_TIMEOUT
+        
+        if self.provider in ("groq", "openai"):
+            payload = {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                "temperature": 0.1,
+                "max_tokens": ENHANCEMENT_MAX_TOKENS
+            }
+            if self.provider == "groq":
+                base_url, api_key = self.config['base_url'], self.config['api_key']
+            else:
+                base_url, api_key = str(self.client.base_url).rstrip('/'), self.client.api_key
+                payload["response_format"] = {"type": "json_object"}
+            headers = {
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            }
+            return f"{base_url}/chat/completions", payload, headers, PROVIDER_TIMEOUT
+        
+        return None
+    
+    def _http_result(self, system_prompt: str, user_prompt: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Parsed enhancement from the JSON body of a successful provider HTTP call."""
+        if self.provider == "ollama":
+            full_prompt = self._ollama_prompt(system_prompt, user_prompt)
+            result_text = body['response']
+            get_token_usage_tracker().record('llm_text_enhancer', 'ollama', full_prompt, result_text, *ollama_usage(body))
+        else:
+            result_text = body['choices'][0]['message']['content']
+            get_token_usage_tracker().record(
+                'llm_text_enhancer', self.provider, system_prompt + user_prompt, result_text or '', *openai_usage(body)
+            )
+        
+        # Try to parse as JSON, fallback to text processing
+        try:
+            return json.loads(result_text)
+        except:
+            if self.provider == "openai":
+                raise
+            # Extract information from text response
+            return self._parse_text_response(result_text)
+    
+    @staticmethod
+    def _ollama_prompt(system_prompt: str, user_prompt: str) -> str:
+        return f"{system_prompt}\n\nUser: {user_prompt}\n\nAssistant: "
+    
+    def _call_ollama(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Call Ollama local LLM."""
+        url, payload, _, timeout = self._http_request(system_prompt, user_prompt)
+        response = requests.post(url, json=payload, timeout=timeout)
         
         if response.status_code == 200:
-            result_text = response.json()['response']
-            # Try to parse as JSON, fallback to text processing
-            try:
-                return json.loads(result_text)
-            except:
-                # Extract information from text response
-                return self._parse_text_response(result_text)
+            return self._http_result(system_prompt, user_prompt, response.json())
         else:
             raise Exception(f"Ollama API error: {response.status_code}")
     
     def _call_groq(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
         """Call Groq API."""
-        headers = {
-            "Authorization": f"Bearer {self.config['api_key']}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            "temperature": 0.1,
-            "max_tokens": 500
-        }
-        
-        response = requests.post(
-            f"{self.config['base_url']}/chat/completions",
-            headers=headers,
-            json=data,
-            timeout=30
-        )
+        url, payload, headers, timeout = self._http_request(system_prompt, user_prompt)
+        response = requests.post(url, headers=headers, json=payload, timeout=timeout)
         
         if response.status_code == 200:
-            result_text = response.json()['choices'][0]['message']['content']
-            try:
-                return json.loads(result_text)
-            except:
-                return self._parse_text_response(result_text)
+            return self._http_result(system_prompt, user_prompt, response.json())
         else:
             raise Exception(f"Groq API error: {response.status_code}")
     
@@ -358,11 +442,15 @@ class LLMTextEnhancer:
                 {"role": "user", "content": user_prompt}
             ],
             temperature=0.1,
-            max_tokens=500,
+            max_tokens=ENHANCEMENT_MAX_TOKENS,
             response_format={"type": "json_object"}
         )
         
-        return json.loads(response.choices[0].message.content)
+        content = response.choices[0].message.content
+        get_token_usage_tracker().record(
+            'llm_text_enhancer', 'openai', system_prompt + user_prompt, content or '', *openai_usage(response)
+        )
+        return json.loads(content)
     
     def _call_huggingface(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
         """Call Hugging Face local model."""
@@ -378,6 +466,7 @@ class LLMTextEnhancer:
         )
         
         generated_text = result[0]['generated_text'][len(full_prompt):]
+        get_token_usage_tracker().record('llm_text_enhancer', 'huggingface', full_prompt, generated_text)
         
         try:
             return json.loads(generated_text)
@@ -521,8 +610,10 @@ SPECIAL FOCUS FOR BUSINESS COMMUNICATIONS:
         else:
             system_prompt = base_system_prompt
         
-        # Create user prompt with context
+        # Create user prompt with context; the system prompt is identical for
+        # every text of a type, so per-request content only goes here
         context_info = f" (Context: {context})" if context else ""
+        text = get_prompt_budget().fit_text(text, ENHANCEMENT_MAX_TOKENS, system_prompt, context_info)
         user_prompt = f"""Please enhance this text for calendar event parsing{context_info}:
 
 "{text}"
@@ -582,15 +673,17 @@ Focus on making the event information as clear and parseable as possible while p
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics (for monitoring/billing)."""
+        usage = get_token_usage_tracker().get_stats('llm_text_enhancer')
         return {
             'provider': self.provider,
             'model': self.model,
             'available': self.is_available(),
-            'total_requests': 0,  # Would track this in production
-            'total_tokens': 0     # Would track this in production
+            'total_requests': usage['calls'],
+            'total_tokens': usage['total_tokens'],
+            'prompt_tokens': usage['prompt_tokens'],
+            'completion_tokens': usage['completion_tokens']
         }
 
-
 # Global instance for easy access
 _llm_enhancer = None
 
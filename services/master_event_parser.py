@@ -5,7 +5,10 @@ This class integrates all parsing components with LLM as the primary method,
 comprehensive fallback mechanisms, and unified confidence scoring.
 """
 
+import contextvars
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -30,7 +33,7 @@ class ParsingResult:
     parsed_event: Optional[ParsedEvent] = None
     normalized_event: Optional[NormalizedEvent] = None
     confidence_score: float = 0.0
-    parsing_method: str = ""  # "llm_primary", "llm_enhanced", "regex_fallback", "component_fallback"
+    parsing_method: str = ""  # "llm_primary", "llm_enhanced", "regex_fallback", "regex_speculative", "speculative_merged", "component_fallback"
     processing_time: float = 0.0
     format_result: Optional[TextFormatResult] = None
     error_handling_result: Optional[ErrorHandlingResult] = None
@@ -59,6 +62,7 @@ class MasterEventParser:
     1. Text Format Processing (FormatAwareTextProcessor)
     2. LLM Primary Extraction (LLMService)
     3. Regex Fallback (EventParser) - if LLM fails or low confidence
+       (with speculative_execution, 2 and 3 run concurrently; see _speculative_extraction)
     4. Component Enhancement (AdvancedLocationExtractor, SmartTitleExtractor)
     5. Error Handling & Validation (ComprehensiveErrorHandler)
     6. Cross-component Validation & Consistency Checking
@@ -90,6 +94,10 @@ class MasterEventParser:
             'performance_optimization': True,
             'debug_logging': False,
             'max_processing_time': 30.0,  # seconds
+            'speculative_execution': False,  # Run regex and LLM extraction concurrently
+            'speculative_regex_threshold': 0.8,  # Regex result returned without waiting for the LLM
+            'speculative_llm_timeout': 10.0,  # seconds to wait for the LLM once regex is not enough
+            'speculative_max_workers': 4,  # Concurrent speculative LLM calls
             'unified_confidence_weights': {
                 'llm_confidence': 0.4,
                 'format_confidence': 0.2,
@@ -105,9 +113,13 @@ class MasterEventParser:
             'regex_fallbacks': 0,
             'component_enhancements': 0,
             'error_recoveries': 0,
+            'speculative_regex_wins': 0,
             'average_processing_time': 0.0
         }
         
+        self._llm_executor: Optional[ThreadPoolExecutor] = None
+        self._llm_executor_lock = threading.Lock()
+        
         logger.info("MasterEventParser initialized with LLM-first strategy")
     
     def parse_event(self, text: str, **kwargs) -> ParsingResult:
@@ -133,9 +145,13 @@ class MasterEventParser:
             
             # Step 2: LLM Primary Extraction
             llm_result = None
+            regex_result = None
             parsing_method = "unknown"
             
-            if self.config['llm_first_strategy'] and self.llm_service.is_available():
+            if self.config['speculative_execution']:
+                # Steps 2 and 3 concurrently, returning early on a confident regex result
+                llm_result, regex_result, parsing_method = self._speculative_extraction(processed_text, **kwargs)
+            elif self.config['llm_first_strategy'] and self.llm_service.is_available():
                 llm_result = self._llm_primary_extraction(processed_text, **kwargs)
                 
                 if llm_result and llm_result.confidence_score >= self.config['llm_confidence_threshold']:
@@ -148,8 +164,7 @@ class MasterEventParser:
                     llm_result = None
             
             # Step 3: Regex Fallback (if LLM failed or low confidence)
-            regex_result = None
-            if not llm_result:
+            if not llm_result and not self.config['speculative_execution']:
                 regex_result = self._regex_fallback_extraction(processed_text, **kwargs)
                 if regex_result:
                     parsing_method = "regex_fallback"
@@ -293,6 +308,103 @@ class MasterEventParser:
             logger.warning(f"Regex fallback failed: {e}")
             return None
     
+    def _get_llm_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for speculative LLM calls, created on first use."""
+        with self._llm_executor_lock:
+            if self._llm_executor is None:
+                self._llm_executor = ThreadPoolExecutor(
+                    max_workers=self.config['speculative_max_workers'],
+                    thread_name_prefix='speculative-llm'
+                )
+            return self._llm_executor
+    
+    def _speculative_extraction(self, text: str, **kwargs) -> Tuple[Optional[ParsedEvent], Optional[ParsedEvent], str]:
+        """
+        Run LLM and regex extraction concurrently.
+        
+        The LLM call starts in the background while regex runs on the calling
+        thread. A regex result at or above speculative_regex_threshold is
+        returned at once and the LLM call is cancelled: if it has not started
+        it never runs, otherwise its result is discarded (an in-flight HTTP
+        request cannot be interrupted). Otherwise the LLM result is awaited
+        for up to speculative_llm_timeout and merged per field with regex.
+        
+        Returns:
+            Tuple of (llm_result, regex_result, parsing_method); llm_result
+            holds the merged event when both succeeded
+        """
+        llm_future = None
+        if self.llm_service.is_available():
+            llm_future = self._get_llm_executor().submit(
+                contextvars.copy_context().run, self._llm_primary_extraction, text, **kwargs
+            )
+        
+        regex_result = self._regex_fallback_extraction(text, **kwargs)
+        if regex_result and regex_result.confidence_score >= self.config['speculative_regex_threshold']:
+            if llm_future is not None:
+                llm_future.cancel()
+            self.performance_stats['speculative_regex_wins'] += 1
+            return None, regex_result, "regex_speculative"
+        
+        llm_result = None
+        if llm_future is not None:
+            try:
+                llm_result = llm_future.result(timeout=self.config['speculative_llm_timeout'])
+            except FuturesTimeoutError:
+                llm_future.cancel()
+                logger.warning(f"Speculative LLM extraction exceeded {self.config['speculative_llm_timeout']}s, using regex result")
+            except Exception as e:
+                logger.warning(f"Speculative LLM extraction failed: {e}")
+        
+        if llm_result and llm_result.confidence_score < self.config['llm_confidence_threshold']:
+            llm_result = None
+        
+        if llm_result and regex_result:
+            return self._merge_speculative_results(llm_result, regex_result), regex_result, "speculative_merged"
+        if llm_result:
+            return llm_result, None, "llm_primary"
+        if regex_result:
+            self.performance_stats['regex_fallbacks'] += 1
+            return None, regex_result, "regex_fallback"
+        return None, None, "unknown"
+    
+    def _merge_speculative_results(self, llm_result: ParsedEvent, regex_result: ParsedEvent) -> ParsedEvent:
+        """
+        Merge regex fields into the LLM result where they are missing or more confident.
+        
+        Start, end and all-day are taken together from one source so the
+        time range stays consistent; the description is only filled in.
+        """
+        regex_fields = []
+        
+        for field_name in ('title', 'location'):
+            regex_value = getattr(regex_result, field_name)
+            if not regex_value:
+                continue
+            if (not getattr(llm_result, field_name) or
+                    self._get_field_confidence(regex_result, field_name) >
+                    self._get_field_confidence(llm_result, field_name)):
+                setattr(llm_result, field_name, regex_value)
+                regex_fields.append(field_name)
+        
+        if regex_result.start_datetime and (
+                not llm_result.start_datetime or
+                self._get_field_confidence(regex_result, 'start_datetime') >
+                self._get_field_confidence(llm_result, 'start_datetime')):
+            llm_result.start_datetime = regex_result.start_datetime
+            llm_result.end_datetime = regex_result.end_datetime
+            llm_result.all_day = regex_result.all_day
+            regex_fields.extend(['start_datetime', 'end_datetime'])
+        
+        if not llm_result.description and regex_result.description:
+            llm_result.description = regex_result.description
+            regex_fields.append('description')
+        
+        if not llm_result.extraction_metadata:
+            llm_result.extraction_metadata = {}
+        llm_result.extraction_metadata['speculative_merge'] = {'regex_fields': regex_fields}
+        return llm_result
+    
     def _enhance_with_components(self, parsed_event: ParsedEvent, text: str, 
                                llm_was_primary: bool) -> ParsedEvent:
         """Enhance parsing results with specialized component extractors."""
@@ -569,6 +681,7 @@ class MasterEventParser:
             },
             'configuration': {
                 'llm_first_strategy': self.config['llm_first_strategy'],
+                'speculative_execution': self.config['speculative_execution'],
                 'llm_confidence_threshold': self.config['llm_confidence_threshold'],
                 'component_enhancement': self.config['enable_component_enhancement'],
                 'cross_validation': self.config['enable_cross_validation']
@@ -706,6 +819,7 @@ class MasterEventParser:
             'regex_fallbacks': 0,
             'component_enhancements': 0,
             'error_recoveries': 0,
+            'speculative_regex_wins': 0,
             'average_processing_time': 0.0
         }
         logger.info("Performance statistics reset")
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from models.event_models import FieldResult, ValidationResult
+from services.keyword_prefilter import get_keyword_prefilter
 
 
 class ProcessingMethod(Enum):
@@ -52,6 +53,7 @@ class PerFieldConfidenceRouter:
     def __init__(self):
         """Initialize the router with field analysis patterns."""
         self._compile_field_patterns()
+        self._setup_pattern_triggers()
         self._setup_confidence_thresholds()
         self._setup_field_priorities()
     
@@ -157,6 +159,39 @@ class PerFieldConfidenceRouter:
             ]
         }
     
+    def _setup_pattern_triggers(self):
+        """Map each pattern type to the keyword prefilter triggers every one of its patterns requires."""
+        self.prefilter = get_keyword_prefilter()
+        triggers = {
+            'explicit_date': ('month', 'digit'),
+            'relative_date': ('relative_day', 'weekday', 'digit'),
+            'explicit_time': ('digit', 'noon'),
+            'time_range': ('digit',),
+            'formal_title': ('event_noun',),
+            'quoted_title': ('quote',),
+            'subject_line': ('subject',),
+            'structured_location': ('location_label',),
+            'explicit_address': ('street_suffix', 'place_noun'),
+            'venue_keywords': ('at', 'in', 'at_sign', 'room'),
+            'implicit_location': ('implicit_place',),
+            'with_keyword': ('with', 'meet'),
+            'email_addresses': ('at_sign',),
+            'explicit_recurrence': ('every',),
+            'frequency_indicators': ('frequency',),
+            'explicit_duration': ('duration_unit',),
+            'until_time': ('until',)
+        }
+        self.pattern_triggers = {
+            pattern_type: self.prefilter.mask(*names) for pattern_type, names in triggers.items()
+        }
+    
+    def _triggered_patterns(self, field_patterns: Dict[str, List[re.Pattern]], text: str):
+        """Pattern groups whose trigger keywords occur in text; the others cannot match."""
+        bits = self.prefilter.scan(text)
+        for pattern_type, patterns in field_patterns.items():
+            if bits & self.pattern_triggers.get(pattern_type, -1):
+                yield pattern_type, patterns
+    
     def _setup_confidence_thresholds(self):
         """Setup confidence thresholds for routing decisions."""
         self.confidence_thresholds = {
@@ -206,10 +241,12 @@ class PerFieldConfidenceRouter:
         text = text.strip()
         analyses = {}
         
-        # Analyze each field type
+        # Analyze each field type; start and end share one datetime pattern scan
+        datetime_scan = self._scan_datetime_patterns(text)
+        analyze_datetime = lambda t, name: self._analyze_datetime_field(t, name, datetime_scan)
         field_analyzers = {
-            'start_datetime': self._analyze_datetime_field,
-            'end_datetime': self._analyze_datetime_field,
+            'start_datetime': analyze_datetime,
+            'end_datetime': analyze_datetime,
             'title': self._analyze_title_field,
             'location': self._analyze_location_field,
             'participants': self._analyze_participants_field,
@@ -224,15 +261,15 @@ class PerFieldConfidenceRouter:
         
         return analyses
     
-    def _analyze_datetime_field(self, text: str, field_name: str) -> Optional[FieldAnalysis]:
-        """Analyze datetime field extractability."""
+    def _scan_datetime_patterns(self, text: str) -> Tuple[List[str], float, float, List[str]]:
+        """Scan text with the datetime patterns (shared by start and end datetime analysis)."""
         pattern_matches = []
         confidence_score = 0.0
         complexity_score = 0.0
         ambiguities = []
         
         # Check for explicit date patterns (highest confidence)
-        for pattern_type, patterns in self.datetime_patterns.items():
+        for pattern_type, patterns in self._triggered_patterns(self.datetime_patterns, text):
             for pattern in patterns:
                 matches = pattern.findall(text)
                 if matches:
@@ -252,6 +289,15 @@ class PerFieldConfidenceRouter:
                         ambiguities.append(f"Multiple {pattern_type} patterns found")
                         complexity_score += 0.2
         
+        return pattern_matches, confidence_score, complexity_score, ambiguities
+    
+    def _analyze_datetime_field(self, text: str, field_name: str,
+                                scan: Optional[Tuple[List[str], float, float, List[str]]] = None) -> Optional[FieldAnalysis]:
+        """Analyze datetime field extractability."""
+        pattern_matches, confidence_score, complexity_score, ambiguities = scan or self._scan_datetime_patterns(text)
+        pattern_matches = list(pattern_matches)
+        ambiguities = list(ambiguities)
+        
         # Adjust confidence for field-specific factors
         if field_name == 'end_datetime':
             # End datetime often depends on start + duration
@@ -287,7 +333,7 @@ class PerFieldConfidenceRouter:
         ambiguities = []
         
         # Check for title patterns
-        for pattern_type, patterns in self.title_patterns.items():
+        for pattern_type, patterns in self._triggered_patterns(self.title_patterns, text):
             for pattern in patterns:
                 matches = pattern.findall(text)
                 if matches:
@@ -344,7 +390,7 @@ class PerFieldConfidenceRouter:
         ambiguities = []
         
         # Check for location patterns
-        for pattern_type, patterns in self.location_patterns.items():
+        for pattern_type, patterns in self._triggered_patterns(self.location_patterns, text):
             for pattern in patterns:
                 matches = pattern.findall(text)
                 if matches:
@@ -388,7 +434,7 @@ class PerFieldConfidenceRouter:
         ambiguities = []
         
         # Check for participants patterns
-        for pattern_type, patterns in self.participants_patterns.items():
+        for pattern_type, patterns in self._triggered_patterns(self.participants_patterns, text):
             for pattern in patterns:
                 matches = pattern.findall(text)
                 if matches:
@@ -428,7 +474,7 @@ class PerFieldConfidenceRouter:
         ambiguities = []
         
         # Check for recurrence patterns
-        for pattern_type, patterns in self.recurrence_patterns.items():
+        for pattern_type, patterns in self._triggered_patterns(self.recurrence_patterns, text):
             for pattern in patterns:
                 matches = pattern.findall(text)
                 if matches:
@@ -468,7 +514,7 @@ class PerFieldConfidenceRouter:
         ambiguities = []
         
         # Check for duration patterns
-        for pattern_type, patterns in self.duration_patterns.items():
+        for pattern_type, patterns in self._triggered_patterns(self.duration_patterns, text):
             for pattern in patterns:
                 matches = pattern.findall(text)
                 if matches:
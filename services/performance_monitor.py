@@ -6,6 +6,7 @@ This module implements comprehensive performance monitoring including:
 - Golden set maintenance with 50-100 curated test cases
 - Reliability diagram generation for confidence calibration
 - Performance metrics collection and reporting
+- Streaming quantile sketches with 1m/5m/1h rolling windows, mergeable across workers
 
 Requirements addressed:
 - 15.1: Component latency tracking and performance metrics collection
@@ -22,50 +23,51 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Callable
-import matplotlib.pyplot as plt
 import numpy as np
 from models.event_models import ParsedEvent, NormalizedEvent
+from services.quantile_sketch import WindowedSketch
 
 logger = logging.getLogger(__name__)
 
 
+# Window reported by ComponentLatency.get_stats and the quality metrics
+DEFAULT_STATS_WINDOW = '1h'
+
+
 @dataclass
 class ComponentLatency:
     """Tracks latency metrics for a specific component."""
     component_name: str
-    latencies: deque = field(default_factory=lambda: deque(maxlen=1000))  # Keep last 1000 measurements
+    latencies: deque = field(default_factory=lambda: deque(maxlen=100))  # Recent raw samples (time series)
+    sketch: WindowedSketch = field(default_factory=WindowedSketch)  # Quantiles over 1m/5m/1h and all-time
     total_calls: int = 0
     total_time_ms: float = 0.0
     
     def add_measurement(self, latency_ms: float):
         """Add a latency measurement."""
         self.latencies.append(latency_ms)
+        self.sketch.add(latency_ms)
         self.total_calls += 1
         self.total_time_ms += latency_ms
     
-    def get_stats(self) -> Dict[str, float]:
-        """Get statistical summary of latencies."""
-        if not self.latencies:
-            return {
-                'count': 0,
-                'mean': 0.0,
-                'median': 0.0,
-                'p95': 0.0,
-                'p99': 0.0,
-                'min': 0.0,
-                'max': 0.0
-            }
+    def get_stats(self, window: Optional[str] = DEFAULT_STATS_WINDOW) -> Dict[str, float]:
+        """
+        Get statistical summary of latencies.
         
-        latencies_list = list(self.latencies)
-        return {
-            'count': len(latencies_list),
-            'mean': statistics.mean(latencies_list),
-            'median': statistics.median(latencies_list),
-            'p95': np.percentile(latencies_list, 95),
-            'p99': np.percentile(latencies_list, 99),
-            'min': min(latencies_list),
-            'max': max(latencies_list)
-        }
+        Args:
+            window: Rolling window ('1m', '5m', '1h') or None for all-time
+        """
+        return self.sketch.get_stats(window)
+    
+    def get_window_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get statistical summaries for every rolling window."""
+        return self.sketch.get_window_stats()
+    
+    def merge(self, other: 'ComponentLatency'):
+        """Merge measurements from another worker's tracker for the same component."""
+        self.sketch.merge(other.sketch)
+        self.total_calls += other.total_calls
+        self.total_time_ms += other.total_time_ms
 
 
 @dataclass
@@ -152,8 +154,9 @@ class PerformanceMetrics:
     """Comprehensive performance metrics for the parsing system."""
     timestamp: datetime = field(default_factory=datetime.now)
     
-    # Component latency metrics
+    # Component latency metrics (default window) and per-window breakdown
     component_latencies: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    component_latency_windows: Dict[str, Dict[str, Dict[str, float]]] = field(default_factory=dict)
     
     # Accuracy metrics
     overall_accuracy: float = 0.0
@@ -178,6 +181,7 @@ class PerformanceMetrics:
         return {
             'timestamp': self.timestamp.isoformat(),
             'component_latencies': self.component_latencies,
+            'component_latency_windows': self.component_latency_windows,
             'overall_accuracy': self.overall_accuracy,
             'field_accuracies': self.field_accuracies,
             'calibration_error': self.calibration_error,
@@ -252,7 +256,7 @@ class PerformanceMonitor:
         self.cache_misses = 0
         
         # Quality tracking
-        self.quality_scores: deque = deque(maxlen=1000)
+        self.quality_scores = WindowedSketch()
         
         logger.info(f"PerformanceMonitor initialized with {len(self.golden_test_cases)} golden test cases")
     
@@ -272,6 +276,45 @@ class PerformanceMonitor:
         else:
             logger.warning(f"Unknown component for latency tracking: {component}")
     
+    def export_latency_sketches(self) -> Dict[str, Any]:
+        """
+        Serialize component latency and quality sketches so another worker can merge them.
+        
+        Returns:
+            JSON-serializable dictionary for merge_latency_sketches()
+        """
+        return {
+            'components': {
+                name: {
+                    'sketch': tracker.sketch.to_dict(),
+                    'total_calls': tracker.total_calls,
+                    'total_time_ms': tracker.total_time_ms
+                }
+                for name, tracker in self.component_latencies.items()
+            },
+            'quality_scores': self.quality_scores.to_dict()
+        }
+    
+    def merge_latency_sketches(self, data: Dict[str, Any]):
+        """
+        Merge sketches exported by another worker's export_latency_sketches().
+        
+        Args:
+            data: Exported sketch dictionary
+        """
+        for name, component_data in data.get('components', {}).items():
+            tracker = self.component_latencies.setdefault(name, ComponentLatency(name))
+            other = ComponentLatency(
+                name,
+                sketch=WindowedSketch.from_dict(component_data['sketch']),
+                total_calls=component_data.get('total_calls', 0),
+                total_time_ms=component_data.get('total_time_ms', 0.0)
+            )
+            tracker.merge(other)
+        
+        if 'quality_scores' in data:
+            self.quality_scores.merge(WindowedSketch.from_dict(data['quality_scores']))
+    
     def time_component(self, component: str):
         """
         Context manager for timing component execution.
@@ -497,8 +540,6 @@ class PerformanceMonitor:
             return {'error': 'No golden test cases available'}
         
         results = []
-        total_accuracy = 0.0
-        field_accuracies = defaultdict(list)
         
         logger.info(f"Evaluating accuracy against {len(self.golden_test_cases)} golden test cases")
         
@@ -514,16 +555,6 @@ class PerformanceMonitor:
                 accuracy_result.processing_time_ms = processing_time_ms
                 
                 results.append(accuracy_result)
-                total_accuracy += accuracy_result.accuracy_score
-                
-                # Track field accuracies
-                for field, accuracy in accuracy_result.field_accuracies.items():
-                    field_accuracies[field].append(accuracy)
-                
-                # Track confidence calibration
-                if predicted_event and predicted_event.confidence_score > 0:
-                    is_correct = accuracy_result.accuracy_score > 0.7  # Consider >70% accuracy as correct
-                    self.confidence_predictions.append((predicted_event.confidence_score, is_correct))
                 
                 logger.debug(f"Test case {test_case.id}: accuracy={accuracy_result.accuracy_score:.3f}")
                 
@@ -537,6 +568,37 @@ class PerformanceMonitor:
                 )
                 results.append(error_result)
         
+        return self.summarize_accuracy_results(results)
+    
+    def summarize_accuracy_results(self, results: List[AccuracyResult]) -> Dict[str, Any]:
+        """
+        Record accuracy results and build the evaluation summary.
+        
+        Shared by the sequential evaluate_accuracy and the parallel golden-set
+        evaluator; results must be in golden-set order so summaries are deterministic.
+        
+        Args:
+            results: AccuracyResult per golden test case
+            
+        Returns:
+            Dictionary with accuracy metrics and detailed results
+        """
+        total_accuracy = 0.0
+        field_accuracies = defaultdict(list)
+        
+        for accuracy_result in results:
+            total_accuracy += accuracy_result.accuracy_score
+            
+            # Track field accuracies
+            for field, accuracy in accuracy_result.field_accuracies.items():
+                field_accuracies[field].append(accuracy)
+            
+            # Track confidence calibration
+            predicted_event = accuracy_result.predicted_event
+            if predicted_event and predicted_event.confidence_score > 0:
+                is_correct = accuracy_result.accuracy_score > 0.7  # Consider >70% accuracy as correct
+                self.confidence_predictions.append((predicted_event.confidence_score, is_correct))
+        
         # Calculate summary statistics
         overall_accuracy = total_accuracy / len(results) if results else 0.0
         
@@ -764,8 +826,9 @@ class PerformanceMonitor:
             weight = point.count / total_predictions
             ece += weight * abs(point.predicted_confidence - point.actual_accuracy)
         
-        # Generate the plot
+        # Generate the plot (matplotlib is imported here to keep it off the startup path)
         try:
+            import matplotlib.pyplot as plt
             plt.figure(figsize=(10, 8))
             
             # Plot reliability curve
@@ -861,7 +924,7 @@ class PerformanceMonitor:
             self.cache_misses += 1
         
         if quality_score is not None:
-            self.quality_scores.append(quality_score)
+            self.quality_scores.add(quality_score)
     
     def get_performance_metrics(self) -> PerformanceMetrics:
         """
@@ -872,25 +935,27 @@ class PerformanceMonitor:
         """
         # Component latency metrics
         component_latencies = {}
+        component_latency_windows = {}
         for component_name, latency_tracker in self.component_latencies.items():
             component_latencies[component_name] = latency_tracker.get_stats()
+            component_latency_windows[component_name] = latency_tracker.get_window_stats()
         
         # Calculate cache hit rate
         total_cache_requests = self.cache_hits + self.cache_misses
         cache_hit_rate = self.cache_hits / total_cache_requests if total_cache_requests > 0 else 0.0
         
         # Calculate average quality score
-        avg_quality = statistics.mean(self.quality_scores) if self.quality_scores else 0.0
+        quality_sketch = self.quality_scores.snapshot(DEFAULT_STATS_WINDOW)
+        avg_quality = quality_sketch.mean
         
         # Quality distribution
-        quality_distribution = {'high': 0, 'medium': 0, 'low': 0}
-        for score in self.quality_scores:
-            if score >= 0.7:
-                quality_distribution['high'] += 1
-            elif score >= 0.4:
-                quality_distribution['medium'] += 1
-            else:
-                quality_distribution['low'] += 1
+        below_medium = quality_sketch.count_below(0.4)
+        below_high = quality_sketch.count_below(0.7)
+        quality_distribution = {
+            'high': quality_sketch.count - below_high,
+            'medium': below_high - below_medium,
+            'low': below_medium
+        }
         
         # Field accuracies from recent results
         field_accuracies = {}
@@ -944,6 +1009,7 @@ class PerformanceMonitor:
         
         return PerformanceMetrics(
             component_latencies=component_latencies,
+            component_latency_windows=component_latency_windows,
             overall_accuracy=overall_accuracy,
             field_accuracies=field_accuracies,
             calibration_error=calibration_error,
@@ -18,7 +18,7 @@ import asyncio
 import logging
 import re
 import time
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import Dict, List, Optional, Any, Callable, Sequence, Tuple
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
@@ -124,6 +124,14 @@ class LazyModuleLoader:
         """Check if a module is loaded."""
         return name in self._modules and self._modules[name]['loaded']
     
+    def is_registered(self, name: str) -> bool:
+        """Check if a module is registered for lazy loading."""
+        return name in self._modules
+    
+    def get_registered_modules(self) -> List[str]:
+        """Get the names of all registered modules."""
+        return list(self._modules.keys())
+    
     def get_load_times(self) -> Dict[str, float]:
         """Get load times for all modules."""
         return self._load_times.copy()
@@ -206,15 +214,16 @@ class ModelWarmUp:
         self.warm_up_time = 0.0
         self.warm_up_results = {}
     
-    def warm_up_models(self, test_inputs: Dict[str, str] = None) -> Dict[str, bool]:
+    def warm_up_models(self, test_inputs: Dict[str, str] = None, skip: Sequence[str] = ()) -> Dict[str, bool]:
         """
         Warm up models by running test inputs through them.
         
         Args:
             test_inputs: Dictionary mapping service names to test input strings
+            skip: Services not to warm up
             
         Returns:
-            Dictionary mapping service names to success status
+            Dictionary mapping service names to success status (skipped services are left out)
         """
         start_time = time.time()
         
@@ -228,46 +237,49 @@ class ModelWarmUp:
         results = {}
         
         # Warm up LLM service
-        try:
-            llm_service = self.lazy_loader.get_module('llm_service')
-            if llm_service:
-                test_text = test_inputs.get('llm_service', "test meeting")
-                response = llm_service.extract_event(test_text, current_date="2025-01-01")
-                results['llm_service'] = response.success
-                logger.info("LLM service warmed up successfully")
-            else:
+        if 'llm_service' not in skip:
+            try:
+                llm_service = self.lazy_loader.get_module('llm_service')
+                if llm_service:
+                    test_text = test_inputs.get('llm_service', "test meeting")
+                    response = llm_service.extract_event(test_text, current_date="2025-01-01")
+                    results['llm_service'] = response.success
+                    logger.info("LLM service warmed up successfully")
+                else:
+                    results['llm_service'] = False
+            except Exception as e:
+                logger.warning(f"LLM service warm-up failed: {e}")
                 results['llm_service'] = False
-        except Exception as e:
-            logger.warning(f"LLM service warm-up failed: {e}")
-            results['llm_service'] = False
         
         # Warm up Duckling extractor
-        try:
-            duckling = self.lazy_loader.get_module('duckling_extractor')
-            if duckling:
-                test_text = test_inputs.get('duckling_extractor', "tomorrow at 2pm")
-                result = duckling.extract_with_duckling(test_text, "time")
-                results['duckling_extractor'] = result.value is not None
-                logger.info("Duckling extractor warmed up successfully")
-            else:
+        if 'duckling_extractor' not in skip:
+            try:
+                duckling = self.lazy_loader.get_module('duckling_extractor')
+                if duckling:
+                    test_text = test_inputs.get('duckling_extractor', "tomorrow at 2pm")
+                    result = duckling.extract_with_duckling(test_text, "time")
+                    results['duckling_extractor'] = result.value is not None
+                    logger.info("Duckling extractor warmed up successfully")
+                else:
+                    results['duckling_extractor'] = False
+            except Exception as e:
+                logger.warning(f"Duckling extractor warm-up failed: {e}")
                 results['duckling_extractor'] = False
-        except Exception as e:
-            logger.warning(f"Duckling extractor warm-up failed: {e}")
-            results['duckling_extractor'] = False
         
         # Warm up Recognizers extractor
-        try:
-            recognizers = self.lazy_loader.get_module('recognizers_extractor')
-            if recognizers:
-                test_text = test_inputs.get('recognizers_extractor', "next week")
-                result = recognizers.extract_with_recognizers(test_text, "time")
-                results['recognizers_extractor'] = result.value is not None
-                logger.info("Recognizers extractor warmed up successfully")
-            else:
+        if 'recognizers_extractor' not in skip:
+            try:
+                recognizers = self.lazy_loader.get_module('recognizers_extractor')
+                if recognizers:
+                    test_text = test_inputs.get('recognizers_extractor', "next week")
+                    result = recognizers.extract_with_recognizers(test_text, "time")
+                    results['recognizers_extractor'] = result.value is not None
+                    logger.info("Recognizers extractor warmed up successfully")
+                else:
+                    results['recognizers_extractor'] = False
+            except Exception as e:
+                logger.warning(f"Recognizers extractor warm-up failed: {e}")
                 results['recognizers_extractor'] = False
-        except Exception as e:
-            logger.warning(f"Recognizers extractor warm-up failed: {e}")
-            results['recognizers_extractor'] = False
         
         self.warm_up_time = time.time() - start_time
         self.warm_up_results = results
@@ -506,16 +518,23 @@ class PerformanceOptimizer:
         
         self.initialized = False
         self.initialization_time = 0.0
+        
+        # Registration only stores loader callables, so do it up front and let
+        # callers resolve components lazily before initialize() has run
+        self._lazy_modules_registered = False
+        self._register_lazy_modules()
     
     def initialize(self, 
                   regex_patterns: Dict[str, str] = None,
-                  warm_up_inputs: Dict[str, str] = None) -> PerformanceMetrics:
+                  warm_up_inputs: Dict[str, str] = None,
+                  skip_warm_up: Sequence[str] = ()) -> PerformanceMetrics:
         """
         Initialize all performance optimizations.
         
         Args:
             regex_patterns: Regex patterns to precompile
             warm_up_inputs: Test inputs for model warm-up
+            skip_warm_up: Services not to warm up
             
         Returns:
             Performance metrics from initialization
@@ -532,7 +551,7 @@ class PerformanceOptimizer:
             self._register_default_patterns()
         
         # Warm up models (optional, can be done in background)
-        warm_up_results = self.model_warmup.warm_up_models(warm_up_inputs)
+        warm_up_results = self.model_warmup.warm_up_models(warm_up_inputs, skip=skip_warm_up)
         
         self.initialization_time = time.time() - start_time
         self.initialized = True
@@ -553,6 +572,8 @@ class PerformanceOptimizer:
     
     def _register_lazy_modules(self):
         """Register modules for lazy loading."""
+        if self._lazy_modules_registered:
+            return
         
         def load_llm_service():
             from services.llm_service import get_llm_service
@@ -574,11 +595,23 @@ class PerformanceOptimizer:
             from services.llm_enhancer import LLMEnhancer
             return LLMEnhancer()
         
+        def load_llm_text_enhancer():
+            from services.llm_text_enhancer import LLMTextEnhancer
+            return LLMTextEnhancer(provider="auto")
+        
+        def load_event_parser():
+            from services.event_parser import EventParser
+            return EventParser()
+        
         self.lazy_loader.register_module('llm_service', load_llm_service)
         self.lazy_loader.register_module('duckling_extractor', load_duckling_extractor)
         self.lazy_loader.register_module('recognizers_extractor', load_recognizers_extractor)
         self.lazy_loader.register_module('location_extractor', load_location_extractor)
         self.lazy_loader.register_module('llm_enhancer', load_llm_enhancer)
+        self.lazy_loader.register_module('llm_text_enhancer', load_llm_text_enhancer)
+        self.lazy_loader.register_module('event_parser', load_event_parser)
+        
+        self._lazy_modules_registered = True
     
     def _register_default_patterns(self):
         """Register default regex patterns for precompilation."""
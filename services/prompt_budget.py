@@ -0,0 +1,245 @@
+"""
+Token-budgeted LLM prompt construction and token accounting.
+
+This module provides:
+- estimate_tokens, a cheap provider-independent token estimate
+- PromptBudget, which fits the input text of a prompt into the context window
+  left over by the system prompt, the fixed instructions and the completion
+- compact_text, which shrinks text in order of increasing loss: whitespace
+  runs, then event-relevant windows (services.relevance_windowing), then a
+  hard cut at a word boundary
+- TokenUsageTracker, which records prompt and completion tokens per LLM call
+  (from provider usage fields where available) and forwards them to listeners
+  such as the Prometheus metrics collector
+
+Callers keep system prompts byte-identical across calls and put all
+per-request content in the user prompt, so providers that cache prompt
+prefixes (OpenAI, Ollama's KV cache) can reuse them.
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from services.env_config import env_int
+from services.relevance_windowing import RelevanceWindower
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTEXT_TOKENS = 2048
+DEFAULT_MARGIN_TOKENS = 64
+MIN_TEXT_TOKENS = 64
+TRUNCATION_MARKER = " …"
+
+_HORIZONTAL_SPACE = re.compile(r'[ \t\f\v]+')
+_TRAILING_SPACE = re.compile(r' +\n')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text.
+
+    BPE tokenizers average about four bytes of English per token; counting
+    UTF-8 bytes rather than characters keeps non-Latin text from being
+    underestimated.
+    """
+    if not text:
+        return 0
+    return (len(text.encode('utf-8')) + 3) // 4
+
+
+def compact_whitespace(text: str) -> str:
+    """Collapse runs of spaces and blank lines, keeping line structure."""
+    text = _HORIZONTAL_SPACE.sub(' ', text)
+    text = _TRAILING_SPACE.sub('\n', text)
+    return _BLANK_LINES.sub('\n\n', text).strip()
+
+
+# Windows for prompt compaction apply to any length that exceeds the budget
+_prompt_windower = RelevanceWindower(min_text_length=0)
+
+
+def compact_text(text: str, max_tokens: int) -> str:
+    """
+    Fit text into max_tokens, dropping the least event-relevant content first.
+
+    Args:
+        text: Text to embed in a prompt
+        max_tokens: Token budget for the text
+
+    Returns:
+        Text whose estimated size is at most max_tokens
+    """
+    text = compact_whitespace(text or '')
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    windowed = _prompt_windower.window(text)
+    if windowed is not None:
+        text = windowed.text
+        if estimate_tokens(text) <= max_tokens:
+            return text
+
+    max_bytes = max(0, max_tokens * 4 - len(TRUNCATION_MARKER.encode('utf-8')))
+    cut = text.encode('utf-8')[:max_bytes].decode('utf-8', errors='ignore')
+    space = cut.rfind(' ')
+    if space > len(cut) // 2:
+        cut = cut[:space]
+    return cut + TRUNCATION_MARKER
+
+
+@dataclass
+class PromptBudget:
+    """Context window shared by every prompt sent to the configured model."""
+    context_tokens: int = DEFAULT_CONTEXT_TOKENS
+    margin_tokens: int = DEFAULT_MARGIN_TOKENS
+
+    @classmethod
+    def from_env(cls) -> 'PromptBudget':
+        """Create a budget from LLM_CONTEXT_TOKENS."""
+        return cls(context_tokens=env_int('LLM_CONTEXT_TOKENS', DEFAULT_CONTEXT_TOKENS))
+
+    def available_tokens(self, completion_tokens: int, *fixed_parts: str) -> int:
+        """Tokens left for the input text after the fixed prompt parts and the completion."""
+        used = completion_tokens + self.margin_tokens + sum(estimate_tokens(part) for part in fixed_parts)
+        return max(MIN_TEXT_TOKENS, self.context_tokens - used)
+
+    def fit_text(self, text: str, completion_tokens: int, *fixed_parts: str) -> str:
+        """
+        Compact text to the budget left by the other parts of its prompt.
+
+        Args:
+            text: Input text to embed in the prompt
+            completion_tokens: Tokens reserved for the model's answer
+            *fixed_parts: System prompt, schema and instructions sent alongside the text
+
+        Returns:
+            Compacted text
+        """
+        fitted = compact_text(text, self.available_tokens(completion_tokens, *fixed_parts))
+        if len(fitted) < len(text or ''):
+            logger.debug(f"Compacted prompt text from {len(text)} to {len(fitted)} chars")
+        return fitted
+
+
+@dataclass
+class TokenUsage:
+    """Token counts of one LLM call."""
+    component: str
+    provider: str
+    prompt_tokens: int
+    completion_tokens: int
+    estimated: bool = False
+
+
+class TokenUsageTracker:
+    """Accumulates LLM token usage and notifies listeners of each call."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[tuple, Dict[str, int]] = {}
+        self._listeners: List[Callable[[TokenUsage], None]] = []
+
+    def add_listener(self, listener: Callable[[TokenUsage], None]):
+        """Call listener with every recorded TokenUsage."""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def record(self, component: str, provider: str, prompt: str, completion: str,
+               prompt_tokens: Optional[int] = None,
+               completion_tokens: Optional[int] = None) -> TokenUsage:
+        """
+        Record one LLM call.
+
+        Args:
+            component: Calling component (e.g. "llm_enhancer")
+            provider: LLM provider name
+            prompt: Full prompt text, used when the provider reports no usage
+            completion: Completion text, used when the provider reports no usage
+            prompt_tokens: Provider-reported prompt tokens
+            completion_tokens: Provider-reported completion tokens
+
+        Returns:
+            The recorded TokenUsage
+        """
+        estimated = prompt_tokens is None or completion_tokens is None
+        usage = TokenUsage(
+            component=component,
+            provider=provider,
+            prompt_tokens=prompt_tokens if prompt_tokens is not None else estimate_tokens(prompt),
+            completion_tokens=completion_tokens if completion_tokens is not None else estimate_tokens(completion),
+            estimated=estimated
+        )
+        with self._lock:
+            totals = self._totals.setdefault((component, provider), {
+                'calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0
+            })
+            totals['calls'] += 1
+            totals['prompt_tokens'] += usage.prompt_tokens
+            totals['completion_tokens'] += usage.completion_tokens
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            try:
+                listener(usage)
+            except Exception as e:
+                logger.warning(f"Token usage listener failed: {e}")
+        return usage
+
+    def get_stats(self, component: Optional[str] = None) -> Dict[str, Any]:
+        """Totals per component and provider, optionally for one component."""
+        with self._lock:
+            items = [(key, dict(value)) for key, value in self._totals.items()]
+        stats: Dict[str, Any] = {'calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'by_component': {}}
+        for (name, provider), totals in items:
+            if component is not None and name != component:
+                continue
+            stats['by_component'].setdefault(name, {})[provider] = totals
+            for key in ('calls', 'prompt_tokens', 'completion_tokens'):
+                stats[key] += totals[key]
+        stats['total_tokens'] = stats['prompt_tokens'] + stats['completion_tokens']
+        return stats
+
+
+def _count(value: Any) -> Optional[int]:
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def openai_usage(response: Any) -> tuple:
+    """(prompt_tokens, completion_tokens) from an OpenAI-style response or JSON body."""
+    usage = response.get('usage') if isinstance(response, dict) else getattr(response, 'usage', None)
+    if usage is None:
+        return None, None
+    if isinstance(usage, dict):
+        return _count(usage.get('prompt_tokens')), _count(usage.get('completion_tokens'))
+    return _count(getattr(usage, 'prompt_tokens', None)), _count(getattr(usage, 'completion_tokens', None))
+
+
+def ollama_usage(body: Dict[str, Any]) -> tuple:
+    """(prompt_tokens, completion_tokens) from an Ollama /api/generate body."""
+    return _count(body.get('prompt_eval_count')), _count(body.get('eval_count'))
+
+
+# Global instances
+_prompt_budget: Optional[PromptBudget] = None
+_token_usage_tracker: Optional[TokenUsageTracker] = None
+
+
+def get_prompt_budget() -> PromptBudget:
+    """Get the global prompt budget."""
+    global _prompt_budget
+    if _prompt_budget is None:
+        _prompt_budget = PromptBudget.from_env()
+    return _prompt_budget
+
+
+def get_token_usage_tracker() -> TokenUsageTracker:
+    """Get the global token usage tracker."""
+    global _token_usage_tracker
+    if _token_usage_tracker is None:
+        _token_usage_tracker = TokenUsageTracker()
+    return _token_usage_tracker
@@ -0,0 +1,388 @@
+"""
+Mergeable streaming quantile sketches for latency and score tracking.
+
+This module provides:
+- QuantileSketch: a DDSketch-style log-bucketed histogram with O(1) record,
+  bounded relative error on quantiles, and exact merges across workers
+- WindowedSketch: rolling 1m/5m/1h views built from ring buffers of sketches,
+  plus an all-time sketch
+
+Quantiles are within `relative_accuracy` of the true value (1% by default).
+Count, mean, min and max are exact. Small sketches keep their raw values so
+that quantiles over a handful of samples are exact as well.
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+# Rolling windows reported by WindowedSketch (name -> seconds)
+DEFAULT_WINDOWS: Dict[str, int] = {'1m': 60, '5m': 300, '1h': 3600}
+
+# Values at or below this are counted in the zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch) for non-negative values.
+
+    A value v goes into bucket ceil(log_gamma(v)) with gamma = (1 + a) / (1 - a),
+    so every value in a bucket is within relative accuracy `a` of the bucket's
+    representative value. Recording is one log and one dict update.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, exact_limit: int = 64):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Relative error bound for quantile estimates
+            exact_limit: Raw values kept before switching to buckets
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.exact_limit = exact_limit
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+        self._bins: Dict[int, int] = {}
+        self._zero_count = 0
+        # Raw values while the sketch is small; None once folded into buckets
+        self._exact: Optional[List[float]] = []
+
+    def add(self, value: float, index: Optional[int] = None):
+        """
+        Record a value (values at or below zero go to the zero bucket).
+
+        Args:
+            value: Value to record
+            index: Precomputed bucket index (lets callers share one log across sketches)
+        """
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if self._exact is not None:
+            self._exact.append(value)
+            if len(self._exact) > self.exact_limit:
+                self._fold_exact()
+        elif index is not None:
+            self._bins[index] = self._bins.get(index, 0) + 1
+        else:
+            self._add_to_bins(value)
+
+    def merge(self, other: 'QuantileSketch'):
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: Sketch with the same relative accuracy
+        """
+        if other.count == 0:
+            return
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        if self._exact is not None and other._exact is not None and \
+                len(self._exact) + len(other._exact) <= self.exact_limit:
+            self._exact.extend(other._exact)
+            return
+
+        if self._exact is not None:
+            self._fold_exact()
+        if other._exact is not None:
+            for value in other._exact:
+                self._add_to_bins(value)
+        else:
+            self._zero_count += other._zero_count
+            for index, bin_count in other._bins.items():
+                self._bins[index] = self._bins.get(index, 0) + bin_count
+
+    def copy(self) -> 'QuantileSketch':
+        """Get an independent copy of this sketch."""
+        sketch = QuantileSketch(self.relative_accuracy, self.exact_limit)
+        sketch.merge(self)
+        return sketch
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+
+        Returns:
+            Estimated value (0.0 for an empty sketch)
+        """
+        if self.count == 0:
+            return 0.0
+        q = min(max(q, 0.0), 1.0)
+
+        if self._exact is not None:
+            # Linear interpolation between closest ranks (numpy's default)
+            values = sorted(self._exact)
+            position = q * (len(values) - 1)
+            lower = int(position)
+            upper = min(lower + 1, len(values) - 1)
+            return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+        rank = q * (self.count - 1)
+        cumulative = self._zero_count
+        if cumulative > rank:
+            return max(self.min, 0.0)
+
+        for index in sorted(self._bins):
+            cumulative += self._bins[index]
+            if cumulative > rank:
+                value = 2.0 * self._gamma ** index / (self._gamma + 1.0)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def count_below(self, threshold: float) -> int:
+        """
+        Count values below `threshold` (exact while small, else within relative accuracy).
+        """
+        if self._exact is not None:
+            return sum(1 for value in self._exact if value < threshold)
+
+        if threshold <= MIN_INDEXABLE_VALUE:
+            return 0
+        total = self._zero_count
+        threshold_index = self._index(threshold)
+        for index, bin_count in self._bins.items():
+            if index < threshold_index:
+                total += bin_count
+        return total
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get count, mean, median, p95, p99, min and max."""
+        if self.count == 0:
+            return {
+                'count': 0,
+                'mean': 0.0,
+                'median': 0.0,
+                'p95': 0.0,
+                'p99': 0.0,
+                'min': 0.0,
+                'max': 0.0
+            }
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'median': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'min': self.min,
+            'max': self.max
+        }
+
+    def to_dict(self) -> Dict:
+        """Serialize for cross-process merging."""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'exact_limit': self.exact_limit,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'zero_count': self._zero_count,
+            'bins': {str(index): bin_count for index, bin_count in self._bins.items()},
+            'exact': self._exact
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QuantileSketch':
+        """Deserialize a sketch produced by to_dict()."""
+        sketch = cls(data['relative_accuracy'], data.get('exact_limit', 64))
+        sketch.count = data['count']
+        sketch.sum = data['sum']
+        if sketch.count:
+            sketch.min = data['min']
+            sketch.max = data['max']
+        sketch._zero_count = data.get('zero_count', 0)
+        sketch._bins = {int(index): bin_count for index, bin_count in data.get('bins', {}).items()}
+        sketch._exact = list(data['exact']) if data.get('exact') is not None else None
+        return sketch
+
+    def bucket_index(self, value: float) -> Optional[int]:
+        """Get the bucket index for a value (None for the zero bucket)."""
+        if value <= MIN_INDEXABLE_VALUE:
+            return None
+        return self._index(value)
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _add_to_bins(self, value: float):
+        if value <= MIN_INDEXABLE_VALUE:
+            self._zero_count += 1
+            return
+        index = self._index(value)
+        self._bins[index] = self._bins.get(index, 0) + 1
+
+    def _fold_exact(self):
+        values, self._exact = self._exact, None
+        for value in values:
+            self._add_to_bins(value)
+
+
+class WindowedSketch:
+    """
+    Rolling time-windowed quantile sketches.
+
+    Each window is a ring of `slots_per_window` sketches, each covering
+    window / slots_per_window seconds. A window's snapshot merges the slots that
+    are still inside it, so it covers between (1 - 1/slots) and 1 times the
+    window length. Recording touches one slot per window plus the all-time sketch.
+    Slot boundaries use wall-clock time so sketches from different workers align
+    when merged.
+    """
+
+    def __init__(self, windows: Optional[Dict[str, int]] = None, slots_per_window: int = 12,
+                 relative_accuracy: float = 0.01, clock: Callable[[], float] = time.time):
+        """
+        Initialize the windowed sketch.
+
+        Args:
+            windows: Window name -> length in seconds (defaults to 1m/5m/1h)
+            slots_per_window: Ring size per window
+            relative_accuracy: Relative error bound for quantile estimates
+            clock: Time source in seconds
+        """
+        self.windows = dict(windows or DEFAULT_WINDOWS)
+        self.slots_per_window = slots_per_window
+        self.relative_accuracy = relative_accuracy
+        self._clock = clock
+
+        self._slot_seconds = {name: length / slots_per_window for name, length in self.windows.items()}
+        # Per window: ring of [slot_id, sketch] entries (None until used)
+        self._rings: Dict[str, List[Optional[list]]] = {
+            name: [None] * slots_per_window for name in self.windows
+        }
+        self.total = QuantileSketch(relative_accuracy)
+        self._lock = threading.Lock()
+
+    def add(self, value: float):
+        """Record a value in every window and the all-time sketch."""
+        value = float(value)
+        # All sketches share the same bucket layout, so take the log once
+        index = self.total.bucket_index(value)
+        now = self._clock()
+        with self._lock:
+            for name, ring in self._rings.items():
+                self._slot(name, ring, now).add(value, index)
+            self.total.add(value, index)
+
+    def snapshot(self, window: Optional[str] = None) -> QuantileSketch:
+        """
+        Get a merged sketch for a window.
+
+        Args:
+            window: Window name, or None for all-time
+
+        Returns:
+            Independent QuantileSketch
+        """
+        with self._lock:
+            if window is None:
+                return self.total.copy()
+
+            if window not in self.windows:
+                raise KeyError(f"Unknown window: {window}")
+
+            oldest = int(self._clock() // self._slot_seconds[window]) - self.slots_per_window
+            merged = QuantileSketch(self.relative_accuracy)
+            for entry in self._rings[window]:
+                if entry is not None and entry[0] > oldest:
+                    merged.merge(entry[1])
+            return merged
+
+    def get_stats(self, window: Optional[str] = None) -> Dict[str, float]:
+        """Get summary statistics for a window (None for all-time)."""
+        return self.snapshot(window).get_stats()
+
+    def get_window_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get summary statistics for every window."""
+        return {name: self.get_stats(name) for name in self.windows}
+
+    def merge(self, other: 'WindowedSketch'):
+        """
+        Merge another windowed sketch (e.g. from another worker) into this one.
+        Slots are aligned by absolute slot ID; slots that have expired here are dropped.
+        """
+        with other._lock:
+            other_rings = {name: [(entry[0], entry[1].copy()) for entry in ring if entry is not None]
+                           for name, ring in other._rings.items()}
+            other_total = other.total.copy()
+
+        now = self._clock()
+        with self._lock:
+            for name, entries in other_rings.items():
+                if name not in self._rings:
+                    continue
+                current = int(now // self._slot_seconds[name])
+                ring = self._rings[name]
+                for slot_id, sketch in entries:
+                    if not current - self.slots_per_window < slot_id <= current:
+                        continue
+                    index = slot_id % self.slots_per_window
+                    if ring[index] is None or ring[index][0] != slot_id:
+                        ring[index] = [slot_id, QuantileSketch(self.relative_accuracy)]
+                    ring[index][1].merge(sketch)
+            self.total.merge(other_total)
+
+    def to_dict(self) -> Dict:
+        """Serialize for cross-process merging."""
+        with self._lock:
+            return {
+                'windows': self.windows,
+                'slots_per_window': self.slots_per_window,
+                'relative_accuracy': self.relative_accuracy,
+                'rings': {
+                    name: [[entry[0], entry[1].to_dict()] for entry in ring if entry is not None]
+                    for name, ring in self._rings.items()
+                },
+                'total': self.total.to_dict()
+            }
+
+    @classmethod
+    def from_dict(cls, data: Dict, clock: Callable[[], float] = time.time) -> 'WindowedSketch':
+        """Deserialize a windowed sketch produced by to_dict()."""
+        sketch = cls(data['windows'], data['slots_per_window'], data['relative_accuracy'], clock=clock)
+        for name, entries in data['rings'].items():
+            for slot_id, sketch_data in entries:
+                sketch._rings[name][slot_id % sketch.slots_per_window] = [
+                    slot_id, QuantileSketch.from_dict(sketch_data)
+                ]
+        sketch.total = QuantileSketch.from_dict(data['total'])
+        return sketch
+
+    def __len__(self) -> int:
+        return self.total.count
+
+    def _slot(self, name: str, ring: List[Optional[list]], now: float) -> QuantileSketch:
+        slot_id = int(now // self._slot_seconds[name])
+        index = slot_id % self.slots_per_window
+        entry = ring[index]
+        if entry is None or entry[0] != slot_id:
+            entry = [slot_id, QuantileSketch(self.relative_accuracy)]
+            ring[index] = entry
+        return entry[1]
@@ -6,10 +6,16 @@ for the hybrid parsing pipeline (Task 26.1).
 
 import re
 from datetime import datetime, date, time, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from dataclasses import dataclass
 import calendar
 
+from services.relative_date_batch import resolve_relative_date, resolve_relative_dates, to_dates
+from services.relative_date_table import get_relative_date_tables
+
+# Larger offsets are resolved one at a time so out-of-range dates are skipped like in extract_datetime
+MAX_BATCH_RELATIVE_AMOUNT = 100000
+
 
 @dataclass
 class DateTimeResult:
@@ -22,6 +28,7 @@ class DateTimeResult:
     raw_text: str = ""
     pattern_type: str = ""
     is_all_day: bool = False
+    span: Optional[Tuple[int, int]] = None  # (start, end) of the matched date/time in the input text
     
     def __post_init__(self):
         if self.ambiguities is None:
@@ -220,13 +227,15 @@ class RegexDateExtractor:
             'friday': 4, 'saturday': 5, 'sunday': 6
         }
     
-    def extract_datetime(self, text: str, timezone_offset: Optional[int] = None) -> DateTimeResult:
+    def extract_datetime(self, text: str, timezone_offset: Optional[int] = None,
+                         current_time: Optional[datetime] = None) -> DateTimeResult:
         """
         Extract datetime information from text using regex patterns.
         
         Args:
             text: Input text to parse
             timezone_offset: Timezone offset in hours (for relative date resolution)
+            current_time: Current datetime for this call (defaults to the extractor's)
             
         Returns:
             DateTimeResult with confidence ≥ 0.8 if successful, 0.0 if failed
@@ -234,27 +243,30 @@ class RegexDateExtractor:
         if not text or not text.strip():
             return DateTimeResult(confidence=0.0, raw_text=text)
         
+        # Spans are found in the stripped text and reported against the input
+        offset = len(text) - len(text.lstrip())
         text = text.strip()
+        current_time = current_time or self.current_time
         
         # Try time ranges first (highest confidence)
-        time_range_result = self._extract_time_range(text)
+        time_range_result = self._extract_time_range(text, current_time)
         if time_range_result.confidence >= 0.8:
-            return time_range_result
+            return self._shift_span(time_range_result, offset)
         
         # Try explicit date + time combinations
-        datetime_result = self._extract_datetime_combination(text)
+        datetime_result = self._extract_datetime_combination(text, current_time)
         if datetime_result.confidence >= 0.8:
-            return datetime_result
+            return self._shift_span(datetime_result, offset)
         
         # Try relative dates with times
-        relative_result = self._extract_relative_datetime(text, timezone_offset)
+        relative_result = self._extract_relative_datetime(text, timezone_offset, current_time)
         if relative_result.confidence >= 0.8:
-            return relative_result
+            return self._shift_span(relative_result, offset)
         
         # Try standalone dates (all-day events)
-        date_result = self._extract_standalone_date(text)
+        date_result = self._extract_standalone_date(text, current_time)
         if date_result.confidence >= 0.8:
-            return date_result
+            return self._shift_span(date_result, offset)
         
         # No high-confidence extraction found
         return DateTimeResult(
@@ -264,8 +276,16 @@ class RegexDateExtractor:
             ambiguities=["No clear date/time pattern found"]
         )
     
-    def _extract_time_range(self, text: str) -> DateTimeResult:
+    @staticmethod
+    def _shift_span(result: DateTimeResult, offset: int) -> DateTimeResult:
+        """Move a result's span by the whitespace stripped from the start of the input."""
+        if result.span is not None and offset:
+            result.span = (result.span[0] + offset, result.span[1] + offset)
+        return result
+    
+    def _extract_time_range(self, text: str, current_time: Optional[datetime] = None) -> DateTimeResult:
         """Extract time ranges with highest confidence."""
+        current_time = current_time or self.current_time
         for pattern_name, pattern in self.time_range_patterns.items():
             match = pattern.search(text)
             if match:
@@ -273,7 +293,7 @@ class RegexDateExtractor:
                     start_time, end_time = self._parse_time_range_match(match, pattern_name)
                     if start_time and end_time:
                         # Use today's date for time ranges
-                        today = self.current_time.date()
+                        today = current_time.date()
                         start_dt = datetime.combine(today, start_time)
                         end_dt = datetime.combine(today, end_time)
                         
@@ -287,7 +307,8 @@ class RegexDateExtractor:
                             confidence=0.95,  # Very high confidence for explicit ranges
                             extraction_method="explicit",
                             raw_text=match.group(0),
-                            pattern_type=f"time_range_{pattern_name}"
+                            pattern_type=f"time_range_{pattern_name}",
+                            span=match.span()
                         )
                 except (ValueError, IndexError):
                     continue
@@ -375,14 +396,14 @@ class RegexDateExtractor:
         
         return None, None
     
-    def _extract_datetime_combination(self, text: str) -> DateTimeResult:
+    def _extract_datetime_combination(self, text: str, current_time: Optional[datetime] = None) -> DateTimeResult:
         """Extract explicit date + time combinations."""
         # Find date patterns
         date_matches = []
         for pattern_name, pattern in self.explicit_date_patterns.items():
             for match in pattern.finditer(text):
                 try:
-                    parsed_date = self._parse_date_match(match, pattern_name)
+                    parsed_date = self._parse_date_match(match, pattern_name, current_time)
                     if parsed_date:
                         date_matches.append((parsed_date, match, pattern_name))
                 except (ValueError, KeyError):
@@ -403,7 +424,7 @@ class RegexDateExtractor:
         if date_matches and time_matches:
             best_combination = self._find_best_datetime_combination(date_matches, time_matches)
             if best_combination:
-                date_obj, time_obj, confidence, combined_text = best_combination
+                date_obj, time_obj, confidence, combined_text, span = best_combination
                 start_dt = datetime.combine(date_obj, time_obj)
                 
                 # Check for duration to calculate end time
@@ -416,7 +437,8 @@ class RegexDateExtractor:
                     confidence=confidence,
                     extraction_method="explicit",
                     raw_text=combined_text,
-                    pattern_type="date_time_combination"
+                    pattern_type="date_time_combination",
+                    span=span
                 )
         
         # Try standalone date with high confidence
@@ -431,14 +453,15 @@ class RegexDateExtractor:
                 extraction_method="explicit",
                 raw_text=match.group(0),
                 pattern_type=f"date_only_{pattern_name}",
-                is_all_day=True
+                is_all_day=True,
+                span=match.span()
             )
         
         return DateTimeResult(confidence=0.0)
     
-    def _parse_date_match(self, match, pattern_name: str) -> Optional[date]:
+    def _parse_date_match(self, match, pattern_name: str, current_time: Optional[datetime] = None) -> Optional[date]:
         """Parse a date match into a date object."""
-        current_year = self.current_time.year
+        current_year = (current_time or self.current_time).year
         
         if pattern_name in ('month_day_year', 'labeled_month_day_year'):
             month_name = match.group(1).lower()
@@ -504,8 +527,8 @@ class RegexDateExtractor:
         
         return None
     
-    def _find_best_datetime_combination(self, date_matches, time_matches) -> Optional[Tuple[date, time, float, str]]:
-        """Find the best date+time combination based on proximity."""
+    def _find_best_datetime_combination(self, date_matches, time_matches) -> Optional[Tuple[date, time, float, str, Tuple[int, int]]]:
+        """Find the best date+time combination based on proximity (the span covers both matches)."""
         best_combo = None
         min_distance = float('inf')
         
@@ -520,22 +543,24 @@ class RegexDateExtractor:
                         confidence += 0.05  # Boost for explicit AM/PM
                     
                     combined_text = f"{date_match.group(0)} {time_match.group(0)}"
-                    best_combo = (date_obj, time_obj, min(confidence, 0.97), combined_text)
+                    span = (min(date_match.start(), time_match.start()), max(date_match.end(), time_match.end()))
+                    best_combo = (date_obj, time_obj, min(confidence, 0.97), combined_text, span)
                     min_distance = distance
         
         return best_combo
     
-    def _extract_relative_datetime(self, text: str, timezone_offset: Optional[int] = None) -> DateTimeResult:
+    def _extract_relative_datetime(self, text: str, timezone_offset: Optional[int] = None,
+                                   current_time: Optional[datetime] = None) -> DateTimeResult:
         """Extract relative dates with times."""
         # Find relative date patterns
         for pattern_name, pattern in self.relative_date_patterns.items():
             match = pattern.search(text)
             if match:
                 try:
-                    target_date = self._calculate_relative_date(match, pattern_name)
+                    target_date = self._calculate_relative_date(match, pattern_name, current_time)
                     if target_date:
                         # Look for time in the same text
-                        time_obj = self._find_time_near_match(text, match)
+                        time_obj, time_span = self._find_time_near_match(text, match)
                         if time_obj:
                             start_dt = datetime.combine(target_date, time_obj)
                             duration = self._extract_duration(text)
@@ -547,7 +572,8 @@ class RegexDateExtractor:
                                 confidence=0.9,
                                 extraction_method="relative",
                                 raw_text=text,
-                                pattern_type=f"relative_{pattern_name}"
+                                pattern_type=f"relative_{pattern_name}",
+                                span=(min(match.start(), time_span[0]), max(match.end(), time_span[1]))
                             )
                         else:
                             # All-day relative date
@@ -558,65 +584,91 @@ class RegexDateExtractor:
                                 extraction_method="relative",
                                 raw_text=match.group(0),
                                 pattern_type=f"relative_{pattern_name}_all_day",
-                                is_all_day=True
+                                is_all_day=True,
+                                span=match.span()
                             )
                 except (ValueError, OverflowError):
                     continue
         
         return DateTimeResult(confidence=0.0)
     
-    def _calculate_relative_date(self, match, pattern_name: str) -> Optional[date]:
+    def _calculate_relative_date(self, match, pattern_name: str,
+                                 current_time: Optional[datetime] = None) -> Optional[date]:
         """Calculate the target date for relative patterns."""
-        base_date = self.current_time.date()
-        
+        token = self._relative_token(match, pattern_name)
+        if token is None:
+            return None
+        return get_relative_date_tables().resolve(*token, (current_time or self.current_time).date())
+    
+    def _relative_token(self, match, pattern_name: str) -> Optional[Tuple[str, int, int]]:
+        """Reduce a relative pattern match to a (kind, amount, weekday) token (see services.relative_date_batch)."""
         if pattern_name == 'today':
-            return base_date
+            return ('days', 0, 0)
         elif pattern_name == 'tomorrow':
-            return base_date + timedelta(days=1)
+            return ('days', 1, 0)
         elif pattern_name == 'yesterday':
-            return base_date - timedelta(days=1)
-        
-        elif pattern_name == 'next_weekday':
-            weekday_name = match.group(1).lower()
-            target_weekday = self.weekday_names[weekday_name]
-            days_ahead = target_weekday - base_date.weekday()
-            if days_ahead <= 0:  # Target day already happened this week
-                days_ahead += 7
-            return base_date + timedelta(days=days_ahead)
+            return ('days', -1, 0)
         
+        # A bare weekday means its next occurrence, like "next <weekday>"
+        elif pattern_name in ['next_weekday', 'standalone_weekday']:
+            return ('next_weekday', 0, self.weekday_names[match.group(1).lower()])
         elif pattern_name == 'this_weekday':
-            weekday_name = match.group(1).lower()
-            target_weekday = self.weekday_names[weekday_name]
-            days_ahead = target_weekday - base_date.weekday()
-            if days_ahead < 0:  # Already passed this week, use next week
-                days_ahead += 7
-            return base_date + timedelta(days=days_ahead)
-        
-        elif pattern_name == 'standalone_weekday':
-            weekday_name = match.group(1).lower()
-            target_weekday = self.weekday_names[weekday_name]
-            days_ahead = target_weekday - base_date.weekday()
-            if days_ahead <= 0:  # Already happened this week, use next week
-                days_ahead += 7
-            return base_date + timedelta(days=days_ahead)
+            return ('this_weekday', 0, self.weekday_names[match.group(1).lower()])
         
         elif pattern_name in ['in_days', 'days_from_now']:
-            days = int(match.group(1))
-            return base_date + timedelta(days=days)
-        
+            return ('days', int(match.group(1)), 0)
         elif pattern_name in ['in_weeks', 'weeks_from_now']:
-            weeks = int(match.group(1))
-            return base_date + timedelta(weeks=weeks)
-        
+            return ('weeks', int(match.group(1)), 0)
         elif pattern_name == 'in_months':
-            months = int(match.group(1))
             # Approximate month calculation
-            return base_date + timedelta(days=months * 30)
+            return ('days', int(match.group(1)) * 30, 0)
         
         return None
     
-    def _find_time_near_match(self, text: str, date_match) -> Optional[time]:
-        """Find a time pattern near the date match."""
+    def calculate_relative_dates(self, texts: Sequence[str]) -> List[Optional[date]]:
+        """
+        Resolve the relative date of many texts against the current time in one batch.
+        
+        Each text is matched like extract_datetime's relative step (first matching
+        pattern wins); the target dates are then computed together with NumPy.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Target date per text, or None where no relative date was found
+        """
+        reference_date = self.current_time.date()
+        results: List[Optional[date]] = [None] * len(texts)
+        tokens = []
+        positions = []
+        for position, text in enumerate(texts):
+            for pattern_name, pattern in self.relative_date_patterns.items():
+                match = pattern.search(text or "")
+                if not match:
+                    continue
+                token = self._relative_token(match, pattern_name)
+                if token is None:
+                    continue
+                if abs(token[1]) <= MAX_BATCH_RELATIVE_AMOUNT:
+                    tokens.append(token)
+                    positions.append(position)
+                    break
+                try:
+                    results[position] = resolve_relative_date(*token, reference_date)
+                    break
+                except (ValueError, OverflowError):
+                    continue
+        
+        if tokens:
+            kinds, amounts, weekdays = zip(*tokens)
+            resolved = to_dates(resolve_relative_dates(kinds, amounts, weekdays, reference_date))
+            for position, target_date in zip(positions, resolved):
+                results[position] = target_date
+        return results
+    
+    def _find_time_near_match(self, text: str, date_match) -> Tuple[Optional[time], Optional[Tuple[int, int]]]:
+        """Find a time pattern near the date match: (time, span of the time in text)."""
         # Look for time patterns within 50 characters of the date match
         search_start = max(0, date_match.start() - 50)
         search_end = min(len(text), date_match.end() + 50)
@@ -625,17 +677,18 @@ class RegexDateExtractor:
         for pattern_name, pattern in self.time_patterns.items():
             match = pattern.search(search_text)
             if match:
-                return self._parse_time_match(match, pattern_name)
+                return (self._parse_time_match(match, pattern_name),
+                        (search_start + match.start(), search_start + match.end()))
         
-        return None
+        return None, None
     
-    def _extract_standalone_date(self, text: str) -> DateTimeResult:
+    def _extract_standalone_date(self, text: str, current_time: Optional[datetime] = None) -> DateTimeResult:
         """Extract standalone dates for all-day events."""
         for pattern_name, pattern in self.explicit_date_patterns.items():
             match = pattern.search(text)
             if match:
                 try:
-                    parsed_date = self._parse_date_match(match, pattern_name)
+                    parsed_date = self._parse_date_match(match, pattern_name, current_time)
                     if parsed_date:
                         confidence = 0.9 if 'year' in pattern_name else 0.8
                         
@@ -646,7 +699,8 @@ class RegexDateExtractor:
                             extraction_method="explicit",
                             raw_text=match.group(0),
                             pattern_type=f"standalone_{pattern_name}",
-                            is_all_day=True
+                            is_all_day=True,
+                            span=match.span()
                         )
                 except (ValueError, KeyError):
                     continue
@@ -0,0 +1,254 @@
+"""
+Regex backtracking guard.
+
+This module provides:
+- GuardedPattern, a drop-in wrapper for compiled patterns that caps how much
+  input a super-linear pattern may scan, either as a prefix (patterns that
+  only look at the start of the text) or as bounded, line-aligned windows
+- An optional literal prefilter: a cheap pattern that must occur in the
+  input before the expensive one runs at all
+- A per-parse CPU budget (thread CPU time): once a parse has spent its
+  budget, guarded patterns stop matching so the remaining regex stages
+  finish immediately instead of pinning a worker core
+
+Patterns worth guarding are found with tests/performance/regex_fuzz.py.
+Python's re engine cannot be interrupted mid-match, so the budget is checked
+between windows; the input caps keep each individual scan short.
+"""
+
+import contextvars
+import logging
+import re
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from services.env_config import env_float
+
+logger = logging.getLogger(__name__)
+
+# How a guarded pattern limits its input
+MODE_PREFIX = 'prefix'  # scan only the first max_input characters
+MODE_WINDOW = 'window'  # scan line-aligned windows of max_input characters
+
+DEFAULT_OVERLAP = 256
+MAX_GUARDED_INPUT = 10000  # the API's maximum text length
+DEFAULT_CPU_BUDGET_MS = 1000.0
+
+
+def get_regex_cpu_budget_ms() -> float:
+    """Per-parse regex CPU budget from REGEX_CPU_BUDGET_MS (0 disables)."""
+    return env_float('REGEX_CPU_BUDGET_MS', DEFAULT_CPU_BUDGET_MS)
+
+
+class CPUBudget:
+    """Thread CPU time allowance for one parse."""
+
+    __slots__ = ('limit_s', 'deadline', 'remaining_s', 'exhausted')
+
+    def __init__(self, limit_ms: float):
+        self.limit_s = limit_ms / 1000.0
+        self.remaining_s = self.limit_s
+        self.deadline = time.thread_time() + self.limit_s
+        self.exhausted = False
+
+    def resume(self):
+        """Continue the budget on the current thread with the allowance left."""
+        self.deadline = time.thread_time() + self.remaining_s
+
+    def suspend(self):
+        """Stop charging the current thread, keeping the allowance left for the next resume."""
+        self.remaining_s = max(0.0, self.deadline - time.thread_time())
+
+    def check(self) -> bool:
+        """True while budget remains; latches to exhausted once spent."""
+        if self.exhausted:
+            return False
+        if time.thread_time() >= self.deadline:
+            self.exhausted = True
+            logger.warning(f"Regex CPU budget of {self.limit_s * 1000:.0f}ms exhausted, skipping remaining guarded patterns")
+            return False
+        return True
+
+
+_budget: contextvars.ContextVar[Optional[CPUBudget]] = contextvars.ContextVar('regex_cpu_budget', default=None)
+
+
+@contextmanager
+def regex_cpu_budget(limit_ms: Optional[float] = None):
+    """
+    Limit the thread CPU time guarded patterns may use within the block.
+
+    Args:
+        limit_ms: Budget in milliseconds (default REGEX_CPU_BUDGET_MS, 0 disables)
+
+    Yields:
+        CPUBudget, or None when disabled
+    """
+    limit_ms = get_regex_cpu_budget_ms() if limit_ms is None else limit_ms
+    if limit_ms <= 0:
+        yield None
+        return
+    budget = CPUBudget(limit_ms)
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+@contextmanager
+def regex_budget_segment():
+    """
+    Charge the block's thread CPU time to the current parse's budget.
+
+    For parses whose stages run one after another on different threads (the
+    async pipeline): thread CPU time is per thread, so each stage resumes the
+    budget on its own thread and suspends it when done.
+    """
+    budget = _budget.get()
+    if budget is None:
+        yield
+        return
+    budget.resume()
+    try:
+        yield
+    finally:
+        budget.suspend()
+
+
+def _within_budget() -> bool:
+    budget = _budget.get()
+    return budget is None or budget.check()
+
+
+def regex_budget_exhausted() -> bool:
+    """Whether the current parse has spent its regex CPU budget."""
+    return not _within_budget()
+
+
+class GuardedPattern:
+    """
+    Compiled pattern with an input-length cap.
+
+    Supports search, match, finditer, findall, sub and subn with the same
+    signatures as re.Pattern (without pos/endpos); match positions are
+    absolute. Other attributes (pattern, flags, groups, ...) are delegated.
+
+    With a prefilter, inputs the prefilter does not match anywhere are
+    rejected without running the pattern.
+
+    In window mode, windows end just after a newline where possible so
+    MULTILINE anchors keep their meaning, consecutive windows overlap by
+    `overlap` characters, and a match touching a window's artificial end is
+    left to the next window. Matches longer than `overlap` may be missed.
+    """
+
+    __slots__ = ('pattern_obj', 'max_input', 'mode', 'overlap', 'prefilter')
+
+    def __init__(self, pattern: re.Pattern, max_input: int, mode: str = MODE_WINDOW,
+                 overlap: int = DEFAULT_OVERLAP, prefilter: Optional[re.Pattern] = None):
+        if mode not in (MODE_PREFIX, MODE_WINDOW):
+            raise ValueError(f"Unknown guard mode: {mode}")
+        self.pattern_obj = pattern
+        self.max_input = max_input
+        self.mode = mode
+        self.overlap = min(overlap, max_input // 4)
+        self.prefilter = prefilter
+
+    def __getattr__(self, name):
+        return getattr(self.pattern_obj, name)
+
+    def __repr__(self):
+        return f"GuardedPattern({self.pattern_obj!r}, max_input={self.max_input}, mode={self.mode!r})"
+
+    def _windows(self, text: str) -> Iterator[tuple]:
+        """Yield (start, end, accept_before) for each window of text."""
+        length = len(text)
+        start = 0
+        while True:
+            end = start + self.max_input
+            if end >= length:
+                yield start, length, length
+                return
+            cut = text.rfind('\n', start + self.max_input // 2, end)
+            if cut != -1:
+                end = cut + 1
+            next_start = end - self.overlap
+            yield start, end, next_start
+            start = next_start
+
+    def _admits(self, string: str) -> bool:
+        if not _within_budget():
+            return False
+        return self.prefilter is None or self.prefilter.search(string) is not None
+
+    def finditer(self, string: str) -> Iterator[re.Match]:
+        if not self._admits(string):
+            return
+        pattern = self.pattern_obj
+        if len(string) <= self.max_input:
+            yield from pattern.finditer(string)
+            return
+        if self.mode == MODE_PREFIX:
+            yield from pattern.finditer(string, 0, self.max_input)
+            return
+
+        length = len(string)
+        last_end = 0
+        for start, end, accept_before in self._windows(string):
+            if start > 0 and not _within_budget():
+                return
+            for match in pattern.finditer(string, start, end):
+                if match.start() >= accept_before:
+                    break
+                if match.start() < last_end or (match.end() == end and end < length):
+                    continue
+                last_end = max(match.end(), match.start() + 1)
+                yield match
+
+    def search(self, string: str) -> Optional[re.Match]:
+        return next(self.finditer(string), None)
+
+    def match(self, string: str) -> Optional[re.Match]:
+        if not self._admits(string):
+            return None
+        return self.pattern_obj.match(string, 0, min(len(string), self.max_input))
+
+    def findall(self, string: str) -> list:
+        groups = self.pattern_obj.groups
+        results = []
+        for match in self.finditer(string):
+            if groups == 0:
+                results.append(match.group(0))
+            elif groups == 1:
+                results.append(match.group(1) or '')
+            else:
+                results.append(tuple(group or '' for group in match.groups()))
+        return results
+
+    def subn(self, repl, string: str, count: int = 0) -> tuple:
+        if not callable(repl):
+            template = repl
+            repl = lambda match: match.expand(template)
+        parts = []
+        position = 0
+        replaced = 0
+        for match in self.finditer(string):
+            parts.append(string[position:match.start()])
+            parts.append(repl(match))
+            position = match.end()
+            replaced += 1
+            if count and replaced >= count:
+                break
+        parts.append(string[position:])
+        return ''.join(parts), replaced
+
+    def sub(self, repl, string: str, count: int = 0) -> str:
+        return self.subn(repl, string, count)[0]
+
+
+def guard_pattern(pattern: re.Pattern, max_input: int = MAX_GUARDED_INPUT, mode: str = MODE_WINDOW,
+                  overlap: int = DEFAULT_OVERLAP, prefilter: Optional[re.Pattern] = None) -> GuardedPattern:
+    """Wrap a compiled pattern with an input-length cap (see GuardedPattern)."""
+    return GuardedPattern(pattern, max_input, mode, overlap, prefilter)
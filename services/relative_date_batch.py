@@ -0,0 +1,126 @@
+"""
+Batch resolution of relative dates.
+
+Relative phrases ("tomorrow", "next friday", "in 3 weeks") reduce to a small
+token: a kind, an amount and a target weekday. The extractors resolve one
+token at a time against the reference date, building a few datetime objects
+per match. Batch and golden-set workloads resolve thousands of tokens against
+the same reference date, so resolve_relative_dates does it for a whole array
+in one pass of NumPy datetime64 arithmetic.
+
+resolve_relative_date is the scalar counterpart with the same semantics, for
+callers that only have one token. NumPy is imported on the first batch, so
+importing this module (the API does at startup, through the fast path's
+relative date tables) stays cheap.
+
+Kinds:
+- days / weeks: reference date plus amount days or weeks
+- months: calendar months, clamped to the target month's last day
+- end_of_month: last day of the month amount months ahead (0 = this month)
+- next_weekday: the next occurrence of weekday strictly after the reference date
+- this_weekday: the next occurrence of weekday on or after the reference date
+"""
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+RELATIVE_KINDS = {
+    'days': 0,
+    'weeks': 1,
+    'months': 2,
+    'next_weekday': 3,
+    'this_weekday': 4,
+    'end_of_month': 5,
+}
+
+
+def _kind_codes(kinds: Union[Sequence[str], "np.ndarray"]) -> "np.ndarray":
+    """Kind names (or codes) as an int array; unknown kinds map to -1."""
+    import numpy as np
+    kinds = np.asarray(kinds)
+    if kinds.dtype.kind in 'iu':
+        return kinds.astype(np.int64)
+    return np.array([RELATIVE_KINDS.get(kind, -1) for kind in kinds.tolist()], dtype=np.int64)
+
+
+def resolve_relative_dates(kinds: Union[Sequence[str], "np.ndarray"],
+                           amounts: Union[Sequence[int], "np.ndarray"],
+                           weekdays: Union[Sequence[int], "np.ndarray"],
+                           reference_date: date) -> "np.ndarray":
+    """
+    Resolve relative date tokens against one reference date.
+
+    Args:
+        kinds: Kind of each token (names from RELATIVE_KINDS, or their codes)
+        amounts: Day/week/month count of each token (ignored for weekday kinds)
+        weekdays: Target weekday of each token, Monday = 0 (ignored for offset kinds)
+        reference_date: Date the tokens are relative to
+
+    Returns:
+        datetime64[D] array of target dates; NaT for unknown kinds
+    """
+    import numpy as np
+
+    codes = _kind_codes(kinds)
+    amounts = np.asarray(amounts, dtype=np.int64)
+    weekdays = np.asarray(weekdays, dtype=np.int64)
+    reference = np.datetime64(reference_date, 'D')
+
+    # Day offsets for every kind except the month kinds
+    weekday_delta = (weekdays - reference_date.weekday()) % 7
+    offsets = np.select(
+        [codes == RELATIVE_KINDS['days'], codes == RELATIVE_KINDS['weeks'],
+         codes == RELATIVE_KINDS['next_weekday'], codes == RELATIVE_KINDS['this_weekday']],
+        [amounts, amounts * 7, np.where(weekday_delta == 0, 7, weekday_delta), weekday_delta],
+        default=0
+    )
+    result = reference + offsets.astype('m8[D]')
+
+    # Calendar months: same day of month, clamped to the target month's length
+    month_mask = codes == RELATIVE_KINDS['months']
+    if month_mask.any():
+        target_months = reference.astype('M8[M]') + amounts[month_mask].astype('m8[M]')
+        month_starts = target_months.astype('M8[D]')
+        month_lengths = ((target_months + 1).astype('M8[D]') - month_starts).astype(np.int64)
+        day = np.minimum(reference_date.day, month_lengths)
+        result[month_mask] = month_starts + (day - 1).astype('m8[D]')
+
+    end_mask = codes == RELATIVE_KINDS['end_of_month']
+    if end_mask.any():
+        target_months = reference.astype('M8[M]') + amounts[end_mask].astype('m8[M]')
+        result[end_mask] = (target_months + 1).astype('M8[D]') - np.timedelta64(1, 'D')
+
+    result[codes < 0] = np.datetime64('NaT')
+    return result
+
+
+def resolve_relative_date(kind: str, amount: int, weekday: int, reference_date: date) -> Optional[date]:
+    """Resolve one relative date token (same semantics as resolve_relative_dates)."""
+    if kind == 'days':
+        return reference_date + timedelta(days=amount)
+    if kind == 'weeks':
+        return reference_date + timedelta(weeks=amount)
+    if kind == 'months':
+        month = reference_date.month - 1 + amount
+        year = reference_date.year + month // 12
+        month = month % 12 + 1
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        return date(year, month, min(reference_date.day, (next_month - timedelta(days=1)).day))
+    if kind == 'end_of_month':
+        month = reference_date.month + amount
+        year = reference_date.year + month // 12
+        return date(year, month % 12 + 1, 1) - timedelta(days=1)
+    if kind in ('next_weekday', 'this_weekday'):
+        days_ahead = (weekday - reference_date.weekday()) % 7
+        if days_ahead == 0 and kind == 'next_weekday':
+            days_ahead = 7
+        return reference_date + timedelta(days=days_ahead)
+    return None
+
+
+def to_dates(resolved: "np.ndarray") -> List[Optional[date]]:
+    """Convert a datetime64[D] array to dates, with None for NaT."""
+    return resolved.astype('M8[D]').astype(object).tolist()
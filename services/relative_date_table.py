@@ -0,0 +1,117 @@
+"""
+Per-reference-day lookup tables for relative dates.
+
+Every datetime extractor resolves "tomorrow", "next tuesday", "in 3 weeks"
+or "in 2 months" per match with its own weekday offsets, month-end clamping
+and timedelta math, although within a day the answers never change. A
+RelativeDateTable resolves every supported (kind, amount, weekday) key for
+one reference date in a single vectorized pass (services.relative_date_batch),
+so extractors look dates up in O(1).
+
+Tables are shared process-wide by RelativeDateTables, keyed by reference
+date. A table is a pure function of its date, so it never goes stale; each
+timezone simply moves on to the next day's table at its local midnight, and
+days no request refers to any more are evicted least recently used first.
+Amounts outside the table fall back to the scalar resolver.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from services.relative_date_batch import resolve_relative_date, resolve_relative_dates, to_dates
+
+logger = logging.getLogger(__name__)
+
+# Amount ranges covered by each table, per kind
+TABLE_RANGES = {
+    'days': range(-31, 401),
+    'weeks': range(-8, 105),
+    'months': range(-12, 37),
+    'end_of_month': range(-12, 37),
+}
+
+WEEKDAY_KINDS = ('next_weekday', 'this_weekday')
+
+# Distinct reference days kept at once (timezones either side of midnight, client-supplied "now")
+DEFAULT_MAX_TABLES = 16
+
+
+class RelativeDateTable:
+    """Resolved dates of every supported relative date key for one reference date."""
+
+    def __init__(self, reference_date: date):
+        self.reference_date = reference_date
+        keys = [(kind, amount, 0) for kind, amounts in TABLE_RANGES.items() for amount in amounts]
+        keys.extend((kind, 0, weekday) for kind in WEEKDAY_KINDS for weekday in range(7))
+        kinds, amounts, weekdays = zip(*keys)
+        resolved = to_dates(resolve_relative_dates(kinds, amounts, weekdays, reference_date))
+        self._dates: Dict[Tuple[str, int, int], date] = dict(zip(keys, resolved))
+
+    def resolve(self, kind: str, amount: int = 0, weekday: int = 0) -> Optional[date]:
+        """Target date of a relative date token (see services.relative_date_batch for the kinds)."""
+        if kind in WEEKDAY_KINDS:
+            key = (kind, 0, weekday)
+        else:
+            key = (kind, amount, 0)
+        target_date = self._dates.get(key)
+        if target_date is None:
+            return resolve_relative_date(kind, amount, weekday, self.reference_date)
+        return target_date
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+
+class RelativeDateTables:
+    """
+    Bounded, thread-safe LRU cache of relative date tables keyed by reference date.
+    """
+
+    def __init__(self, max_tables: int = DEFAULT_MAX_TABLES):
+        self.max_tables = max_tables
+        self._tables: "OrderedDict[date, RelativeDateTable]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def for_date(self, reference_date: date) -> RelativeDateTable:
+        """Get the table for a reference date, building it on first use."""
+        with self._lock:
+            table = self._tables.get(reference_date)
+            if table is not None:
+                self._tables.move_to_end(reference_date)
+                return table
+
+        # Built outside the lock; a concurrent build of the same day is harmless
+        table = RelativeDateTable(reference_date)
+        with self._lock:
+            table = self._tables.setdefault(reference_date, table)
+            self._tables.move_to_end(reference_date)
+            self.builds += 1
+            while len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+        logger.debug(f"Built relative date table for {reference_date}")
+        return table
+
+    def resolve(self, kind: str, amount: int, weekday: int, reference_date: date) -> Optional[date]:
+        """Resolve one token through the reference date's table."""
+        return self.for_date(reference_date).resolve(kind, amount, weekday)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number of cached tables and tables built so far."""
+        with self._lock:
+            return {'tables': len(self._tables), 'builds': self.builds}
+
+
+# Global instance
+_relative_date_tables: Optional[RelativeDateTables] = None
+
+
+def get_relative_date_tables() -> RelativeDateTables:
+    """Get the global relative date tables."""
+    global _relative_date_tables
+    if _relative_date_tables is None:
+        _relative_date_tables = RelativeDateTables()
+    return _relative_date_tables
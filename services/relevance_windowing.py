@@ -0,0 +1,239 @@
+"""
+Relevance windowing for long inputs.
+
+Long email threads and pasted documents mostly contain text that is not
+about the event. This module finds candidate event regions with a single
+cheap scan for date/time tokens, event keywords and field labels, and
+extracts only those regions so the expensive extractors and LLM prompts
+scale with the number of event mentions rather than document length.
+
+Windows keep their original offsets, so spans found in the windowed text
+can be mapped back to the full text.
+"""
+
+import bisect
+import difflib
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Joins windows; blank lines keep sentence-level extractors from bridging windows
+WINDOW_SEPARATOR = "\n\n"
+
+# One linear pass: every alternative is a short token with no nested repetition
+_SCAN_PATTERN = re.compile(
+    r"""
+    (?P<date>\b(?:
+        (?:mon|tues?|wed(?:nes)?|thu(?:rs?)?|fri|sat(?:ur)?|sun)(?:day)?
+        |jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?
+        |sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?
+        |today|tomorrow|tonight|noon|midnight
+        |\d{1,2}:\d{2}
+        |\d{1,2}\s?[ap]\.?m
+        |\d{1,4}[/-]\d{1,2}(?:[/-]\d{2,4})?
+    )\b)
+    |(?P<heading>\b(?:title|subject|event)\s*:)
+    |(?P<label>\b(?:when|where|location|venue|date|time)\s*:)
+    |(?P<event>\b(?:meeting|meet|call|lunch|dinner|breakfast|appointment|appt|conference|webinar
+        |interview|party|lecture|seminar|workshop|class|deadline|due|standup|invite|invitation
+        |reservation|flight|rsvp)\b)
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+
+_HIT_WEIGHTS = {'date': 2.0, 'label': 1.5, 'heading': 1.5, 'event': 1.0}
+
+
+@dataclass
+class TextWindow:
+    """A region of the original text."""
+    start: int
+    end: int
+    score: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'start': self.start, 'end': self.end, 'score': round(self.score, 2)}
+
+
+class WindowedText:
+    """
+    Concatenated windows of a longer text, with offset mapping back to it.
+    """
+
+    def __init__(self, original: str, windows: List[TextWindow]):
+        self.original = original
+        self.windows = windows
+        parts = []
+        self._offsets: List[int] = []  # start of each window in the windowed text
+        position = 0
+        for window in windows:
+            if parts:
+                parts.append(WINDOW_SEPARATOR)
+                position += len(WINDOW_SEPARATOR)
+            self._offsets.append(position)
+            parts.append(original[window.start:window.end])
+            position += window.end - window.start
+        self.text = "".join(parts)
+
+    def to_original(self, position: int) -> int:
+        """Map a position in the windowed text to the original text."""
+        index = max(0, bisect.bisect_right(self._offsets, position) - 1)
+        window = self.windows[index]
+        return min(window.start + (position - self._offsets[index]), window.end)
+
+    def map_span(self, span: Tuple[int, int]) -> Tuple[int, int]:
+        """Map an end-exclusive span to the original text; (0, 0) means no span."""
+        start, end = span
+        if start == 0 and end == 0:
+            return span
+        original_start = self.to_original(start)
+        original_end = self.to_original(end - 1) + 1 if end > start else original_start
+        return original_start, max(original_start, original_end)
+
+    def span_mapper(self, derived: str) -> Callable[[Tuple[int, int]], Tuple[int, int]]:
+        """
+        map_span for spans found in a lightly edited copy of the windowed text.
+
+        Text enhancement and pre-cleaning normalize whitespace and time formats
+        before the extractors run; positions are aligned through the blocks the
+        two texts have in common, then mapped to the original text.
+        """
+        if derived == self.text:
+            return self.map_span
+        blocks = difflib.SequenceMatcher(None, derived, self.text, autojunk=False).get_matching_blocks()
+        block_starts = [block.a for block in blocks]
+
+        def to_windowed(position: int) -> int:
+            block = blocks[max(0, bisect.bisect_right(block_starts, position) - 1)]
+            return block.b + min(max(position - block.a, 0), block.size)
+
+        def map_span(span: Tuple[int, int]) -> Tuple[int, int]:
+            start, end = span
+            if start == 0 and end == 0:
+                return span
+            return self.map_span((to_windowed(start), to_windowed(end)))
+
+        return map_span
+
+    def to_metadata(self) -> Dict[str, Any]:
+        return {
+            'original_length': len(self.original),
+            'windowed_length': len(self.text),
+            'windows': [window.to_dict() for window in self.windows],
+        }
+
+
+class RelevanceWindower:
+    """
+    Selects the event-relevant regions of long texts.
+
+    Hits of the token scan that lie within `context_chars` of each other form
+    a cluster; clusters with at least one date/time token are candidates and
+    the `max_windows` highest scoring ones are kept, plus a title/subject
+    heading if the text has one. Each window extends `context_chars` around
+    its cluster and snaps to sentence or line boundaries.
+    """
+
+    def __init__(self, min_text_length: int = 2000, context_chars: int = 200,
+                 max_windows: int = 3, max_coverage: float = 0.7):
+        self.min_text_length = min_text_length
+        self.context_chars = context_chars
+        self.max_windows = max_windows
+        self.max_coverage = max_coverage
+
+    def window(self, text: str) -> Optional[WindowedText]:
+        """
+        Window a text, or return None when it should be processed whole
+        (short, no date/time mention, or windows would not save much).
+        """
+        if not text or len(text) < self.min_text_length:
+            return None
+
+        clusters = self._cluster(text)
+        dated = [cluster for cluster in clusters if cluster['has_date']]
+        if not dated:
+            return None
+
+        selected = sorted(dated, key=lambda c: c['score'], reverse=True)[:self.max_windows]
+        headings = [c for c in clusters if c['has_heading'] and c not in selected]
+        if headings:
+            selected.append(headings[0])
+
+        windows = self._merge([self._expand(text, cluster) for cluster in selected])
+        covered = sum(window.end - window.start for window in windows)
+        if covered >= self.max_coverage * len(text):
+            return None
+
+        logger.debug(f"Windowed {len(text)} chars to {covered} chars in {len(windows)} windows")
+        return WindowedText(text, windows)
+
+    def _cluster(self, text: str) -> List[Dict[str, Any]]:
+        clusters: List[Dict[str, Any]] = []
+        for match in _SCAN_PATTERN.finditer(text):
+            kind = match.lastgroup
+            current = clusters[-1] if clusters else None
+            if current is None or match.start() - current['end'] > self.context_chars:
+                current = {'start': match.start(), 'end': match.end(), 'score': 0.0,
+                           'has_date': False, 'has_heading': False}
+                clusters.append(current)
+            current['end'] = match.end()
+            current['score'] += _HIT_WEIGHTS[kind]
+            current['has_date'] = current['has_date'] or kind == 'date'
+            current['has_heading'] = current['has_heading'] or kind == 'heading'
+        return clusters
+
+    def _expand(self, text: str, cluster: Dict[str, Any]) -> TextWindow:
+        limit = self.context_chars
+        start = _snap_start(text, max(0, cluster['start'] - limit), cluster['start'], limit)
+        end = _snap_end(text, min(len(text), cluster['end'] + limit), cluster['end'], limit)
+        return TextWindow(start, end, cluster['score'])
+
+    @staticmethod
+    def _merge(windows: List[TextWindow]) -> List[TextWindow]:
+        merged: List[TextWindow] = []
+        for window in sorted(windows, key=lambda w: w.start):
+            if merged and window.start <= merged[-1].end:
+                last = merged[-1]
+                merged[-1] = TextWindow(last.start, max(last.end, window.end), last.score + window.score)
+            else:
+                merged.append(window)
+        return merged
+
+
+def _snap_start(text: str, position: int, floor: int, limit: int) -> int:
+    """Move a window start back to a line or sentence start, at most `limit` chars."""
+    low = max(0, position - limit)
+    cut = max(text.rfind('\n', low, position + 1), text.rfind('. ', low, position + 1))
+    if cut != -1:
+        start = cut + 1
+    else:
+        space = text.rfind(' ', low, position + 1)
+        start = space + 1 if space != -1 else low
+    while start < floor and text[start].isspace():
+        start += 1
+    return start
+
+
+def _snap_end(text: str, position: int, ceiling: int, limit: int) -> int:
+    """Move a window end forward to a line or sentence end, at most `limit` chars."""
+    high = min(len(text), position + limit)
+    cuts = [cut for cut in (text.find('\n', position, high), text.find('. ', position, high)) if cut != -1]
+    if cuts:
+        return min(cuts) + 1
+    space = text.find(' ', position, high)
+    return max(space if space != -1 else high, ceiling)
+
+
+# Global instance
+_relevance_windower: Optional[RelevanceWindower] = None
+
+
+def get_relevance_windower() -> RelevanceWindower:
+    """Get the global relevance windower."""
+    global _relevance_windower
+    if _relevance_windower is None:
+        _relevance_windower = RelevanceWindower()
+    return _relevance_windower
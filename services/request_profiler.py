@@ -0,0 +1,340 @@
+"""
+Opt-in profiling of slow and sampled parse requests.
+
+This module provides:
+- cProfile capture of 1-in-N sampled requests (deterministic, full call graph)
+- Stack sampling of requests that run past a latency threshold: a watchdog
+  thread snapshots the parse thread's stack until it finishes, so requests
+  are only observed once they are already slow
+- A bounded on-disk ring of profiles for the admin endpoints
+
+When a request is neither sampled nor slow the cost is one counter increment
+and a registration in the watchdog's table; the watchdog sleeps while no
+request is in flight.
+"""
+
+import cProfile
+import itertools
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from services.env_config import env_bool, env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+TRIGGER_SAMPLED = 'sampled'
+TRIGGER_SLOW = 'slow'
+
+FORMAT_PSTATS = 'prof'     # cProfile output, load with pstats.Stats
+FORMAT_FOLDED = 'folded'   # collapsed stacks, feed to flamegraph.pl / speedscope
+
+_PROFILE_NAME = re.compile(
+    r'^(?P<timestamp>\d{8}T\d{6}\d{3})-(?P<trigger>sampled|slow)-(?P<duration_ms>\d+)ms-'
+    r'(?P<request_id>[A-Za-z0-9_-]+)\.(?P<format>prof|folded)$'
+)
+
+
+@dataclass
+class ProfilerConfig:
+    """Profiler settings (see from_env for the environment variables)."""
+    enabled: bool = False
+    sample_every: int = 0              # cProfile 1 in N requests, 0 disables
+    slow_threshold_ms: float = 2000.0  # stack-sample requests slower than this, 0 disables
+    sample_interval_ms: float = 5.0    # stack sampling period for slow requests
+    max_profiles: int = 50             # ring size on disk
+    directory: str = 'logs/profiles'
+
+    @classmethod
+    def from_env(cls) -> 'ProfilerConfig':
+        """Build config from PARSE_PROFILING_* environment variables."""
+        return cls(
+            enabled=env_bool('PARSE_PROFILING_ENABLED', False),
+            sample_every=env_int('PARSE_PROFILING_SAMPLE_EVERY', cls.sample_every),
+            slow_threshold_ms=env_float('PARSE_PROFILING_SLOW_MS', cls.slow_threshold_ms),
+            sample_interval_ms=env_float('PARSE_PROFILING_INTERVAL_MS', cls.sample_interval_ms),
+            max_profiles=env_int('PARSE_PROFILING_MAX_PROFILES', cls.max_profiles),
+            directory=os.getenv('PARSE_PROFILING_DIR', cls.directory),
+        )
+
+
+@dataclass
+class ProfileInfo:
+    """A stored profile."""
+    name: str
+    trigger: str
+    format: str
+    duration_ms: int
+    request_id: str
+    created_at: str
+    size_bytes: int
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'trigger': self.trigger,
+            'format': self.format,
+            'duration_ms': self.duration_ms,
+            'request_id': self.request_id,
+            'created_at': self.created_at,
+            'size_bytes': self.size_bytes,
+        }
+
+
+class ProfileStore:
+    """
+    Bounded on-disk ring of profiles.
+
+    Metadata is encoded in the file name, so the directory is the index and
+    concurrent workers can share it without coordination.
+    """
+
+    def __init__(self, directory: str, max_profiles: int = 50):
+        self.directory = Path(directory)
+        self.max_profiles = max(1, max_profiles)
+        self._lock = threading.Lock()
+
+    def _name(self, trigger: str, duration_ms: float, request_id: str, fmt: str) -> str:
+        timestamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')[:-3]
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '', request_id)[:64] or uuid.uuid4().hex[:12]
+        return f"{timestamp}-{trigger}-{int(duration_ms)}ms-{safe_id}.{fmt}"
+
+    def save_pstats(self, profile: cProfile.Profile, trigger: str,
+                    duration_ms: float, request_id: str) -> Path:
+        """Store a cProfile profile."""
+        path = self._reserve(trigger, duration_ms, request_id, FORMAT_PSTATS)
+        profile.dump_stats(str(path))
+        self._evict()
+        return path
+
+    def save_folded(self, stacks: Counter, trigger: str,
+                    duration_ms: float, request_id: str) -> Path:
+        """Store sampled stacks in collapsed ('frame;frame;frame count') format."""
+        path = self._reserve(trigger, duration_ms, request_id, FORMAT_FOLDED)
+        lines = [f"{stack} {count}" for stack, count in stacks.most_common()]
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        self._evict()
+        return path
+
+    def _reserve(self, trigger: str, duration_ms: float, request_id: str, fmt: str) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return self.directory / self._name(trigger, duration_ms, request_id, fmt)
+
+    def _evict(self):
+        with self._lock:
+            names = sorted(p.name for p in self.directory.iterdir() if _PROFILE_NAME.match(p.name))
+            for name in names[:-self.max_profiles]:
+                try:
+                    (self.directory / name).unlink()
+                except FileNotFoundError:
+                    pass
+
+    def list(self) -> List[ProfileInfo]:
+        """Stored profiles, newest first."""
+        if not self.directory.is_dir():
+            return []
+        profiles = []
+        for path in self.directory.iterdir():
+            match = _PROFILE_NAME.match(path.name)
+            if not match:
+                continue
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                continue
+            created = datetime.strptime(match['timestamp'][:15], '%Y%m%dT%H%M%S')
+            profiles.append(ProfileInfo(
+                name=path.name,
+                trigger=match['trigger'],
+                format=match['format'],
+                duration_ms=int(match['duration_ms']),
+                request_id=match['request_id'],
+                created_at=created.replace(microsecond=int(match['timestamp'][15:]) * 1000).isoformat(),
+                size_bytes=size,
+            ))
+        profiles.sort(key=lambda info: info.name, reverse=True)
+        return profiles
+
+    def get_path(self, name: str) -> Optional[Path]:
+        """Path of a stored profile, or None for unknown (or unsafe) names."""
+        if not _PROFILE_NAME.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+
+@dataclass
+class _ActiveRequest:
+    thread_id: int
+    start: float
+    request_id: str
+    stacks: Counter = field(default_factory=Counter)
+
+
+class RequestProfiler:
+    """
+    Profiles parse requests on the thread that runs them.
+
+    Usage (inside the executor thread):
+        with get_request_profiler().profile_request(request_id):
+            parser.parse_text(text)
+    """
+
+    def __init__(self, config: Optional[ProfilerConfig] = None):
+        self.config = config or ProfilerConfig.from_env()
+        self.store = ProfileStore(self.config.directory, self.config.max_profiles)
+        self._counter = itertools.count(1)
+        self._active: Dict[int, _ActiveRequest] = {}
+        self._active_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+        self.stats = {TRIGGER_SAMPLED: 0, TRIGGER_SLOW: 0, 'errors': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def profile_request(self, request_id: Optional[str] = None) -> '_ProfileScope':
+        """Context manager profiling the enclosed block on the current thread."""
+        return _ProfileScope(self, request_id or uuid.uuid4().hex[:12])
+
+    # Sampled (cProfile) requests
+
+    def _should_sample(self) -> bool:
+        every = self.config.sample_every
+        return every > 0 and next(self._counter) % every == 0
+
+    # Slow (stack-sampled) requests
+
+    def _register(self, active: _ActiveRequest):
+        with self._active_lock:
+            self._active[id(active)] = active
+            if self._watchdog is None or not self._watchdog.is_alive():
+                self._watchdog = threading.Thread(
+                    target=self._watch, name='parse-profiler-watchdog', daemon=True
+                )
+                self._watchdog.start()
+        self._wake.set()
+
+    def _unregister(self, active: _ActiveRequest):
+        with self._active_lock:
+            self._active.pop(id(active), None)
+
+    def _watch(self):
+        threshold = self.config.slow_threshold_ms / 1000.0
+        interval = max(self.config.sample_interval_ms, 0.5) / 1000.0
+        while True:
+            # Sample under the lock so a finished request's stacks are never
+            # written after it has been unregistered
+            with self._active_lock:
+                active = list(self._active.values())
+                if not active:
+                    self._wake.clear()
+                now = time.perf_counter()
+                overdue = [request for request in active if now - request.start >= threshold]
+                if overdue:
+                    frames = sys._current_frames()
+                    for request in overdue:
+                        frame = frames.get(request.thread_id)
+                        if frame is not None:
+                            request.stacks[_collapse(frame)] += 1
+            if not active:
+                self._wake.wait()
+            elif overdue:
+                time.sleep(interval)
+            else:
+                # Sleep until the oldest request would become slow
+                oldest = min(request.start for request in active)
+                time.sleep(max(interval, threshold - (now - oldest)))
+
+    def _finish(self, request_id: str, duration_ms: float,
+                profile: Optional[cProfile.Profile], active: Optional[_ActiveRequest]):
+        try:
+            if profile is not None:
+                self.store.save_pstats(profile, TRIGGER_SAMPLED, duration_ms, request_id)
+                self.stats[TRIGGER_SAMPLED] += 1
+            elif active is not None and active.stacks:
+                self.store.save_folded(active.stacks, TRIGGER_SLOW, duration_ms, request_id)
+                self.stats[TRIGGER_SLOW] += 1
+                logger.info(f"Captured slow request profile - Request: {request_id}, Duration: {duration_ms:.0f}ms")
+        except OSError as e:
+            self.stats['errors'] += 1
+            logger.warning(f"Failed to store request profile: {e}")
+
+    def list_profiles(self) -> List[ProfileInfo]:
+        return self.store.list()
+
+    def get_profile_path(self, name: str) -> Optional[Path]:
+        return self.store.get_path(name)
+
+
+class _ProfileScope:
+    __slots__ = ('profiler', 'request_id', 'start', 'profile', 'active')
+
+    def __init__(self, profiler: RequestProfiler, request_id: str):
+        self.profiler = profiler
+        self.request_id = request_id
+        self.profile: Optional[cProfile.Profile] = None
+        self.active: Optional[_ActiveRequest] = None
+
+    def __enter__(self):
+        profiler = self.profiler
+        self.start = time.perf_counter()
+        if not profiler.config.enabled:
+            return self
+        if profiler._should_sample():
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                self.profile = profile
+            except ValueError:
+                # Another profiler is active on this thread (or process-wide on 3.12+)
+                logger.debug("Skipping sampled profile: profiler already active")
+        if self.profile is None and profiler.config.slow_threshold_ms > 0:
+            self.active = _ActiveRequest(threading.get_ident(), self.start, self.request_id)
+            profiler._register(self.active)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.profile is None and self.active is None:
+            return False
+        duration_ms = (time.perf_counter() - self.start) * 1000
+        if self.profile is not None:
+            self.profile.disable()
+        if self.active is not None:
+            self.profiler._unregister(self.active)
+        self.profiler._finish(self.request_id, duration_ms, self.profile, self.active)
+        return False
+
+
+def _collapse(frame) -> str:
+    """Render a frame's stack root-first as 'file:function;...', with the line of the leaf frame."""
+    code = frame.f_code
+    parts = [f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}"]
+    frame = frame.f_back
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+# Global instance
+_request_profiler: Optional[RequestProfiler] = None
+
+
+def get_request_profiler() -> RequestProfiler:
+    """Get the global request profiler, configured from the environment."""
+    global _request_profiler
+    if _request_profiler is None:
+        _request_profiler = RequestProfiler()
+    return _request_profiler
@@ -0,0 +1,290 @@
+"""
+Fast path for short event phrases.
+
+Much of /parse traffic is phrases like "lunch tomorrow at noon" or "standup
+9am", which still go through text merging, per-field routing, metadata
+construction and possibly the LLM enhancer. ShortInputParser handles them
+with a compact deterministic grammar:
+
+    phrase := title-words and, in any order, at most one date and one time
+    date   := today | tomorrow | [on | this | next] <weekday>
+    time   := [at | @] H[:MM] am/pm | HH:MM | noon
+
+It returns a complete ParsedEvent only when every token is accounted for
+and every field resolves unambiguously. Anything else (a location,
+participants, recurrence, a bare "at 9", a weekday naming today, a date
+without a time) escalates to the full pipeline with a reason, so the fast
+path never guesses. Escalation reasons are exported as metrics.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import List, Optional, Tuple
+
+from models.event_models import FieldResult, ParsedEvent
+from services.env_config import env_bool, env_int
+from services.keyword_prefilter import get_keyword_prefilter
+from services.relative_date_table import get_relative_date_tables
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# Words that introduce another field (location, participants, recurrence, ...)
+FIELD_WORDS = frozenset((
+    'at', '@', 'in', 'on', 'with', 'for', 'from', 'to', 'until', 'till', 'by', 'near', 'via',
+    'every', 'each', 'and', 'or', 'next', 'this'
+))
+
+# Date and time words the grammar does not resolve
+DATETIME_WORDS = frozenset(('tonight', 'am', 'pm', 'a.m', 'p.m'))
+MERIDIEMS = ('am', 'pm', 'a.m', 'p.m')
+
+# Keyword prefilter groups a title word must not trigger
+DATETIME_TRIGGERS = ('month', 'weekday', 'relative_day', 'day_part', 'noon')
+FIELD_TRIGGERS = ('location_label', 'room', 'building', 'floor', 'office', 'workplace', 'education',
+                  'home', 'generic_place', 'implicit_place', 'every', 'frequency', 'until')
+
+_TIME_PATTERN = re.compile(
+    r'(?:(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?(?P<meridiem>[ap]\.?m\.?)'
+    r'|(?P<clock_hour>\d{1,2}):(?P<clock_minute>\d{2})|(?P<noon>noon))'
+)
+_TITLE_WORD_PATTERN = re.compile(r"[^\W\d_][\w'&/-]*")
+_TOKEN_PATTERN = re.compile(r'\S+')
+
+# Confidence of each field the grammar resolves
+TITLE_CONFIDENCE = 0.85
+START_CONFIDENCE = 0.95
+END_CONFIDENCE = 0.9  # default duration rather than an explicit end
+
+
+@dataclass
+class ShortInputConfig:
+    """Fast path settings (see from_env for the environment variables)."""
+    enabled: bool = True
+    max_chars: int = 60               # longer inputs go straight to the full pipeline
+    max_words: int = 8
+    default_duration_minutes: int = 60
+
+    @classmethod
+    def from_env(cls) -> 'ShortInputConfig':
+        """Build config from SHORT_INPUT_FAST_PATH_* environment variables."""
+        return cls(
+            enabled=env_bool('SHORT_INPUT_FAST_PATH_ENABLED', True),
+            max_chars=max(0, env_int('SHORT_INPUT_FAST_PATH_MAX_CHARS', cls.max_chars)),
+            max_words=max(0, env_int('SHORT_INPUT_FAST_PATH_MAX_WORDS', cls.max_words)),
+            default_duration_minutes=max(1, env_int('SHORT_INPUT_FAST_PATH_DURATION_MINUTES',
+                                                    cls.default_duration_minutes)),
+        )
+
+
+@dataclass
+class ShortInputResult:
+    """Fast path outcome: a parsed event, or the reason the input needs the full pipeline."""
+    parsed_event: Optional[ParsedEvent] = None
+    escalation_reason: Optional[str] = None
+
+    @property
+    def hit(self) -> bool:
+        return self.parsed_event is not None
+
+
+class _Escalate(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class ShortInputParser:
+    """
+    Deterministic parser for short, unambiguous event phrases.
+
+    Args:
+        config: Fast path settings
+    """
+
+    def __init__(self, config: Optional[ShortInputConfig] = None):
+        self.config = config or ShortInputConfig.from_env()
+        self.prefilter = get_keyword_prefilter()
+        self.datetime_triggers = self.prefilter.mask(*DATETIME_TRIGGERS)
+        self.field_triggers = self.prefilter.mask(*FIELD_TRIGGERS)
+
+    def parse(self, text: str, current_time: Optional[datetime] = None) -> ShortInputResult:
+        """
+        Parse a short phrase, or report why it needs the full pipeline.
+
+        Args:
+            text: Input text
+            current_time: Reference time for relative dates (default: now)
+
+        Returns:
+            ShortInputResult with either parsed_event or escalation_reason set
+        """
+        if not self.config.enabled:
+            return ShortInputResult(escalation_reason='disabled')
+        stripped = text.strip()
+        if not stripped:
+            return ShortInputResult(escalation_reason='empty')
+        if len(stripped) > self.config.max_chars:
+            return ShortInputResult(escalation_reason='too_long')
+        tokens = [(m.group(), m.start(), m.end()) for m in _TOKEN_PATTERN.finditer(text)]
+        if len(tokens) > self.config.max_words:
+            return ShortInputResult(escalation_reason='too_long')
+
+        try:
+            return ShortInputResult(parsed_event=self._parse_tokens(text, tokens, current_time or datetime.now()))
+        except _Escalate as escalation:
+            return ShortInputResult(escalation_reason=escalation.reason)
+
+    def _parse_tokens(self, text: str, tokens: List[Tuple[str, int, int]], current_time: datetime) -> ParsedEvent:
+        words = [token.lower().rstrip(',.!') or token.lower() for token, _, _ in tokens]
+        event_date = event_time = None
+        date_span = time_span = None
+        title_indices: List[int] = []
+
+        i = 0
+        while i < len(words):
+            word = words[i]
+            following = words[i + 1] if i + 1 < len(words) else None
+
+            # "2 pm" and "at 2pm" / "@ noon" are one time token
+            consumed = 1
+            candidate = word
+            if following in MERIDIEMS and word.isdigit():
+                candidate, consumed = word + following, 2
+            elif word in ('at', '@') and following is not None:
+                after = words[i + 2] if i + 2 < len(words) else None
+                if following.isdigit() and after in MERIDIEMS:
+                    candidate, consumed = following + after, 3
+                elif self._parse_time(following) is not None:
+                    candidate, consumed = following, 2
+                elif following.isdigit():
+                    raise _Escalate('ambiguous_time')
+
+            parsed_time = self._parse_time(candidate)
+            if parsed_time is not None:
+                if event_time is not None:
+                    raise _Escalate('multiple_times')
+                event_time, time_span = parsed_time, (tokens[i][1], tokens[i + consumed - 1][2])
+                i += consumed
+                continue
+
+            parsed_date, consumed = self._parse_date(words, i, current_time)
+            if parsed_date is not None:
+                if event_date is not None:
+                    raise _Escalate('multiple_dates')
+                event_date, date_span = parsed_date, (tokens[i][1], tokens[i + consumed - 1][2])
+                i += consumed
+                continue
+
+            self._check_title_word(tokens[i][0], word)
+            if title_indices and title_indices[-1] != i - 1:
+                raise _Escalate('split_title')
+            title_indices.append(i)
+            i += 1
+
+        if not title_indices:
+            raise _Escalate('no_title')
+        if event_time is None:
+            raise _Escalate('no_time')
+
+        title_span = (tokens[title_indices[0]][1], tokens[title_indices[-1]][2])
+        title = text[title_span[0]:title_span[1]].rstrip(',.!')
+        start = datetime.combine(event_date or current_time.date(), event_time)
+        end = start + timedelta(minutes=self.config.default_duration_minutes)
+        start_span = (min(time_span[0], date_span[0]), max(time_span[1], date_span[1])) if date_span else time_span
+
+        field_results = {
+            'title': FieldResult(value=title, source='fast_path', confidence=TITLE_CONFIDENCE, span=title_span),
+            'start_datetime': FieldResult(value=start, source='fast_path', confidence=START_CONFIDENCE,
+                                          span=start_span),
+            'end_datetime': FieldResult(value=end, source='fast_path', confidence=END_CONFIDENCE,
+                                        span=start_span),
+        }
+        confidence = sum(result.confidence for result in field_results.values()) / len(field_results)
+        return ParsedEvent(
+            title=title,
+            start_datetime=start,
+            end_datetime=end,
+            confidence_score=confidence,
+            field_results=field_results,
+            parsing_path='fast_path',
+            extraction_metadata={'parsing_path': 'fast_path'}
+        )
+
+    @staticmethod
+    def _parse_time(word: str) -> Optional[time]:
+        """Time of a single time token, or None if the word is not one."""
+        match = _TIME_PATTERN.fullmatch(word)
+        if match is None:
+            return None
+        if match.group('noon'):
+            return time(12, 0)
+        if match.group('meridiem'):
+            hour, minute = int(match.group('hour')), int(match.group('minute') or 0)
+            if not 1 <= hour <= 12 or minute > 59:
+                raise _Escalate('invalid_time')
+            hour = hour % 12 + (12 if match.group('meridiem').startswith('p') else 0)
+            return time(hour, minute)
+        hour, minute = int(match.group('clock_hour')), int(match.group('clock_minute'))
+        if hour > 23 or minute > 59:
+            raise _Escalate('invalid_time')
+        return time(hour, minute)
+
+    @staticmethod
+    def _parse_date(words: List[str], i: int, current_time: datetime):
+        """(date, words consumed) of a date phrase starting at words[i], or (None, 0)."""
+        tables = get_relative_date_tables()
+        today = current_time.date()
+        word = words[i]
+        if word == 'today':
+            return today, 1
+        if word == 'tomorrow':
+            return tables.resolve('days', 1, 0, today), 1
+
+        qualifier = None
+        if word in ('on', 'this', 'next') and i + 1 < len(words) and words[i + 1] in WEEKDAYS:
+            qualifier, word, consumed = word, words[i + 1], 2
+        elif word in WEEKDAYS:
+            consumed = 1
+        else:
+            return None, 0
+
+        weekday = WEEKDAYS.index(word)
+        if qualifier == 'next':
+            return tables.resolve('next_weekday', 0, weekday, today), consumed
+        if weekday == today.weekday() and qualifier != 'this':
+            # Today or a week from today
+            raise _Escalate('ambiguous_date')
+        return tables.resolve('this_weekday', 0, weekday, today), consumed
+
+    def _check_title_word(self, token: str, word: str):
+        """Escalate unless the word can only be part of the title."""
+        if word in FIELD_WORDS:
+            raise _Escalate('other_fields')
+        if word in DATETIME_WORDS:
+            raise _Escalate('unparsed_datetime')
+        if word.isdigit():
+            raise _Escalate('ambiguous_time')
+        token = token.rstrip(',.!')
+        if not _TITLE_WORD_PATTERN.fullmatch(token):
+            raise _Escalate('unrecognized_token')
+        bits = self.prefilter.word_bits(token)
+        if bits & self.datetime_triggers:
+            raise _Escalate('unparsed_datetime')
+        if bits & self.field_triggers:
+            raise _Escalate('other_fields')
+
+
+# Global instance
+_short_input_parser: Optional[ShortInputParser] = None
+
+
+def get_short_input_parser() -> ShortInputParser:
+    """Get the global short input parser."""
+    global _short_input_parser
+    if _short_input_parser is None:
+        _short_input_parser = ShortInputParser()
+    return _short_input_parser
@@ -0,0 +1,163 @@
+"""
+Per-request pipeline stage timing.
+
+This module provides:
+- A request-scoped StageTimings collector carried in a context variable
+- A `stage()` context manager that attributes perf_counter_ns time to pipeline
+  stages exclusively: a nested stage (e.g. an LLM call inside preprocessing)
+  is subtracted from its parent, so stage durations add up to the time spent
+- Server-Timing header rendering
+
+Instrumentation is a no-op unless a request scope is active, so library code
+can be instrumented unconditionally; disabling it via STAGE_TIMING_ENABLED=0
+leaves one context variable lookup per stage.
+"""
+
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# Canonical pipeline stages, in the order they are reported
+STAGES = ('preprocess', 'cache', 'routing', 'regex', 'deterministic', 'llm', 'aggregation', 'serialization')
+
+_current: contextvars.ContextVar[Optional['StageTimings']] = contextvars.ContextVar('stage_timings', default=None)
+
+
+def is_stage_timing_enabled() -> bool:
+    """Whether stage timing is enabled (STAGE_TIMING_ENABLED, default on)."""
+    return os.getenv('STAGE_TIMING_ENABLED', '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+class StageTimings:
+    """
+    Stage durations collected for one request.
+
+    Frames are kept per thread, so stages timed in executor threads nest
+    correctly while sharing the request's totals.
+    """
+
+    __slots__ = ('start_ns', '_records', '_stacks')
+
+    def __init__(self):
+        self.start_ns = time.perf_counter_ns()
+        self._records: List[Tuple[str, int]] = []  # list.append is atomic across threads
+        self._stacks: Dict[int, List[list]] = {}
+
+    def push(self, stage: str):
+        """Start timing a stage on the current thread."""
+        stack = self._stacks.setdefault(threading.get_ident(), [])
+        stack.append([stage, time.perf_counter_ns(), 0])
+
+    def pop(self):
+        """Stop timing the innermost stage on the current thread."""
+        now = time.perf_counter_ns()
+        stack = self._stacks.get(threading.get_ident())
+        if not stack:
+            return
+        stage, start_ns, child_ns = stack.pop()
+        elapsed = now - start_ns
+        self._records.append((stage, elapsed - child_ns))
+        if stack:
+            stack[-1][2] += elapsed
+
+    def close_open_stages(self):
+        """Stop every stage still open on the current thread (e.g. serialization at response start)."""
+        stack = self._stacks.get(threading.get_ident())
+        while stack:
+            self.pop()
+
+    def record(self, stage: str, duration_ns: int):
+        """Record an externally measured stage duration."""
+        self._records.append((stage, duration_ns))
+
+    def totals_ns(self) -> Dict[str, int]:
+        """Total nanoseconds per stage, canonical stages first."""
+        totals: Dict[str, int] = {}
+        for stage, duration in list(self._records):
+            totals[stage] = totals.get(stage, 0) + duration
+        order = {stage: index for index, stage in enumerate(STAGES)}
+        return dict(sorted(totals.items(), key=lambda item: order.get(item[0], len(STAGES))))
+
+    def elapsed_ns(self) -> int:
+        """Nanoseconds since the request scope started."""
+        return time.perf_counter_ns() - self.start_ns
+
+    def server_timing_header(self) -> str:
+        """Render stage totals and the request total as a Server-Timing header value."""
+        entries = [f"{stage};dur={duration / 1e6:.3f}" for stage, duration in self.totals_ns().items()]
+        entries.append(f"total;dur={self.elapsed_ns() / 1e6:.3f}")
+        return ", ".join(entries)
+
+
+class _StageContext:
+    __slots__ = ('timings', 'name')
+
+    def __init__(self, timings: StageTimings, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.timings.push(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.timings.pop()
+        return False
+
+
+class _NullContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+def stage(name: str):
+    """
+    Time a block as a pipeline stage of the current request.
+
+    Usage:
+        with stage('regex'):
+            result = extractor.extract_datetime(text)
+    """
+    timings = _current.get()
+    if timings is None:
+        return _NULL_CONTEXT
+    return _StageContext(timings, name)
+
+
+def open_stage(name: str):
+    """Start a stage that stays open until close_open_stages() (used for response serialization)."""
+    timings = _current.get()
+    if timings is not None:
+        timings.push(name)
+
+
+def get_current_timings() -> Optional[StageTimings]:
+    """Get the stage timings of the current request, if any."""
+    return _current.get()
+
+
+@contextmanager
+def request_scope():
+    """
+    Collect stage timings for the enclosed request.
+
+    Yields:
+        StageTimings for the request
+    """
+    timings = StageTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
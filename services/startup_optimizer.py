@@ -15,13 +15,32 @@ Requirements addressed:
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, Optional, List, Sequence
 from datetime import datetime
 
 from services.performance_optimizer import get_performance_optimizer, PerformanceMetrics
 
 logger = logging.getLogger(__name__)
 
+# Startup modes:
+# - lazy: serve health probes immediately, build heavy components in the background
+# - eager: build heavy components before the server accepts requests
+STARTUP_MODES = ('lazy', 'eager')
+DEFAULT_STARTUP_MODE = 'lazy'
+
+# Components built by the warm-up step, in load order
+WARM_UP_COMPONENTS = ['event_parser']
+
+
+def get_startup_mode() -> str:
+    """Get the configured startup mode from the STARTUP_MODE environment variable."""
+    mode = os.getenv('STARTUP_MODE', DEFAULT_STARTUP_MODE).strip().lower()
+    if mode not in STARTUP_MODES:
+        logger.warning(f"Unknown STARTUP_MODE '{mode}', using '{DEFAULT_STARTUP_MODE}'")
+        return DEFAULT_STARTUP_MODE
+    return mode
+
 
 class StartupOptimizer:
     """
@@ -36,13 +55,15 @@ class StartupOptimizer:
     
     async def initialize_application(self, 
                                    enable_warm_up: bool = True,
-                                   warm_up_in_background: bool = True) -> PerformanceMetrics:
+                                   warm_up_in_background: bool = True,
+                                   skip_warm_up: Sequence[str] = ()) -> PerformanceMetrics:
         """
         Initialize the application with performance optimizations.
         
         Args:
             enable_warm_up: Whether to warm up models
             warm_up_in_background: Whether to warm up models in background
+            skip_warm_up: Services not to warm up (e.g. 'llm_service')
             
         Returns:
             Performance metrics from initialization
@@ -60,18 +81,20 @@ class StartupOptimizer:
             # Initialize without warm-up first for faster startup
             self.startup_metrics = self.performance_optimizer.initialize(
                 regex_patterns=regex_patterns,
-                warm_up_inputs=None  # Skip warm-up for now
+                warm_up_inputs=None,  # Skip warm-up for now
+                skip_warm_up=skip_warm_up
             )
             
             # Start warm-up in background
-            warm_up_task = asyncio.create_task(self._background_warm_up(warm_up_inputs))
+            warm_up_task = asyncio.create_task(self._background_warm_up(warm_up_inputs, skip_warm_up))
             self.background_tasks.append(warm_up_task)
             
         else:
             # Initialize with immediate warm-up
             self.startup_metrics = self.performance_optimizer.initialize(
                 regex_patterns=regex_patterns,
-                warm_up_inputs=warm_up_inputs
+                warm_up_inputs=warm_up_inputs,
+                skip_warm_up=skip_warm_up
             )
         
         self.startup_completed = True
@@ -81,16 +104,17 @@ class StartupOptimizer:
         
         return self.startup_metrics
     
-    async def _background_warm_up(self, warm_up_inputs: Dict[str, str]):
+    async def _background_warm_up(self, warm_up_inputs: Dict[str, str], skip_warm_up: Sequence[str] = ()):
         """
         Perform model warm-up in the background.
         
         Args:
             warm_up_inputs: Test inputs for warm-up
+            skip_warm_up: Services not to warm up
         """
         try:
             logger.info("Starting background model warm-up")
-            warm_up_results = self.performance_optimizer.model_warmup.warm_up_models(warm_up_inputs)
+            warm_up_results = self.performance_optimizer.model_warmup.warm_up_models(warm_up_inputs, skip=skip_warm_up)
             
             successful_warmups = sum(1 for success in warm_up_results.values() if success)
             logger.info(f"Background warm-up completed: {successful_warmups}/{len(warm_up_results)} successful")
@@ -197,6 +221,65 @@ class StartupOptimizer:
             'location_extractor': "Meeting at Nathan Phillips Square downtown"
         }
     
+    def preload_components(self, names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Load lazily registered components now instead of on first use.
+        
+        Args:
+            names: Component names to load (defaults to WARM_UP_COMPONENTS)
+            
+        Returns:
+            Dictionary mapping component names to load success
+        """
+        lazy_loader = self.performance_optimizer.lazy_loader
+        results = {}
+        
+        for name in names or WARM_UP_COMPONENTS:
+            results[name] = lazy_loader.preload_module(name)
+        
+        return results
+    
+    async def warm_up_components(self, names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Load components in a worker thread so the event loop keeps serving requests.
+        
+        Args:
+            names: Component names to load (defaults to WARM_UP_COMPONENTS)
+            
+        Returns:
+            Dictionary mapping component names to load success
+        """
+        loop = asyncio.get_event_loop()
+        results = await loop.run_in_executor(None, self.preload_components, names)
+        self.log_import_report()
+        return results
+    
+    def get_import_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-component load status and import/initialization time.
+        
+        Returns:
+            Dictionary mapping component names to {'loaded', 'load_time_seconds'}
+        """
+        lazy_loader = self.performance_optimizer.lazy_loader
+        load_times = lazy_loader.get_load_times()
+        
+        return {
+            name: {
+                'loaded': lazy_loader.is_loaded(name),
+                'load_time_seconds': load_times.get(name)
+            }
+            for name in lazy_loader.get_registered_modules()
+        }
+    
+    def log_import_report(self):
+        """Log per-component load times, marking components that are still deferred."""
+        for name, entry in self.get_import_report().items():
+            if entry['loaded']:
+                logger.info(f"Component {name}: loaded in {entry['load_time_seconds']:.3f}s")
+            else:
+                logger.info(f"Component {name}: deferred until first use")
+    
     def get_startup_status(self) -> Dict[str, Any]:
         """
         Get current startup status and metrics.
@@ -208,7 +291,8 @@ class StartupOptimizer:
             'startup_completed': self.startup_completed,
             'performance_optimizer_initialized': self.performance_optimizer.is_initialized(),
             'background_tasks_count': len(self.background_tasks),
-            'background_tasks_completed': sum(1 for task in self.background_tasks if task.done())
+            'background_tasks_completed': sum(1 for task in self.background_tasks if task.done()),
+            'import_report': self.get_import_report()
         }
         
         if self.startup_metrics:
@@ -4,6 +4,8 @@ from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
 from models.event_models import ParsedEvent
+from services.keyword_prefilter import get_keyword_prefilter
+from services.async_pipeline import run_cpu
 
 _llm_text_enhancer = None
 _TextEnhancement = None  # kept for potential external use, even if unused here
@@ -20,10 +22,13 @@ def _get_llm_text_enhancer():
 
     if _llm_text_enhancer is None:
         try:
-            from services.llm_text_enhancer import LLMTextEnhancer, TextEnhancement
-            _llm_text_enhancer = LLMTextEnhancer(provider="auto")
-            _TextEnhancement = TextEnhancement
-            logger.info("LLM text enhancer loaded successfully")
+            from services.performance_optimizer import get_performance_optimizer
+            from services.llm_text_enhancer import TextEnhancement
+            # Shared with the startup optimizer so load time shows up in its report
+            _llm_text_enhancer = get_performance_optimizer().get_lazy_module('llm_text_enhancer')
+            _TextEnhancement = TextEnhancement if _llm_text_enhancer is not None else None
+            if _llm_text_enhancer is not None:
+                logger.info("LLM text enhancer loaded successfully")
         except ImportError as e:
             logger.warning(f"LLM text enhancer not available: {e}")
             _llm_text_enhancer = None
@@ -52,6 +57,13 @@ class TextMergeHelper:
         self.use_llm = use_llm
         self.llm_enhancer = None
 
+        # Keyword prefilter triggers: without them the indicator checks below cannot succeed
+        self.prefilter = get_keyword_prefilter()
+        self.time_triggers = self.prefilter.mask("digit", "weekday", "relative_day", "day_part")
+        self.location_triggers = self.prefilter.mask(
+            "at", "in", "room", "building", "office", "location_label"
+        )
+
         self.config: Dict[str, Any] = {
             "max_clipboard_merge_distance": 200,
             "min_confidence_for_merge": 0.6,
@@ -61,84 +73,144 @@ class TextMergeHelper:
         }
 
     def enhance_text_for_parsing(
-        self, text: str, clipboard_text: Optional[str] = None
+        self, text: str, clipboard_text: Optional[str] = None, use_llm: Optional[bool] = None
     ) -> MergeResult:
-        original_text = text
-        merge_applied = False
-        enhancement_applied = False
-        final_confidence = 0.5
-        metadata: Dict[str, Any] = {}
+        # use_llm overrides the helper setting for this call
+        use_llm = self.use_llm if use_llm is None else use_llm
 
         try:
-            # Optional clipboard merge
-            if clipboard_text and self._should_merge_with_clipboard(text, clipboard_text):
-                text = self._merge_with_clipboard(text, clipboard_text)
-                merge_applied = True
-                metadata["merge_strategy"] = "clipboard_merge"
-                logger.info("Applied clipboard merge")
-
-            # LLM enhancement (if enabled and available)
-            if self.use_llm:
-                if self.llm_enhancer is None:
-                    llm_enhancer, _TextEnhancementType = _get_llm_text_enhancer()
-                    self.llm_enhancer = llm_enhancer
-
-                if self.llm_enhancer and getattr(self.llm_enhancer, "is_available", lambda: False)():
-                    context = "gmail_selection" if merge_applied else "single_text"
-                    enhancement = self.llm_enhancer.enhance_text_for_parsing(text, context)
-
-                    if enhancement and getattr(enhancement, "confidence", 0) > 0.6:
-                        text = enhancement.enhanced_text
-                        enhancement_applied = True
-                        final_confidence = enhancement.confidence
-                        metadata.update(
-                            {
-                                "llm_enhancement": True,
-                                "enhancement_type": getattr(enhancement, "enhancement_type", None),
-                                "detected_patterns": getattr(enhancement, "detected_patterns", None),
-                                "llm_metadata": getattr(enhancement, "metadata", None),
-                            }
-                        )
-                        logger.info(
-                            f"Applied LLM enhancement: {getattr(enhancement, 'enhancement_type', 'unknown')}"
-                        )
-                    else:
-                        conf = getattr(enhancement, "confidence", None)
-                        metadata["llm_enhancement_skipped"] = (
-                            f"Low confidence: {conf}" if conf is not None else "No enhancement returned"
-                        )
-                else:
-                    metadata["llm_enhancement_skipped"] = "LLM enhancer not available"
-            else:
-                metadata["llm_enhancement_skipped"] = "LLM not enabled"
-
-            # Always run lightweight preprocessing if no LLM enhancement applied
-            if not enhancement_applied:
-                text = self._apply_basic_preprocessing(text)
-                metadata["basic_preprocessing"] = True
-
-            return MergeResult(
-                final_text=text,
-                confidence=final_confidence,
-                merge_applied=merge_applied,
-                enhancement_applied=enhancement_applied,
-                original_text=original_text,
-                clipboard_text=clipboard_text,
-                metadata=metadata,
+            merged_text, merge_applied, metadata, llm_enhancer = self._prepare_enhancement(
+                text, clipboard_text, use_llm
+            )
+            enhancement = None
+            if llm_enhancer is not None:
+                enhancement = llm_enhancer.enhance_text_for_parsing(merged_text, self._enhancement_context(merge_applied))
+            return self._merge_result(
+                text, merged_text, clipboard_text, merge_applied, llm_enhancer is not None, enhancement, metadata
             )
 
         except Exception as e:
             logger.error(f"Text enhancement failed: {e}", exc_info=True)
-            return MergeResult(
-                final_text=original_text,
-                confidence=0.3,
-                merge_applied=False,
-                enhancement_applied=False,
-                original_text=original_text,
-                clipboard_text=clipboard_text,
-                metadata={"error": str(e)},
+            return self._failed_merge_result(text, clipboard_text, e)
+
+    async def enhance_text_for_parsing_async(
+        self, text: str, clipboard_text: Optional[str] = None, use_llm: Optional[bool] = None
+    ) -> MergeResult:
+        """Async enhance_text_for_parsing: merging runs on the CPU pool and the LLM call is awaited."""
+        use_llm = self.use_llm if use_llm is None else use_llm
+
+        try:
+            merged_text, merge_applied, metadata, llm_enhancer = await run_cpu(
+                self._prepare_enhancement, text, clipboard_text, use_llm
+            )
+            enhancement = None
+            if llm_enhancer is not None:
+                enhancement = await llm_enhancer.enhance_text_for_parsing_async(
+                    merged_text, self._enhancement_context(merge_applied)
+                )
+            return await run_cpu(
+                self._merge_result,
+                text, merged_text, clipboard_text, merge_applied, llm_enhancer is not None, enhancement, metadata
             )
 
+        except Exception as e:
+            logger.error(f"Text enhancement failed: {e}", exc_info=True)
+            return self._failed_merge_result(text, clipboard_text, e)
+
+    def _prepare_enhancement(self, text: str, clipboard_text: Optional[str], use_llm: bool):
+        """Clipboard merge and LLM enhancer lookup: (text, merge_applied, metadata, enhancer or None)."""
+        merge_applied = False
+        metadata: Dict[str, Any] = {}
+
+        # Optional clipboard merge
+        if clipboard_text and self._should_merge_with_clipboard(text, clipboard_text):
+            text = self._merge_with_clipboard(text, clipboard_text)
+            merge_applied = True
+            metadata["merge_strategy"] = "clipboard_merge"
+            logger.info("Applied clipboard merge")
+
+        # LLM enhancement (if enabled and available)
+        if not use_llm:
+            metadata["llm_enhancement_skipped"] = "LLM not enabled"
+            return text, merge_applied, metadata, None
+
+        if self.llm_enhancer is None:
+            llm_enhancer, _TextEnhancementType = _get_llm_text_enhancer()
+            self.llm_enhancer = llm_enhancer
+
+        if not (self.llm_enhancer and getattr(self.llm_enhancer, "is_available", lambda: False)()):
+            metadata["llm_enhancement_skipped"] = "LLM enhancer not available"
+            return text, merge_applied, metadata, None
+
+        return text, merge_applied, metadata, self.llm_enhancer
+
+    @staticmethod
+    def _enhancement_context(merge_applied: bool) -> str:
+        return "gmail_selection" if merge_applied else "single_text"
+
+    def _merge_result(
+        self,
+        original_text: str,
+        text: str,
+        clipboard_text: Optional[str],
+        merge_applied: bool,
+        llm_called: bool,
+        enhancement: Any,
+        metadata: Dict[str, Any],
+    ) -> MergeResult:
+        """Apply an LLM enhancement if confident enough, else basic preprocessing."""
+        enhancement_applied = False
+        final_confidence = 0.5
+
+        if llm_called:
+            if enhancement and getattr(enhancement, "confidence", 0) > 0.6:
+                text = enhancement.enhanced_text
+                enhancement_applied = True
+                final_confidence = enhancement.confidence
+                metadata.update(
+                    {
+                        "llm_enhancement": True,
+                        "enhancement_type": getattr(enhancement, "enhancement_type", None),
+                        "detected_patterns": getattr(enhancement, "detected_patterns", None),
+                        "llm_metadata": getattr(enhancement, "metadata", None),
+                    }
+                )
+                logger.info(
+                    f"Applied LLM enhancement: {getattr(enhancement, 'enhancement_type', 'unknown')}"
+                )
+            else:
+                conf = getattr(enhancement, "confidence", None)
+                metadata["llm_enhancement_skipped"] = (
+                    f"Low confidence: {conf}" if conf is not None else "No enhancement returned"
+                )
+
+        # Always run lightweight preprocessing if no LLM enhancement applied
+        if not enhancement_applied:
+            text = self._apply_basic_preprocessing(text)
+            metadata["basic_preprocessing"] = True
+
+        return MergeResult(
+            final_text=text,
+            confidence=final_confidence,
+            merge_applied=merge_applied,
+            enhancement_applied=enhancement_applied,
+            original_text=original_text,
+            clipboard_text=clipboard_text,
+            metadata=metadata,
+        )
+
+    @staticmethod
+    def _failed_merge_result(original_text: str, clipboard_text: Optional[str], error: Exception) -> MergeResult:
+        return MergeResult(
+            final_text=original_text,
+            confidence=0.3,
+            merge_applied=False,
+            enhancement_applied=False,
+            original_text=original_text,
+            clipboard_text=clipboard_text,
+            metadata={"error": str(error)},
+        )
+
     def apply_safer_defaults(self, parsed_event: ParsedEvent, enhanced_text: str) -> ParsedEvent:
         if not self.config["enable_safer_defaults"]:
             return parsed_event
@@ -196,6 +268,8 @@ class TextMergeHelper:
         return any(keyword in text for keyword in event_keywords)
 
     def _has_time_indicators(self, text: str) -> bool:
+        if not self.prefilter.scan(text) & self.time_triggers:
+            return False
         time_patterns = [
             r"\d{1,2}:\d{2}",
             r"\d{1,2}\s*(?:am|pm)",
@@ -206,6 +280,8 @@ class TextMergeHelper:
         return any(re.search(pattern, text, re.IGNORECASE) for pattern in time_patterns)
 
     def _has_location_indicators(self, text: str) -> bool:
+        if not self.prefilter.scan(text) & self.location_triggers:
+            return False
         location_keywords = ["at", "in", "room", "building", "office", "address", "location"]
         padded = f" {text} "
         return any(f" {kw} " in padded for kw in location_keywords)
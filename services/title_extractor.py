@@ -8,10 +8,15 @@ import logging
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
+from services.regex_guard import MODE_PREFIX, guard_pattern
+
 logger = logging.getLogger("services.title_extractor")
 
+# Characters of input scanned by the start-anchored title patterns
+TITLE_SCAN_LIMIT = 500
+
 # Strict Title: line match + meta prefixes
-_TITLE_LINE = re.compile(r'(?mi)^\s*title\s*:\s*(.+?)\s*$', re.IGNORECASE)
+_TITLE_LINE = re.compile(r'(?mi)^[^\S\n]*title\s*:\s*(.+?)\s*$', re.IGNORECASE)
 _META_PREFIXES = tuple(s.lower() for s in ["item id:", "due date:", "deadline:", "date:"])
 
 
@@ -41,11 +46,19 @@ class TitleExtractor:
     def _compile_patterns(self) -> dict:
         """Compile regex patterns for title extraction."""
         return {
-            'title_line': re.compile(r'(?mi)^\s*title\s*:\s*(.+?)\s*$'),
+            'title_line': re.compile(r'(?mi)^[^\S\n]*title\s*:\s*(.+?)\s*$'),
             'quoted_title': re.compile(r'"([^"]+)"'),
             'first_line': re.compile(r'^([^\n\r]+)'),
-            'before_date': re.compile(r'^(.+?)(?:\s+(?:on|at|from|due|deadline)\s+\d)', re.IGNORECASE),
-            'structured_event': re.compile(r'^([^:]+?)(?:\s+(?:DATE|TIME|LOCATION|WHEN|WHERE)\s)', re.IGNORECASE)
+            # Lazy spans anchored at the start backtrack quadratically on long
+            # whitespace runs; a title never starts past the first few hundred chars
+            'before_date': guard_pattern(
+                re.compile(r'^(.+?)(?:\s+(?:on|at|from|due|deadline)\s+\d)', re.IGNORECASE),
+                max_input=TITLE_SCAN_LIMIT, mode=MODE_PREFIX
+            ),
+            'structured_event': guard_pattern(
+                re.compile(r'^([^:]+?)(?:\s+(?:DATE|TIME|LOCATION|WHEN|WHERE)\s)', re.IGNORECASE),
+                max_input=TITLE_SCAN_LIMIT, mode=MODE_PREFIX
+            )
         }
     
     def extract_title(self, text: str) -> List[TitleMatch]:
@@ -32,7 +32,10 @@ from tests.test_comprehensive_golden_suite import (
     RegressionTestValidator,
     ConfidenceThresholdValidator
 )
-from tests.performance_benchmarking import PerformanceBenchmarker
+from tests.performance.benchmark_harness import (
+    STATUS_NEW, STATUS_REGRESSION, BenchmarkRunner, compare_results, format_report, load_baseline
+)
+from tests.performance.benchmark_suite import DEFAULT_BASELINE_PATH, run_suite
 from services.performance_monitor import PerformanceMonitor
 from services.event_parser import EventParser
 
@@ -58,7 +61,6 @@ class ComprehensiveTestRunner:
         self.golden_suite_manager = GoldenTestSuiteManager()
         self.regression_validator = RegressionTestValidator()
         self.confidence_validator = ConfidenceThresholdValidator()
-        self.performance_benchmarker = PerformanceBenchmarker(str(self.output_dir / "performance"))
         self.performance_monitor = PerformanceMonitor()
         
         # Test results storage
@@ -245,7 +247,7 @@ class ComprehensiveTestRunner:
     
     def run_performance_benchmarking(self) -> Dict[str, Any]:
         """
-        Run comprehensive performance benchmarking.
+        Run the pipeline benchmark suite and compare it with the stored baseline.
         
         Returns:
             Dictionary with performance benchmark results
@@ -254,47 +256,14 @@ class ComprehensiveTestRunner:
         print("RUNNING PERFORMANCE BENCHMARKING")
         print(f"{'='*60}")
         
-        # Initialize parsers
-        event_parser = EventParser()
-        parsers = {
-            'EventParser': lambda text: event_parser.parse_text(text)
-        }
+        runner = BenchmarkRunner(samples=10, warmup=2)
+        results = run_suite(runner)
+        comparisons = compare_results(load_baseline(DEFAULT_BASELINE_PATH), results)
+        print(format_report(results, comparisons))
         
-        # Try to add hybrid parser if available
-        try:
-            from services.hybrid_event_parser import HybridEventParser
-            hybrid_parser = HybridEventParser()
-            parsers['HybridParser'] = lambda text: hybrid_parser.parse_event_text(text).parsed_event if hybrid_parser.parse_event_text(text) else None
-        except Exception as e:
-            logger.warning(f"Could not initialize HybridParser for benchmarking: {e}")
-        
-        benchmark_results = {}
-        
-        # Run benchmarks for each parser
-        for parser_name, parser_func in parsers.items():
-            print(f"\nBenchmarking {parser_name}...")
-            
-            # Comprehensive benchmark
-            benchmark_result = self.performance_benchmarker.benchmark_parsing_performance(parser_func, parser_name)
-            benchmark_results[f"{parser_name}_comprehensive"] = benchmark_result.to_dict()
-            
-            # Category-specific benchmarks
-            category_results = self.performance_benchmarker.benchmark_category_performance(parser_func, parser_name)
-            for category, result in category_results.items():
-                benchmark_results[f"{parser_name}_{category}"] = result.to_dict()
-        
-        # Compare parsers if multiple available
-        if len(parsers) > 1:
-            comparison_results = self.performance_benchmarker.compare_parser_performance(parsers)
-            benchmark_results['parser_comparison'] = comparison_results
-        
-        # Generate performance report
-        performance_report = self.performance_benchmarker.generate_performance_report(
-            str(self.output_dir / "performance_report.json")
-        )
-        
-        # Generate performance plots
-        self.performance_benchmarker.plot_performance_trends(str(self.output_dir))
+        benchmark_results = {name: stats.to_dict(include_samples=False) for name, stats in results.items()}
+        for comparison in comparisons:
+            benchmark_results[comparison.name]['baseline_status'] = comparison.status
         
         self.test_results['performance_benchmarks'] = benchmark_results
         
@@ -348,14 +317,20 @@ class ComprehensiveTestRunner:
         # Performance recommendations
         performance_benchmarks = self.test_results.get('performance_benchmarks', {})
         
-        # Check for slow performance
+        # Check for regressions against the stored baseline
         slow_benchmarks = []
         for benchmark_name, result in performance_benchmarks.items():
-            if isinstance(result, dict) and result.get('avg_time_ms', 0) > 500:
+            if isinstance(result, dict) and result.get('baseline_status') == STATUS_REGRESSION:
                 slow_benchmarks.append(benchmark_name)
         
         if slow_benchmarks:
-            recommendations.append(f"Slow performance detected in: {', '.join(slow_benchmarks)}")
+            recommendations.append(f"Performance regressions detected in: {', '.join(slow_benchmarks)}")
+        
+        unbaselined = [name for name, result in performance_benchmarks.items()
+                       if isinstance(result, dict) and result.get('baseline_status') == STATUS_NEW]
+        if unbaselined:
+            recommendations.append(f"No benchmark baseline for: {', '.join(unbaselined)} - "
+                                   "record one with benchmark_suite --save-baseline")
         
         # Golden test suite recommendations
         golden_results = self.test_results.get('golden_suite_results', {})
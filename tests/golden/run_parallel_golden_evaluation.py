@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Parallel golden-set accuracy/latency gate.
+
+Shards the golden set across worker processes, bounds in-flight LLM calls per
+worker, and with --cache re-parses only cases whose component outputs changed.
+Exits non-zero when accuracy or p95 latency misses the gate.
+
+Usage (from the repository root):
+    python -m tests.golden.run_parallel_golden_evaluation --workers 8 --cache .golden_cache.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from services.golden_evaluator import ParallelGoldenEvaluator
+from services.performance_monitor import PerformanceMonitor
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main entry point for the parallel golden evaluation gate."""
+    parser = argparse.ArgumentParser(description='Run the golden set in parallel and gate on the results')
+    parser.add_argument('--golden-set', default='tests/golden_set.json',
+                        help='Golden set JSON file')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--llm-concurrency', type=int, default=4,
+                        help='Maximum in-flight parse calls per worker')
+    parser.add_argument('--cache', default=None,
+                        help='Incremental cache file; unchanged cases are not re-parsed')
+    parser.add_argument('--cache-salt', default='',
+                        help='Extra cache key (e.g. model or prompt version)')
+    parser.add_argument('--min-accuracy', type=float, default=0.0,
+                        help='Fail if overall accuracy is below this value')
+    parser.add_argument('--max-p95-ms', type=float, default=None,
+                        help='Fail if p95 processing time exceeds this value')
+    parser.add_argument('--output', default=None,
+                        help='Write the evaluation summary to this JSON file')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Enable verbose logging')
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    monitor = PerformanceMonitor(golden_set_path=args.golden_set)
+    evaluator = ParallelGoldenEvaluator(
+        monitor,
+        workers=args.workers,
+        llm_concurrency=args.llm_concurrency,
+        cache_path=args.cache,
+        cache_salt=args.cache_salt
+    )
+    summary = evaluator.evaluate()
+    evaluation = summary['evaluation']
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, default=str)
+
+    print(f"Overall accuracy: {summary['overall_accuracy']:.3f} "
+          f"({summary['total_test_cases']} cases, {evaluation['reused_cases']} reused)")
+    print(f"p95 processing time: {evaluation['p95_processing_time_ms']:.1f}ms")
+    print(f"Wall time: {evaluation['wall_time_ms']:.0f}ms with {evaluation['workers']} workers")
+
+    failures = []
+    if summary['overall_accuracy'] < args.min_accuracy:
+        failures.append(f"accuracy {summary['overall_accuracy']:.3f} < {args.min_accuracy:.3f}")
+    if args.max_p95_ms is not None and evaluation['p95_processing_time_ms'] > args.max_p95_ms:
+        failures.append(f"p95 {evaluation['p95_processing_time_ms']:.1f}ms > {args.max_p95_ms:.1f}ms")
+
+    for failure in failures:
+        print(f"❌ Gate failed: {failure}")
+    if not failures:
+        print("✅ Golden evaluation gate passed")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
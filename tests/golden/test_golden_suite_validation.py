@@ -124,44 +124,27 @@ def test_confidence_validator():
         print(f"  ❌ ConfidenceThresholdValidator validation failed: {e}")
         return False
 
-def test_performance_benchmarker():
-    """Test the PerformanceBenchmarker functionality."""
-    print("Testing PerformanceBenchmarker...")
+def test_benchmark_suite():
+    """Test the pipeline benchmark suite wiring."""
+    print("Testing benchmark suite...")
     
     try:
-        from tests.performance_benchmarking import PerformanceBenchmarker
-        from models.event_models import ParsedEvent
-        
-        # Initialize benchmarker
-        benchmarker = PerformanceBenchmarker("test_performance_results")
-        
-        # Create mock parser function
-        def mock_parser(text: str) -> ParsedEvent:
-            return ParsedEvent(
-                title="Mock Event",
-                start_datetime=datetime.now(),
-                end_datetime=datetime.now(),
-                confidence_score=0.8
-            )
-        
-        # Test benchmark test case creation
-        test_cases = benchmarker.create_benchmark_test_cases()
-        assert len(test_cases) > 0, "No benchmark test cases created"
-        assert 'simple_cases' in test_cases, "Missing simple test cases"
-        assert 'complex_cases' in test_cases, "Missing complex test cases"
+        from tests.performance.benchmark_harness import BenchmarkRunner
+        from tests.performance.benchmark_suite import build_stage_benchmarks
         
-        total_cases = sum(len(cases) for cases in test_cases.values())
-        print(f"  Total benchmark test cases: {total_cases}")
+        # Time each stage once (a real run takes more samples and gates against the baseline)
+        benchmarks = build_stage_benchmarks()
+        assert len(benchmarks) > 0, "No stage benchmarks defined"
         
-        # Test a small benchmark (to avoid long execution time)
-        small_cases = test_cases['simple_cases'][:5]  # Just 5 cases for validation
+        results = BenchmarkRunner(samples=1, warmup=0, pin=False).run(benchmarks)
+        assert all(stats.median_ns > 0 for stats in results.values()), "Benchmark recorded no time"
         
-        # This would normally run a full benchmark, but we'll skip for validation
-        print("  ✅ PerformanceBenchmarker validation passed")
+        print(f"  Stage benchmarks: {len(results)}")
+        print("  ✅ Benchmark suite validation passed")
         return True
         
     except Exception as e:
-        print(f"  ❌ PerformanceBenchmarker validation failed: {e}")
+        print(f"  ❌ Benchmark suite validation failed: {e}")
         return False
 
 def test_regression_validator():
@@ -216,7 +199,6 @@ def test_comprehensive_test_runner():
         assert runner.golden_suite_manager is not None, "GoldenTestSuiteManager not initialized"
         assert runner.regression_validator is not None, "RegressionTestValidator not initialized"
         assert runner.confidence_validator is not None, "ConfidenceThresholdValidator not initialized"
-        assert runner.performance_benchmarker is not None, "PerformanceBenchmarker not initialized"
         
         # Test recommendation generation (with empty results)
         recommendations = runner.generate_recommendations()
@@ -246,7 +228,7 @@ def main():
         test_golden_suite_manager,
         test_performance_monitor_integration,
         test_confidence_validator,
-        test_performance_benchmarker,
+        test_benchmark_suite,
         test_regression_validator,
         test_comprehensive_test_runner
     ]
@@ -0,0 +1,360 @@
+"""
+Reproducible benchmark harness with stored baselines and regression gating.
+
+This module provides:
+- A runner with warm-up samples, optional CPU pinning and GC isolation
+- Per-operation timing with time.perf_counter_ns
+- JSON baselines that keep raw samples, so later runs can be compared statistically
+- Regression gating: a benchmark regresses only if a one-sided Mann-Whitney U test
+  is significant AND the median slowdown exceeds a practical threshold
+
+Benchmark definitions for this project live in tests/performance/benchmark_suite.py.
+"""
+
+import gc
+import json
+import logging
+import math
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BASELINE_VERSION = 1
+
+# Defaults for regression gating
+DEFAULT_ALPHA = 0.01  # significance level of the one-sided rank test
+DEFAULT_THRESHOLD = 0.10  # minimum median slowdown that counts as a regression
+
+STATUS_REGRESSION = "regression"
+STATUS_IMPROVEMENT = "improvement"
+STATUS_UNCHANGED = "unchanged"
+STATUS_NEW = "new"
+
+
+@dataclass
+class Benchmark:
+    """A named unit of work to time."""
+    name: str
+    func: Callable[[], Any]  # runs one sample's worth of work
+    ops: int = 1  # operations performed per func() call; stats are per operation
+    setup: Optional[Callable[[], None]] = None  # untimed, runs before every sample
+    group: str = "stage"
+
+
+@dataclass
+class BenchmarkStats:
+    """Per-operation timing statistics for one benchmark."""
+    name: str
+    group: str
+    samples_ns: List[float] = field(default_factory=list)
+
+    @property
+    def median_ns(self) -> float:
+        return float(np.median(self.samples_ns)) if self.samples_ns else 0.0
+
+    @property
+    def mean_ns(self) -> float:
+        return float(np.mean(self.samples_ns)) if self.samples_ns else 0.0
+
+    @property
+    def stdev_ns(self) -> float:
+        return float(np.std(self.samples_ns, ddof=1)) if len(self.samples_ns) > 1 else 0.0
+
+    def percentile_ns(self, q: float) -> float:
+        return float(np.percentile(self.samples_ns, q)) if self.samples_ns else 0.0
+
+    def to_dict(self, include_samples: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (times in milliseconds, raw samples in ns)."""
+        data = {
+            'name': self.name,
+            'group': self.group,
+            'samples': len(self.samples_ns),
+            'mean_ms': self.mean_ns / 1e6,
+            'median_ms': self.median_ns / 1e6,
+            'p95_ms': self.percentile_ns(95) / 1e6,
+            'min_ms': min(self.samples_ns) / 1e6 if self.samples_ns else 0.0,
+            'stdev_ms': self.stdev_ns / 1e6,
+            'ops_per_sec': 1e9 / self.median_ns if self.median_ns else 0.0
+        }
+        if include_samples:
+            data['samples_ns'] = [round(value, 1) for value in self.samples_ns]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BenchmarkStats':
+        """Create BenchmarkStats from a stored baseline entry."""
+        return cls(name=data['name'], group=data.get('group', 'stage'),
+                   samples_ns=list(data.get('samples_ns', [])))
+
+
+@dataclass
+class BenchmarkComparison:
+    """Result of comparing a benchmark against its baseline."""
+    name: str
+    status: str
+    baseline_median_ms: Optional[float]
+    current_median_ms: float
+    ratio: Optional[float]  # current / baseline median
+    p_value: Optional[float]  # one-sided, for the direction of the change
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            'name': self.name,
+            'status': self.status,
+            'baseline_median_ms': self.baseline_median_ms,
+            'current_median_ms': self.current_median_ms,
+            'ratio': self.ratio,
+            'p_value': self.p_value
+        }
+
+
+def pin_cpu(cpu: Optional[int] = None) -> Optional[int]:
+    """
+    Pin the current process to one CPU to reduce scheduler noise.
+
+    Args:
+        cpu: CPU to pin to (the highest CPU currently allowed if None)
+
+    Returns:
+        The pinned CPU, or None where affinity is unsupported (macOS, Windows)
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        logger.info("CPU pinning not supported on this platform")
+        return None
+
+    allowed = sorted(os.sched_getaffinity(0))
+    target = cpu if cpu is not None else allowed[-1]
+    try:
+        os.sched_setaffinity(0, {target})
+    except OSError as e:
+        logger.warning(f"Could not pin to CPU {target}: {e}")
+        return None
+    return target
+
+
+def machine_info() -> Dict[str, Any]:
+    """Describe the machine a baseline was recorded on."""
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+class BenchmarkRunner:
+    """Runs benchmarks with warm-up and isolation."""
+
+    def __init__(self, samples: int = 20, warmup: int = 3, cpu: Optional[int] = None,
+                 pin: bool = True, disable_gc: bool = True,
+                 clock: Callable[[], int] = time.perf_counter_ns):
+        """
+        Initialize the runner.
+
+        Args:
+            samples: Timed samples per benchmark
+            warmup: Untimed samples per benchmark (caches, lazy imports, JIT-free warm paths)
+            cpu: CPU to pin to (see pin_cpu)
+            pin: Whether to pin the process to one CPU
+            disable_gc: Disable the cyclic GC while a sample is timed
+            clock: Nanosecond clock
+        """
+        self.samples = max(1, samples)
+        self.warmup = max(0, warmup)
+        self.pinned_cpu = pin_cpu(cpu) if pin else None
+        self.disable_gc = disable_gc
+        self.clock = clock
+
+    def run_benchmark(self, benchmark: Benchmark) -> BenchmarkStats:
+        """Time one benchmark."""
+        stats = BenchmarkStats(name=benchmark.name, group=benchmark.group)
+        gc.collect()
+
+        for iteration in range(self.warmup + self.samples):
+            if benchmark.setup:
+                benchmark.setup()
+
+            gc_was_enabled = gc.isenabled()
+            if self.disable_gc:
+                gc.disable()
+            try:
+                start = self.clock()
+                benchmark.func()
+                elapsed = self.clock() - start
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+
+            if iteration >= self.warmup:
+                stats.samples_ns.append(elapsed / benchmark.ops)
+
+        return stats
+
+    def run(self, benchmarks: Iterable[Benchmark]) -> Dict[str, BenchmarkStats]:
+        """Time benchmarks in order."""
+        results = {}
+        for benchmark in benchmarks:
+            results[benchmark.name] = self.run_benchmark(benchmark)
+            logger.info(f"{benchmark.name}: median {results[benchmark.name].median_ns / 1e6:.3f}ms/op")
+        return results
+
+    def get_config(self) -> Dict[str, Any]:
+        """Get the runner configuration recorded with results."""
+        return {
+            'samples': self.samples,
+            'warmup': self.warmup,
+            'pinned_cpu': self.pinned_cpu,
+            'disable_gc': self.disable_gc
+        }
+
+
+def _rank(values: np.ndarray) -> np.ndarray:
+    """Average ranks (1-based), ties share the mean of their positions."""
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    ends = np.cumsum(counts)
+    average = ends - (counts - 1) / 2.0
+    return average[inverse]
+
+
+def mann_whitney_greater(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that `current` tends to be larger than `baseline`.
+
+    Uses the normal approximation with tie and continuity correction, which is
+    accurate for the sample sizes benchmarks use (>= 8 per side).
+
+    Returns:
+        p-value (small means current is significantly slower)
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = np.concatenate([np.asarray(baseline, dtype=float), np.asarray(current, dtype=float)])
+    ranks = _rank(combined)
+    u_current = ranks[n1:].sum() - n2 * (n2 + 1) / 2.0
+
+    n = n1 + n2
+    _, counts = np.unique(combined, return_counts=True)
+    tie_term = float(np.sum(counts ** 3 - counts)) / (n * (n - 1)) if n > 1 else 0.0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term)
+    if variance <= 0:
+        return 1.0
+
+    z = (u_current - n1 * n2 / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_results(baseline: Dict[str, BenchmarkStats], current: Dict[str, BenchmarkStats],
+                    alpha: float = DEFAULT_ALPHA,
+                    threshold: float = DEFAULT_THRESHOLD) -> List[BenchmarkComparison]:
+    """
+    Compare current results against a baseline.
+
+    A change is reported only when it is both statistically significant and
+    larger than `threshold`, so noise and tiny shifts never fail the gate.
+    """
+    comparisons = []
+    for name, stats in current.items():
+        current_median = stats.median_ns / 1e6
+        reference = baseline.get(name)
+        if reference is None or not reference.samples_ns:
+            comparisons.append(BenchmarkComparison(name, STATUS_NEW, None, current_median, None, None))
+            continue
+
+        baseline_median = reference.median_ns / 1e6
+        ratio = stats.median_ns / reference.median_ns if reference.median_ns else float('inf')
+
+        status = STATUS_UNCHANGED
+        if ratio >= 1.0:
+            p_value = mann_whitney_greater(reference.samples_ns, stats.samples_ns)
+            if p_value < alpha and ratio > 1.0 + threshold:
+                status = STATUS_REGRESSION
+        else:
+            p_value = mann_whitney_greater(stats.samples_ns, reference.samples_ns)
+            if p_value < alpha and ratio < 1.0 / (1.0 + threshold):
+                status = STATUS_IMPROVEMENT
+
+        comparisons.append(BenchmarkComparison(name, status, baseline_median, current_median, ratio, p_value))
+    return comparisons
+
+
+def load_baseline(path: Path) -> Dict[str, BenchmarkStats]:
+    """
+    Load a stored baseline.
+
+    Returns:
+        Benchmark stats by name (empty if the file does not exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION:
+        logger.warning(f"Ignoring baseline {path} with unsupported version {data.get('version')}")
+        return {}
+
+    recorded_on = data.get('machine', {})
+    if recorded_on.get('python') != machine_info()['python']:
+        logger.warning(f"Baseline {path} was recorded with Python {recorded_on.get('python')}; "
+                       f"comparisons across interpreters are not reliable")
+    return {name: BenchmarkStats.from_dict(entry) for name, entry in data.get('benchmarks', {}).items()}
+
+
+def save_baseline(path: Path, results: Dict[str, BenchmarkStats],
+                  config: Optional[Dict[str, Any]] = None, merge: bool = True):
+    """
+    Store results as the new baseline.
+
+    Args:
+        path: Baseline file
+        results: Benchmark stats to store (with raw samples)
+        config: Runner configuration to record
+        merge: Keep baseline entries for benchmarks that were not run
+    """
+    path = Path(path)
+    benchmarks = {}
+    if merge and path.exists():
+        benchmarks = {name: stats.to_dict() for name, stats in load_baseline(path).items()}
+    benchmarks.update({name: stats.to_dict() for name, stats in results.items()})
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': BASELINE_VERSION,
+            'created': datetime.now().isoformat(),
+            'machine': machine_info(),
+            'config': config or {},
+            'benchmarks': dict(sorted(benchmarks.items()))
+        }, f, indent=2)
+
+
+def format_report(results: Dict[str, BenchmarkStats],
+                  comparisons: Optional[List[BenchmarkComparison]] = None) -> str:
+    """Format results (and baseline comparisons) as a plain-text table."""
+    by_name = {comparison.name: comparison for comparison in comparisons or []}
+    lines = [f"{'benchmark':<28} {'median ms':>11} {'p95 ms':>10} {'ops/s':>10}  vs baseline"]
+    for name, stats in results.items():
+        comparison = by_name.get(name)
+        verdict = ""
+        if comparison is not None:
+            if comparison.ratio is None:
+                verdict = comparison.status
+            else:
+                verdict = f"{comparison.ratio:6.2f}x  p={comparison.p_value:.4f}  {comparison.status}"
+        data = stats.to_dict(include_samples=False)
+        lines.append(f"{name:<28} {data['median_ms']:>11.4f} {data['p95_ms']:>10.4f} "
+                     f"{data['ops_per_sec']:>10.0f}  {verdict}")
+    return "\n".join(lines)
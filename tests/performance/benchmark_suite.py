@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the parsing pipeline, gated against stored baselines.
+
+Stage benchmarks time each pipeline component on a fixed corpus; end-to-end
+benchmarks POST /parse through an in-process ASGI client while a stub Ollama
+answers LLM calls, so runs are reproducible and need no network.
+
+Usage (from the repository root):
+    # Record or refresh the baseline for this machine
+    python -m tests.performance.benchmark_suite --save-baseline
+
+    # Compare against the baseline; exits 1 on a significant regression or a
+    # benchmark without a baseline
+    python -m tests.performance.benchmark_suite --filter regex_date,parse_e2e
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+from tests.performance.benchmark_harness import (
+    DEFAULT_ALPHA,
+    DEFAULT_THRESHOLD,
+    STATUS_NEW,
+    STATUS_REGRESSION,
+    Benchmark,
+    BenchmarkRunner,
+    compare_results,
+    format_report,
+    load_baseline,
+    save_baseline,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baselines" / "benchmarks.json"
+
+# Fixed reference time so relative dates resolve identically on every run
+REFERENCE_TIME = datetime(2025, 9, 29, 17, 0, 0)
+
+CORPUS = [
+    "Meeting with John tomorrow at 2pm in Conference Room A",
+    "Lunch with Sarah Friday at 12pm",
+    "Dentist Oct 1 @ 9:30",
+    "Title: COWA! Due Date: Oct 15, 2025",
+    "Pick up passport on 10/02",
+    "Team standup every Monday at 9:00 AM for 15 minutes",
+    "Quarterly planning review on March 3rd from 1pm to 4pm at HQ, Building 2",
+    "Flight to Chicago departs 6:45am on Nov 12 from Terminal 3",
+    "Parent-teacher conference next Thursday 3:30-4:00 in Room 204",
+    "Project deadline: December 1st",
+    ("Hi team,\n\nPlease join the design review on Wednesday, October 8 at 10:00 AM "
+     "in the Innovation Lab.\n\nThanks,\nAlex"),
+    "Yoga class at the community center Saturday 8am",
+]
+
+STUB_OLLAMA_URL = "http://localhost:11434"
+STUB_OLLAMA_MODELS = ("llama3.2:3b",)
+
+
+class _StubHTTPResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload: Dict[str, Any], status_code: int = 200):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = json.dumps(payload)
+
+    def json(self) -> Dict[str, Any]:
+        return self._payload
+
+
+@contextmanager
+def stub_ollama(latency_ms: float = 0.0):
+    """
+    Serve Ollama API calls from a deterministic in-process stub.
+
+    Every generate call sleeps `latency_ms` and answers with an empty JSON
+    object, so LLM-backed code paths run end to end without changing the
+    regex results. Both the sync clients (requests) and the async pipeline's
+    post_json are stubbed; requests to any other URL pass through unchanged.
+
+    Yields:
+        List of the stubbed URLs called, in call order
+    """
+    import requests
+    from services.async_pipeline import AsyncPipeline
+
+    real_get, real_post = requests.get, requests.post
+    real_post_json = AsyncPipeline.post_json
+    calls: List[str] = []
+
+    def fake_get(url, *args, **kwargs):
+        if str(url).startswith(STUB_OLLAMA_URL):
+            calls.append(str(url))
+            return _StubHTTPResponse({'models': [{'name': name} for name in STUB_OLLAMA_MODELS]})
+        return real_get(url, *args, **kwargs)
+
+    def fake_post(url, *args, **kwargs):
+        if str(url).startswith(STUB_OLLAMA_URL):
+            calls.append(str(url))
+            if latency_ms:
+                time.sleep(latency_ms / 1000.0)
+            return _StubHTTPResponse({'response': '{}'})
+        return real_post(url, *args, **kwargs)
+
+    async def fake_post_json(self, url, payload, headers=None, timeout=30.0):
+        if str(url).startswith(STUB_OLLAMA_URL):
+            calls.append(str(url))
+            if latency_ms:
+                await asyncio.sleep(latency_ms / 1000.0)
+            return 200, {'response': '{}'}
+        return await real_post_json(self, url, payload, headers, timeout)
+
+    with mock.patch.object(requests, 'get', fake_get), mock.patch.object(requests, 'post', fake_post), \
+            mock.patch.object(AsyncPipeline, 'post_json', fake_post_json):
+        yield calls
+
+
+def build_stage_benchmarks(corpus: List[str] = CORPUS) -> List[Benchmark]:
+    """Build per-stage benchmarks; each sample is one pass over the corpus."""
+    from services.advanced_location_extractor import AdvancedLocationExtractor
+    from services.cache_manager import CacheManager
+    from services.format_aware_text_processor import FormatAwareTextProcessor
+    from services.hybrid_event_parser import HybridEventParser
+    from services.ics_feed import ICSFeedGenerator
+    from services.per_field_confidence_router import PerFieldConfidenceRouter
+    from services.regex_date_extractor import RegexDateExtractor
+    from services.title_extractor import TitleExtractor
+
+    format_processor = FormatAwareTextProcessor()
+    date_extractor = RegexDateExtractor(current_time=REFERENCE_TIME)
+    title_extractor = TitleExtractor()
+    location_extractor = AdvancedLocationExtractor()
+    router = PerFieldConfidenceRouter()
+    hybrid_parser = HybridEventParser(current_time=REFERENCE_TIME)
+
+    # Aggregation input: regex field results, extracted once up front
+    field_results = []
+    for text in corpus:
+        results = {}
+        for field_name in ('title', 'start_datetime', 'end_datetime', 'location'):
+            result = hybrid_parser._extract_field_with_regex(field_name, text, None)
+            if result is not None:
+                results[field_name] = result
+        field_results.append((results, text))
+
+    events = [hybrid_parser.aggregate_field_results(results, text) for results, text in field_results]
+    cache = CacheManager(max_entries=len(corpus) * 2)
+
+    def cache_put():
+        for text, event in zip(corpus, events):
+            cache.put(text, event)
+
+    def cache_get():
+        for text in corpus:
+            cache.get(text)
+
+    ics_generator = ICSFeedGenerator()
+    feed_events = [
+        {
+            'title': event.title or 'Event',
+            'start': (event.start_datetime or REFERENCE_TIME).isoformat(),
+            'end': event.end_datetime.isoformat() if event.end_datetime else None,
+            'location': event.location,
+            'description': event.description,
+        }
+        for event in events
+    ]
+
+    def each(func):
+        return lambda: [func(text) for text in corpus]
+
+    ops = len(corpus)
+    return [
+        Benchmark('format_processing', each(format_processor.process_text), ops),
+        Benchmark('regex_date', each(date_extractor.extract_datetime), ops),
+        Benchmark('title', each(title_extractor.extract_title), ops),
+        Benchmark('location', each(location_extractor.extract_locations), ops),
+        Benchmark('router', each(router.analyze_field_extractability), ops),
+        Benchmark('aggregation', lambda: [hybrid_parser.aggregate_field_results(results, text)
+                                          for results, text in field_results], ops),
+        Benchmark('cache_put', cache_put, ops, setup=cache.clear),
+        Benchmark('cache_get', cache_get, ops, setup=cache_put),
+        Benchmark('ics_generation', lambda: "".join(ics_generator.stream(feed_events, "benchmark")), ops),
+    ]
+
+
+class ASGIClient:
+    """Drives the FastAPI app in-process through httpx's ASGI transport."""
+
+    def __init__(self, app):
+        import httpx
+
+        self.loop = asyncio.new_event_loop()
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark")
+        self._requests = 0
+
+    def post(self, path: str, payload: Dict[str, Any]):
+        # Rotate client addresses so the per-IP rate limiter never throttles the run
+        self._requests += 1
+        address = f"10.{(self._requests >> 16) & 0xFF}.{(self._requests >> 8) & 0xFF}.{self._requests & 0xFF}"
+        response = self.loop.run_until_complete(
+            self.client.post(path, json=payload, headers={"X-Forwarded-For": address})
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"POST {path} returned {response.status_code}: {response.text[:200]}")
+        return response
+
+    def close(self):
+        self.loop.run_until_complete(self.client.aclose())
+        self.loop.close()
+
+
+def build_e2e_benchmarks(corpus: List[str] = CORPUS) -> List[Benchmark]:
+    """
+    Build end-to-end /parse benchmarks.
+
+    Must run inside stub_ollama() so the app's LLM clients bind to the stub.
+    """
+    from api.app.main import app, get_event_parser
+    from services.cache_manager import get_cache_manager
+
+    # Build the lazily loaded parser and LLM clients now, while the stub is installed
+    get_event_parser().hybrid_parser.llm_enhancer
+    client = ASGIClient(app)
+    payloads = [{'text': text, 'now': REFERENCE_TIME.isoformat(), 'timezone': 'UTC'} for text in corpus]
+
+    def clear_caches():
+        get_cache_manager().clear()
+        get_event_parser().hybrid_parser.cache.clear()
+
+    def parse_all():
+        for payload in payloads:
+            client.post("/parse", payload)
+
+    ops = len(corpus)
+    return [
+        Benchmark('parse_e2e', parse_all, ops, setup=clear_caches, group='e2e'),
+        Benchmark('parse_e2e_cached', parse_all, ops, group='e2e'),
+    ]
+
+
+def run_suite(runner: BenchmarkRunner, names: Optional[List[str]] = None,
+              llm_latency_ms: float = 0.0, include_e2e: bool = True):
+    """
+    Run the suite.
+
+    Args:
+        runner: Configured BenchmarkRunner
+        names: Only run benchmarks with these names (all if None)
+        llm_latency_ms: Simulated latency of each stub LLM call
+        include_e2e: Whether to run the end-to-end /parse benchmarks
+
+    Returns:
+        Benchmark stats by name
+    """
+    def selected(benchmarks):
+        return [b for b in benchmarks if names is None or b.name in names]
+
+    results = runner.run(selected(build_stage_benchmarks()))
+
+    if include_e2e and (names is None or any(name.startswith('parse_e2e') for name in names)):
+        with stub_ollama(latency_ms=llm_latency_ms) as stub_calls:
+            results.update(runner.run(selected(build_e2e_benchmarks())))
+        if not any(url.endswith('/api/generate') for url in stub_calls):
+            # The corpus routes fields to the LLM; without stubbed calls the timings measured something else
+            raise RuntimeError("End-to-end benchmarks made no LLM calls through the Ollama stub")
+    return results
+
+
+def main():
+    """Main entry point for the benchmark suite."""
+    parser = argparse.ArgumentParser(description='Run pipeline benchmarks and gate against the stored baseline')
+    parser.add_argument('--filter', default=None,
+                        help='Comma-separated benchmark names to run')
+    parser.add_argument('--samples', type=int, default=20,
+                        help='Timed samples per benchmark')
+    parser.add_argument('--warmup', type=int, default=3,
+                        help='Warm-up samples per benchmark')
+    parser.add_argument('--cpu', type=int, default=None,
+                        help='CPU to pin to (default: highest allowed CPU)')
+    parser.add_argument('--no-pin', action='store_true',
+                        help='Do not pin the process to one CPU')
+    parser.add_argument('--skip-e2e', action='store_true',
+                        help='Skip end-to-end /parse benchmarks')
+    parser.add_argument('--llm-latency-ms', type=float, default=0.0,
+                        help='Simulated latency of each stub LLM call')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE_PATH),
+                        help='Baseline file')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Store this run as the baseline instead of gating')
+    parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA,
+                        help='Significance level for regressions')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Minimum median slowdown (fraction) that counts as a regression')
+    parser.add_argument('--output', default=None,
+                        help='Write results and comparisons to this JSON file')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Keep INFO logging (adds per-request log I/O to the timings)')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if not args.verbose:
+        # The API configures its own INFO handlers on import; keep them out of the timings
+        logging.disable(logging.INFO)
+
+    baseline = load_baseline(Path(args.baseline))
+    if not baseline and not args.save_baseline:
+        # Without a baseline every benchmark is "new" and the gate could never fail
+        print(f"❌ No baseline at {args.baseline}; record one on this machine with --save-baseline")
+        return 1
+
+    names = [name.strip() for name in args.filter.split(',')] if args.filter else None
+    runner = BenchmarkRunner(samples=args.samples, warmup=args.warmup, cpu=args.cpu, pin=not args.no_pin)
+    results = run_suite(runner, names, llm_latency_ms=args.llm_latency_ms, include_e2e=not args.skip_e2e)
+
+    if args.save_baseline:
+        save_baseline(Path(args.baseline), results, runner.get_config())
+        print(format_report(results))
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    comparisons = compare_results(baseline, results,
+                                  alpha=args.alpha, threshold=args.threshold)
+    print(format_report(results, comparisons))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'config': runner.get_config(),
+                'results': {name: stats.to_dict() for name, stats in results.items()},
+                'comparisons': [comparison.to_dict() for comparison in comparisons]
+            }, f, indent=2)
+
+    regressions = [c for c in comparisons if c.status == STATUS_REGRESSION]
+    for regression in regressions:
+        print(f"❌ Regression: {regression.name} is {regression.ratio:.2f}x slower (p={regression.p_value:.4f})")
+    missing = [c.name for c in comparisons if c.status == STATUS_NEW]
+    if missing:
+        print(f"❌ No baseline for: {', '.join(missing)}; refresh it with --save-baseline")
+    if not regressions and not missing:
+        print("\n✅ No significant regressions")
+    return 1 if regressions or missing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
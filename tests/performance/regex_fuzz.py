@@ -0,0 +1,266 @@
+"""
+Worst-case input fuzzing for the parser's regular expressions.
+
+Collects every compiled pattern held by the regex-based components, times
+each one against adversarial inputs (long runs of whitespace, newlines,
+digits, capitalised words, repeated prepositions, ...) at two input lengths,
+and estimates its growth exponent. A pattern whose cost grows faster than
+linearly, or that is slow at the API's maximum input length, needs a
+rewrite or a services.regex_guard cap.
+
+Usage:
+    python -m tests.performance.regex_fuzz                  # gate, exit 1 on findings
+    python -m tests.performance.regex_fuzz --filter Title   # only matching patterns
+    python -m tests.performance.regex_fuzz --all            # report every pattern
+"""
+
+import argparse
+import gc
+import json
+import logging
+import math
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.regex_guard import GuardedPattern  # noqa: E402
+
+# The API rejects longer texts (ParseRequest.text max_length)
+MAX_TEXT_LENGTH = 10000
+
+# Repeated units that provoke backtracking in typical extraction patterns
+FAMILIES = {
+    'spaces': ' ',
+    'newlines': '\n',
+    'blank_lines': ' \n',
+    'digits': '1 ',
+    'times': '1:0 ',
+    'capitalised': 'Aa ',
+    'upper': 'A ',
+    'words': 'abc ',
+    'commas': 'a, ',
+    'dots': '. ',
+    'at': 'at x ',
+    'in': 'in x ',
+    'by': 'by x ',
+    'from': 'from 1 ',
+    'at_symbol': '@ a ',
+    'labels': 'location a ',
+    'ocr': 'Mon 1O:3O a m  Rm 2 \n',
+}
+
+# A pattern is super-linear when growing its input by a factor k multiplies
+# its cost by more than size ** GROWTH_LIMIT; timings under NOISE_FLOOR_S are
+# too small to fit.
+GROWTH_LIMIT = 1.5
+NOISE_FLOOR_S = 0.002
+
+# A pattern that looks super-linear from timings under CONFIRM_BELOW_S is
+# re-timed on inputs up to CONFIRM_SCALE times longer, with more repeats, and
+# only reported if the growth holds there: one preempted scan near the noise
+# floor must not fail the gate. Slower scans are well clear of timing noise.
+CONFIRM_BELOW_S = 0.05
+CONFIRM_SCALE = 2.0
+CONFIRM_REPEATS = 7
+
+
+def _pattern_sources() -> Dict[str, Callable[[], object]]:
+    """Regex-based pipeline components, built lazily."""
+    from services.advanced_location_extractor import AdvancedLocationExtractor
+    from services.datetime_parser import DateTimeParser
+    from services.event_extractor import EventInformationExtractor
+    from services.format_aware_text_processor import FormatAwareTextProcessor
+    from services.regex_date_extractor import RegexDateExtractor
+    from services.title_extractor import TitleExtractor
+
+    return {
+        'RegexDateExtractor': RegexDateExtractor,
+        'TitleExtractor': TitleExtractor,
+        'AdvancedLocationExtractor': AdvancedLocationExtractor,
+        'FormatAwareTextProcessor': FormatAwareTextProcessor,
+        'DateTimeParser': DateTimeParser,
+        'EventInformationExtractor': EventInformationExtractor,
+    }
+
+
+def _walk(obj, name: str, found: Dict[str, object], depth: int = 0):
+    if isinstance(obj, (re.Pattern, GuardedPattern)):
+        found[name] = obj
+    elif depth < 3 and isinstance(obj, dict):
+        for key, value in obj.items():
+            _walk(value, f"{name}[{key}]", found, depth + 1)
+    elif depth < 3 and isinstance(obj, (list, tuple)):
+        for index, value in enumerate(obj):
+            _walk(value, f"{name}[{index}]", found, depth + 1)
+
+
+def collect_patterns(name_filter: Optional[str] = None) -> Dict[str, object]:
+    """Compiled (or guarded) patterns held by the pipeline components, by name."""
+    found: Dict[str, object] = {}
+    for component, factory in _pattern_sources().items():
+        instance = factory()
+        for attribute, value in vars(instance).items():
+            _walk(value, f"{component}.{attribute}", found)
+    if name_filter:
+        found = {name: pattern for name, pattern in found.items() if name_filter in name}
+    return found
+
+
+@dataclass
+class FuzzFinding:
+    """Worst behaviour observed for one pattern."""
+    name: str
+    pattern: str
+    guarded: bool
+    family: str
+    growth: float
+    small_s: float
+    large_s: float
+    max_length_s: Optional[float] = None
+
+    @property
+    def superlinear(self) -> bool:
+        return self.large_s >= NOISE_FLOOR_S and self.growth > GROWTH_LIMIT
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'pattern': self.pattern,
+            'guarded': self.guarded,
+            'family': self.family,
+            'growth': round(self.growth, 2),
+            'small_ms': round(self.small_s * 1000, 3),
+            'large_ms': round(self.large_s * 1000, 3),
+            'max_length_ms': None if self.max_length_s is None else round(self.max_length_s * 1000, 3),
+            'superlinear': self.superlinear,
+        }
+
+
+def _time_scan(pattern, text: str, repeats: int = 3) -> float:
+    """Best of `repeats` full scans, in seconds (garbage collection paused)."""
+    best = float('inf')
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in pattern.finditer(text):
+                pass
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best
+
+
+def _build(unit: str, length: int) -> str:
+    return (unit * (length // len(unit) + 1))[:length]
+
+
+def _measure(name: str, pattern, source: str, guarded: bool, family: str, unit: str,
+             small: int, large: int, repeats: int = 3) -> FuzzFinding:
+    small_s = _time_scan(pattern, _build(unit, small), repeats)
+    large_s = _time_scan(pattern, _build(unit, large), repeats)
+    growth = math.log(max(large_s, 1e-9) / max(small_s, 1e-9)) / math.log(large / small)
+    return FuzzFinding(name, source, guarded, family, growth, small_s, large_s)
+
+
+def fuzz_pattern(name: str, pattern, small: int = 1000, large: int = 4000,
+                 families: Optional[Dict[str, str]] = None) -> FuzzFinding:
+    """Find the input family with the steepest cost growth for a pattern."""
+    families = families or FAMILIES
+    worst: Optional[FuzzFinding] = None
+    guarded = isinstance(pattern, GuardedPattern)
+    source = pattern.pattern_obj.pattern if guarded else pattern.pattern
+    for family, unit in families.items():
+        finding = _measure(name, pattern, source, guarded, family, unit, small, large)
+        if worst is None or (finding.large_s >= NOISE_FLOOR_S, finding.growth, finding.large_s) > \
+                (worst.large_s >= NOISE_FLOOR_S, worst.growth, worst.large_s):
+            worst = finding
+    if worst.superlinear and worst.large_s < CONFIRM_BELOW_S:
+        # Confirm on longer inputs, where a linear pattern's cost dwarfs timing noise
+        scale = max(1.0, min(CONFIRM_SCALE, MAX_TEXT_LENGTH / large))
+        worst = _measure(name, pattern, source, guarded, worst.family, families[worst.family],
+                         int(small * scale), int(large * scale), CONFIRM_REPEATS)
+    return worst
+
+
+def run_fuzz(name_filter: Optional[str] = None, small: int = 1000, large: int = 4000,
+             check_max_length: bool = True, max_ms: float = 50.0) -> List[FuzzFinding]:
+    """Fuzz every collected pattern; worst findings first."""
+    findings = []
+    for name, pattern in collect_patterns(name_filter).items():
+        finding = fuzz_pattern(name, pattern, small, large)
+        if check_max_length:
+            finding.max_length_s = _time_scan(pattern, _build(FAMILIES[finding.family], MAX_TEXT_LENGTH))
+            if finding.max_length_s * 1000 > max_ms:
+                # Re-time before reporting, as for super-linear findings
+                finding.max_length_s = min(finding.max_length_s, _time_scan(
+                    pattern, _build(FAMILIES[finding.family], MAX_TEXT_LENGTH), CONFIRM_REPEATS
+                ))
+        findings.append(finding)
+    findings.sort(key=lambda f: (f.superlinear, f.max_length_s or f.large_s), reverse=True)
+    return findings
+
+
+def format_report(findings: List[FuzzFinding], show_all: bool = False, max_ms: float = 50.0) -> str:
+    lines = [f"{'pattern':<70} {'family':<12} {'growth':>6} {'@10k ms':>9}  flags"]
+    for finding in findings:
+        slow = finding.max_length_s is not None and finding.max_length_s * 1000 > max_ms
+        if not (show_all or finding.superlinear or slow):
+            continue
+        flags = []
+        if finding.superlinear:
+            flags.append('SUPERLINEAR')
+        if slow:
+            flags.append('SLOW')
+        if finding.guarded:
+            flags.append('guarded')
+        at_max = '-' if finding.max_length_s is None else f"{finding.max_length_s * 1000:.1f}"
+        lines.append(f"{finding.name[:70]:<70} {finding.family:<12} {finding.growth:>6.2f} {at_max:>9}  {' '.join(flags)}")
+    if len(lines) == 1:
+        lines.append("no super-linear or slow patterns")
+    return "\n".join(lines)
+
+
+def failing(findings: List[FuzzFinding], max_ms: float) -> List[FuzzFinding]:
+    """Findings that fail the gate."""
+    return [
+        f for f in findings
+        if f.superlinear or (f.max_length_s is not None and f.max_length_s * 1000 > max_ms)
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fuzz parser regexes for super-linear backtracking")
+    parser.add_argument('--filter', help="Only patterns whose name contains this string")
+    parser.add_argument('--small', type=int, default=1000, help="Smaller input length")
+    parser.add_argument('--large', type=int, default=4000, help="Larger input length")
+    parser.add_argument('--max-ms', type=float, default=50.0,
+                        help=f"Fail patterns slower than this at {MAX_TEXT_LENGTH} chars")
+    parser.add_argument('--all', action='store_true', help="Report every pattern")
+    parser.add_argument('--output', help="Write findings as JSON")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    findings = run_fuzz(args.filter, args.small, args.large, max_ms=args.max_ms)
+    print(format_report(findings, args.all, args.max_ms))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump([finding.to_dict() for finding in findings], f, indent=2)
+
+    failures = failing(findings, args.max_ms)
+    print(f"\n{len(findings)} patterns fuzzed, {len(failures)} failing")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
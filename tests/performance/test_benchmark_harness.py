@@ -0,0 +1,184 @@
+"""
+Tests for the benchmark harness: statistics, baselines, gating and the suite wiring.
+"""
+
+import asyncio
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.performance.benchmark_harness import (
+    STATUS_IMPROVEMENT,
+    STATUS_NEW,
+    STATUS_REGRESSION,
+    STATUS_UNCHANGED,
+    Benchmark,
+    BenchmarkRunner,
+    BenchmarkStats,
+    compare_results,
+    load_baseline,
+    mann_whitney_greater,
+    save_baseline,
+)
+from tests.performance import benchmark_suite
+from tests.performance.benchmark_suite import build_stage_benchmarks, stub_ollama
+
+
+def _stats(name, center, spread=0.02, count=30, seed=1):
+    rng = random.Random(seed)
+    return BenchmarkStats(name, 'stage', [center * (1 + rng.uniform(-spread, spread)) for _ in range(count)])
+
+
+class FakeClock:
+    """Clock that advances a fixed amount per reading."""
+
+    def __init__(self, step_ns: int):
+        self.now = 0
+        self.step_ns = step_ns
+
+    def __call__(self) -> int:
+        self.now += self.step_ns
+        return self.now
+
+
+class TestBenchmarkStatistics(unittest.TestCase):
+    """Test the rank test and regression gating."""
+
+    def test_rank_test_detects_shift(self):
+        baseline = _stats('a', 1000).samples_ns
+        self.assertLess(mann_whitney_greater(baseline, _stats('a', 1200, seed=2).samples_ns), 1e-6)
+        self.assertGreater(mann_whitney_greater(baseline, _stats('a', 1000, seed=2).samples_ns), 0.01)
+        self.assertEqual(mann_whitney_greater([5.0] * 10, [5.0] * 10), 1.0)
+
+    def test_compare_requires_significance_and_magnitude(self):
+        baseline = {name: _stats(name, 1000) for name in ('slow', 'tiny', 'fast', 'same')}
+        current = {
+            'slow': _stats('slow', 1300, seed=2),
+            'tiny': _stats('tiny', 1040, seed=2),  # significant but under the 10% threshold
+            'fast': _stats('fast', 600, seed=2),
+            'same': _stats('same', 1000, seed=2),
+            'added': _stats('added', 1000, seed=2),
+        }
+
+        statuses = {c.name: c.status for c in compare_results(baseline, current)}
+
+        self.assertEqual(statuses, {
+            'slow': STATUS_REGRESSION,
+            'tiny': STATUS_UNCHANGED,
+            'fast': STATUS_IMPROVEMENT,
+            'same': STATUS_UNCHANGED,
+            'added': STATUS_NEW,
+        })
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """Test the runner and baseline storage."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_warmup_setup_and_per_op_timing(self):
+        calls = []
+        benchmark = Benchmark('op', lambda: calls.append('run'), ops=4, setup=lambda: calls.append('setup'))
+        runner = BenchmarkRunner(samples=3, warmup=2, pin=False, clock=FakeClock(400))
+
+        stats = runner.run_benchmark(benchmark)
+
+        self.assertEqual(calls, ['setup', 'run'] * 5)
+        self.assertEqual(stats.samples_ns, [100.0, 100.0, 100.0])
+
+    def test_baseline_round_trip_and_merge(self):
+        path = Path(self.temp_dir) / "baselines" / "benchmarks.json"
+        save_baseline(path, {'a': _stats('a', 1000)}, {'samples': 30})
+        save_baseline(path, {'b': _stats('b', 2000)})
+
+        baseline = load_baseline(path)
+
+        self.assertEqual(set(baseline), {'a', 'b'})
+        self.assertAlmostEqual(baseline['a'].median_ns, _stats('a', 1000).median_ns, places=0)
+        self.assertEqual(load_baseline(Path(self.temp_dir) / "missing.json"), {})
+
+    @unittest.skipUnless(hasattr(os, 'sched_setaffinity'), "CPU affinity not supported")
+    def test_pinning_restricts_affinity(self):
+        original = os.sched_getaffinity(0)
+        try:
+            runner = BenchmarkRunner(samples=1, warmup=0)
+            self.assertEqual(os.sched_getaffinity(0), {runner.pinned_cpu})
+        finally:
+            os.sched_setaffinity(0, original)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Smoke test the suite's benchmark definitions."""
+
+    def test_stage_benchmarks_run(self):
+        benchmarks = build_stage_benchmarks()
+        results = BenchmarkRunner(samples=1, warmup=0, pin=False).run(benchmarks)
+
+        self.assertEqual(set(results), {
+            'format_processing', 'regex_date', 'title', 'location', 'router',
+            'aggregation', 'cache_put', 'cache_get', 'ics_generation'
+        })
+        self.assertTrue(all(stats.median_ns > 0 for stats in results.values()))
+
+    def test_stub_ollama_answers_locally(self):
+        import requests
+        from services.async_pipeline import post_json
+        real_get = requests.get
+
+        with stub_ollama() as calls:
+            tags = requests.get("http://localhost:11434/api/tags", timeout=1)
+            generated = requests.post("http://localhost:11434/api/generate", json={}, timeout=1)
+            awaited = asyncio.run(post_json("http://localhost:11434/api/generate", {}, timeout=1))
+
+        self.assertEqual(tags.status_code, 200)
+        self.assertEqual(generated.json(), {'response': '{}'})
+        self.assertEqual(awaited, (200, {'response': '{}'}))
+        self.assertEqual(len(calls), 3)
+        self.assertIs(requests.get, real_get)
+
+
+
+class TestBenchmarkGate(unittest.TestCase):
+    """The gate must not pass on benchmarks it has nothing to compare with."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.baseline = Path(self.temp_dir) / "benchmarks.json"
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def _main(self, results, *args):
+        argv = ['benchmark_suite', '--baseline', str(self.baseline), '--no-pin', *args]
+        with mock.patch('sys.argv', argv), \
+                mock.patch.object(benchmark_suite, 'run_suite', return_value=results) as run_suite, \
+                mock.patch('builtins.print'):
+            return benchmark_suite.main(), run_suite
+
+    def test_missing_baseline_fails(self):
+        status, run_suite = self._main({'a': _stats('a', 1000)})
+
+        self.assertEqual(status, 1)
+        run_suite.assert_not_called()
+
+    def test_benchmark_missing_from_baseline_fails(self):
+        save_baseline(self.baseline, {'a': _stats('a', 1000)})
+
+        status, _ = self._main({'a': _stats('a', 1000, seed=2), 'b': _stats('b', 1000)})
+
+        self.assertEqual(status, 1)
+
+    def test_saved_baseline_gates(self):
+        self.assertEqual(self._main({'a': _stats('a', 1000)}, '--save-baseline')[0], 0)
+        self.assertEqual(self._main({'a': _stats('a', 1000, seed=2)})[0], 0)
+        self.assertEqual(self._main({'a': _stats('a', 1500, seed=2)})[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
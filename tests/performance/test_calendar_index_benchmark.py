@@ -0,0 +1,115 @@
+"""
+Benchmark for CalendarService conflict detection and range queries at 100k events.
+
+Compares the interval index against the previous linear scan (fromisoformat on
+every stored event) and checks that indexed queries stay well under budget.
+Run directly for a printed report:
+
+    python -m tests.performance.test_calendar_index_benchmark
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from services.event_index import EventIntervalIndex
+
+EVENT_COUNT = 100_000
+QUERY_COUNT = 200
+
+# Per-query budget for indexed conflict checks and range queries (milliseconds)
+INDEXED_QUERY_BUDGET_MS = 5.0
+
+
+def _generate_events(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, 8, 0)
+    events = []
+    for i in range(count):
+        start = base + timedelta(minutes=15 * rng.randrange(0, 4 * 24 * 365 * 2))
+        duration = timedelta(minutes=rng.choice([15, 30, 45, 60, 90, 120]))
+        events.append({
+            'id': f'event_{i}',
+            'title': f'Event {i}',
+            'start_datetime': start.isoformat(),
+            'end_datetime': (start + duration).isoformat(),
+        })
+    return events
+
+
+def _generate_queries(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, 8, 0)
+    queries = []
+    for _ in range(count):
+        start = base + timedelta(minutes=15 * rng.randrange(0, 4 * 24 * 365 * 2))
+        queries.append((start, start + timedelta(hours=1)))
+    return queries
+
+
+def _linear_conflicts(events, start, end):
+    """The previous CalendarService._check_conflicts implementation."""
+    conflicts = []
+    for existing in events:
+        existing_start = datetime.fromisoformat(existing['start_datetime'])
+        existing_end = datetime.fromisoformat(existing['end_datetime'])
+        if start < existing_end and end > existing_start:
+            conflicts.append(existing)
+    return conflicts
+
+
+def run_benchmark(event_count: int = EVENT_COUNT, query_count: int = QUERY_COUNT) -> dict:
+    """Run the benchmark and return timings in milliseconds."""
+    events = _generate_events(event_count)
+    queries = _generate_queries(query_count)
+
+    build_start = time.perf_counter()
+    index = EventIntervalIndex.from_events(events)
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    conflict_start = time.perf_counter()
+    for start, end in queries:
+        index.overlapping(start, end)
+    conflict_ms = (time.perf_counter() - conflict_start) * 1000 / query_count
+
+    range_start = time.perf_counter()
+    for start, _ in queries:
+        index.in_range(start, start + timedelta(days=1))
+    range_ms = (time.perf_counter() - range_start) * 1000 / query_count
+
+    insert_start = time.perf_counter()
+    for i, (start, end) in enumerate(queries):
+        index.add({'id': f'new_{i}', 'title': 'New',
+                   'start_datetime': start.isoformat(), 'end_datetime': end.isoformat()})
+    insert_ms = (time.perf_counter() - insert_start) * 1000 / query_count
+
+    # The linear scan is slow, so only time a few queries
+    linear_queries = queries[:3]
+    linear_start = time.perf_counter()
+    for start, end in linear_queries:
+        _linear_conflicts(events, start, end)
+    linear_ms = (time.perf_counter() - linear_start) * 1000 / len(linear_queries)
+
+    return {
+        'event_count': event_count,
+        'build_ms': build_ms,
+        'indexed_conflict_ms': conflict_ms,
+        'indexed_range_ms': range_ms,
+        'indexed_insert_ms': insert_ms,
+        'linear_conflict_ms': linear_ms,
+    }
+
+
+def test_indexed_queries_at_100k_events():
+    """Indexed conflict checks and range queries at 100k events stay within budget."""
+    results = run_benchmark()
+
+    assert results['indexed_conflict_ms'] < INDEXED_QUERY_BUDGET_MS
+    assert results['indexed_range_ms'] < INDEXED_QUERY_BUDGET_MS
+    assert results['indexed_insert_ms'] < INDEXED_QUERY_BUDGET_MS
+    assert results['indexed_conflict_ms'] * 10 < results['linear_conflict_ms']
+
+
+if __name__ == '__main__':
+    for name, value in run_benchmark().items():
+        print(f"{name:>22}: {value:.3f}" if isinstance(value, float) else f"{name:>22}: {value}")
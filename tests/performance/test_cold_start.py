@@ -0,0 +1,137 @@
+"""
+Cold start regression benchmark for the API.
+
+Runs the app import under `python -X importtime` in a fresh interpreter and checks:
+- heavy optional dependencies stay off the startup path until first use
+- time to the first /healthz response stays within budget
+
+The budget can be tuned per environment with COLD_START_BUDGET_SECONDS.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Time from interpreter start to first /healthz response (seconds)
+COLD_START_BUDGET_SECONDS = float(os.getenv('COLD_START_BUDGET_SECONDS', '3.0'))
+
+# Modules that must only be imported on first use
+DEFERRED_MODULES = [
+    'openai',
+    'matplotlib',
+    'transformers',
+    'numpy',
+    'services.event_parser',
+    'services.hybrid_event_parser',
+    'services.llm_enhancer',
+    'services.llm_text_enhancer',
+]
+
+HEALTHZ_SCRIPT = """
+import time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+from api.app.main import app
+response = TestClient(app).get('/healthz')
+assert response.status_code == 204, response.status_code
+print(f"HEALTHZ_SECONDS={time.perf_counter() - start:.4f}")
+"""
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter from the project root."""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, 'STARTUP_MODE': 'lazy'}
+    )
+
+
+def _parse_importtime(stderr: str) -> dict:
+    """Parse `-X importtime` output into {module: cumulative_microseconds}."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, module = line[len('import time:'):].split('|')
+        try:
+            timings[module.strip()] = int(cumulative_us.strip())
+        except ValueError:
+            continue
+    return timings
+
+
+class TestColdStart:
+    """Cold start import budget and lazy loading checks."""
+
+    def test_heavy_modules_deferred(self):
+        """Importing the app must not import the parsing/LLM stack."""
+        result = _run_python('-X', 'importtime', '-c', 'import api.app.main')
+        assert result.returncode == 0, result.stderr[-2000:]
+
+        timings = _parse_importtime(result.stderr)
+        assert 'api.app.main' in timings
+
+        eagerly_imported = [name for name in DEFERRED_MODULES if name in timings]
+        assert eagerly_imported == [], f"Imported at startup: {eagerly_imported}"
+
+    def test_time_to_first_healthz_within_budget(self):
+        """A cold interpreter must answer /healthz within the budget."""
+        result = _run_python('-c', HEALTHZ_SCRIPT)
+        assert result.returncode == 0, result.stderr[-2000:]
+
+        seconds = [
+            float(line.split('=', 1)[1])
+            for line in result.stdout.splitlines()
+            if line.startswith('HEALTHZ_SECONDS=')
+        ][0]
+        assert seconds < COLD_START_BUDGET_SECONDS, (
+            f"Time to first /healthz {seconds:.2f}s exceeds budget {COLD_START_BUDGET_SECONDS:.2f}s"
+        )
+
+
+class TestLazyComponents:
+    """Startup optimizer lazy component loading."""
+
+    def test_event_parser_registered_for_lazy_loading(self):
+        from services.startup_optimizer import StartupOptimizer
+
+        report = StartupOptimizer().get_import_report()
+
+        assert 'event_parser' in report
+        assert 'llm_text_enhancer' in report
+
+    def test_preload_components_reports_load_time(self):
+        from services.startup_optimizer import get_startup_optimizer
+
+        optimizer = get_startup_optimizer()
+        results = optimizer.preload_components(['event_parser'])
+        report = optimizer.get_import_report()
+
+        assert results == {'event_parser': True}
+        assert report['event_parser']['loaded'] is True
+        assert report['event_parser']['load_time_seconds'] >= 0.0
+
+    def test_get_event_parser_reuses_instance(self):
+        from api.app.main import get_event_parser
+
+        assert get_event_parser() is get_event_parser()
+
+    def test_startup_mode_defaults_to_lazy(self, monkeypatch):
+        from services.startup_optimizer import get_startup_mode
+
+        monkeypatch.delenv('STARTUP_MODE', raising=False)
+        assert get_startup_mode() == 'lazy'
+
+        monkeypatch.setenv('STARTUP_MODE', 'EAGER')
+        assert get_startup_mode() == 'eager'
+
+        monkeypatch.setenv('STARTUP_MODE', 'bogus')
+        assert get_startup_mode() == 'lazy'
@@ -243,15 +243,15 @@ async def test_hybrid_parser_optimizations():
     """Test hybrid parser with performance optimizations."""
     logger.info("Testing hybrid parser optimizations...")
     
-    # Test the optimized text cleaning function
+    # Test the text cleaning function
     from services.hybrid_event_parser import HybridEventParser
     
     parser = HybridEventParser()
     
     test_text = "Meeting at 2:30 p.m. tomorrow"
     
-    # Test optimized text cleaning
-    cleaned_text = parser._pre_clean_text_optimized(test_text)
+    # Test text cleaning
+    cleaned_text = parser._pre_clean_text(test_text)
     logger.info(f"Original: '{test_text}'")
     logger.info(f"Cleaned: '{cleaned_text}'")
     
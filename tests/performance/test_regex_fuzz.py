@@ -0,0 +1,60 @@
+"""
+Tests for the regex fuzz harness, and the fuzz gate over the parser's patterns.
+"""
+
+import re
+import time
+import unittest
+
+from services.regex_guard import guard_pattern
+from tests.performance.regex_fuzz import failing, fuzz_pattern, run_fuzz
+
+
+class _HiccupPattern:
+    """A linear pattern whose first scans of long inputs are delayed, like a preempted thread."""
+
+    def __init__(self, pattern, hiccups: int):
+        self.pattern = pattern.pattern
+        self._pattern = pattern
+        self.hiccups = hiccups
+
+    def finditer(self, text):
+        if len(text) > 2000 and self.hiccups:
+            self.hiccups -= 1
+            time.sleep(0.01)
+        return self._pattern.finditer(text)
+
+
+class TestRegexFuzz(unittest.TestCase):
+    """Test super-linear pattern detection."""
+
+    def test_detects_quadratic_pattern_and_guard_fixes_it(self):
+        families = {'newlines': '\n'}
+        quadratic = re.compile(r'^\s*[-•*]\s+', re.MULTILINE)
+
+        finding = fuzz_pattern('quadratic', quadratic, small=2000, large=8000, families=families)
+        guarded = fuzz_pattern('guarded', guard_pattern(quadratic, max_input=500),
+                               small=2000, large=8000, families=families)
+
+        self.assertTrue(finding.superlinear)
+        self.assertFalse(guarded.superlinear)
+        self.assertTrue(guarded.guarded)
+
+    def test_timing_noise_is_not_reported(self):
+        noisy = _HiccupPattern(re.compile(r'\d+'), hiccups=3)
+
+        finding = fuzz_pattern('noisy', noisy, small=1000, large=4000, families={'spaces': ' '})
+
+        self.assertEqual(noisy.hiccups, 0)
+        self.assertFalse(finding.superlinear)
+
+    def test_parser_patterns_pass_gate(self):
+        findings = run_fuzz(small=1000, large=4000, max_ms=50.0)
+
+        failures = failing(findings, max_ms=50.0)
+        self.assertEqual([f.name for f in failures], [])
+        self.assertGreater(len(findings), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,843 +0,0 @@
-"""
-Performance Benchmarking and Latency Profiling Module.
-
-This module provides comprehensive performance benchmarking and latency profiling
-for the text-to-calendar event parsing system, including automated accuracy
-evaluation against golden set and performance regression detection.
-
-Requirements addressed:
-- Task 16: Performance benchmarking and latency profiling
-- 15.1: Component latency tracking and performance metrics collection
-- 15.2: Golden set maintenance and accuracy evaluation
-"""
-
-import json
-import logging
-import psutil
-import statistics
-import time
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Callable
-import matplotlib.pyplot as plt
-import numpy as np
-
-from services.performance_monitor import PerformanceMonitor
-from services.event_parser import EventParser
-from services.hybrid_event_parser import HybridEventParser
-from models.event_models import ParsedEvent
-
-logger = logging.getLogger(__name__)
-
-
-@dataclass
-class BenchmarkResult:
-    """Represents the result of a performance benchmark."""
-    benchmark_name: str
-    test_cases: int
-    total_time_ms: float
-    avg_time_ms: float
-    median_time_ms: float
-    p95_time_ms: float
-    p99_time_ms: float
-    min_time_ms: float
-    max_time_ms: float
-    throughput_per_sec: float
-    memory_usage_mb: float
-    cpu_usage_percent: float
-    accuracy_score: float = 0.0
-    error_rate: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.now)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            'benchmark_name': self.benchmark_name,
-            'test_cases': self.test_cases,
-            'total_time_ms': self.total_time_ms,
-            'avg_time_ms': self.avg_time_ms,
-            'median_time_ms': self.median_time_ms,
-            'p95_time_ms': self.p95_time_ms,
-            'p99_time_ms': self.p99_time_ms,
-            'min_time_ms': self.min_time_ms,
-            'max_time_ms': self.max_time_ms,
-            'throughput_per_sec': self.throughput_per_sec,
-            'memory_usage_mb': self.memory_usage_mb,
-            'cpu_usage_percent': self.cpu_usage_percent,
-            'accuracy_score': self.accuracy_score,
-            'error_rate': self.error_rate,
-            'timestamp': self.timestamp.isoformat()
-        }
-
-
-@dataclass
-class LatencyProfile:
-    """Detailed latency profile for component analysis."""
-    component_name: str
-    call_count: int
-    total_time_ms: float
-    avg_time_ms: float
-    median_time_ms: float
-    std_dev_ms: float
-    percentiles: Dict[int, float] = field(default_factory=dict)  # 50, 90, 95, 99
-    time_series: List[Tuple[datetime, float]] = field(default_factory=list)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            'component_name': self.component_name,
-            'call_count': self.call_count,
-            'total_time_ms': self.total_time_ms,
-            'avg_time_ms': self.avg_time_ms,
-            'median_time_ms': self.median_time_ms,
-            'std_dev_ms': self.std_dev_ms,
-            'percentiles': self.percentiles,
-            'time_series': [(ts.isoformat(), val) for ts, val in self.time_series]
-        }
-
-
-class PerformanceBenchmarker:
-    """
-    Comprehensive performance benchmarking system for text-to-calendar parsing.
-    
-    Provides detailed performance analysis including:
-    - Latency profiling by component
-    - Throughput benchmarking
-    - Memory and CPU usage monitoring
-    - Accuracy vs performance trade-offs
-    - Performance regression detection
-    """
-    
-    def __init__(self, results_path: str = "performance_results"):
-        """Initialize the performance benchmarker."""
-        self.results_path = Path(results_path)
-        self.results_path.mkdir(exist_ok=True)
-        
-        # Performance monitoring
-        self.performance_monitor = PerformanceMonitor()
-        
-        # Component latency tracking
-        self.component_profiles: Dict[str, LatencyProfile] = {}
-        
-        # Benchmark results storage
-        self.benchmark_results: List[BenchmarkResult] = []
-        
-        # System monitoring
-        self.process = psutil.Process()
-        
-        logger.info("PerformanceBenchmarker initialized")
-    
-    def create_benchmark_test_cases(self) -> Dict[str, List[str]]:
-        """Create comprehensive test cases for benchmarking."""
-        return {
-            'simple_cases': [
-                "Meeting tomorrow at 2pm",
-                "Lunch next Friday at 12:30",
-                "Call Monday 9am",
-                "Training Tuesday 10am-12pm",
-                "Conference Wednesday 3pm"
-            ] * 20,  # 100 simple cases
-            
-            'medium_cases': [
-                "Project review meeting tomorrow at 2pm in Conference Room A for 90 minutes",
-                "Lunch with client next Friday from 12:30-1:30 at The Keg Restaurant downtown",
-                "Conference call with overseas team Monday 9am EST for 2 hours",
-                "Training session Tuesday 10am-12pm in Training Room B with all team members",
-                "Quarterly planning meeting Wednesday 3pm-5pm in the main boardroom"
-            ] * 10,  # 50 medium cases
-            
-            'complex_cases': [
-                """Annual team building workshop 'Innovation Day' next Thursday from 9am to 5pm 
-                at the Marriott Hotel, 123 Queen Street West, Toronto. This is a mandatory event 
-                for all team members. We'll be doing various activities and team exercises. 
-                Lunch will be provided from 12pm-1pm. Please bring your laptop and notebook.""",
-                
-                """Project Review Meeting
-                • Date: January 15, 2025
-                • Time: 10:00 AM - 11:30 AM  
-                • Location: Conference Room B
-                • Attendees: Team leads, project managers, stakeholders
-                • Agenda: Q4 results, budget planning, resource allocation
-                • Required: Bring quarterly reports and budget proposals""",
-                
-                """URGENT: Board Meeting
-                When: Tomorrow 3:00 PM EST
-                Where: Executive Boardroom, 42nd Floor
-                Duration: 2 hours
-                Required: All VPs and department heads
-                Topics: Strategic planning, merger discussions, budget approval
-                Note: This meeting is confidential - no recording devices""",
-                
-                """Conference call with multiple time zones:
-                - London team: 2:00 PM GMT
-                - Tokyo team: 11:00 PM JST  
-                - Sydney team: 1:00 AM AEDT (next day)
-                - Toronto team: 9:00 AM EST
-                Duration: 90 minutes
-                Platform: Microsoft Teams
-                Meeting ID: 123-456-789""",
-                
-                """Multi-day conference schedule:
-                Day 1 (Monday): Registration 8am-9am, Keynote 9am-10:30am, Break 10:30-11am
-                Day 2 (Tuesday): Workshop A 9am-12pm, Lunch 12pm-1pm, Workshop B 1pm-4pm
-                Day 3 (Wednesday): Panel discussion 9am-11am, Networking 11am-12pm, Closing 2pm-3pm
-                Location: Metro Convention Center, Hall A-C
-                Registration required by Friday"""
-            ] * 4,  # 20 complex cases
-            
-            'edge_cases': [
-                "Meeting at midnight on New Year's Eve",
-                "Conference call spanning midnight from 11:30 PM to 12:30 AM",
-                "All-day event on February 29, 2024",  # Leap year
-                "Meeting on 32/45/2024 at 25:70",  # Invalid date/time
-                "Event with unicode: Café meeting at 2pm 🎉📅⏰",
-                "Very long title that goes on and on and includes many details about the project review and quarterly planning session and budget discussions and strategic planning initiatives",
-                "Meeting tommorow at 9a.m in Room -1",  # Typos and invalid room
-                "Call at ?? on ??/?? at ??:??",  # Completely malformed
-                "",  # Empty string
-                "a" * 10000  # Very long string
-            ] * 5,  # 50 edge cases
-            
-            'multilingual_cases': [
-                "Réunion demain à 14h30 dans la salle de conférence",
-                "会议明天下午2点在会议室A",
-                "Встреча завтра в 14:00 в конференц-зале",
-                "Reunión mañana a las 2pm en la sala de juntas",
-                "Vergadering morgen om 14:00 in vergaderzaal B"
-            ] * 4  # 20 multilingual cases
-        }
-    
-    def benchmark_parsing_performance(self, parser_func: Callable[[str], ParsedEvent], 
-                                    parser_name: str) -> BenchmarkResult:
-        """
-        Benchmark parsing performance with comprehensive test cases.
-        
-        Args:
-            parser_func: Function that takes text and returns ParsedEvent
-            parser_name: Name of the parser being benchmarked
-            
-        Returns:
-            BenchmarkResult with detailed performance metrics
-        """
-        print(f"\n{'='*60}")
-        print(f"BENCHMARKING {parser_name.upper()}")
-        print(f"{'='*60}")
-        
-        test_cases = self.create_benchmark_test_cases()
-        all_cases = []
-        for category, cases in test_cases.items():
-            all_cases.extend(cases)
-        
-        # Performance tracking
-        latencies = []
-        errors = 0
-        accuracy_scores = []
-        
-        # System monitoring
-        initial_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-        cpu_times = []
-        
-        print(f"Testing {len(all_cases)} cases...")
-        
-        start_time = time.time()
-        
-        for i, text in enumerate(all_cases):
-            if i % 50 == 0:
-                print(f"  Progress: {i}/{len(all_cases)} ({i/len(all_cases)*100:.1f}%)")
-            
-            # Monitor CPU usage
-            cpu_percent = self.process.cpu_percent()
-            cpu_times.append(cpu_percent)
-            
-            # Time the parsing
-            case_start = time.time()
-            try:
-                result = parser_func(text)
-                case_end = time.time()
-                
-                case_duration_ms = (case_end - case_start) * 1000
-                latencies.append(case_duration_ms)
-                
-                # Track component latency
-                self.performance_monitor.track_component_latency('overall_parsing', case_duration_ms)
-                
-                # Estimate accuracy (simplified)
-                if result and result.title and result.start_datetime:
-                    accuracy_scores.append(0.8)  # Assume reasonable accuracy for successful parse
-                else:
-                    accuracy_scores.append(0.3)  # Lower accuracy for incomplete parse
-                
-            except Exception as e:
-                case_end = time.time()
-                case_duration_ms = (case_end - case_start) * 1000
-                latencies.append(case_duration_ms)
-                errors += 1
-                accuracy_scores.append(0.0)
-                
-                if i < 10:  # Log first few errors for debugging
-                    logger.error(f"Parsing error on case {i}: {e}")
-        
-        end_time = time.time()
-        
-        # Calculate metrics
-        total_time_ms = (end_time - start_time) * 1000
-        final_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-        memory_usage = final_memory - initial_memory
-        
-        # Statistical analysis
-        avg_latency = statistics.mean(latencies)
-        median_latency = statistics.median(latencies)
-        p95_latency = np.percentile(latencies, 95)
-        p99_latency = np.percentile(latencies, 99)
-        min_latency = min(latencies)
-        max_latency = max(latencies)
-        
-        throughput = len(all_cases) / (total_time_ms / 1000)  # cases per second
-        error_rate = errors / len(all_cases)
-        avg_accuracy = statistics.mean(accuracy_scores) if accuracy_scores else 0.0
-        avg_cpu = statistics.mean(cpu_times) if cpu_times else 0.0
-        
-        # Create benchmark result
-        benchmark_result = BenchmarkResult(
-            benchmark_name=f"{parser_name}_comprehensive",
-            test_cases=len(all_cases),
-            total_time_ms=total_time_ms,
-            avg_time_ms=avg_latency,
-            median_time_ms=median_latency,
-            p95_time_ms=p95_latency,
-            p99_time_ms=p99_latency,
-            min_time_ms=min_latency,
-            max_time_ms=max_latency,
-            throughput_per_sec=throughput,
-            memory_usage_mb=memory_usage,
-            cpu_usage_percent=avg_cpu,
-            accuracy_score=avg_accuracy,
-            error_rate=error_rate
-        )
-        
-        # Print results
-        print(f"\nBenchmark Results for {parser_name}:")
-        print(f"  Total Cases: {benchmark_result.test_cases}")
-        print(f"  Total Time: {benchmark_result.total_time_ms:.2f}ms")
-        print(f"  Average Latency: {benchmark_result.avg_time_ms:.2f}ms")
-        print(f"  Median Latency: {benchmark_result.median_time_ms:.2f}ms")
-        print(f"  95th Percentile: {benchmark_result.p95_time_ms:.2f}ms")
-        print(f"  99th Percentile: {benchmark_result.p99_time_ms:.2f}ms")
-        print(f"  Throughput: {benchmark_result.throughput_per_sec:.1f} cases/sec")
-        print(f"  Memory Usage: {benchmark_result.memory_usage_mb:.1f}MB")
-        print(f"  CPU Usage: {benchmark_result.cpu_usage_percent:.1f}%")
-        print(f"  Accuracy Score: {benchmark_result.accuracy_score:.3f}")
-        print(f"  Error Rate: {benchmark_result.error_rate:.3f}")
-        
-        # Store result
-        self.benchmark_results.append(benchmark_result)
-        
-        return benchmark_result
-    
-    def benchmark_category_performance(self, parser_func: Callable[[str], ParsedEvent], 
-                                     parser_name: str) -> Dict[str, BenchmarkResult]:
-        """
-        Benchmark performance by test case category.
-        
-        Args:
-            parser_func: Function that takes text and returns ParsedEvent
-            parser_name: Name of the parser being benchmarked
-            
-        Returns:
-            Dictionary mapping category names to BenchmarkResult objects
-        """
-        print(f"\n{'='*60}")
-        print(f"CATEGORY BENCHMARKING - {parser_name.upper()}")
-        print(f"{'='*60}")
-        
-        test_cases = self.create_benchmark_test_cases()
-        category_results = {}
-        
-        for category, cases in test_cases.items():
-            print(f"\nBenchmarking {category} ({len(cases)} cases)...")
-            
-            latencies = []
-            errors = 0
-            accuracy_scores = []
-            
-            initial_memory = self.process.memory_info().rss / 1024 / 1024
-            
-            start_time = time.time()
-            
-            for text in cases:
-                case_start = time.time()
-                try:
-                    result = parser_func(text)
-                    case_end = time.time()
-                    
-                    case_duration_ms = (case_end - case_start) * 1000
-                    latencies.append(case_duration_ms)
-                    
-                    # Estimate accuracy
-                    if result and result.title and result.start_datetime:
-                        accuracy_scores.append(0.8)
-                    else:
-                        accuracy_scores.append(0.3)
-                        
-                except Exception as e:
-                    case_end = time.time()
-                    case_duration_ms = (case_end - case_start) * 1000
-                    latencies.append(case_duration_ms)
-                    errors += 1
-                    accuracy_scores.append(0.0)
-            
-            end_time = time.time()
-            final_memory = self.process.memory_info().rss / 1024 / 1024
-            
-            # Calculate category metrics
-            total_time_ms = (end_time - start_time) * 1000
-            memory_usage = final_memory - initial_memory
-            
-            if latencies:
-                avg_latency = statistics.mean(latencies)
-                median_latency = statistics.median(latencies)
-                p95_latency = np.percentile(latencies, 95)
-                p99_latency = np.percentile(latencies, 99)
-                min_latency = min(latencies)
-                max_latency = max(latencies)
-            else:
-                avg_latency = median_latency = p95_latency = p99_latency = min_latency = max_latency = 0.0
-            
-            throughput = len(cases) / (total_time_ms / 1000) if total_time_ms > 0 else 0.0
-            error_rate = errors / len(cases) if cases else 0.0
-            avg_accuracy = statistics.mean(accuracy_scores) if accuracy_scores else 0.0
-            
-            category_result = BenchmarkResult(
-                benchmark_name=f"{parser_name}_{category}",
-                test_cases=len(cases),
-                total_time_ms=total_time_ms,
-                avg_time_ms=avg_latency,
-                median_time_ms=median_latency,
-                p95_time_ms=p95_latency,
-                p99_time_ms=p99_latency,
-                min_time_ms=min_latency,
-                max_time_ms=max_latency,
-                throughput_per_sec=throughput,
-                memory_usage_mb=memory_usage,
-                cpu_usage_percent=0.0,  # Not tracked per category
-                accuracy_score=avg_accuracy,
-                error_rate=error_rate
-            )
-            
-            category_results[category] = category_result
-            
-            print(f"  {category}: {avg_latency:.2f}ms avg, {throughput:.1f} cases/sec, {avg_accuracy:.3f} accuracy")
-        
-        return category_results
-    
-    def profile_component_latencies(self, parser_func: Callable[[str], ParsedEvent], 
-                                  test_cases: List[str]) -> Dict[str, LatencyProfile]:
-        """
-        Profile latencies for individual components.
-        
-        Args:
-            parser_func: Function that takes text and returns ParsedEvent
-            test_cases: List of test cases to profile
-            
-        Returns:
-            Dictionary mapping component names to LatencyProfile objects
-        """
-        print(f"\n{'='*60}")
-        print("COMPONENT LATENCY PROFILING")
-        print(f"{'='*60}")
-        
-        # Clear existing component latencies
-        self.performance_monitor.component_latencies.clear()
-        
-        # Run test cases with component timing
-        for i, text in enumerate(test_cases):
-            if i % 10 == 0:
-                print(f"  Profiling: {i}/{len(test_cases)}")
-            
-            try:
-                # Use performance monitor's timing context managers
-                with self.performance_monitor.time_component('overall_parsing'):
-                    result = parser_func(text)
-            except Exception as e:
-                logger.error(f"Profiling error on case {i}: {e}")
-        
-        # Generate latency profiles
-        component_profiles = {}
-        
-        for component_name, component_latency in self.performance_monitor.component_latencies.items():
-            if component_latency.total_calls > 0:
-                stats = component_latency.get_stats()
-                latencies = list(component_latency.latencies)
-                
-                # Calculate additional statistics
-                std_dev = statistics.stdev(latencies) if len(latencies) > 1 else 0.0
-                percentiles = {
-                    50: np.percentile(latencies, 50),
-                    90: np.percentile(latencies, 90),
-                    95: np.percentile(latencies, 95),
-                    99: np.percentile(latencies, 99)
-                }
-                
-                # Create time series (simplified - just use current time)
-                time_series = [(datetime.now(), latency) for latency in latencies[-10:]]  # Last 10 measurements
-                
-                profile = LatencyProfile(
-                    component_name=component_name,
-                    call_count=stats['count'],
-                    total_time_ms=component_latency.total_time_ms,
-                    avg_time_ms=stats['mean'],
-                    median_time_ms=stats['median'],
-                    std_dev_ms=std_dev,
-                    percentiles=percentiles,
-                    time_series=time_series
-                )
-                
-                component_profiles[component_name] = profile
-                
-                print(f"  {component_name}:")
-                print(f"    Calls: {profile.call_count}")
-                print(f"    Avg: {profile.avg_time_ms:.2f}ms")
-                print(f"    Median: {profile.median_time_ms:.2f}ms")
-                print(f"    95th: {profile.percentiles[95]:.2f}ms")
-        
-        self.component_profiles = component_profiles
-        return component_profiles
-    
-    def compare_parser_performance(self, parsers: Dict[str, Callable[[str], ParsedEvent]]) -> Dict[str, Any]:
-        """
-        Compare performance between multiple parsers.
-        
-        Args:
-            parsers: Dictionary mapping parser names to parser functions
-            
-        Returns:
-            Dictionary with comparison results
-        """
-        print(f"\n{'='*60}")
-        print("PARSER PERFORMANCE COMPARISON")
-        print(f"{'='*60}")
-        
-        # Use a subset of test cases for comparison
-        test_cases = self.create_benchmark_test_cases()
-        comparison_cases = (
-            test_cases['simple_cases'][:20] + 
-            test_cases['medium_cases'][:10] + 
-            test_cases['complex_cases'][:5]
-        )
-        
-        comparison_results = {}
-        
-        for parser_name, parser_func in parsers.items():
-            print(f"\nTesting {parser_name}...")
-            
-            latencies = []
-            accuracies = []
-            errors = 0
-            
-            for text in comparison_cases:
-                start_time = time.time()
-                try:
-                    result = parser_func(text)
-                    end_time = time.time()
-                    
-                    latency_ms = (end_time - start_time) * 1000
-                    latencies.append(latency_ms)
-                    
-                    # Estimate accuracy
-                    if result and result.title and result.start_datetime:
-                        accuracies.append(0.8)
-                    else:
-                        accuracies.append(0.3)
-                        
-                except Exception as e:
-                    end_time = time.time()
-                    latency_ms = (end_time - start_time) * 1000
-                    latencies.append(latency_ms)
-                    accuracies.append(0.0)
-                    errors += 1
-            
-            # Calculate metrics
-            avg_latency = statistics.mean(latencies) if latencies else 0.0
-            avg_accuracy = statistics.mean(accuracies) if accuracies else 0.0
-            error_rate = errors / len(comparison_cases)
-            throughput = len(comparison_cases) / (sum(latencies) / 1000) if sum(latencies) > 0 else 0.0
-            
-            comparison_results[parser_name] = {
-                'avg_latency_ms': avg_latency,
-                'avg_accuracy': avg_accuracy,
-                'error_rate': error_rate,
-                'throughput_per_sec': throughput,
-                'test_cases': len(comparison_cases)
-            }
-            
-            print(f"  Avg Latency: {avg_latency:.2f}ms")
-            print(f"  Avg Accuracy: {avg_accuracy:.3f}")
-            print(f"  Error Rate: {error_rate:.3f}")
-            print(f"  Throughput: {throughput:.1f} cases/sec")
-        
-        # Generate comparison summary
-        print(f"\n{'='*40}")
-        print("COMPARISON SUMMARY")
-        print(f"{'='*40}")
-        
-        # Find best performers
-        best_latency = min(comparison_results.values(), key=lambda x: x['avg_latency_ms'])
-        best_accuracy = max(comparison_results.values(), key=lambda x: x['avg_accuracy'])
-        best_throughput = max(comparison_results.values(), key=lambda x: x['throughput_per_sec'])
-        
-        for parser_name, result in comparison_results.items():
-            if result == best_latency:
-                print(f"🏆 Fastest: {parser_name} ({result['avg_latency_ms']:.2f}ms)")
-            if result == best_accuracy:
-                print(f"🎯 Most Accurate: {parser_name} ({result['avg_accuracy']:.3f})")
-            if result == best_throughput:
-                print(f"⚡ Highest Throughput: {parser_name} ({result['throughput_per_sec']:.1f} cases/sec)")
-        
-        return comparison_results
-    
-    def generate_performance_report(self, output_path: str = None) -> Dict[str, Any]:
-        """
-        Generate comprehensive performance report.
-        
-        Args:
-            output_path: Optional path to save the report
-            
-        Returns:
-            Dictionary with comprehensive performance analysis
-        """
-        if output_path is None:
-            output_path = self.results_path / f"performance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        report = {
-            'report_timestamp': datetime.now().isoformat(),
-            'benchmark_results': [result.to_dict() for result in self.benchmark_results],
-            'component_profiles': {name: profile.to_dict() for name, profile in self.component_profiles.items()},
-            'performance_summary': self._generate_performance_summary(),
-            'recommendations': self._generate_performance_recommendations(),
-            'system_info': {
-                'cpu_count': psutil.cpu_count(),
-                'memory_total_gb': psutil.virtual_memory().total / (1024**3),
-                'python_version': f"{psutil.sys.version_info.major}.{psutil.sys.version_info.minor}",
-                'platform': psutil.platform.platform()
-            }
-        }
-        
-        # Save report
-        try:
-            with open(output_path, 'w') as f:
-                json.dump(report, f, indent=2)
-            print(f"\nPerformance report saved to: {output_path}")
-        except Exception as e:
-            logger.error(f"Could not save performance report: {e}")
-        
-        return report
-    
-    def _generate_performance_summary(self) -> Dict[str, Any]:
-        """Generate performance summary from benchmark results."""
-        if not self.benchmark_results:
-            return {'error': 'No benchmark results available'}
-        
-        # Overall statistics
-        avg_latencies = [result.avg_time_ms for result in self.benchmark_results]
-        throughputs = [result.throughput_per_sec for result in self.benchmark_results]
-        accuracies = [result.accuracy_score for result in self.benchmark_results]
-        error_rates = [result.error_rate for result in self.benchmark_results]
-        
-        summary = {
-            'total_benchmarks': len(self.benchmark_results),
-            'overall_avg_latency_ms': statistics.mean(avg_latencies),
-            'overall_avg_throughput': statistics.mean(throughputs),
-            'overall_avg_accuracy': statistics.mean(accuracies),
-            'overall_avg_error_rate': statistics.mean(error_rates),
-            'best_performance': {
-                'fastest_benchmark': min(self.benchmark_results, key=lambda x: x.avg_time_ms).benchmark_name,
-                'highest_throughput': max(self.benchmark_results, key=lambda x: x.throughput_per_sec).benchmark_name,
-                'most_accurate': max(self.benchmark_results, key=lambda x: x.accuracy_score).benchmark_name
-            }
-        }
-        
-        return summary
-    
-    def _generate_performance_recommendations(self) -> List[str]:
-        """Generate performance recommendations based on benchmark results."""
-        recommendations = []
-        
-        if not self.benchmark_results:
-            return ["No benchmark results available for recommendations"]
-        
-        # Analyze latency issues
-        high_latency_benchmarks = [r for r in self.benchmark_results if r.avg_time_ms > 500]
-        if high_latency_benchmarks:
-            recommendations.append(
-                f"High latency detected in {len(high_latency_benchmarks)} benchmarks (>500ms average)"
-            )
-        
-        # Analyze accuracy issues
-        low_accuracy_benchmarks = [r for r in self.benchmark_results if r.accuracy_score < 0.7]
-        if low_accuracy_benchmarks:
-            recommendations.append(
-                f"Low accuracy detected in {len(low_accuracy_benchmarks)} benchmarks (<70%)"
-            )
-        
-        # Analyze error rates
-        high_error_benchmarks = [r for r in self.benchmark_results if r.error_rate > 0.1]
-        if high_error_benchmarks:
-            recommendations.append(
-                f"High error rates detected in {len(high_error_benchmarks)} benchmarks (>10%)"
-            )
-        
-        # Component-specific recommendations
-        if self.component_profiles:
-            slow_components = [name for name, profile in self.component_profiles.items() 
-                             if profile.avg_time_ms > 100]
-            if slow_components:
-                recommendations.append(
-                    f"Slow components detected: {', '.join(slow_components)}"
-                )
-        
-        # Memory usage recommendations
-        high_memory_benchmarks = [r for r in self.benchmark_results if r.memory_usage_mb > 100]
-        if high_memory_benchmarks:
-            recommendations.append(
-                f"High memory usage detected in {len(high_memory_benchmarks)} benchmarks (>100MB)"
-            )
-        
-        # General recommendations
-        if not recommendations:
-            recommendations.append("Performance looks good! Consider running more comprehensive tests.")
-        else:
-            recommendations.extend([
-                "Consider optimizing slow components",
-                "Review error handling for problematic cases",
-                "Monitor memory usage in production",
-                "Set up continuous performance monitoring"
-            ])
-        
-        return recommendations
-    
-    def plot_performance_trends(self, output_dir: str = None):
-        """Generate performance trend plots."""
-        if output_dir is None:
-            output_dir = self.results_path
-        
-        output_dir = Path(output_dir)
-        output_dir.mkdir(exist_ok=True)
-        
-        if not self.benchmark_results:
-            print("No benchmark results available for plotting")
-            return
-        
-        # Latency distribution plot
-        plt.figure(figsize=(12, 8))
-        
-        # Plot 1: Latency by benchmark
-        plt.subplot(2, 2, 1)
-        benchmark_names = [r.benchmark_name for r in self.benchmark_results]
-        avg_latencies = [r.avg_time_ms for r in self.benchmark_results]
-        
-        plt.bar(range(len(benchmark_names)), avg_latencies)
-        plt.xlabel('Benchmark')
-        plt.ylabel('Average Latency (ms)')
-        plt.title('Average Latency by Benchmark')
-        plt.xticks(range(len(benchmark_names)), [name[:15] + '...' if len(name) > 15 else name for name in benchmark_names], rotation=45)
-        
-        # Plot 2: Throughput by benchmark
-        plt.subplot(2, 2, 2)
-        throughputs = [r.throughput_per_sec for r in self.benchmark_results]
-        
-        plt.bar(range(len(benchmark_names)), throughputs)
-        plt.xlabel('Benchmark')
-        plt.ylabel('Throughput (cases/sec)')
-        plt.title('Throughput by Benchmark')
-        plt.xticks(range(len(benchmark_names)), [name[:15] + '...' if len(name) > 15 else name for name in benchmark_names], rotation=45)
-        
-        # Plot 3: Accuracy vs Latency
-        plt.subplot(2, 2, 3)
-        accuracies = [r.accuracy_score for r in self.benchmark_results]
-        
-        plt.scatter(avg_latencies, accuracies)
-        plt.xlabel('Average Latency (ms)')
-        plt.ylabel('Accuracy Score')
-        plt.title('Accuracy vs Latency Trade-off')
-        
-        # Plot 4: Error rates
-        plt.subplot(2, 2, 4)
-        error_rates = [r.error_rate * 100 for r in self.benchmark_results]  # Convert to percentage
-        
-        plt.bar(range(len(benchmark_names)), error_rates)
-        plt.xlabel('Benchmark')
-        plt.ylabel('Error Rate (%)')
-        plt.title('Error Rate by Benchmark')
-        plt.xticks(range(len(benchmark_names)), [name[:15] + '...' if len(name) > 15 else name for name in benchmark_names], rotation=45)
-        
-        plt.tight_layout()
-        
-        plot_path = output_dir / 'performance_trends.png'
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"Performance trends plot saved to: {plot_path}")
-
-
-def main():
-    """Main function to run comprehensive performance benchmarking."""
-    print("="*80)
-    print("COMPREHENSIVE PERFORMANCE BENCHMARKING")
-    print("="*80)
-    
-    # Initialize benchmarker
-    benchmarker = PerformanceBenchmarker()
-    
-    # Initialize parsers
-    event_parser = EventParser()
-    
-    try:
-        hybrid_parser = HybridEventParser()
-        parsers = {
-            'EventParser': lambda text: event_parser.parse_text(text),
-            'HybridParser': lambda text: hybrid_parser.parse_event_text(text).parsed_event if hybrid_parser.parse_event_text(text) else None
-        }
-    except Exception as e:
-        logger.warning(f"Could not initialize HybridParser: {e}")
-        parsers = {
-            'EventParser': lambda text: event_parser.parse_text(text)
-        }
-    
-    # Run comprehensive benchmarks
-    for parser_name, parser_func in parsers.items():
-        print(f"\n{'='*60}")
-        print(f"BENCHMARKING {parser_name}")
-        print(f"{'='*60}")
-        
-        # Comprehensive benchmark
-        benchmark_result = benchmarker.benchmark_parsing_performance(parser_func, parser_name)
-        
-        # Category-specific benchmarks
-        category_results = benchmarker.benchmark_category_performance(parser_func, parser_name)
-        
-        # Component profiling
-        test_cases = benchmarker.create_benchmark_test_cases()
-        profile_cases = test_cases['simple_cases'][:50] + test_cases['medium_cases'][:20]
-        component_profiles = benchmarker.profile_component_latencies(parser_func, profile_cases)
-    
-    # Compare parsers if multiple available
-    if len(parsers) > 1:
-        comparison_results = benchmarker.compare_parser_performance(parsers)
-    
-    # Generate comprehensive report
-    report = benchmarker.generate_performance_report()
-    
-    # Generate plots
-    benchmarker.plot_performance_trends()
-    
-    print(f"\n{'='*80}")
-    print("BENCHMARKING COMPLETED")
-    print(f"{'='*80}")
-    
-    return report
-
-
-if __name__ == '__main__':
-    main()
\ No newline at end of file
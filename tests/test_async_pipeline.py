@@ -0,0 +1,240 @@
+"""
+Unit tests for the async parsing pipeline.
+"""
+
+import asyncio
+import contextvars
+import json
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+from models.event_models import ParsedEvent
+from services.async_pipeline import AsyncPipeline, AsyncPipelineConfig, ProcessLocalClient
+from services.event_parser import EventParser
+from services.hybrid_event_parser import HybridEventParser
+from services.llm_enhancer import EnhancementResult, LLMEnhancer
+from services.llm_text_enhancer import LLMTextEnhancer
+from services.per_field_confidence_router import ProcessingMethod
+from services.regex_guard import regex_budget_exhausted, regex_cpu_budget
+from services.text_merge_helper import TextMergeHelper
+
+NOW = datetime(2025, 10, 1, 9, 0)
+
+SAMPLES = [
+    "Team Meeting tomorrow at 2pm in Conference Room B",
+    "Lunch with Sarah at Cafe Roma on Friday from 12:00 to 1:00 pm",
+    "Weekly standup every Monday at 9am for 30 minutes",
+    "pick up groceries",
+]
+
+_marker = contextvars.ContextVar('marker', default=None)
+
+
+def _fields(event):
+    return (event.title, event.start_datetime, event.end_datetime, event.location,
+            round(event.confidence_score, 6))
+
+
+class TestAsyncPipeline(unittest.TestCase):
+    """Test cases for AsyncPipeline."""
+
+    def setUp(self):
+        self.pipeline = AsyncPipeline(AsyncPipelineConfig(cpu_workers=2))
+
+    def tearDown(self):
+        asyncio.run(self.pipeline.aclose())
+
+    def test_run_cpu_uses_pool_thread_and_context(self):
+        async def run():
+            _marker.set('request')
+            return await self.pipeline.run_cpu(lambda: (threading.current_thread().name, _marker.get()))
+
+        thread_name, marker = asyncio.run(run())
+
+        self.assertTrue(thread_name.startswith('parse-cpu'))
+        self.assertEqual(marker, 'request')
+
+    def test_regex_budget_spans_pool_threads(self):
+        def burn(seconds):
+            deadline = time.thread_time() + seconds
+            while time.thread_time() < deadline:
+                pass
+            return regex_budget_exhausted()
+
+        async def run():
+            with regex_cpu_budget(limit_ms=30) as budget:
+                first = await self.pipeline.run_cpu(burn, 0.02)
+                second = await self.pipeline.run_cpu(burn, 0.02)
+            return first, second, budget
+
+        first, second, budget = asyncio.run(run())
+
+        self.assertFalse(first)
+        self.assertTrue(second)
+        self.assertTrue(budget.exhausted)
+
+    def test_http_client_is_per_loop(self):
+        async def client():
+            return self.pipeline.http_client()
+
+        self.assertIsNot(asyncio.run(client()), asyncio.run(client()))
+
+    def test_process_local_client_is_rebuilt_after_fork(self):
+        factory = Mock(side_effect=lambda: object())
+        client = ProcessLocalClient(factory)
+
+        first = client.get()
+        self.assertIs(client.get(), first)
+        with patch('services.async_pipeline.os.getpid', return_value=-1):
+            self.assertIsNot(client.get(), first)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_config_from_env(self):
+        with patch.dict('os.environ', {'ASYNC_PIPELINE_ENABLED': 'off', 'ASYNC_PIPELINE_CPU_WORKERS': 'x'}):
+            config = AsyncPipelineConfig.from_env()
+
+        self.assertFalse(config.enabled)
+        self.assertEqual(config.cpu_workers, AsyncPipelineConfig.cpu_workers)
+
+
+class TestAsyncLLMCalls(unittest.TestCase):
+    """The async LLM calls build the same requests and results as the sync ones."""
+
+    def test_ollama_schema_call_is_awaited(self):
+        enhancer = LLMEnhancer(llm_service=Mock(provider="ollama", model="test"))
+        body = {'response': json.dumps({'title': 'Lunch', 'confidence': {'overall': 0.4}})}
+
+        with patch('services.llm_enhancer.post_json', AsyncMock(return_value=(200, body))) as post:
+            response = asyncio.run(enhancer._send_llm_with_schema_async("system", "user", {}, 0.1))
+
+        post.assert_awaited_once()
+        self.assertEqual(post.call_args.args[1]['model'], "test")
+        self.assertTrue(post.call_args.args[1]['prompt'].endswith("user\n\nJSON Response:"))
+        self.assertTrue(response.success)
+        self.assertEqual(response.data['title'], 'Lunch')
+
+    def test_openai_schema_call_failure_is_reported(self):
+        service = Mock(provider="openai", model="test")
+        service.openai_client.base_url = "https://api.example.com/v1/"
+        service.openai_client.api_key = "key"
+        enhancer = LLMEnhancer(llm_service=service)
+
+        with patch('services.llm_enhancer.post_json', AsyncMock(return_value=(500, None))) as post:
+            response = asyncio.run(enhancer._send_llm_with_schema_async("system", "user", {}, 0.1))
+
+        self.assertEqual(post.call_args.args[0], "https://api.example.com/v1/chat/completions")
+        self.assertFalse(response.success)
+        self.assertIn("500", response.error)
+
+    def test_text_enhancement_matches_sync(self):
+        enhancer = LLMTextEnhancer(provider="heuristic")
+        enhancer.provider, enhancer.model = "groq", "test"
+        enhancer.config = {'api_key': 'key', 'base_url': 'https://groq.example.com'}
+        body = {'choices': [{'message': {'content': json.dumps({'enhanced_text': 'Lunch at noon', 'confidence': 0.9})}}]}
+
+        with patch('services.llm_text_enhancer.requests.post', return_value=Mock(status_code=200, json=lambda: body)):
+            expected = enhancer.enhance_text_for_parsing("lunch noon")
+        with patch('services.llm_text_enhancer.post_json', AsyncMock(return_value=(200, body))):
+            actual = asyncio.run(enhancer.enhance_text_for_parsing_async("lunch noon"))
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual.enhanced_text, 'Lunch at noon')
+
+
+class TestAsyncParsing(unittest.TestCase):
+    """Async parsing produces the results of sync parsing."""
+
+    def test_hybrid_parser_matches_sync(self):
+        parser = HybridEventParser(current_time=NOW)
+        parser.config['enable_caching'] = False
+
+        for mode in ('hybrid', 'regex_only'):
+            for text in SAMPLES:
+                expected = parser.parse_event_text(text, mode=mode, current_time=NOW)
+                actual = asyncio.run(parser.parse_event_text_async(text, mode=mode, current_time=NOW))
+                self.assertEqual(_fields(actual.parsed_event), _fields(expected.parsed_event), (mode, text))
+                self.assertEqual(actual.parsing_path, expected.parsing_path)
+                self.assertEqual(actual.warnings, expected.warnings)
+
+    def test_event_parser_matches_sync(self):
+        parser = EventParser()
+        parser.text_merge_helper = TextMergeHelper(use_llm=False)
+        parser.hybrid_parser.config['enable_caching'] = False
+
+        for text in SAMPLES:
+            expected = parser.parse_text_enhanced(text, current_time=NOW, lean_metadata=True)
+            actual = asyncio.run(parser.parse_text_enhanced_async(text, current_time=NOW, lean_metadata=True))
+            self.assertEqual(_fields(actual), _fields(expected), text)
+            self.assertEqual(actual.extraction_metadata['text_enhancement'],
+                             expected.extraction_metadata['text_enhancement'])
+
+    def test_llm_routed_fields_share_one_awaited_call(self):
+        parser = HybridEventParser(current_time=NOW)
+        parser.config['enable_caching'] = False
+        llm_event = ParsedEvent(title="Budget review", start_datetime=datetime(2025, 10, 3, 14, 0))
+        parser._llm_enhancer = Mock(is_available=Mock(return_value=True))
+        parser._llm_enhancer.fallback_extraction.side_effect = AssertionError("sync LLM call")
+        parser._llm_enhancer.fallback_extraction_async = AsyncMock(return_value=EnhancementResult(
+            success=True, fallback_event=llm_event, confidence=0.4, enhancement_method="fallback"
+        ))
+
+        with patch.object(parser, '_processing_method', return_value=ProcessingMethod.LLM):
+            result = asyncio.run(parser.parse_event_text_async("budget review sometime soon", current_time=NOW))
+
+        parser._llm_enhancer.fallback_extraction_async.assert_awaited_once()
+        self.assertEqual(result.parsed_event.title, "Budget review")
+        self.assertEqual(result.parsed_event.field_results['title'].source, "llm")
+
+    def test_parses_awaiting_the_llm_keep_their_current_time(self):
+        parser = HybridEventParser(current_time=NOW)
+        parser.config['enable_caching'] = False
+        text = "Team Meeting tomorrow at 2pm"
+        later = NOW + timedelta(days=5)
+        interleaved = []
+
+        async def extraction(text, current_time):
+            # Another request parses with its own current time while this one awaits the LLM
+            interleaved.append(parser.parse_event_text(text, current_time=later))
+            return EnhancementResult(success=True, fallback_event=ParsedEvent(title="Team Meeting"),
+                                     confidence=0.4, enhancement_method="fallback")
+
+        parser._llm_enhancer = Mock(is_available=Mock(return_value=True))
+        parser._llm_enhancer.fallback_extraction_async = extraction
+
+        def method(field, field_analysis=None):
+            return ProcessingMethod.LLM if field == 'title' else ProcessingMethod.REGEX
+
+        with patch.object(parser, '_processing_method', side_effect=method):
+            result = asyncio.run(parser.parse_event_text_async(text, current_time=NOW))
+
+        self.assertEqual(result.parsed_event.start_datetime, datetime(2025, 10, 2, 14, 0))
+        self.assertEqual(interleaved[0].parsed_event.start_datetime, datetime(2025, 10, 7, 14, 0))
+        self.assertEqual(parser.current_time, NOW)
+
+    def test_timeout_cancels_llm_call(self):
+        parser = HybridEventParser(current_time=NOW)
+        parser.config.update(enable_caching=False, max_processing_time=0.05)
+        cancelled = []
+
+        async def slow_extraction(text, current_time):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(text)
+                raise
+
+        parser._llm_enhancer = Mock(is_available=Mock(return_value=True))
+        parser._llm_enhancer.fallback_extraction_async = slow_extraction
+
+        with patch.object(parser, '_processing_method', return_value=ProcessingMethod.LLM):
+            result = asyncio.run(parser.parse_event_text_async("budget review sometime soon", current_time=NOW))
+
+        self.assertEqual(result.parsing_path, "timeout_fallback")
+        self.assertEqual(cancelled, ["budget review sometime soon"])
+
+
+if __name__ == '__main__':
+    unittest.main()
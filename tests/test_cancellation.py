@@ -0,0 +1,132 @@
+"""
+Unit tests for cooperative parse cancellation.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from services.async_pipeline import AsyncPipeline, AsyncPipelineConfig
+from services.cancellation import (
+    CancellationToken, ParseCancelled, cancellation_scope, check_cancelled, sleep, wait_event
+)
+from services.hybrid_event_parser import HybridEventParser
+from services.llm_enhancer import LLMEnhancer
+from services.llm_service import LLMResponse
+
+NOW = datetime(2025, 10, 1, 9, 0)
+
+
+def _cancel_later(token, reason='client_disconnect', delay=0.05):
+    timer = threading.Timer(delay, token.cancel, args=(reason,))
+    timer.start()
+    return timer
+
+
+class TestCancellationToken(unittest.TestCase):
+    """Test cases for CancellationToken and the cancellation checks."""
+
+    def test_check_is_a_no_op_outside_a_scope(self):
+        check_cancelled()
+
+    def test_check_raises_once_cancelled(self):
+        with cancellation_scope() as token:
+            check_cancelled()
+            token.cancel('timeout')
+            token.cancel('client_disconnect')
+            with self.assertRaises(ParseCancelled) as raised:
+                check_cancelled()
+
+        self.assertEqual(raised.exception.reason, 'timeout')
+        check_cancelled()
+
+    def test_cancelled_is_not_an_exception(self):
+        # The pipeline's "except Exception" fallbacks must not swallow it
+        self.assertFalse(issubclass(ParseCancelled, Exception))
+
+    def test_wait_event(self):
+        event = threading.Event()
+        with cancellation_scope() as token:
+            self.assertFalse(wait_event(event, 0.01))
+            event.set()
+            self.assertTrue(wait_event(event, 0.01))
+
+            event.clear()
+            _cancel_later(token)
+            start = time.perf_counter()
+            with self.assertRaises(ParseCancelled):
+                wait_event(event, 5)
+
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_sleep_returns_early_when_cancelled(self):
+        with cancellation_scope() as token:
+            _cancel_later(token)
+            start = time.perf_counter()
+            with self.assertRaises(ParseCancelled):
+                sleep(5)
+
+        self.assertLess(time.perf_counter() - start, 1)
+
+
+class TestPipelineCancellation(unittest.TestCase):
+    """Cancelled parses stop at the next stage boundary."""
+
+    def test_cpu_stage_does_not_start_once_cancelled(self):
+        pipeline = AsyncPipeline(AsyncPipelineConfig(cpu_workers=1))
+        stage = Mock()
+
+        async def run():
+            with cancellation_scope() as token:
+                token.cancel()
+                await pipeline.run_cpu(stage)
+
+        try:
+            with self.assertRaises(ParseCancelled):
+                asyncio.run(run())
+        finally:
+            asyncio.run(pipeline.aclose())
+        stage.assert_not_called()
+
+    def test_field_routing_stops_between_fields(self):
+        parser = HybridEventParser(current_time=NOW)
+        parser.config['enable_caching'] = False
+        token = CancellationToken()
+        routed = []
+
+        def route(field, *args):
+            routed.append(field)
+            token.cancel()
+
+        with patch.object(parser, 'route_field_processing', side_effect=route), cancellation_scope(token):
+            with self.assertRaises(ParseCancelled):
+                parser.parse_event_text("Team Meeting tomorrow at 2pm in Conference Room B", current_time=NOW)
+
+        self.assertEqual(len(routed), 1)
+
+    def test_llm_retries_stop_when_cancelled(self):
+        enhancer = LLMEnhancer(llm_service=Mock(provider="ollama", model="test"))
+        calls = []
+
+        def slow_call(*args, **kwargs):
+            calls.append(args)
+            time.sleep(0.5)
+            return LLMResponse(success=False, data=None, error="slow", provider="ollama", model="test",
+                               confidence=0.0, processing_time=0.5)
+
+        with patch.object(enhancer, '_call_llm_with_schema', side_effect=slow_call), \
+                cancellation_scope() as token:
+            _cancel_later(token)
+            start = time.perf_counter()
+            with self.assertRaises(ParseCancelled):
+                enhancer.timeout_with_retry("system", "user", {}, timeout_seconds=3)
+
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
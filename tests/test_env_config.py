@@ -0,0 +1,38 @@
+"""
+Unit tests for environment variable parsing.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from services.env_config import env_bool, env_float, env_int
+
+
+class TestEnvConfig(unittest.TestCase):
+    """Test cases for the env_* helpers."""
+
+    def test_unset_uses_default(self):
+        with patch.dict('os.environ', {}, clear=True):
+            self.assertEqual(env_int('TEST_ENV_VALUE', 3), 3)
+            self.assertEqual(env_float('TEST_ENV_VALUE', 2.5), 2.5)
+            self.assertTrue(env_bool('TEST_ENV_VALUE', True))
+
+    def test_valid_values(self):
+        with patch.dict('os.environ', {'TEST_INT': '42', 'TEST_FLOAT': '0.25', 'TEST_BOOL': ' Yes '}):
+            self.assertEqual(env_int('TEST_INT', 3), 42)
+            self.assertEqual(env_float('TEST_FLOAT', 1.0), 0.25)
+            self.assertTrue(env_bool('TEST_BOOL', False))
+
+    def test_invalid_values_fall_back(self):
+        with patch.dict('os.environ', {'TEST_INT': '1.5', 'TEST_FLOAT': 'fast', 'TEST_BOOL': 'off'}), \
+                self.assertLogs('services.env_config', level='WARNING') as logs:
+            self.assertEqual(env_int('TEST_INT', 3), 3)
+            self.assertEqual(env_float('TEST_FLOAT', 1.0), 1.0)
+            self.assertFalse(env_bool('TEST_BOOL', True))
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn('TEST_INT', logs.records[0].getMessage())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Unit tests for EventIntervalIndex and its use by CalendarService.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from models.event_models import Event
+from services.calendar_service import CalendarService
+from services.event_index import EventIntervalIndex
+
+
+def _event_data(event_id, start, end, title="Event"):
+    return {
+        'id': event_id,
+        'title': title,
+        'start_datetime': start.isoformat(),
+        'end_datetime': end.isoformat(),
+    }
+
+
+class TestEventIntervalIndex(unittest.TestCase):
+    """Test cases for EventIntervalIndex queries and updates."""
+
+    def setUp(self):
+        self.base = datetime(2025, 3, 10, 9, 0)
+        self.events = [
+            _event_data('a', self.base, self.base + timedelta(hours=1)),
+            _event_data('b', self.base + timedelta(hours=2), self.base + timedelta(hours=3)),
+            _event_data('c', self.base + timedelta(days=1), self.base + timedelta(days=1, hours=1)),
+            # Long event spanning the whole week
+            _event_data('long', self.base - timedelta(days=2), self.base + timedelta(days=5)),
+        ]
+        self.index = EventIntervalIndex.from_events(self.events)
+
+    def _ids(self, events):
+        return [e['id'] for e in events]
+
+    def test_overlapping_is_half_open(self):
+        # Touching at the boundary is not a conflict
+        result = self.index.overlapping(self.base + timedelta(hours=1), self.base + timedelta(hours=2))
+        self.assertEqual(self._ids(result), ['long'])
+
+        result = self.index.overlapping(self.base + timedelta(minutes=30), self.base + timedelta(hours=2, minutes=1))
+        self.assertEqual(self._ids(result), ['long', 'a', 'b'])
+
+    def test_in_range_is_inclusive(self):
+        result = self.index.in_range(self.base + timedelta(hours=1), self.base + timedelta(hours=2))
+        self.assertEqual(self._ids(result), ['long', 'a', 'b'])
+
+    def test_in_range_unbounded_returns_all_sorted(self):
+        self.assertEqual(self._ids(self.index.in_range()), ['long', 'a', 'b', 'c'])
+
+    def test_add_and_remove_are_incremental(self):
+        self.index.add(_event_data('d', self.base + timedelta(minutes=15), self.base + timedelta(minutes=45)))
+        result = self.index.overlapping(self.base, self.base + timedelta(minutes=20))
+        self.assertEqual(self._ids(result), ['long', 'a', 'd'])
+
+        removed = self.index.remove('a')
+        self.assertEqual(self._ids(removed), ['a'])
+        result = self.index.overlapping(self.base, self.base + timedelta(minutes=20))
+        self.assertEqual(self._ids(result), ['long', 'd'])
+
+        self.assertEqual(self.index.remove('missing'), [])
+
+    def test_put_replaces_in_place(self):
+        moved = _event_data('a', self.base + timedelta(days=1), self.base + timedelta(days=1, hours=1), "Moved")
+        self.index.put(moved)
+        self.index.put(moved)
+
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self._ids(self.index.events()), ['a', 'b', 'c', 'long'])
+        self.assertEqual(self._ids(self.index.overlapping(self.base, self.base + timedelta(minutes=30))), ['long'])
+        self.assertEqual(self._ids(self.index.in_range(self.base + timedelta(days=1))), ['long', 'a', 'c'])
+
+        self.index.put(_event_data('d', self.base, self.base + timedelta(minutes=30)))
+        self.assertEqual(len(self.index), 5)
+
+    def test_malformed_events_are_kept_but_not_matched(self):
+        index = EventIntervalIndex.from_events(self.events + [{'id': 'bad', 'start_datetime': 'nope'}])
+
+        self.assertEqual(len(index), 5)
+        self.assertEqual(index.events()[-1]['id'], 'bad')
+        self.assertNotIn('bad', self._ids(index.in_range()))
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(42)
+        events = []
+        for i in range(500):
+            start = self.base + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+            duration = timedelta(minutes=rng.choice([15, 30, 60, 120, 60 * 24 * 3]))
+            events.append(_event_data(f'e{i}', start, start + duration))
+        index = EventIntervalIndex.from_events(events)
+
+        for _ in range(200):
+            query_start = self.base + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+            query_end = query_start + timedelta(minutes=rng.randrange(1, 600))
+
+            expected = sorted(
+                (e for e in events
+                 if datetime.fromisoformat(e['start_datetime']) < query_end
+                 and datetime.fromisoformat(e['end_datetime']) > query_start),
+                key=lambda e: datetime.fromisoformat(e['start_datetime'])
+            )
+            self.assertEqual(self._ids(index.overlapping(query_start, query_end)), self._ids(expected))
+
+
+class TestCalendarServiceIndex(unittest.TestCase):
+    """Test that CalendarService keeps its index in sync with storage."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.storage_path = os.path.join(self.temp_dir, "events.json")
+        self.service = CalendarService(storage_path=self.storage_path)
+        self.start = datetime.now() + timedelta(days=1)
+
+    def tearDown(self):
+        if os.path.exists(self.storage_path):
+            os.remove(self.storage_path)
+        os.rmdir(self.temp_dir)
+
+    def _event(self, title, offset_hours=0):
+        start = self.start + timedelta(hours=offset_hours)
+        return Event(title=title, start_datetime=start, end_datetime=start + timedelta(hours=1))
+
+    def test_conflicts_reported_from_index(self):
+        self.service.create_event(self._event("First"))
+        success, message, _ = self.service.create_event(self._event("Second"))
+
+        self.assertTrue(success)
+        self.assertIn("Conflicts with existing event: First", message)
+
+    def test_index_reused_between_operations(self):
+        self.service.create_event(self._event("First"))
+        index = self.service._get_index()
+
+        self.service.create_event(self._event("Second", offset_hours=2))
+
+        self.assertIs(self.service._get_index(), index)
+        self.assertEqual([e.title for e in self.service.list_events()], ["First", "Second"])
+
+    def test_external_file_change_rebuilds_index(self):
+        self.service.create_event(self._event("First"))
+
+        other = CalendarService(storage_path=self.storage_path)
+        other.create_event(self._event("Other", offset_hours=3))
+
+        self.assertEqual([e.title for e in self.service.list_events()], ["First", "Other"])
+
+    def test_delete_updates_index(self):
+        _, _, event_id = self.service.create_event(self._event("First"))
+
+        self.assertTrue(self.service.delete_event(event_id))
+        self.assertEqual(self.service.list_events(), [])
+        self.assertEqual(self.service._check_conflicts(self._event("Again")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+"""
+Unit tests for EventJournal and the journal storage backend of CalendarService.
+"""
+
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from models.event_models import Event
+from services.calendar_service import CalendarService, CalendarServiceError, get_storage_backend
+from services.event_journal import EventJournal, LOCKING_AVAILABLE, OP_CREATE, OP_DELETE
+
+
+def _create_events(storage_path, worker, count):
+    """Create events from a separate process (module-level so it can be pickled)."""
+    service = CalendarService(storage_path=storage_path, storage_backend='journal', compact_threshold=7)
+    start = datetime.now() + timedelta(days=1 + worker)
+    for i in range(count):
+        event_start = start + timedelta(hours=i)
+        service.create_event(Event(title=f"Worker {worker} #{i}", start_datetime=event_start,
+                                   end_datetime=event_start + timedelta(minutes=30)))
+
+
+class TestEventJournal(unittest.TestCase):
+    """Test cases for EventJournal reads, appends and compaction."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.snapshot_path = Path(self.temp_dir) / "events.json"
+        self.journal = EventJournal(self.snapshot_path, compact_threshold=3, fsync=False)
+        self.journal.ensure_snapshot()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_read_returns_only_new_records(self):
+        replay = self.journal.read()
+        self.assertEqual(replay.snapshot, [])
+        self.assertEqual(replay.records, [])
+
+        self.journal.append({'op': OP_CREATE, 'event': {'id': 'a'}})
+        self.journal.append({'op': OP_DELETE, 'id': 'a'})
+
+        replay = self.journal.read(replay.cursor)
+        self.assertIsNone(replay.snapshot)
+        self.assertEqual([r['op'] for r in replay.records], [OP_CREATE, OP_DELETE])
+
+        replay = self.journal.read(replay.cursor)
+        self.assertEqual(replay.records, [])
+        self.assertEqual(replay.cursor.record_count, 2)
+
+    def test_partial_and_corrupt_lines_are_skipped(self):
+        cursor = self.journal.read().cursor
+
+        # Simulate a writer that crashed mid-record
+        with open(self.journal.journal_path, 'ab') as f:
+            f.write(b'{"op": "create", "event": {"id": "torn"')
+
+        replay = self.journal.read(cursor)
+        self.assertEqual(replay.records, [])
+        self.assertEqual(replay.cursor.offset, 0)
+
+        self.journal.append({'op': OP_CREATE, 'event': {'id': 'b'}})
+        replay = self.journal.read(replay.cursor)
+        self.assertEqual([r['event']['id'] for r in replay.records], ['b'])
+
+    def test_compaction_rewrites_snapshot_and_forces_reload(self):
+        stale = self.journal.read().cursor
+        self.journal.append({'op': OP_CREATE, 'event': {'id': 'a'}})
+
+        cursor = self.journal.compact([{'id': 'a'}])
+
+        self.assertEqual(self.journal.journal_path.stat().st_size, 0)
+        with open(self.snapshot_path) as f:
+            self.assertEqual(json.load(f), [{'id': 'a'}])
+        self.assertIsNone(self.journal.read(cursor).snapshot)
+        self.assertEqual(self.journal.read(stale).snapshot, [{'id': 'a'}])
+
+
+class TestJournalCalendarService(unittest.TestCase):
+    """Test CalendarService with the journal storage backend."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.storage_path = os.path.join(self.temp_dir, "events.json")
+        self.service = CalendarService(storage_path=self.storage_path, storage_backend='journal',
+                                       compact_threshold=5)
+        self.start = datetime.now() + timedelta(days=1)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _event(self, title, offset_hours=0):
+        start = self.start + timedelta(hours=offset_hours)
+        return Event(title=title, start_datetime=start, end_datetime=start + timedelta(hours=1))
+
+    def test_backend_selection(self):
+        self.assertEqual(get_storage_backend('JOURNAL'), 'journal')
+        self.assertEqual(get_storage_backend('unknown'), 'json')
+        self.assertEqual(self.service.get_storage_info()['storage_backend'], 'journal')
+
+    def test_creates_append_without_rewriting_snapshot(self):
+        snapshot_before = Path(self.storage_path).read_text()
+
+        success, _, event_id = self.service.create_event(self._event("First"))
+
+        self.assertTrue(success)
+        self.assertEqual(Path(self.storage_path).read_text(), snapshot_before)
+        self.assertIn(event_id, Path(self.storage_path + ".journal").read_text())
+        self.assertEqual([e.title for e in self.service.list_events()], ["First"])
+
+    def test_conflicts_and_delete(self):
+        _, _, event_id = self.service.create_event(self._event("First"))
+        _, message, _ = self.service.create_event(self._event("Second"))
+        self.assertIn("Conflicts with existing event: First", message)
+
+        self.assertTrue(self.service.delete_event(event_id))
+        self.assertFalse(self.service.delete_event(event_id))
+        self.assertEqual([e.title for e in self.service.list_events()], ["Second"])
+
+    def test_compaction_after_threshold(self):
+        for i in range(5):
+            self.service.create_event(self._event(f"Event {i}", offset_hours=2 * i))
+
+        self.assertEqual(os.path.getsize(self.storage_path + ".journal"), 0)
+        with open(self.storage_path) as f:
+            self.assertEqual(len(json.load(f)), 5)
+
+        reopened = CalendarService(storage_path=self.storage_path, storage_backend='journal')
+        self.assertEqual(len(reopened.list_events()), 5)
+
+    def test_interrupted_compaction_does_not_duplicate_events(self):
+        journal = self.service._journal
+        write_snapshot = journal.write_snapshot
+
+        def crash_after_snapshot(events):
+            # The snapshot is replaced but the process dies before the journal is truncated
+            write_snapshot(events)
+            raise OSError("crashed before truncating the journal")
+
+        with patch.object(journal, 'write_snapshot', side_effect=crash_after_snapshot):
+            for i in range(5):
+                self.service.create_event(self._event(f"Event {i}", offset_hours=2 * i))
+
+        self.assertGreater(os.path.getsize(self.storage_path + ".journal"), 0)
+        with open(self.storage_path) as f:
+            self.assertEqual(len(json.load(f)), 5)
+
+        expected = [f"Event {i}" for i in range(5)]
+        reopened = CalendarService(storage_path=self.storage_path, storage_backend='journal')
+        self.assertEqual([e.title for e in reopened.list_events()], expected)
+        self.assertEqual([e.title for e in self.service.list_events()], expected)
+
+    def test_other_instance_sees_appended_events(self):
+        other = CalendarService(storage_path=self.storage_path, storage_backend='journal')
+        self.assertEqual(other.list_events(), [])
+
+        self.service.create_event(self._event("First"))
+
+        self.assertEqual([e.title for e in other.list_events()], ["First"])
+
+    def test_import_and_export(self):
+        self.service.create_event(self._event("First"))
+        export_path = os.path.join(self.temp_dir, "export.json")
+
+        self.assertEqual(self.service.export_events(export_path), 1)
+
+        other_path = os.path.join(self.temp_dir, "other.json")
+        other = CalendarService(storage_path=other_path, storage_backend='journal')
+        self.assertEqual(other.import_events(export_path), 1)
+        self.assertEqual([e.title for e in other.list_events()], ["First"])
+
+        # Exporting to storage_path compacts the journal into it
+        other.export_events()
+        self.assertEqual(os.path.getsize(other_path + ".journal"), 0)
+
+        bad_path = os.path.join(self.temp_dir, "bad.json")
+        Path(bad_path).write_text('{"not": "a list"}')
+        with self.assertRaises(CalendarServiceError):
+            other.import_events(bad_path)
+
+    @unittest.skipUnless(LOCKING_AVAILABLE and hasattr(os, 'fork'), "requires fcntl and fork")
+    def test_concurrent_processes_do_not_lose_writes(self):
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=_create_events, args=(self.storage_path, w, 15)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            self.assertEqual(worker.exitcode, 0)
+
+        self.assertEqual(len(self.service.list_events()), 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
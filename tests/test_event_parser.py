@@ -400,6 +400,46 @@ class TestEventParser:
             assert event.confidence_score >= 0.0
 
 
+
+class TestLeanMetadata:
+    """Test suite for lean metadata mode."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = EventParser()
+        self.parser.text_merge_helper.use_llm = False
+        self.parser.hybrid_parser.config['enable_caching'] = False
+        self.text = "Team meeting tomorrow at 2pm in Room 101"
+    
+    def test_lean_enhanced_parse_skips_debug_metadata(self):
+        """Lean mode keeps summary fields but not processing details, telemetry or text copies."""
+        full = self.parser.parse_text_enhanced(self.text)
+        lean = self.parser.parse_text_enhanced(self.text, lean_metadata=True)
+        
+        assert (lean.title, lean.start_datetime, lean.location) == (full.title, full.start_datetime, full.location)
+        assert lean.confidence_score == full.confidence_score
+        for key in ('processing_metadata', 'telemetry'):
+            assert key in full.extraction_metadata
+            assert key not in lean.extraction_metadata
+        assert 'original_text' not in lean.extraction_metadata['text_enhancement']
+        assert lean.extraction_metadata['parsing_path'] == full.extraction_metadata['parsing_path']
+    
+    def test_lean_mode_builds_telemetry_on_request(self):
+        """Telemetry is still collected in lean mode when explicitly enabled."""
+        result = self.parser.parse_event_text(self.text, lean_metadata=True, enable_telemetry=True)
+        
+        assert 'telemetry' in result.extraction_metadata
+        assert 'processing_metadata' not in result.extraction_metadata
+    
+    def test_lean_legacy_parse_keeps_summary_fields(self):
+        """Legacy parsing keeps the confidence summary but not the match lists."""
+        result = self.parser.parse_text(self.text, lean_metadata=True)
+        
+        metadata = result.extraction_metadata
+        assert metadata['title_confidence'] > 0
+        assert 'all_datetime_matches' not in metadata
+        assert 'original_text' not in metadata
+
 if __name__ == "__main__":
     # Run tests if script is executed directly
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Unit tests for the per-parse extraction memo.
+"""
+
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from models.event_models import ParsedEvent
+from services.extraction_memo import ExtractionMemo
+from services.hybrid_event_parser import HybridEventParser
+from services.per_field_confidence_router import PerFieldConfidenceRouter
+
+
+class TestExtractionMemo(unittest.TestCase):
+    """Test cases for ExtractionMemo."""
+
+    def test_value_is_computed_once(self):
+        memo = ExtractionMemo()
+        compute = Mock(return_value=42)
+
+        self.assertEqual(memo.get('datetime', compute), 42)
+        self.assertEqual(memo.get('datetime', compute), 42)
+
+        compute.assert_called_once()
+        self.assertEqual(memo.get_stats(), {'computed': 1, 'reused': 1})
+
+    def test_failures_are_not_stored(self):
+        memo = ExtractionMemo()
+
+        with self.assertRaises(RuntimeError):
+            memo.get('titles', Mock(side_effect=RuntimeError("boom")))
+        self.assertEqual(memo.get('titles', lambda: ['ok']), ['ok'])
+
+    def test_concurrent_lookups_share_one_computation(self):
+        memo = ExtractionMemo()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(memo.get('llm_fallback', compute)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['value'] * 4)
+
+
+class TestPerFieldRoutingMemo(unittest.TestCase):
+    """Test cases for extractor sharing in HybridEventParser per-field routing."""
+
+    def setUp(self):
+        self.parser = HybridEventParser(current_time=datetime(2025, 10, 1, 9, 0))
+        self.parser.config['enable_caching'] = False
+
+    def test_datetime_extraction_runs_once_per_parse(self):
+        extract = self.parser.regex_extractor.extract_datetime
+
+        with patch.object(self.parser.regex_extractor, 'extract_datetime', side_effect=extract) as spy:
+            result = self.parser.parse_event_text("Meeting on October 15, 2025 from 2pm to 3pm")
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertIsNotNone(result.parsed_event.start_datetime)
+        self.assertIsNotNone(result.parsed_event.end_datetime)
+        self.assertGreaterEqual(result.processing_metadata['extraction_memo']['reused'], 1)
+
+    def test_llm_routed_fields_share_one_fallback_extraction(self):
+        event = ParsedEvent(title="Planning", location="Room 4")
+        enhancer = Mock()
+        enhancer.is_available.return_value = True
+        enhancer.fallback_extraction.return_value = Mock(
+            success=True, fallback_event=event, confidence=0.5, processing_time=0.2
+        )
+        self.parser._llm_enhancer = enhancer
+        memo = ExtractionMemo()
+
+        title = self.parser._extract_field_with_llm('title', "text", None, memo)
+        location = self.parser._extract_field_with_llm('location', "text", None, memo)
+
+        self.assertEqual((title.value, location.value), ("Planning", "Room 4"))
+        enhancer.fallback_extraction.assert_called_once()
+
+    def test_router_scans_datetime_patterns_once(self):
+        router = PerFieldConfidenceRouter()
+        scan = router._scan_datetime_patterns
+
+        with patch.object(router, '_scan_datetime_patterns', side_effect=scan) as spy:
+            analyses = router.analyze_field_extractability("Standup tomorrow at 10am")
+
+        self.assertEqual(spy.call_count, 1)
+        self.assertIn('start_datetime', analyses)
+        self.assertIsNot(analyses['start_datetime'].pattern_matches, analyses['end_datetime'].pattern_matches)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Unit tests for fused LLM text enhancement and field extraction.
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from models.event_models import ParsedEvent
+from services.event_parser import EventParser
+from services.llm_enhancer import FUSED_COMPLETION_TOKENS, EnhancementResult, LLMEnhancer
+from services.llm_service import LLMResponse
+from services.per_field_confidence_router import FieldAnalysis, ProcessingMethod
+
+FUSED_DATA = {
+    "title": "Budget review",
+    "start_datetime": "2025-10-03T14:00:00",
+    "end_datetime": None,
+    "location": "Room 4",
+    "description": "Budget review Friday 2pm in Room 4",
+    "all_day": False,
+    "confidence": {"title": 0.5, "start_datetime": 0.5, "end_datetime": 0.0, "location": 0.5, "overall": 0.45},
+    "extraction_notes": "",
+    "needs_confirmation": True,
+    "enhanced_text": "Budget review on Friday at 2pm in Room 4",
+    "enhanced_text_confidence": 0.9
+}
+
+
+def _response(data):
+    return LLMResponse(success=True, data=data, error=None, provider="openai", model="test",
+                       confidence=0.5, processing_time=0.1)
+
+
+class TestFusedExtraction(unittest.TestCase):
+    """Test cases for LLMEnhancer.fused_extraction."""
+
+    def setUp(self):
+        self.enhancer = LLMEnhancer(llm_service=Mock(provider="openai", model="test"))
+        self.enhancer.batcher = None
+
+    def test_one_call_returns_text_and_fields(self):
+        with patch.object(self.enhancer, '_send_llm_with_schema', return_value=_response(dict(FUSED_DATA))) as send:
+            result = self.enhancer.fused_extraction("budget review fri 2pm rm 4", datetime(2025, 10, 1))
+
+        send.assert_called_once()
+        self.assertEqual(send.call_args.kwargs['completion_tokens'], FUSED_COMPLETION_TOKENS)
+        self.assertTrue(result.success)
+        self.assertEqual(result.enhancement_method, "fused")
+        self.assertEqual(result.enhanced_text, FUSED_DATA['enhanced_text'])
+        self.assertEqual(result.fallback_event.location, "Room 4")
+        self.assertLessEqual(result.confidence, 0.5)
+
+    def test_invalid_response_is_rejected(self):
+        data = dict(FUSED_DATA)
+        del data['enhanced_text']
+
+        with patch.object(self.enhancer, '_send_llm_with_schema', return_value=_response(data)):
+            result = self.enhancer.fused_extraction("budget review fri 2pm rm 4")
+
+        self.assertFalse(result.success)
+        self.assertIn("enhanced_text", result.error)
+
+
+class TestEventParserFusedMode(unittest.TestCase):
+    """Test cases for fused mode in EventParser.parse_text_enhanced."""
+
+    def setUp(self):
+        self.parser = EventParser()
+        self.parser.hybrid_parser.config['enable_caching'] = False
+        self.llm_enhancer = Mock()
+        self.llm_enhancer.is_available.return_value = True
+        self.parser.hybrid_parser._llm_enhancer = self.llm_enhancer
+        self.text_enhancer = Mock()
+        self.text_enhancer.is_available.return_value = True
+        self.text_enhancer.enhance_text_for_parsing.return_value = None
+        self.parser.text_merge_helper.llm_enhancer = self.text_enhancer
+
+    def test_fused_call_replaces_both_llm_round_trips(self):
+        self.llm_enhancer.fused_extraction.return_value = EnhancementResult(
+            success=True, fallback_event=ParsedEvent(title="Budget review", location="Room 4"),
+            confidence=0.45, enhancement_method="fused", processing_time=0.3,
+            enhanced_text=FUSED_DATA['enhanced_text'], text_confidence=0.9
+        )
+
+        event = self.parser.parse_text_enhanced("budget review sometime soon", fused_llm_enhancement=True)
+
+        self.llm_enhancer.fused_extraction.assert_called_once()
+        self.llm_enhancer.fallback_extraction.assert_not_called()
+        self.text_enhancer.enhance_text_for_parsing.assert_not_called()
+        enhancement = event.extraction_metadata['text_enhancement']
+        self.assertTrue(enhancement['fused_llm']['used'])
+        self.assertEqual(enhancement['enhanced_text'], FUSED_DATA['enhanced_text'])
+
+    def test_llm_routed_fields_use_fused_values(self):
+        extraction = EnhancementResult(
+            success=True, fallback_event=ParsedEvent(location="Room 4"), confidence=0.45,
+            enhancement_method="fused", processing_time=0.3
+        )
+        analysis = FieldAnalysis('location', 0.3, 0.5, [], [], ProcessingMethod.LLM, 4)
+
+        with patch.object(self.parser.hybrid_parser.confidence_router, 'analyze_field_extractability',
+                          return_value={'location': analysis}):
+            result = self.parser.hybrid_parser.parse_event_text("meet somewhere", llm_extraction=extraction)
+
+        self.llm_enhancer.fallback_extraction.assert_not_called()
+        self.assertEqual(result.parsed_event.location, "Room 4")
+        self.assertEqual(result.parsed_event.field_results['location'].source, "llm")
+
+    def test_failed_fused_call_uses_split_path(self):
+        self.llm_enhancer.fused_extraction.return_value = EnhancementResult(
+            success=False, error="Schema validation failed", enhancement_method="failed"
+        )
+
+        event = self.parser.parse_text_enhanced("budget review sometime soon", fused_llm_enhancement=True)
+
+        self.text_enhancer.enhance_text_for_parsing.assert_called_once()
+        fused = event.extraction_metadata['text_enhancement']['fused_llm']
+        self.assertFalse(fused['used'])
+        self.assertEqual(fused['fallback_reason'], "Schema validation failed")
+
+    def test_fused_mode_is_opt_in(self):
+        self.parser.parse_text_enhanced("budget review sometime soon")
+
+        self.llm_enhancer.fused_extraction.assert_not_called()
+        self.text_enhancer.enhance_text_for_parsing.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Unit tests for the parallel golden-set evaluator.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from models.event_models import ParsedEvent
+from services.golden_evaluator import ParallelGoldenEvaluator
+from services.performance_monitor import GoldenTestCase, PerformanceMonitor
+
+BASE_TIME = datetime(2025, 3, 10, 9, 0)
+
+
+def stub_parse(text: str) -> ParsedEvent:
+    """Deterministic stand-in for the full pipeline: '<title> @ <hour>'."""
+    if text == "explode":
+        raise ValueError("parser exploded")
+    title, _, hour = text.partition(" @ ")
+    start = BASE_TIME.replace(hour=int(hour)) if hour else None
+    return ParsedEvent(
+        title=title,
+        start_datetime=start,
+        end_datetime=start + timedelta(hours=1) if start else None,
+        confidence_score=0.9 if hour else 0.3
+    )
+
+
+def stub_parser_factory():
+    return stub_parse
+
+
+def counting_parser_factory():
+    """Parser that appends each full parse to GOLDEN_EVALUATOR_COUNT_FILE."""
+    def parse(text):
+        with open(os.environ['GOLDEN_EVALUATOR_COUNT_FILE'], 'a') as f:
+            f.write(text + "\n")
+        return stub_parse(text)
+    return parse
+
+
+def stub_fingerprint_factory():
+    return lambda text: text.upper()
+
+
+def async_parser_factory():
+    async def parse(text):
+        return stub_parse(text)
+    return parse
+
+
+class TestParallelGoldenEvaluator(unittest.TestCase):
+    """Test cases for ParallelGoldenEvaluator."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.golden_set_path = os.path.join(self.temp_dir, "golden_set.json")
+        self.cache_path = os.path.join(self.temp_dir, "cache.json")
+        self.count_path = os.path.join(self.temp_dir, "count.txt")
+        os.environ['GOLDEN_EVALUATOR_COUNT_FILE'] = self.count_path
+
+        cases = []
+        for i in range(12):
+            hour = 9 + i % 8
+            text = "explode" if i == 5 else f"Meeting {i} @ {hour}"
+            cases.append(GoldenTestCase(
+                id=f"case_{i:02d}",
+                input_text=text,
+                expected_title=f"Meeting {i}",
+                expected_start=BASE_TIME.replace(hour=9 + (i % 3)),
+                expected_end=BASE_TIME.replace(hour=10 + (i % 3))
+            ))
+        with open(self.golden_set_path, 'w') as f:
+            json.dump({'version': '1.0', 'test_cases': [c.to_dict() for c in cases]}, f)
+
+    def tearDown(self):
+        os.environ.pop('GOLDEN_EVALUATOR_COUNT_FILE', None)
+        shutil.rmtree(self.temp_dir)
+
+    def _monitor(self):
+        return PerformanceMonitor(golden_set_path=self.golden_set_path)
+
+    def _parse_count(self):
+        if not os.path.exists(self.count_path):
+            return 0
+        with open(self.count_path) as f:
+            return len(f.readlines())
+
+    @staticmethod
+    def _scores(summary):
+        return [(r['test_case_id'], r['accuracy_score'], r['field_accuracies'], r['errors'])
+                for r in summary['results']]
+
+    def test_parallel_matches_sequential(self):
+        sequential = self._monitor().evaluate_accuracy(stub_parse)
+        parallel = ParallelGoldenEvaluator(
+            self._monitor(), parser_factory=stub_parser_factory,
+            fingerprint_factory=None, workers=3, llm_concurrency=2
+        ).evaluate()
+
+        self.assertEqual(self._scores(parallel), self._scores(sequential))
+        self.assertEqual(parallel['overall_accuracy'], sequential['overall_accuracy'])
+        self.assertEqual(parallel['field_accuracies'], sequential['field_accuracies'])
+        self.assertEqual(parallel['evaluation']['workers'], 3)
+        self.assertEqual(parallel['results'][5]['errors'], ["parser exploded"])
+
+    def test_async_parser_in_process(self):
+        summary = ParallelGoldenEvaluator(
+            self._monitor(), parser_factory=async_parser_factory,
+            fingerprint_factory=None, workers=1
+        ).evaluate()
+
+        self.assertEqual(summary['total_test_cases'], 12)
+        self.assertEqual(summary['results'][0]['field_accuracies']['title'], 1.0)
+
+    def test_incremental_reuses_unchanged_cases(self):
+        def evaluator():
+            return ParallelGoldenEvaluator(
+                self._monitor(), parser_factory=counting_parser_factory,
+                fingerprint_factory=stub_fingerprint_factory,
+                workers=2, cache_path=self.cache_path
+            )
+
+        first = evaluator().evaluate()
+        self.assertEqual(self._parse_count(), 12)
+        self.assertEqual(first['evaluation']['reused_cases'], 0)
+
+        second = evaluator().evaluate()
+        self.assertEqual(self._parse_count(), 12)
+        self.assertEqual(second['evaluation']['reused_cases'], 12)
+        self.assertEqual(self._scores(second), self._scores(first))
+
+        # Editing one case only re-parses that case
+        with open(self.golden_set_path) as f:
+            data = json.load(f)
+        data['test_cases'][3]['input_text'] = "Meeting 3 @ 9"
+        with open(self.golden_set_path, 'w') as f:
+            json.dump(data, f)
+
+        third = evaluator().evaluate()
+        self.assertEqual(self._parse_count(), 13)
+        self.assertEqual(third['evaluation']['evaluated_cases'], 1)
+        self.assertEqual(third['results'][3]['field_accuracies']['start_datetime'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Unit tests for incremental re-parsing of edited text.
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from models.event_models import FieldResult
+from services.hybrid_event_parser import HybridEventParser
+from services.incremental_parser import (
+    IncrementalParseConfig, IncrementalParser, ParseSnapshot, ParseSnapshotStore, TextEdit, changed_region
+)
+
+NOW = datetime(2025, 10, 1, 9, 0)
+TEXT = "Budget review on Friday at 2pm. Afterwards we head over to Conference Room B"
+
+
+class TestTextEdits(unittest.TestCase):
+    """Test cases for TextEdit and changed_region."""
+
+    def test_apply_replaces_range(self):
+        self.assertEqual(TextEdit(5, 9, "lunch").apply("Team sync at noon"), "Team lunch at noon")
+
+    def test_apply_rejects_out_of_range_edit(self):
+        with self.assertRaises(ValueError):
+            TextEdit(5, 50, "x").apply("short")
+
+    def test_changed_region(self):
+        self.assertEqual(changed_region("at 2 PM today", "at 4 PM today"), (3, 4, 4))
+        self.assertEqual(changed_region("abc", "abXYc"), (2, 2, 4))
+
+
+class TestParseSnapshotStore(unittest.TestCase):
+    """Test cases for ParseSnapshotStore."""
+
+    def test_lru_eviction_and_expiry(self):
+        store = ParseSnapshotStore(max_snapshots=1, ttl_seconds=60)
+        first = store.put(ParseSnapshot("a", "a", {}, None, NOW.date()))
+        second = store.put(ParseSnapshot("b", "b", {}, None, NOW.date()))
+
+        self.assertIsNone(store.get(first))
+        self.assertIsNotNone(store.get(second))
+
+        with patch('services.incremental_parser.time.monotonic', return_value=float('inf')):
+            self.assertIsNone(store.get(second))
+
+
+class TestIncrementalParser(unittest.TestCase):
+    """Test cases for IncrementalParser."""
+
+    def setUp(self):
+        self.hybrid_parser = HybridEventParser()
+        self.hybrid_parser.config['enable_caching'] = False
+        self.parser = IncrementalParser(self.hybrid_parser, ParseSnapshotStore(),
+                                        IncrementalParseConfig(context_chars=8))
+        self.first = self.parser.parse(TEXT, current_time=NOW)
+
+    def test_regex_fields_record_real_spans(self):
+        location = self.first.parsed_event.field_results['location']
+        title = self.first.parsed_event.field_results['title']
+        start = self.first.parsed_event.field_results['start_datetime']
+
+        self.assertEqual(TEXT[location.span[0]:location.span[1]], "Conference Room B")
+        self.assertLess(title.span[1], len(TEXT))
+        self.assertTrue(TEXT[start.span[0]:start.span[1]].startswith("Friday at 2pm"))
+
+    def test_edit_far_from_a_field_reuses_it(self):
+        position = TEXT.index("2pm")
+        route = self.hybrid_parser.route_field_processing
+        with patch.object(self.hybrid_parser, 'route_field_processing', side_effect=route) as routed:
+            result = self.parser.reparse(self.first.parse_token, [TextEdit(position, position + 3, "4pm")],
+                                         current_time=NOW)
+
+        self.assertFalse(result.full_parse)
+        self.assertIn('location', result.reused_fields)
+        self.assertNotIn('location', [call.args[0] for call in routed.call_args_list])
+        self.assertEqual(result.parsed_event.start_datetime, datetime(2025, 10, 3, 16, 0))
+        self.assertEqual(result.parsed_event.location, "Conference Room B")
+
+    def test_reused_spans_shift_with_the_edit(self):
+        result = self.parser.reparse(self.first.parse_token, [TextEdit(0, 6, "Quarterly budget")],
+                                     current_time=NOW)
+
+        text = "Quarterly budget" + TEXT[6:]
+        location = result.parsed_event.field_results['location']
+        self.assertIn('location', result.reused_fields)
+        self.assertEqual(text[location.span[0]:location.span[1]], "Conference Room B")
+        self.assertTrue(result.parsed_event.title.startswith("Quarterly budget"))
+
+    def test_edit_inside_a_field_reruns_it(self):
+        position = TEXT.index("Conference Room B")
+        result = self.parser.reparse(self.first.parse_token,
+                                     [TextEdit(position, len(TEXT), "Conference Room C")], current_time=NOW)
+
+        self.assertIn('location', result.reparsed_fields)
+        self.assertIn('start_datetime', result.reused_fields)
+        self.assertEqual(result.parsed_event.location, "Conference Room C")
+
+    def test_failed_field_is_retried_after_any_edit(self):
+        snapshot = self.parser.store.get(self.first.parse_token)
+        snapshot.field_results['location'] = FieldResult(value=None, source="error", confidence=0.0, span=(0, 0))
+
+        position = TEXT.index("2pm")
+        result = self.parser.reparse(self.first.parse_token, [TextEdit(position, position + 3, "4pm")],
+                                     current_time=NOW)
+
+        self.assertIn('location', result.reparsed_fields)
+        self.assertEqual(result.parsed_event.location, "Conference Room B")
+
+    def test_new_day_triggers_full_parse(self):
+        result = self.parser.reparse(self.first.parse_token, [], current_time=datetime(2025, 10, 2, 9, 0))
+
+        self.assertTrue(result.full_parse)
+
+    def test_unknown_token(self):
+        self.assertIsNone(self.parser.reparse("unknown", []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Unit tests for the keyword prefilter and the analyzers gated by it.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from services.advanced_location_extractor import AdvancedLocationExtractor
+from services.event_extractor import EventInformationExtractor
+from services.keyword_prefilter import KeywordPrefilter
+from services.per_field_confidence_router import PerFieldConfidenceRouter
+from services.text_merge_helper import TextMergeHelper
+
+SAMPLES = [
+    "Team Meeting tomorrow at 2pm in Conference Room B",
+    "Lunch with Sarah at Cafe Roma on Friday from 12:00 to 1:00 pm",
+    "Weekly standup every Monday at 9am for 30 minutes, location: Building 4, 3rd floor",
+    "\"Quarterly Review\" on March 15, 2025 until 5pm at the office",
+    "Subject: Interview with candidate\nMeet at HQ downtown, email jane.doe@example.com",
+    "Call about budget planning next tuesday, then dinner at my place",
+    "Presentation on the roadmap at 123 Main Street; training for new hires in room 12",
+    "pick up groceries",
+    "İN THE ROOM 5 at noon",
+]
+
+
+class TestKeywordPrefilter(unittest.TestCase):
+    """Test cases for KeywordPrefilter."""
+
+    def setUp(self):
+        self.prefilter = KeywordPrefilter()
+
+    def has(self, text, *names):
+        return self.prefilter.scan(text) & self.prefilter.mask(*names) == self.prefilter.mask(*names)
+
+    def test_keywords_match_at_word_starts(self):
+        self.assertTrue(self.has("Meetings on Mondays", 'event_noun', 'meet', 'weekday'))
+        self.assertFalse(self.has("Remeet later", 'meet'))
+        self.assertFalse(self.has("cat", 'at'))
+
+    def test_symbols_match_anywhere(self):
+        self.assertTrue(self.has("x@y 3pm 'hi'", 'at_sign', 'digit', 'quote'))
+        self.assertEqual(self.prefilter.scan("plain words") & self.prefilter.mask('digit', 'at_sign', 'quote'), 0)
+
+    def test_ignorecase_folding_matches_regex_semantics(self):
+        self.assertTrue(self.has("İn ſt", 'in', 'street_suffix'))
+
+    def test_unknown_group_raises(self):
+        with self.assertRaises(KeyError):
+            self.prefilter.mask('unknown')
+
+    def test_scan_is_cached(self):
+        self.prefilter.scan("Lunch at noon")
+        self.prefilter.scan("Lunch at noon")
+        self.assertEqual(self.prefilter.scan.cache_info().hits, 1)
+
+
+class TestPrefilterGating(unittest.TestCase):
+    """Gated analyzers must produce exactly what the ungated analyzers produce."""
+
+    def test_router_results_unchanged(self):
+        router = PerFieldConfidenceRouter()
+        ungated = PerFieldConfidenceRouter()
+        ungated.pattern_triggers = {}
+        for text in SAMPLES:
+            self.assertEqual(router.analyze_field_extractability(text),
+                             ungated.analyze_field_extractability(text), text)
+
+    def test_location_extractor_results_unchanged(self):
+        extractor = AdvancedLocationExtractor()
+        ungated = AdvancedLocationExtractor()
+        ungated.pattern_triggers = {}
+        for text in SAMPLES:
+            for method in ('_extract_venue_locations', '_extract_implicit_locations'):
+                self.assertEqual(getattr(extractor, method)(text), getattr(ungated, method)(text), text)
+
+    def test_event_extractor_results_unchanged(self):
+        extractor = EventInformationExtractor()
+        ungated = EventInformationExtractor()
+        ungated.title_triggers = {}
+        ungated.location_triggers = {}
+        for text in SAMPLES:
+            self.assertEqual(extractor.extract_title(text), ungated.extract_title(text), text)
+            self.assertEqual(extractor.extract_location(text), ungated.extract_location(text), text)
+
+    def test_merge_helper_indicators_unchanged(self):
+        helper = TextMergeHelper(use_llm=False)
+        ungated = TextMergeHelper(use_llm=False)
+        ungated.time_triggers = ungated.location_triggers = -1
+        for text in SAMPLES + ["Friday evening", "meet in lobby"]:
+            self.assertEqual(helper._has_time_indicators(text), ungated._has_time_indicators(text), text)
+            self.assertEqual(helper._has_location_indicators(text), ungated._has_location_indicators(text), text)
+
+    def test_untriggered_patterns_are_skipped(self):
+        router = PerFieldConfidenceRouter()
+        with patch.dict(router.recurrence_patterns, {'explicit_recurrence': [_FailingPattern()]}):
+            analysis = router.analyze_field_extractability("Lunch with Sarah at noon")
+
+        self.assertEqual(analysis['recurrence'].pattern_matches, [])
+
+
+class _FailingPattern:
+    """Stand-in pattern that fails the test if it is ever run."""
+
+    def findall(self, text):
+        raise AssertionError("pattern should have been skipped")
+
+
+if __name__ == '__main__':
+    unittest.main()
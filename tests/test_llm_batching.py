@@ -0,0 +1,204 @@
+"""
+Unit tests for LLM micro-batching.
+"""
+
+import os
+import re
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from services.cancellation import CancellationToken, ParseCancelled, cancellation_scope, check_cancelled
+from services.llm_batching import BATCH_INSTRUCTIONS, BatchConfig, LLMMicroBatcher
+from services.llm_service import LLMResponse
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"title": {"type": "string"}},
+    "required": ["title"]
+}
+
+
+def _response(data, success=True):
+    return LLMResponse(success=success, data=data, error=None if success else "provider error",
+                       provider="openai", model="test", confidence=0.5, processing_time=0.1)
+
+
+def _validate(json_text, schema):
+    import json
+    data = json.loads(json_text)
+    if not isinstance(data.get('title'), str):
+        return False, None, "title must be a string"
+    return True, data, None
+
+
+class FakeProvider:
+    """Answers batched prompts by echoing each item's text as its title."""
+
+    def __init__(self, drop=(), invalid=(), fail=False):
+        self.calls = []
+        self.drop = set(drop)
+        self.invalid = set(invalid)
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def __call__(self, system_prompt, user_prompt, schema, temperature, completion_tokens):
+        with self.lock:
+            self.calls.append((system_prompt, user_prompt, completion_tokens))
+        if self.fail:
+            return _response(None, success=False)
+        if not system_prompt.endswith(BATCH_INSTRUCTIONS):
+            return _response({'title': f"single:{user_prompt}"})
+        results = []
+        for number, text in re.findall(r'Item (\d+):\n(\S+)', user_prompt):
+            number = int(number)
+            if number in self.drop:
+                continue
+            title = 42 if number in self.invalid else text
+            results.append({'id': number, 'result': {'title': title}})
+        return _response({'results': results})
+
+
+def _submit_concurrently(batcher, prompts):
+    results = [None] * len(prompts)
+
+    def run(index, prompt):
+        results[index] = batcher.submit("system", prompt, SCHEMA, 0.0)
+
+    threads = [threading.Thread(target=run, args=(i, p)) for i, p in enumerate(prompts)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+class TestLLMMicroBatcher(unittest.TestCase):
+    """Test cases for LLMMicroBatcher."""
+
+    def _batcher(self, provider, **config):
+        settings = {'enabled': True, 'window_ms': 200.0, 'max_batch_size': 8}
+        settings.update(config)
+        return LLMMicroBatcher(provider, _validate, BatchConfig(**settings), max_tokens=100000)
+
+    def test_concurrent_calls_share_one_request(self):
+        provider = FakeProvider()
+        batcher = self._batcher(provider, max_batch_size=4)
+
+        results = _submit_concurrently(batcher, ["a", "b", "c", "d"])
+
+        self.assertEqual(len(provider.calls), 1)
+        self.assertEqual([r.data['title'] for r in results], ["a", "b", "c", "d"])
+        self.assertEqual(batcher.get_stats()['batched_items'], 4)
+
+    def test_single_call_is_sent_unchanged(self):
+        provider = FakeProvider()
+        batcher = self._batcher(provider, window_ms=1.0)
+
+        response = batcher.submit("system", "alone", SCHEMA, 0.0)
+
+        self.assertEqual(provider.calls, [("system", "alone", None)])
+        self.assertEqual(response.data['title'], "single:alone")
+
+    def test_dropped_and_invalid_items_are_retried_individually(self):
+        provider = FakeProvider(drop={2}, invalid={3})
+        batcher = self._batcher(provider, max_batch_size=3)
+
+        results = _submit_concurrently(batcher, ["a", "b", "c"])
+
+        by_title = sorted(r.data['title'] for r in results)
+        self.assertEqual(len(provider.calls), 3)
+        self.assertIn("a", by_title)
+        self.assertEqual(sum(title.startswith("single:") for title in by_title), 2)
+        self.assertEqual(batcher.get_stats()['item_retries'], 2)
+
+    def test_provider_failure_reaches_every_caller(self):
+        provider = FakeProvider(fail=True)
+        batcher = self._batcher(provider, max_batch_size=2)
+
+        results = _submit_concurrently(batcher, ["a", "b"])
+
+        self.assertEqual(len(provider.calls), 1)
+        self.assertTrue(all(not r.success for r in results))
+
+    def test_cancelled_leader_still_answers_its_followers(self):
+        provider = FakeProvider()
+        leader_token = CancellationToken()
+
+        def call(*args):
+            # The leader's client goes away while the batch is on the wire
+            leader_token.cancel('client_disconnect')
+            check_cancelled()
+            return provider(*args)
+
+        batcher = LLMMicroBatcher(call, _validate, BatchConfig(enabled=True, window_ms=2000.0, max_batch_size=2),
+                                  max_tokens=100000)
+        leader_outcome = []
+
+        def lead():
+            with cancellation_scope(leader_token):
+                try:
+                    leader_outcome.append(batcher.submit("system", "a", SCHEMA, 0.0))
+                except ParseCancelled as e:
+                    leader_outcome.append(e)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        while not batcher._open:
+            time.sleep(0.001)
+        follower_response = batcher.submit("system", "b", SCHEMA, 0.0)
+        leader.join(5)
+
+        self.assertEqual(len(provider.calls), 1)
+        self.assertTrue(follower_response.success)
+        self.assertEqual(follower_response.data['title'], "b")
+        self.assertIsInstance(leader_outcome[0], ParseCancelled)
+
+    def test_batches_are_split_by_size(self):
+        provider = FakeProvider()
+        batcher = self._batcher(provider, max_batch_size=2)
+
+        results = _submit_concurrently(batcher, ["a", "b", "c", "d"])
+
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(batcher.get_stats()['batches'] + batcher.get_stats()['single_calls'], len(provider.calls))
+        self.assertGreaterEqual(len(provider.calls), 2)
+
+    def test_batches_are_split_by_token_budget(self):
+        provider = FakeProvider()
+        batcher = LLMMicroBatcher(provider, _validate, BatchConfig(enabled=True, window_ms=200.0), max_tokens=500)
+
+        results = _submit_concurrently(batcher, ["a", "b", "c", "d"])
+
+        # Each item reserves 150 completion tokens, so at most two fit in 500
+        self.assertTrue(all(r.success for r in results))
+        self.assertGreaterEqual(len(provider.calls), 2)
+
+
+class TestLLMEnhancerBatching(unittest.TestCase):
+    """Test cases for batching in LLMEnhancer."""
+
+    def test_batching_is_opt_in(self):
+        from services.llm_enhancer import LLMEnhancer
+
+        with patch.dict(os.environ, {'LLM_BATCHING_ENABLED': 'false'}):
+            self.assertIsNone(LLMEnhancer(llm_service=Mock()).batcher)
+
+    def test_schema_calls_go_through_batcher(self):
+        from services.llm_enhancer import LLMEnhancer
+
+        with patch.dict(os.environ, {'LLM_BATCHING_ENABLED': 'true', 'LLM_BATCHING_WINDOW_MS': '1'}):
+            enhancer = LLMEnhancer(llm_service=Mock(provider="openai"))
+        enhancer._send_llm_with_schema = Mock(return_value=_response({'title': 'x'}))
+        enhancer.batcher.call = enhancer._send_llm_with_schema
+
+        response = enhancer._call_llm_with_schema("system", "user", SCHEMA, 0.0)
+
+        self.assertTrue(response.success)
+        self.assertEqual(enhancer.batcher.get_stats()['single_calls'], 1)
+        self.assertTrue(enhancer.get_status()['batching']['enabled'])
+
+
+if __name__ == '__main__':
+    unittest.main()
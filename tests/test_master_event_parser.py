@@ -551,5 +551,79 @@ class TestMasterEventParserPerformance:
         assert result.processing_time > 0
 
 
+class TestSpeculativeExecution:
+    """Test suite for speculative regex + LLM execution."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_llm_service = Mock(spec=LLMService)
+        self.mock_llm_service.is_available.return_value = True
+        self.parser = MasterEventParser(llm_service=self.mock_llm_service)
+        self.parser.configure(speculative_execution=True, speculative_llm_timeout=2.0)
+        self.start = datetime(2026, 10, 23, 14, 0)
+
+    def _slow_llm(self, delay, event):
+        def extract(*args, **kwargs):
+            import time
+            time.sleep(delay)
+            return event
+        return extract
+
+    def test_confident_regex_returns_without_waiting_for_llm(self):
+        import time
+        llm_event = ParsedEvent(title="LLM title", start_datetime=self.start, confidence_score=0.9)
+        self.mock_llm_service.llm_extract_event.side_effect = self._slow_llm(1.5, llm_event)
+        regex_event = ParsedEvent(title="Team sync", start_datetime=self.start, confidence_score=0.9)
+
+        with patch.object(self.parser, '_regex_fallback_extraction', return_value=regex_event):
+            started = time.perf_counter()
+            llm_result, regex_result, method = self.parser._speculative_extraction("Team sync Friday 2pm")
+            elapsed = time.perf_counter() - started
+
+        assert method == "regex_speculative"
+        assert llm_result is None
+        assert regex_result.title == "Team sync"
+        assert elapsed < 1.0
+        assert self.parser.performance_stats['speculative_regex_wins'] == 1
+
+    def test_low_confidence_regex_merges_with_llm(self):
+        llm_event = ParsedEvent(title="Team sync", start_datetime=self.start, confidence_score=0.8)
+        self.mock_llm_service.llm_extract_event.return_value = llm_event
+        regex_event = ParsedEvent(
+            title="sync", start_datetime=self.start, location="Room 301", confidence_score=0.5
+        )
+
+        with patch.object(self.parser, '_regex_fallback_extraction', return_value=regex_event):
+            llm_result, regex_result, method = self.parser._speculative_extraction("Team sync Friday 2pm in Room 301")
+
+        assert method == "speculative_merged"
+        assert llm_result.title == "Team sync"
+        assert llm_result.location == "Room 301"
+        assert llm_result.extraction_metadata['speculative_merge']['regex_fields'] == ['location']
+
+    def test_llm_timeout_falls_back_to_regex(self):
+        self.parser.configure(speculative_llm_timeout=0.1)
+        llm_event = ParsedEvent(title="Late", start_datetime=self.start, confidence_score=0.9)
+        self.mock_llm_service.llm_extract_event.side_effect = self._slow_llm(0.5, llm_event)
+        regex_event = ParsedEvent(title="Team sync", start_datetime=self.start, confidence_score=0.5)
+
+        with patch.object(self.parser, '_regex_fallback_extraction', return_value=regex_event):
+            llm_result, regex_result, method = self.parser._speculative_extraction("Team sync Friday 2pm")
+
+        assert method == "regex_fallback"
+        assert llm_result is None
+        assert regex_result is regex_event
+
+    def test_parse_event_uses_speculative_path(self):
+        self.mock_llm_service.is_available.return_value = False
+
+        result = self.parser.parse_event("Team meeting tomorrow at 2pm in Conference Room A")
+
+        assert result.success
+        assert result.metadata['configuration']['speculative_execution'] is True
+        assert result.parsing_method.startswith(("regex_speculative", "regex_fallback"))
+        self.mock_llm_service.llm_extract_event.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
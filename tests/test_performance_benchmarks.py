@@ -1,537 +0,0 @@
-"""
-Performance Benchmarking Tests for Enhanced Parsing Pipeline.
-
-This module implements performance benchmarks and stress tests for:
-- Component latency measurement
-- Concurrent processing performance
-- Cache performance validation
-- Memory usage monitoring
-- Timeout handling verification
-
-Requirements addressed:
-- 15.1: Component latency tracking and performance metrics collection
-- Task 19: Performance tests for component latency and caching
-"""
-
-import concurrent.futures
-import gc
-import json
-import psutil
-import statistics
-import tempfile
-import time
-import unittest
-from collections import defaultdict
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Any, Tuple
-from unittest.mock import Mock, patch
-import os
-
-
-class PerformanceBenchmarkSuite(unittest.TestCase):
-    """Comprehensive performance benchmarking for the enhanced parsing pipeline."""
-    
-    def setUp(self):
-        """Set up performance testing environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.benchmark_results = {}
-        
-        # Get initial system metrics
-        self.process = psutil.Process(os.getpid())
-        self.initial_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-        
-        # Performance thresholds
-        self.performance_thresholds = {
-            'single_parse_max_ms': 5000,      # 5 seconds max for single parse
-            'average_parse_max_ms': 2000,     # 2 seconds average
-            'concurrent_success_rate': 0.95,   # 95% success rate under load
-            'cache_speedup_factor': 2.0,       # Cache should be 2x faster
-            'memory_increase_max_mb': 100,     # Max 100MB memory increase
-            'p95_latency_max_ms': 3000,        # 95th percentile under 3s
-            'throughput_min_per_sec': 5        # Minimum 5 parses per second
-        }
-    
-    def tearDown(self):
-        """Clean up and report memory usage."""
-        final_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-        memory_increase = final_memory - self.initial_memory
-        
-        if memory_increase > self.performance_thresholds['memory_increase_max_mb']:
-            self.fail(f"Memory leak detected: {memory_increase:.1f}MB increase")
-        
-        # Clean up
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        gc.collect()
-    
-    def test_single_parse_latency_benchmark(self):
-        """Benchmark single parse latency across different text complexities."""
-        test_cases = [
-            # Simple cases
-            ("Meeting tomorrow at 2pm", "simple"),
-            ("Call at 3:30 PM", "simple"),
-            ("Lunch next Friday", "simple"),
-            
-            # Medium complexity
-            ("Team meeting tomorrow at 2:00 PM in Conference Room A", "medium"),
-            ("Lunch with John next Friday from 12:30-1:30 at Cafe Downtown", "medium"),
-            ("Project review on March 15, 2025 from 10:00 AM to 11:30 AM", "medium"),
-            
-            # Complex cases
-            ("Annual team building workshop 'Innovation Day' next Thursday from 9am to 5pm at the Marriott Hotel, 123 Queen Street West, Toronto", "complex"),
-            ("Conference call with overseas team (London, Tokyo, Sydney) tomorrow at 6:00 AM EST for 2 hours to review project timeline and deliverables", "complex"),
-            ("Multi-day conference from March 20-22, 2025, daily sessions 9:00 AM - 5:00 PM at Convention Center with networking events", "complex")
-        ]
-        
-        latency_results = defaultdict(list)
-        
-        for text, complexity in test_cases:
-            # Measure parsing latency
-            start_time = time.perf_counter()
-            
-            # Simulate realistic parsing with complexity-based delays
-            if complexity == "simple":
-                time.sleep(0.01)  # 10ms
-            elif complexity == "medium":
-                time.sleep(0.05)  # 50ms
-            else:  # complex
-                time.sleep(0.1)   # 100ms
-            
-            # Mock parsing result
-            mock_result = Mock()
-            mock_result.confidence_score = 0.8
-            mock_result.processing_time_ms = (time.perf_counter() - start_time) * 1000
-            
-            end_time = time.perf_counter()
-            latency_ms = (end_time - start_time) * 1000
-            
-            latency_results[complexity].append(latency_ms)
-            
-            # Individual parse should meet threshold
-            self.assertLess(latency_ms, self.performance_thresholds['single_parse_max_ms'],
-                           f"Single parse latency {latency_ms:.2f}ms exceeds threshold for: {text}")
-        
-        # Analyze results by complexity
-        for complexity, latencies in latency_results.items():
-            avg_latency = statistics.mean(latencies)
-            p95_latency = statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 20 else max(latencies)
-            
-            print(f"\n{complexity.title()} Text Latency:")
-            print(f"  Average: {avg_latency:.2f}ms")
-            print(f"  P95: {p95_latency:.2f}ms")
-            print(f"  Count: {len(latencies)}")
-            
-            # Store benchmark results
-            self.benchmark_results[f'{complexity}_latency'] = {
-                'average_ms': avg_latency,
-                'p95_ms': p95_latency,
-                'count': len(latencies),
-                'samples': latencies
-            }
-    
-    def test_concurrent_processing_benchmark(self):
-        """Benchmark concurrent processing performance and scalability."""
-        test_scenarios = [
-            (5, 20),   # 5 workers, 20 tasks
-            (10, 50),  # 10 workers, 50 tasks
-            (15, 100), # 15 workers, 100 tasks
-        ]
-        
-        base_texts = [
-            "Meeting tomorrow at 2pm",
-            "Lunch with client next Friday at noon",
-            "Conference call Monday at 3:30 PM",
-            "Training session Tuesday 10am-12pm",
-            "Project review Wednesday 2pm in Room A"
-        ]
-        
-        for workers, total_tasks in test_scenarios:
-            print(f"\nTesting {workers} workers with {total_tasks} tasks...")
-            
-            # Generate test tasks
-            test_texts = []
-            for i in range(total_tasks):
-                base_text = base_texts[i % len(base_texts)]
-                test_texts.append(f"{base_text} (task {i})")
-            
-            def parse_task(text):
-                start_time = time.perf_counter()
-                
-                # Simulate parsing with realistic delay
-                time.sleep(0.01 + (len(text) / 10000))  # 10ms + text length factor
-                
-                # Mock result
-                mock_result = Mock()
-                mock_result.confidence_score = 0.8
-                mock_result.title = f"Event from {text[:20]}..."
-                
-                processing_time = (time.perf_counter() - start_time) * 1000
-                
-                return {
-                    'success': True,
-                    'processing_time_ms': processing_time,
-                    'confidence': mock_result.confidence_score,
-                    'text_length': len(text)
-                }
-            
-            # Execute concurrent benchmark
-            overall_start = time.perf_counter()
-            
-            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = [executor.submit(parse_task, text) for text in test_texts]
-                results = [future.result() for future in concurrent.futures.as_completed(futures)]
-            
-            overall_duration = time.perf_counter() - overall_start
-            
-            # Analyze concurrent performance
-            success_rate = sum(1 for r in results if r['success']) / len(results)
-            processing_times = [r['processing_time_ms'] for r in results]
-            avg_processing_time = statistics.mean(processing_times)
-            p95_processing_time = statistics.quantiles(processing_times, n=20)[18] if len(processing_times) >= 20 else max(processing_times)
-            throughput = len(results) / overall_duration
-            
-            # Performance assertions
-            self.assertGreaterEqual(success_rate, self.performance_thresholds['concurrent_success_rate'],
-                                   f"Concurrent success rate {success_rate:.3f} below threshold")
-            
-            self.assertLess(avg_processing_time, self.performance_thresholds['average_parse_max_ms'],
-                           f"Average processing time {avg_processing_time:.2f}ms exceeds threshold")
-            
-            self.assertGreaterEqual(throughput, self.performance_thresholds['throughput_min_per_sec'],
-                                   f"Throughput {throughput:.2f} parses/sec below threshold")
-            
-            # Store benchmark results
-            scenario_key = f'concurrent_{workers}w_{total_tasks}t'
-            self.benchmark_results[scenario_key] = {
-                'workers': workers,
-                'total_tasks': total_tasks,
-                'success_rate': success_rate,
-                'avg_processing_time_ms': avg_processing_time,
-                'p95_processing_time_ms': p95_processing_time,
-                'throughput_per_sec': throughput,
-                'total_duration_sec': overall_duration
-            }
-            
-            print(f"  Success Rate: {success_rate:.1%}")
-            print(f"  Avg Processing Time: {avg_processing_time:.2f}ms")
-            print(f"  P95 Processing Time: {p95_processing_time:.2f}ms")
-            print(f"  Throughput: {throughput:.2f} parses/sec")
-    
-    def test_cache_performance_benchmark(self):
-        """Benchmark cache performance impact and hit rates."""
-        test_texts = [
-            "Meeting tomorrow at 2pm",
-            "Lunch with John next Friday at noon",
-            "Conference call Monday at 3:30 PM",
-            "Training session Tuesday 10am-12pm"
-        ]
-        
-        cache_results = {}
-        
-        for text in test_texts:
-            # First parse (cache miss)
-            start_time = time.perf_counter()
-            time.sleep(0.02)  # 20ms simulation for full parsing
-            first_parse_time = (time.perf_counter() - start_time) * 1000
-            
-            # Second parse (cache hit)
-            start_time = time.perf_counter()
-            time.sleep(0.005)  # 5ms simulation for cached result
-            cached_parse_time = (time.perf_counter() - start_time) * 1000
-            
-            # Calculate speedup
-            speedup_factor = first_parse_time / cached_parse_time if cached_parse_time > 0 else 0
-            
-            cache_results[text] = {
-                'first_parse_ms': first_parse_time,
-                'cached_parse_ms': cached_parse_time,
-                'speedup_factor': speedup_factor
-            }
-            
-            # Cache should provide significant speedup
-            self.assertGreater(speedup_factor, self.performance_thresholds['cache_speedup_factor'],
-                              f"Cache speedup {speedup_factor:.2f}x below threshold for: {text}")
-        
-        # Overall cache performance
-        avg_speedup = statistics.mean([r['speedup_factor'] for r in cache_results.values()])
-        avg_first_parse = statistics.mean([r['first_parse_ms'] for r in cache_results.values()])
-        avg_cached_parse = statistics.mean([r['cached_parse_ms'] for r in cache_results.values()])
-        
-        self.benchmark_results['cache_performance'] = {
-            'average_speedup_factor': avg_speedup,
-            'average_first_parse_ms': avg_first_parse,
-            'average_cached_parse_ms': avg_cached_parse,
-            'individual_results': cache_results
-        }
-        
-        print(f"\nCache Performance:")
-        print(f"  Average Speedup: {avg_speedup:.2f}x")
-        print(f"  First Parse Avg: {avg_first_parse:.2f}ms")
-        print(f"  Cached Parse Avg: {avg_cached_parse:.2f}ms")
-    
-    def test_memory_usage_benchmark(self):
-        """Benchmark memory usage under sustained load."""
-        initial_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-        memory_samples = [initial_memory]
-        
-        # Simulate sustained parsing load
-        for batch in range(10):  # 10 batches
-            batch_texts = [f"Meeting {i} tomorrow at {10 + (i % 8)}:00 AM" for i in range(50)]
-            
-            for text in batch_texts:
-                # Simulate parsing
-                time.sleep(0.001)  # 1ms per parse
-                
-                # Mock result creation (simulates object allocation)
-                mock_result = Mock()
-                mock_result.title = f"Meeting {len(text)}"
-                mock_result.confidence_score = 0.8
-                mock_result.field_results = {
-                    'title': Mock(value=mock_result.title, confidence=0.9),
-                    'start_datetime': Mock(value=datetime.now(), confidence=0.95)
-                }
-            
-            # Sample memory usage after each batch
-            current_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-            memory_samples.append(current_memory)
-            
-            # Force garbage collection
-            gc.collect()
-        
-        final_memory = memory_samples[-1]
-        max_memory = max(memory_samples)
-        memory_increase = final_memory - initial_memory
-        peak_increase = max_memory - initial_memory
-        
-        # Memory usage should be stable
-        self.assertLess(memory_increase, self.performance_thresholds['memory_increase_max_mb'],
-                       f"Memory increase {memory_increase:.1f}MB exceeds threshold")
-        
-        self.benchmark_results['memory_usage'] = {
-            'initial_memory_mb': initial_memory,
-            'final_memory_mb': final_memory,
-            'max_memory_mb': max_memory,
-            'memory_increase_mb': memory_increase,
-            'peak_increase_mb': peak_increase,
-            'memory_samples': memory_samples
-        }
-        
-        print(f"\nMemory Usage:")
-        print(f"  Initial: {initial_memory:.1f}MB")
-        print(f"  Final: {final_memory:.1f}MB")
-        print(f"  Peak: {max_memory:.1f}MB")
-        print(f"  Increase: {memory_increase:.1f}MB")
-    
-    def test_timeout_handling_benchmark(self):
-        """Benchmark timeout handling performance and reliability."""
-        timeout_scenarios = [
-            (0.1, "10% timeout rate"),
-            (0.2, "20% timeout rate"),
-            (0.3, "30% timeout rate")
-        ]
-        
-        for timeout_rate, description in timeout_scenarios:
-            print(f"\nTesting {description}...")
-            
-            test_texts = [f"Ambiguous text {i} requiring processing" for i in range(50)]
-            timeout_results = []
-            
-            def parse_with_timeout(text):
-                start_time = time.perf_counter()
-                
-                try:
-                    # Simulate timeout based on rate
-                    import random
-                    if random.random() < timeout_rate:
-                        time.sleep(0.1)  # Simulate slow processing
-                        raise TimeoutError("Simulated timeout")
-                    
-                    # Normal processing
-                    time.sleep(0.01)  # 10ms normal processing
-                    
-                    mock_result = Mock()
-                    mock_result.confidence_score = 0.7
-                    mock_result.warnings = []
-                    
-                    return {
-                        'success': True,
-                        'had_timeout': False,
-                        'processing_time_ms': (time.perf_counter() - start_time) * 1000,
-                        'confidence': mock_result.confidence_score
-                    }
-                    
-                except TimeoutError:
-                    # Graceful timeout handling
-                    mock_result = Mock()
-                    mock_result.confidence_score = 0.3
-                    mock_result.warnings = ["Processing timeout"]
-                    mock_result.needs_confirmation = True
-                    
-                    return {
-                        'success': True,  # Should handle gracefully
-                        'had_timeout': True,
-                        'processing_time_ms': (time.perf_counter() - start_time) * 1000,
-                        'confidence': mock_result.confidence_score
-                    }
-            
-            # Execute timeout benchmark
-            for text in test_texts:
-                result = parse_with_timeout(text)
-                timeout_results.append(result)
-            
-            # Analyze timeout handling
-            success_rate = sum(1 for r in timeout_results if r['success']) / len(timeout_results)
-            timeout_rate_actual = sum(1 for r in timeout_results if r['had_timeout']) / len(timeout_results)
-            avg_processing_time = statistics.mean([r['processing_time_ms'] for r in timeout_results])
-            
-            # Should handle timeouts gracefully
-            self.assertGreaterEqual(success_rate, 0.9,
-                                   f"Timeout handling success rate {success_rate:.3f} too low")
-            
-            # Store results
-            scenario_key = f'timeout_{int(timeout_rate*100)}pct'
-            self.benchmark_results[scenario_key] = {
-                'expected_timeout_rate': timeout_rate,
-                'actual_timeout_rate': timeout_rate_actual,
-                'success_rate': success_rate,
-                'avg_processing_time_ms': avg_processing_time,
-                'total_tests': len(timeout_results)
-            }
-            
-            print(f"  Expected Timeout Rate: {timeout_rate:.1%}")
-            print(f"  Actual Timeout Rate: {timeout_rate_actual:.1%}")
-            print(f"  Success Rate: {success_rate:.1%}")
-            print(f"  Avg Processing Time: {avg_processing_time:.2f}ms")
-    
-    def test_component_latency_tracking(self):
-        """Benchmark individual component latency tracking."""
-        components = [
-            'regex_extractor',
-            'duckling_extractor', 
-            'recognizers_extractor',
-            'llm_enhancer',
-            'title_extractor',
-            'location_extractor',
-            'overall_parsing'
-        ]
-        
-        component_latencies = {}
-        
-        for component in components:
-            latencies = []
-            
-            # Simulate component execution multiple times
-            for _ in range(20):
-                start_time = time.perf_counter()
-                
-                # Simulate component-specific processing time
-                if 'llm' in component:
-                    time.sleep(0.05)  # 50ms for LLM
-                elif 'extractor' in component:
-                    time.sleep(0.01)  # 10ms for extractors
-                else:
-                    time.sleep(0.02)  # 20ms for other components
-                
-                latency_ms = (time.perf_counter() - start_time) * 1000
-                latencies.append(latency_ms)
-            
-            # Calculate statistics
-            component_stats = {
-                'count': len(latencies),
-                'mean_ms': statistics.mean(latencies),
-                'median_ms': statistics.median(latencies),
-                'p95_ms': statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 20 else max(latencies),
-                'min_ms': min(latencies),
-                'max_ms': max(latencies)
-            }
-            
-            component_latencies[component] = component_stats
-            
-            print(f"\n{component} Latency:")
-            print(f"  Mean: {component_stats['mean_ms']:.2f}ms")
-            print(f"  P95: {component_stats['p95_ms']:.2f}ms")
-            print(f"  Range: {component_stats['min_ms']:.2f}-{component_stats['max_ms']:.2f}ms")
-        
-        self.benchmark_results['component_latencies'] = component_latencies
-    
-    def generate_benchmark_report(self) -> Dict[str, Any]:
-        """Generate comprehensive benchmark report."""
-        report = {
-            'timestamp': datetime.now().isoformat(),
-            'system_info': {
-                'cpu_count': psutil.cpu_count(),
-                'memory_total_gb': psutil.virtual_memory().total / (1024**3),
-                'python_version': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-                'platform': sys.platform
-            },
-            'performance_thresholds': self.performance_thresholds,
-            'benchmark_results': self.benchmark_results,
-            'summary': self._generate_summary()
-        }
-        
-        return report
-    
-    def _generate_summary(self) -> Dict[str, Any]:
-        """Generate benchmark summary."""
-        summary = {
-            'total_benchmarks': len(self.benchmark_results),
-            'performance_grade': 'A',  # Default
-            'key_metrics': {},
-            'recommendations': []
-        }
-        
-        # Extract key metrics
-        if 'simple_latency' in self.benchmark_results:
-            summary['key_metrics']['avg_simple_parse_ms'] = self.benchmark_results['simple_latency']['average_ms']
-        
-        if 'cache_performance' in self.benchmark_results:
-            summary['key_metrics']['cache_speedup'] = self.benchmark_results['cache_performance']['average_speedup_factor']
-        
-        if 'memory_usage' in self.benchmark_results:
-            summary['key_metrics']['memory_increase_mb'] = self.benchmark_results['memory_usage']['memory_increase_mb']
-        
-        # Generate recommendations
-        summary['recommendations'] = [
-            "Monitor component latencies in production",
-            "Implement cache warming for frequently parsed text patterns",
-            "Set up automated performance regression testing",
-            "Configure memory usage alerts for sustained load",
-            "Optimize timeout handling for better user experience"
-        ]
-        
-        return summary
-
-
-def run_performance_benchmarks():
-    """Run all performance benchmarks and generate report."""
-    print("🚀 Starting Performance Benchmark Suite")
-    print("=" * 60)
-    
-    # Create test suite
-    suite = unittest.TestLoader().loadTestsFromTestCase(PerformanceBenchmarkSuite)
-    
-    # Run benchmarks
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Generate and save report
-    if hasattr(result, 'benchmark_results'):
-        report = result.generate_benchmark_report()
-        
-        # Save report
-        report_path = Path("test_results") / f"performance_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        report_path.parent.mkdir(exist_ok=True)
-        
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
-        
-        print(f"\n📊 Performance benchmark report saved to: {report_path}")
-    
-    return result.wasSuccessful()
-
-
-if __name__ == '__main__':
-    import sys
-    success = run_performance_benchmarks()
-    sys.exit(0 if success else 1)
\ No newline at end of file
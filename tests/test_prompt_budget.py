@@ -0,0 +1,134 @@
+"""
+Unit tests for token-budgeted prompt construction and token accounting.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from services.prompt_budget import (
+    PromptBudget,
+    TokenUsageTracker,
+    compact_text,
+    compact_whitespace,
+    estimate_tokens,
+    ollama_usage,
+    openai_usage,
+)
+
+FILLER = "Thanks for the update on the quarterly numbers and the spreadsheet review. " * 60
+EVENT_SENTENCE = "Team lunch on Friday at 12:30pm at Luigi's."
+
+
+class TestCompaction(unittest.TestCase):
+    """Test cases for text compaction."""
+
+    def test_estimate_counts_bytes(self):
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertEqual(estimate_tokens("abcd" * 10), 10)
+        self.assertGreater(estimate_tokens("日本語" * 10), estimate_tokens("abc" * 10))
+
+    def test_whitespace_keeps_line_structure(self):
+        self.assertEqual(compact_whitespace("  a \t b  \n\n\n\nc   \n d "), "a b\n\nc\n d")
+
+    def test_short_text_is_only_whitespace_compacted(self):
+        self.assertEqual(compact_text("Lunch   tomorrow\tat noon", 100), "Lunch tomorrow at noon")
+
+    def test_long_text_keeps_event_region_within_budget(self):
+        text = FILLER + EVENT_SENTENCE + " " + FILLER
+
+        compacted = compact_text(text, 200)
+
+        self.assertLessEqual(estimate_tokens(compacted), 200)
+        self.assertIn(EVENT_SENTENCE, compacted)
+
+    def test_text_without_event_region_is_truncated(self):
+        compacted = compact_text(FILLER, 50)
+
+        self.assertLessEqual(estimate_tokens(compacted), 50)
+        self.assertTrue(FILLER.startswith(compacted[:-2]))
+
+    def test_budget_subtracts_fixed_parts_and_completion(self):
+        budget = PromptBudget(context_tokens=1000, margin_tokens=0)
+
+        self.assertEqual(budget.available_tokens(200, "x" * 400), 700)
+        self.assertLessEqual(estimate_tokens(budget.fit_text(FILLER, 200, "x" * 400)), 700)
+
+
+class TestTokenUsageTracker(unittest.TestCase):
+    """Test cases for TokenUsageTracker."""
+
+    def test_reported_counts_are_used(self):
+        tracker = TokenUsageTracker()
+        usage = tracker.record('llm_service', 'ollama', "prompt", "answer", 120, 30)
+
+        self.assertEqual((usage.prompt_tokens, usage.completion_tokens), (120, 30))
+        self.assertFalse(usage.estimated)
+
+    def test_missing_counts_are_estimated(self):
+        tracker = TokenUsageTracker()
+        usage = tracker.record('llm_service', 'ollama', "p" * 400, "c" * 40)
+
+        self.assertEqual((usage.prompt_tokens, usage.completion_tokens), (100, 10))
+        self.assertTrue(usage.estimated)
+
+    def test_stats_and_listeners(self):
+        tracker = TokenUsageTracker()
+        seen = []
+        tracker.add_listener(seen.append)
+        tracker.add_listener(Mock(side_effect=RuntimeError("boom")))
+        tracker.record('llm_enhancer', 'openai', "", "", 10, 5)
+        tracker.record('llm_text_enhancer', 'groq', "", "", 20, 5)
+
+        self.assertEqual(len(seen), 2)
+        self.assertEqual(tracker.get_stats()['total_tokens'], 40)
+        stats = tracker.get_stats('llm_enhancer')
+        self.assertEqual(stats['calls'], 1)
+        self.assertEqual(stats['by_component']['llm_enhancer']['openai']['prompt_tokens'], 10)
+
+    def test_provider_usage_extraction(self):
+        self.assertEqual(ollama_usage({'prompt_eval_count': 50, 'eval_count': 7}), (50, 7))
+        self.assertEqual(ollama_usage({}), (None, None))
+        self.assertEqual(openai_usage({'usage': {'prompt_tokens': 9, 'completion_tokens': 3}}), (9, 3))
+        response = Mock()
+        response.usage.prompt_tokens = 11
+        response.usage.completion_tokens = 4
+        self.assertEqual(openai_usage(response), (11, 4))
+        # Mocks without real counts are treated as unreported
+        self.assertEqual(openai_usage(Mock()), (None, None))
+
+
+class TestLLMCallIntegration(unittest.TestCase):
+    """Test cases for budgeted prompts in the LLM services."""
+
+    def test_ollama_call_uses_budget_context_and_records_usage(self):
+        from services.llm_service import LLMService
+
+        with patch.object(LLMService, '_detect_best_provider', return_value='heuristic'):
+            service = LLMService(provider="auto")
+        service.ollama_available = True
+        body = {'response': '{"title": "Lunch"}', 'prompt_eval_count': 321, 'eval_count': 12}
+        tracker = TokenUsageTracker()
+
+        with patch('services.llm_service.requests.post') as post, \
+                patch('services.llm_service.get_token_usage_tracker', return_value=tracker), \
+                patch('services.llm_service.get_prompt_budget', return_value=PromptBudget(context_tokens=4096)):
+            post.return_value = Mock(status_code=200, json=Mock(return_value=body))
+            service._call_ollama("system", "user")
+
+        self.assertEqual(post.call_args.kwargs['json']['options']['num_ctx'], 4096)
+        self.assertEqual(tracker.get_stats('llm_service')['prompt_tokens'], 321)
+
+    def test_field_enhancement_system_prompt_has_stable_prefix(self):
+        from services.llm_enhancer import LLMEnhancer
+
+        enhancer = LLMEnhancer(llm_service=Mock())
+        first = enhancer._get_field_enhancement_system_prompt({'start_datetime': 'x'})
+        second = enhancer._get_field_enhancement_system_prompt({'location': 'y', 'title': 'z'})
+
+        prefix = first[:first.index("LOCKED fields: ")]
+        self.assertTrue(second.startswith(prefix))
+        self.assertIn("['location', 'title']", second)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Unit tests for the streaming quantile sketches and their use in the monitors.
+"""
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from services.cache_manager import CacheManager
+from services.performance_monitor import ComponentLatency, PerformanceMonitor
+from services.quantile_sketch import QuantileSketch, WindowedSketch
+
+
+class FakeClock:
+    """Manually advanced clock for window tests."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test cases for QuantileSketch."""
+
+    def setUp(self):
+        rng = random.Random(3)
+        self.values = [rng.lognormvariate(3, 1) for _ in range(20000)]
+
+    def test_small_sketches_are_exact(self):
+        sketch = QuantileSketch()
+        for value in [100, 200, 150, 300, 250]:
+            sketch.add(value)
+
+        self.assertEqual(sketch.quantile(0.5), 200.0)
+        self.assertEqual(sketch.quantile(0.95), np.percentile([100, 200, 150, 300, 250], 95))
+        self.assertEqual(sketch.count_below(200), 2)
+
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in self.values:
+            sketch.add(value)
+
+        for q in (0.5, 0.9, 0.95, 0.99, 0.999):
+            expected = float(np.quantile(self.values, q, method='lower'))
+            self.assertAlmostEqual(sketch.quantile(q) / expected, 1.0, delta=0.011)
+
+        self.assertEqual(sketch.count, len(self.values))
+        self.assertAlmostEqual(sketch.mean, float(np.mean(self.values)), places=6)
+        self.assertEqual(sketch.min, min(self.values))
+        self.assertEqual(sketch.max, max(self.values))
+
+    def test_merge_matches_single_sketch(self):
+        combined = QuantileSketch()
+        parts = [QuantileSketch() for _ in range(4)]
+        for i, value in enumerate(self.values):
+            combined.add(value)
+            parts[i % 4].add(value)
+
+        merged = QuantileSketch()
+        for part in parts:
+            merged.merge(part)
+
+        merged_stats, combined_stats = merged.get_stats(), combined.get_stats()
+        # Sums differ only by floating point summation order
+        self.assertAlmostEqual(merged_stats.pop('mean'), combined_stats.pop('mean'), places=9)
+        self.assertEqual(merged_stats, combined_stats)
+
+    def test_serialization_round_trip(self):
+        sketch = QuantileSketch()
+        for value in self.values[:500]:
+            sketch.add(value)
+
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        self.assertEqual(restored.get_stats(), sketch.get_stats())
+
+    def test_zero_and_empty(self):
+        self.assertEqual(QuantileSketch().get_stats()['p99'], 0.0)
+
+        sketch = QuantileSketch(exact_limit=0)
+        for value in [0.0, 0.0, 0.5]:
+            sketch.add(value)
+        self.assertEqual(sketch.quantile(0.5), 0.0)
+        self.assertEqual(sketch.count_below(0.4), 2)
+
+
+class TestWindowedSketch(unittest.TestCase):
+    """Test cases for WindowedSketch rolling windows."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sketch = WindowedSketch(clock=self.clock)
+
+    def test_windows_expire_old_samples(self):
+        self.sketch.add(100.0)
+        self.clock.now += 120
+        self.sketch.add(10.0)
+
+        self.assertEqual(self.sketch.get_stats('1m')['count'], 1)
+        self.assertEqual(self.sketch.get_stats('5m')['count'], 2)
+        self.assertEqual(self.sketch.get_stats('1h')['max'], 100.0)
+
+        self.clock.now += 3600
+        self.assertEqual(self.sketch.get_stats('1h')['count'], 0)
+        self.assertEqual(self.sketch.get_stats(None)['count'], 2)
+
+    def test_merge_across_workers(self):
+        other = WindowedSketch(clock=self.clock)
+        self.sketch.add(1.0)
+        other.add(3.0)
+
+        restored = WindowedSketch.from_dict(json.loads(json.dumps(other.to_dict())), clock=self.clock)
+        self.sketch.merge(restored)
+
+        stats = self.sketch.get_stats('1m')
+        self.assertEqual(stats['count'], 2)
+        self.assertEqual(stats['mean'], 2.0)
+        self.assertEqual(len(self.sketch), 2)
+
+    def test_unknown_window(self):
+        with self.assertRaises(KeyError):
+            self.sketch.snapshot('1d')
+
+
+class TestSketchBackedMonitors(unittest.TestCase):
+    """Test the monitors that report latencies from sketches."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.golden_set_path = os.path.join(self.temp_dir, "golden_set.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_component_latency_windows_and_merge(self):
+        first = ComponentLatency("regex_extractor")
+        second = ComponentLatency("regex_extractor")
+        for value in range(1, 101):
+            first.add_measurement(float(value))
+            second.add_measurement(float(value) + 100)
+
+        first.merge(second)
+
+        stats = first.get_stats()
+        self.assertEqual(stats['count'], 200)
+        self.assertEqual(first.total_calls, 200)
+        self.assertAlmostEqual(stats['median'], 100.0, delta=2.0)
+        self.assertEqual(set(first.get_window_stats()), {'1m', '5m', '1h'})
+
+    def test_performance_monitor_export_and_merge(self):
+        worker = PerformanceMonitor(golden_set_path=self.golden_set_path)
+        worker.track_component_latency('llm_enhancer', 250.0)
+        worker.record_request(success=True, quality_score=0.9)
+        worker.record_request(success=True, quality_score=0.5)
+
+        master = PerformanceMonitor(golden_set_path=self.golden_set_path)
+        master.merge_latency_sketches(json.loads(json.dumps(worker.export_latency_sketches())))
+
+        metrics = master.get_performance_metrics()
+        self.assertEqual(metrics.component_latencies['llm_enhancer']['count'], 1)
+        self.assertEqual(metrics.component_latency_windows['llm_enhancer']['1m']['max'], 250.0)
+        self.assertAlmostEqual(metrics.average_quality_score, 0.7)
+        self.assertEqual(metrics.quality_distribution, {'high': 1, 'medium': 1, 'low': 0})
+
+    def test_cache_stats_report_percentiles(self):
+        cache = CacheManager()
+        for value in range(1, 101):
+            cache._update_performance_stats(True, float(value))
+        cache._update_performance_stats(False, 40.0)
+
+        stats = cache.get_stats()
+        self.assertAlmostEqual(stats.average_hit_time_ms, 50.5)
+        self.assertAlmostEqual(stats.p99_hit_time_ms, 99.0, delta=1.5)
+        self.assertEqual(stats.average_miss_time_ms, 40.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Unit tests for the regex backtracking guard.
+"""
+
+import re
+import unittest
+
+from services.regex_guard import (
+    MODE_PREFIX,
+    guard_pattern,
+    regex_budget_exhausted,
+    regex_cpu_budget,
+)
+
+
+def _long_text(lines: int = 400) -> str:
+    return "".join(f"- item {i} at {i % 12 + 1}:{i % 60:02d} in Room {i}\n" for i in range(lines))
+
+
+class TestGuardedPattern(unittest.TestCase):
+    """Test cases for GuardedPattern."""
+
+    def test_window_mode_matches_unguarded_pattern(self):
+        pattern = re.compile(r'\b(\d{1,2}):(\d{2})\b')
+        guarded = guard_pattern(pattern, max_input=500, overlap=64)
+        text = _long_text()
+
+        self.assertEqual(
+            [m.span() for m in guarded.finditer(text)],
+            [m.span() for m in pattern.finditer(text)]
+        )
+        self.assertEqual(guarded.findall(text), pattern.findall(text))
+        self.assertEqual(guarded.sub(r'\2:\1', text), pattern.sub(r'\2:\1', text))
+        self.assertEqual(guarded.search(text).span(), pattern.search(text).span())
+
+    def test_window_mode_keeps_multiline_anchors(self):
+        pattern = re.compile(r'^-\s+item\s+(\d+)', re.MULTILINE)
+        guarded = guard_pattern(pattern, max_input=300)
+        text = _long_text()
+
+        self.assertEqual(guarded.findall(text), [str(i) for i in range(400)])
+
+    def test_prefix_mode_only_scans_the_start(self):
+        guarded = guard_pattern(re.compile(r'Room (\d+)'), max_input=100, mode=MODE_PREFIX)
+        text = _long_text()
+
+        self.assertEqual(guarded.findall(text), ['0', '1', '2'])
+        self.assertIsNotNone(guarded.match("Room 7"))
+        self.assertEqual(guarded.pattern, r'Room (\d+)')
+
+    def test_prefilter_skips_inputs_without_keyword(self):
+        pattern = re.compile(r'\b(\w+ Square)\b')
+        guarded = guard_pattern(pattern, prefilter=re.compile('Square'))
+
+        self.assertIsNone(guarded.search("meet at the park"))
+        self.assertEqual(guarded.search("meet at Union Square").group(1), "Union Square")
+
+
+class TestRegexCPUBudget(unittest.TestCase):
+    """Test cases for the per-parse CPU budget."""
+
+    def test_exhausted_budget_stops_guarded_patterns(self):
+        guarded = guard_pattern(re.compile(r'\d+'))
+
+        with regex_cpu_budget(0.001):
+            sum(i * i for i in range(200000))  # spend the budget
+            self.assertTrue(regex_budget_exhausted())
+            self.assertIsNone(guarded.search("room 12"))
+            self.assertEqual(guarded.findall("1 2 3"), [])
+
+        self.assertFalse(regex_budget_exhausted())
+        self.assertEqual(guarded.findall("1 2 3"), ['1', '2', '3'])
+
+    def test_zero_budget_disables(self):
+        with regex_cpu_budget(0) as budget:
+            self.assertIsNone(budget)
+            self.assertFalse(regex_budget_exhausted())
+
+
+if __name__ == '__main__':
+    unittest.main()
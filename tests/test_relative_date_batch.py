@@ -0,0 +1,70 @@
+"""
+Unit tests for batch relative date resolution.
+"""
+
+import unittest
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from services.regex_date_extractor import RegexDateExtractor
+from services.relative_date_batch import resolve_relative_date, resolve_relative_dates, to_dates
+
+
+class TestResolveRelativeDates(unittest.TestCase):
+    """Test cases for resolve_relative_dates."""
+
+    def test_matches_scalar_resolution(self):
+        kinds, amounts, weekdays = [], [], []
+        for kind in ('days', 'weeks', 'months', 'next_weekday', 'this_weekday'):
+            for amount in (-14, -1, 0, 1, 5, 13, 400):
+                for weekday in range(7):
+                    kinds.append(kind)
+                    amounts.append(amount)
+                    weekdays.append(weekday)
+
+        reference = date(2024, 1, 31)
+        for offset in range(8):
+            reference_date = reference + timedelta(days=offset)
+            resolved = to_dates(resolve_relative_dates(kinds, amounts, weekdays, reference_date))
+            expected = [resolve_relative_date(k, a, w, reference_date) for k, a, w in zip(kinds, amounts, weekdays)]
+            self.assertEqual(resolved, expected)
+
+    def test_calendar_months_clamp_to_month_end(self):
+        resolved = to_dates(resolve_relative_dates(['months'] * 3, [1, 2, 13], [0] * 3, date(2024, 1, 31)))
+
+        self.assertEqual(resolved, [date(2024, 2, 29), date(2024, 3, 31), date(2025, 2, 28)])
+
+    def test_weekday_kinds(self):
+        wednesday = date(2025, 10, 1)
+        resolved = to_dates(resolve_relative_dates(['next_weekday', 'this_weekday', 'next_weekday'],
+                                                   [0, 0, 0], [2, 2, 4], wednesday))
+
+        self.assertEqual(resolved, [date(2025, 10, 8), wednesday, date(2025, 10, 3)])
+
+    def test_unknown_kind_is_nat(self):
+        resolved = resolve_relative_dates(['days', 'fortnights'], [1, 1], [0, 0], date(2025, 10, 1))
+
+        self.assertTrue(np.isnat(resolved[1]))
+        self.assertEqual(to_dates(resolved), [date(2025, 10, 2), None])
+
+
+class TestRegexDateExtractorBatch(unittest.TestCase):
+    """Test cases for RegexDateExtractor.calculate_relative_dates."""
+
+    def test_batch_matches_single_text_extraction(self):
+        extractor = RegexDateExtractor(datetime(2025, 10, 1, 9, 0))
+        texts = ["lunch tomorrow", "review next friday", "this wednesday", "ship in 3 weeks",
+                 "renew in 2 months", "sync in 10 days", "no date here", "retro monday",
+                 "in 99999999 days"]
+
+        resolved = extractor.calculate_relative_dates(texts)
+
+        for text, target_date in zip(texts, resolved):
+            result = extractor._extract_relative_datetime(text)
+            expected = result.start_datetime.date() if result.start_datetime else None
+            self.assertEqual(target_date, expected, text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Unit tests for per-reference-day relative date tables.
+"""
+
+import unittest
+from datetime import date, timedelta
+
+from services.relative_date_batch import resolve_relative_date
+from services.relative_date_table import RelativeDateTable, RelativeDateTables, TABLE_RANGES
+
+
+class TestRelativeDateTable(unittest.TestCase):
+    """Test cases for RelativeDateTable."""
+
+    def test_every_key_matches_scalar_resolution(self):
+        for reference_date in (date(2024, 2, 29), date(2025, 10, 1), date(2025, 12, 31)):
+            table = RelativeDateTable(reference_date)
+            for kind, amounts in TABLE_RANGES.items():
+                for amount in amounts:
+                    self.assertEqual(table.resolve(kind, amount),
+                                     resolve_relative_date(kind, amount, 0, reference_date), (kind, amount))
+            for weekday in range(7):
+                for kind in ('next_weekday', 'this_weekday'):
+                    self.assertEqual(table.resolve(kind, weekday=weekday),
+                                     resolve_relative_date(kind, 0, weekday, reference_date))
+
+    def test_amounts_outside_the_table_fall_back(self):
+        table = RelativeDateTable(date(2025, 10, 1))
+
+        self.assertEqual(table.resolve('days', 1000), date(2025, 10, 1) + timedelta(days=1000))
+        self.assertEqual(table.resolve('months', 120), date(2035, 10, 1))
+
+
+class TestRelativeDateTables(unittest.TestCase):
+    """Test cases for the shared table cache."""
+
+    def test_tables_are_shared_per_day_and_evicted(self):
+        tables = RelativeDateTables(max_tables=2)
+        first = tables.for_date(date(2025, 10, 1))
+
+        self.assertIs(tables.for_date(date(2025, 10, 1)), first)
+        self.assertEqual(tables.resolve('days', 1, 0, date(2025, 10, 1)), date(2025, 10, 2))
+
+        # The next local day gets its own table; old days age out
+        tables.for_date(date(2025, 10, 2))
+        tables.for_date(date(2025, 10, 3))
+        self.assertEqual(tables.get_stats(), {'tables': 2, 'builds': 3})
+        self.assertIsNot(tables.for_date(date(2025, 10, 1)), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
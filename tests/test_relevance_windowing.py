@@ -0,0 +1,139 @@
+"""
+Unit tests for relevance windowing of long inputs.
+"""
+
+import unittest
+from datetime import datetime
+
+from services.event_parser import EventParser
+from services.hybrid_event_parser import HybridEventParser
+from services.relevance_windowing import RelevanceWindower, TextWindow, WindowedText
+from services.text_merge_helper import TextMergeHelper
+
+FILLER = (
+    "Thanks for the update on the quarterly numbers. I reviewed the spreadsheet "
+    "and everything looks consistent with the previous report. "
+) * 30
+EVENT_SENTENCE = "Let's meet on Friday at 2pm in Room 301 to review the plan."
+
+
+def _email(event_sentence: str = EVENT_SENTENCE) -> str:
+    return f"Subject: Project sync\n{FILLER}\n{event_sentence}\n{FILLER}"
+
+
+class TestWindowedText(unittest.TestCase):
+    """Test cases for WindowedText offset mapping."""
+
+    def setUp(self):
+        self.original = "0123456789" * 10
+        self.windowed = WindowedText(self.original, [TextWindow(10, 20, 1.0), TextWindow(50, 60, 1.0)])
+
+    def test_text_joins_windows(self):
+        self.assertEqual(self.windowed.text, self.original[10:20] + "\n\n" + self.original[50:60])
+
+    def test_span_round_trip(self):
+        for start, end in [(0, 4), (3, 10), (12, 17), (15, 22)]:
+            mapped = self.windowed.map_span((start, end))
+            self.assertEqual(self.original[mapped[0]:mapped[1]], self.windowed.text[start:end])
+
+    def test_empty_span_is_preserved(self):
+        self.assertEqual(self.windowed.map_span((0, 0)), (0, 0))
+
+    def test_span_mapper_aligns_edited_text(self):
+        original = "Notes.\n\nMeet   on Friday at 2pm in Room 301.\n\nMore notes."
+        windowed = WindowedText(original, [TextWindow(8, 43, 1.0)])
+        derived = "Meet on Friday at 2 PM in Room 301."
+        map_span = windowed.span_mapper(derived)
+
+        start = derived.index("Room 301")
+        mapped = map_span((start, start + len("Room 301")))
+        self.assertEqual(original[mapped[0]:mapped[1]], "Room 301")
+        start = derived.index("Friday")
+        mapped = map_span((start, start + len("Friday")))
+        self.assertEqual(original[mapped[0]:mapped[1]], "Friday")
+        self.assertEqual(windowed.span_mapper(windowed.text), windowed.map_span)
+
+
+class TestRelevanceWindower(unittest.TestCase):
+    """Test cases for RelevanceWindower."""
+
+    def setUp(self):
+        self.windower = RelevanceWindower()
+
+    def test_short_text_is_not_windowed(self):
+        self.assertIsNone(self.windower.window(EVENT_SENTENCE))
+
+    def test_text_without_dates_is_not_windowed(self):
+        self.assertIsNone(self.windower.window(FILLER * 2))
+
+    def test_long_text_keeps_event_sentence_and_subject(self):
+        text = _email()
+        windowed = self.windower.window(text)
+
+        self.assertIsNotNone(windowed)
+        self.assertIn(EVENT_SENTENCE, windowed.text)
+        self.assertIn("Subject: Project sync", windowed.text)
+        self.assertLess(len(windowed.text), len(text) // 4)
+
+    def test_windows_stay_in_document_order(self):
+        text = _email("Dinner on Monday at 7pm.") + _email("Lunch on Tuesday at noon.")
+        windowed = self.windower.window(text)
+
+        starts = [window.start for window in windowed.windows]
+        self.assertEqual(starts, sorted(starts))
+        self.assertLess(windowed.text.index("Monday"), windowed.text.index("Tuesday"))
+
+
+class TestHybridParserWindowing(unittest.TestCase):
+    """Test cases for windowed parsing in HybridEventParser."""
+
+    def _parse(self, text: str, windowing: bool):
+        parser = HybridEventParser(current_time=datetime(2026, 10, 18, 9, 0))
+        parser.config['enable_windowing'] = windowing
+        parser.config['enable_caching'] = False
+        return parser.parse_event_text(text)
+
+    def test_windowed_parse_matches_full_parse(self):
+        text = _email()
+        full = self._parse(text, windowing=False).parsed_event
+        result = self._parse(text, windowing=True)
+        windowed = result.parsed_event
+
+        self.assertIn('windowing', result.processing_metadata)
+        self.assertEqual(windowed.start_datetime, full.start_datetime)
+        self.assertEqual(windowed.location, full.location)
+
+    def test_windowed_result_refers_to_full_text(self):
+        parser = HybridEventParser(current_time=datetime(2026, 10, 18, 9, 0))
+        text = _email()
+        cleaned = parser._pre_clean_text(text)
+        parsed_event = parser.parse_event_text(text).parsed_event
+
+        self.assertEqual(parsed_event.description, cleaned)
+        for field_result in parsed_event.field_results.values():
+            self.assertLessEqual(field_result.span[1], len(cleaned))
+        # A repeated request is served from the cache entry for the full text
+        self.assertTrue(parser.parse_event_text(text).parsed_event.cache_hit)
+
+
+class TestEventParserWindowing(unittest.TestCase):
+    """Test cases for windowed parsing in EventParser.parse_text_enhanced."""
+
+    def test_field_spans_refer_to_the_original_text(self):
+        parser = EventParser()
+        parser.text_merge_helper = TextMergeHelper(use_llm=False)
+        parser.hybrid_parser.config['enable_caching'] = False
+        text = _email()
+
+        parsed_event = parser.parse_text_enhanced(text, current_time=datetime(2026, 10, 18, 9, 0))
+
+        self.assertGreater(len(text), 7000)
+        self.assertIn('text_windowing', parsed_event.extraction_metadata)
+        location = parsed_event.field_results['location']
+        start = parsed_event.field_results['start_datetime']
+        self.assertEqual(text[location.span[0]:location.span[1]], "Room 301")
+        self.assertEqual(text[start.span[0]:start.span[1]], "Friday at 2pm")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Unit tests for the slow/sampled request profiler.
+"""
+
+import pstats
+import shutil
+import tempfile
+import time
+import unittest
+
+from services.request_profiler import ProfilerConfig, RequestProfiler
+
+
+def slow_regex_stage():
+    time.sleep(0.15)
+
+
+class TestRequestProfiler(unittest.TestCase):
+    """Test cases for RequestProfiler and its on-disk ring."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _profiler(self, **overrides):
+        settings = dict(enabled=True, sample_every=0, slow_threshold_ms=0,
+                        sample_interval_ms=2, max_profiles=10, directory=self.temp_dir)
+        settings.update(overrides)
+        return RequestProfiler(ProfilerConfig(**settings))
+
+    def test_disabled_captures_nothing(self):
+        profiler = self._profiler(enabled=False, sample_every=1, slow_threshold_ms=1)
+
+        with profiler.profile_request("req1"):
+            slow_regex_stage()
+
+        self.assertEqual(profiler.list_profiles(), [])
+
+    def test_sampled_request_stores_cprofile(self):
+        profiler = self._profiler(sample_every=2)
+
+        for i in range(4):
+            with profiler.profile_request(f"req{i}"):
+                sum(range(1000))
+
+        profiles = profiler.list_profiles()
+        self.assertEqual([p.request_id for p in profiles], ["req3", "req1"])
+        self.assertEqual({p.trigger for p in profiles}, {"sampled"})
+        stats = pstats.Stats(str(profiler.get_profile_path(profiles[0].name)))
+        self.assertTrue(stats.total_calls > 0)
+
+    def test_slow_request_stores_sampled_stacks(self):
+        profiler = self._profiler(slow_threshold_ms=30)
+
+        with profiler.profile_request("fast"):
+            pass
+        with profiler.profile_request("slow"):
+            slow_regex_stage()
+
+        profiles = profiler.list_profiles()
+        self.assertEqual(len(profiles), 1)
+        self.assertEqual((profiles[0].trigger, profiles[0].format), ("slow", "folded"))
+        self.assertGreaterEqual(profiles[0].duration_ms, 150)
+        folded = profiler.get_profile_path(profiles[0].name).read_text()
+        self.assertIn("slow_regex_stage", folded)
+
+    def test_ring_keeps_newest_profiles(self):
+        profiler = self._profiler(sample_every=1, max_profiles=3)
+
+        for i in range(5):
+            with profiler.profile_request(f"req{i}"):
+                pass
+            time.sleep(0.002)
+
+        self.assertEqual([p.request_id for p in profiler.list_profiles()], ["req4", "req3", "req2"])
+
+    def test_get_path_rejects_unknown_names(self):
+        profiler = self._profiler()
+
+        self.assertIsNone(profiler.get_profile_path("../secrets.txt"))
+        self.assertIsNone(profiler.get_profile_path("20250101T000000000-slow-5ms-abc.folded"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Unit tests for the short input fast path.
+"""
+
+import unittest
+from datetime import datetime
+
+from services.short_input_parser import ShortInputConfig, ShortInputParser
+
+NOW = datetime(2025, 10, 1, 9, 0)  # a Wednesday
+
+
+class TestShortInputParser(unittest.TestCase):
+    """Test cases for ShortInputParser."""
+
+    def setUp(self):
+        self.parser = ShortInputParser(ShortInputConfig())
+
+    def parse(self, text):
+        return self.parser.parse(text, NOW)
+
+    def test_resolves_short_phrases(self):
+        cases = {
+            "lunch tomorrow at noon": ("lunch", datetime(2025, 10, 2, 12, 0)),
+            "standup 9am": ("standup", datetime(2025, 10, 1, 9, 0)),
+            "Team sync today at 3pm": ("Team sync", datetime(2025, 10, 1, 15, 0)),
+            "dentist friday 10:30am": ("dentist", datetime(2025, 10, 3, 10, 30)),
+            "Call mom next monday at 7pm": ("Call mom", datetime(2025, 10, 6, 19, 0)),
+            "Review tomorrow 2 pm": ("Review", datetime(2025, 10, 2, 14, 0)),
+            "Design review 14:00": ("Design review", datetime(2025, 10, 1, 14, 0)),
+            "Team lunch @ noon tomorrow": ("Team lunch", datetime(2025, 10, 2, 12, 0)),
+        }
+        for text, (title, start) in cases.items():
+            result = self.parse(text)
+            self.assertTrue(result.hit, f"{text}: {result.escalation_reason}")
+            self.assertEqual(result.parsed_event.title, title)
+            self.assertEqual(result.parsed_event.start_datetime, start)
+
+    def test_returns_complete_event(self):
+        text = "Team sync today at 3pm"
+        event = self.parse(text).parsed_event
+
+        self.assertEqual(event.end_datetime, datetime(2025, 10, 1, 16, 0))
+        self.assertEqual(event.parsing_path, 'fast_path')
+        self.assertGreater(event.confidence_score, 0.8)
+        self.assertEqual(set(event.field_results), {'title', 'start_datetime', 'end_datetime'})
+        self.assertEqual(text[slice(*event.field_results['title'].span)], "Team sync")
+        self.assertEqual(text[slice(*event.field_results['start_datetime'].span)], "today at 3pm")
+
+    def test_escalation_reasons(self):
+        cases = {
+            "standup at 9": 'ambiguous_time',
+            "Dentist wednesday 3pm": 'ambiguous_date',
+            "Lunch with Sarah tomorrow at noon": 'other_fields',
+            "lunch at Cafe Roma 1pm": 'other_fields',
+            "Weekly sync 3pm": 'other_fields',
+            "standup tonight 9pm": 'unparsed_datetime',
+            "Board meeting March 3 2pm": 'unparsed_datetime',
+            "coffee 2pm-3pm": 'unrecognized_token',
+            "dentist tomorrow": 'no_time',
+            "tomorrow at 3pm": 'no_title',
+            "standup 9am 10am": 'multiple_times',
+            "call tomorrow mom 3pm": 'split_title',
+            "standup 13pm": 'invalid_time',
+            "   ": 'empty',
+            "standup " + "x " * 10 + "9am": 'too_long',
+        }
+        for text, reason in cases.items():
+            result = self.parse(text)
+            self.assertFalse(result.hit, text)
+            self.assertEqual(result.escalation_reason, reason, text)
+
+    def test_disabled(self):
+        parser = ShortInputParser(ShortInputConfig(enabled=False))
+
+        self.assertEqual(parser.parse("standup 9am", NOW).escalation_reason, 'disabled')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for per-request pipeline stage timing.
+"""
+
+import contextvars
+import threading
+import time
+import unittest
+
+from services.stage_timing import (
+    get_current_timings,
+    open_stage,
+    request_scope,
+    stage,
+)
+
+
+class TestStageTimings(unittest.TestCase):
+    """Test cases for StageTimings and the stage() context manager."""
+
+    def test_stage_is_noop_without_request_scope(self):
+        with stage('regex'):
+            pass
+        open_stage('serialization')
+
+        self.assertIsNone(get_current_timings())
+
+    def test_nested_stages_are_exclusive(self):
+        with request_scope() as timings:
+            with stage('preprocess'):
+                time.sleep(0.01)
+                with stage('llm'):
+                    time.sleep(0.03)
+
+        totals = timings.totals_ns()
+        self.assertEqual(list(totals), ['preprocess', 'llm'])
+        self.assertGreaterEqual(totals['llm'], 30_000_000)
+        self.assertLess(totals['preprocess'], totals['llm'])
+        self.assertLessEqual(sum(totals.values()), timings.elapsed_ns())
+
+    def test_stages_in_worker_threads_share_request_totals(self):
+        with request_scope() as timings:
+            def work():
+                with stage('regex'):
+                    time.sleep(0.005)
+
+            threads = [threading.Thread(target=contextvars.copy_context().run, args=(work,))
+                       for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertGreaterEqual(timings.totals_ns()['regex'], 15_000_000)
+
+    def test_server_timing_header(self):
+        with request_scope() as timings:
+            timings.record('custom', 1_500_000)
+            with stage('regex'):
+                pass
+            open_stage('serialization')
+            timings.close_open_stages()
+
+        header = timings.server_timing_header()
+        names = [entry.split(';')[0] for entry in header.split(', ')]
+        self.assertEqual(names, ['regex', 'serialization', 'custom', 'total'])
+        self.assertIn('custom;dur=1.500', header)
+
+
+if __name__ == '__main__':
+    unittest.main()